@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from zlogging._exc import WriterError, WriterFormatError, ZeekValueError
+from zlogging.background import BackgroundWriter
+from zlogging.loader import parse_ascii
+from zlogging.model import new_model
+from zlogging.rotating import RotatingWriter
+from zlogging.types import CountType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestBackgroundWriter:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'dns.log')).data
+
+    def test_write(self, records, tmp_path):
+        filename = tmp_path / 'dns.log'
+        with BackgroundWriter(filename, batch_size=16, fsync_interval=0) as writer:
+            assert writer.write_many(records) == len(records)
+            writer.flush()
+            assert writer.queue_depth == 0
+            assert writer.written == len(records)
+
+        assert writer.metrics['written'] == len(records)
+        assert writer.metrics['dropped'] == 0
+        assert writer.batches >= len(records) // 16
+
+        parsed = parse_ascii(filename).data
+        assert [record.tojson() for record in parsed] == [record.tojson() for record in records]
+
+    def test_json(self, records, tmp_path):
+        filename = tmp_path / 'dns.log'
+        with BackgroundWriter(filename, format='json') as writer:
+            writer.write_many(records)
+        with open(filename) as file:
+            assert [json.loads(line) for line in file] == [record.tojson() for record in records]
+
+    def test_rotating(self, records, tmp_path):
+        rotating = RotatingWriter(tmp_path / 'dns.log', max_bytes=16384)
+        with BackgroundWriter(rotating) as writer:
+            writer.write_many(records)
+        assert len(rotating.rotated) > 1
+        assert sum(len(parse_ascii(name).data) for name in rotating.rotated) == len(records)
+
+    def test_drop(self, records, tmp_path):
+        writer = BackgroundWriter(tmp_path / 'dns.log', queue_size=1, policy='drop')
+        lock = threading.Lock()
+        with lock:
+            # stall the background thread on its first batch
+            original = writer._sink.write_many
+            writer._sink.write_many = lambda data: (lock.acquire(), lock.release(), original(data))
+            queued = writer.write_many(records)
+        writer.close()
+
+        assert queued < len(records)
+        assert writer.dropped == len(records) - queued
+        assert writer.written == queued
+
+    def test_idle(self, records, tmp_path):
+        filename = tmp_path / 'dns.log'
+        with BackgroundWriter(filename, format='json', fsync_interval=0.05) as writer:
+            writer.write_many(records[:5])
+            writer.flush()
+            size = os.path.getsize(filename)
+            writer.write_many(records[5:10])
+            deadline = time.monotonic() + 5
+            while os.path.getsize(filename) == size and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # pending records are flushed once idle without flush() or close()
+            with open(filename) as file:
+                assert [json.loads(line) for line in file] == [record.tojson() for record in records[:10]]
+
+    def test_closed(self, records, tmp_path):
+        writer = BackgroundWriter(tmp_path / 'dns.log', queue_size=1)
+        writer.write(records[0])
+        writer.close()
+        with pytest.raises(WriterError):
+            writer.write(records[1])
+        writer.close()
+
+    def test_flush_stopped(self, records, tmp_path):
+        writer = BackgroundWriter(tmp_path / 'dns.log', queue_size=1)
+        writer.close()
+        # a record racing with close() fills the queue of the stopped thread
+        writer._queue.put_nowait(records[0])
+
+        errors = []
+
+        def flush():
+            try:
+                writer.flush()
+            except WriterError as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=flush, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    def test_drop_concurrent(self, records, tmp_path):
+        writer = BackgroundWriter(tmp_path / 'dns.log', queue_size=1, policy='drop')
+        lock = threading.Lock()
+        queued = []
+        with lock:
+            original = writer._sink.write_many
+            writer._sink.write_many = lambda data: (lock.acquire(), lock.release(), original(data))
+            threads = [threading.Thread(target=lambda: queued.append(writer.write_many(records * 10)))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        writer.close()
+
+        assert writer.dropped == len(records) * 40 - sum(queued)
+        assert writer.written == sum(queued)
+
+    def test_error(self, tmp_path):
+        model = new_model('test', count=CountType())
+        writer = BackgroundWriter(tmp_path / 'test.log')
+        writer.write(model(count=None))
+        writer.write(object())
+        with pytest.raises(AttributeError):
+            writer.flush()
+        with pytest.raises(AttributeError):
+            writer.write(model(count=None))
+        with pytest.raises(AttributeError):
+            writer.close()
+
+    def test_options(self, tmp_path):
+        with pytest.raises(ZeekValueError):
+            BackgroundWriter(tmp_path / 'test.log', policy='wait')
+        with pytest.raises(WriterFormatError):
+            BackgroundWriter(tmp_path / 'test.log', format='xml')
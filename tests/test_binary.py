@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import decimal
+import io
+import os
+import time
+
+import pytest
+
+from zlogging._data import BinaryInfo
+from zlogging._exc import BinaryParserError, BinaryParserWarning
+from zlogging.binary import dump_binary, load_binary, parse_binary, write_binary
+from zlogging.columnar import Table
+from zlogging.loader import parse_ascii
+from zlogging.model import new_model
+from zlogging.types import DoubleType, SetType, StringType, TimeType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestBinary:
+
+    @pytest.mark.parametrize('name', ['conn.log', 'dns.log', 'http.log', 'ssl.log', 'x509.log'])
+    def test_roundtrip(self, name, tmp_path):
+        records = parse_ascii(os.path.join(LOGS, name)).data
+        filename = tmp_path / name
+        write_binary(records, filename, row_group_size=64)
+
+        info = parse_binary(filename)
+        assert isinstance(info, BinaryInfo)
+        assert info.format == 'binary'
+        assert info.path == os.path.splitext(name)[0]
+        assert not info.exit_with_error
+        assert [repr(record) for record in info.data] == [repr(record) for record in records]
+        assert [record.toascii() for record in info.data] == [record.toascii() for record in records]
+
+    def test_size(self, tmp_path):
+        filename = tmp_path / 'conn.log'
+        write_binary(parse_ascii(os.path.join(LOGS, 'conn.log')).data, filename)
+        assert os.path.getsize(filename) * 3 < os.path.getsize(os.path.join(LOGS, 'conn.log'))
+
+    def test_columnar(self, tmp_path):
+        filename = tmp_path / 'conn.log'
+        write_binary(parse_ascii(os.path.join(LOGS, 'conn.log')).data, filename, row_group_size=100)
+
+        table = parse_binary(filename, columnar=True).data
+        expected = parse_ascii(os.path.join(LOGS, 'conn.log'), columnar=True).data
+        assert isinstance(table, Table)
+        assert table.num_rows == expected.num_rows
+        assert table.to_pydict() == expected.to_pydict()
+
+    def test_values(self):
+        model = new_model('test', string=StringType(), double=DoubleType(), time=TimeType(),
+                          set=SetType(element_type=StringType))
+        records = [
+            model(string=b'', double=decimal.Decimal('-1.5'), time=1581245648.761106, set=set()),
+            model(string=None, double=decimal.Decimal('Infinity'), time=None, set=None),
+            model(string=b'foo', double=None, time=1581245648.0, set={b'a', b'b'}),
+        ]
+        file = io.BytesIO()
+        dump_binary(records, file, name='test.log')
+        file.seek(0)
+
+        data = load_binary(file).data
+        assert [record.toascii() for record in data] == [record.toascii() for record in records]
+        assert data[0].string == b''
+        assert data[0].set == set()
+        assert data[1].string is None
+        assert data[2].set == {b'a', b'b'}
+
+    def test_empty(self):
+        file = io.BytesIO()
+        dump_binary([], file)
+        file.seek(0)
+        assert load_binary(file).data == []
+
+    def test_error(self, tmp_path):
+        filename = tmp_path / 'conn.log'
+        write_binary(parse_ascii(os.path.join(LOGS, 'conn.log')).data, filename, row_group_size=1000)
+        with open(filename, 'rb') as file:
+            data = file.read()
+
+        with pytest.raises(BinaryParserError):
+            load_binary(io.BytesIO(b'#separator \\x09\n'))
+        with pytest.raises(BinaryParserError):
+            load_binary(io.BytesIO(data[:len(data) // 2]))
+
+        # drop the trailer, i.e. the empty block and the close time
+        trailer = data.rindex(b'{"close"') - 2
+        assert data[trailer] == 0
+        with pytest.warns(BinaryParserWarning):
+            info = load_binary(io.BytesIO(data[:trailer]))
+        assert info.exit_with_error
+        assert len(info.data) == 2203
+
+    def test_corrupt(self, tmp_path):
+        file = io.BytesIO()
+        dump_binary(parse_ascii(os.path.join(LOGS, 'dns.log')).data, file)
+        data = file.getvalue()
+
+        header = data.index(b'{')
+        with pytest.raises(BinaryParserError, match='malformed log header'):
+            load_binary(io.BytesIO(data[:header] + data[header:].replace(b'"path"', b'"pat\xff"', 1)))
+        with pytest.raises(BinaryParserError, match='malformed log header'):
+            load_binary(io.BytesIO(data[:header] + data[header:].replace(b'"open"', b'"opex"', 1)))
+
+        trailer = data.rindex(b'"close"')
+        with pytest.raises(BinaryParserError, match='malformed log trailer'):
+            load_binary(io.BytesIO(data[:trailer] + b'"clxse"' + data[trailer + 7:]))
+
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason='time.tzset() not available')
+    def test_fold(self, monkeypatch):
+        monkeypatch.setenv('TZ', 'America/New_York')
+        time.tzset()
+        try:
+            model = new_model('test', ts=TimeType())
+            # the repeated hour when DST ends on 2021-11-07
+            records = [model(ts=b'1636262400.500000'), model(ts=b'1636266000.500000')]
+            file = io.BytesIO()
+            dump_binary(records, file)
+            file.seek(0)
+            assert [record.ts.timestamp() for record in load_binary(file).data] == [1636262400.5, 1636266000.5]
+        finally:
+            monkeypatch.undo()
+            time.tzset()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from zlogging.cache import ParseCache
+from zlogging.columnar import Table
+from zlogging.loader import parse
+from zlogging.model import new_model
+from zlogging.types import CountType, SetType, StringType, VectorType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestParseCache:
+
+    @pytest.fixture
+    def log(self, tmp_path):
+        filename = tmp_path / 'conn.log'
+        shutil.copy(os.path.join(LOGS, 'conn.log'), filename)
+        return filename
+
+    @pytest.mark.parametrize('mmap', [False, True])
+    def test_parse(self, log, tmp_path, mmap):
+        cache = ParseCache(tmp_path / 'cache', mmap=mmap)
+        info = parse(log, cache=cache)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        cached = parse(log, cache=cache)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cached.path == info.path
+        assert cached.open == info.open
+        assert cached.close == info.close
+        assert [repr(record) for record in cached.data] == [repr(record) for record in info.data]
+        assert type(cached.data[0].duration) is type(info.data[0].duration)
+
+    def test_options(self, log, tmp_path):
+        cache = ParseCache(tmp_path / 'cache')
+        parse(log, cache=cache)
+        info = parse(log, cache=cache, columnar=True)
+        assert cache.misses == 2
+        assert isinstance(info.data, Table)
+
+        cached = parse(log, cache=cache, columnar=True)
+        assert cache.hits == 1
+        assert cached.data.to_pydict() == info.data.to_pydict()
+
+        # unpicklable options are never cached
+        class Count(CountType):
+            pass
+
+        parse(log, cache=cache, type_hook={'count': Count})
+        parse(log, cache=cache, type_hook={'count': Count})
+        assert cache.misses == 4
+
+    def test_key(self, log, tmp_path):
+        fields = 'uid=StringType(), orig_bytes=CountType, tunnel_parents=SetType(element_type=StringType)'
+        script = ('import sys\n'
+                  'from zlogging.cache import ParseCache\n'
+                  'from zlogging.model import new_model\n'
+                  'from zlogging.types import CountType, SetType, StringType\n'
+                  'model = new_model("conn", %s)\n'
+                  'print(ParseCache(sys.argv[1]).key(sys.argv[2], model=model, type_hook={"count": CountType}))\n'
+                  % fields)
+        keys = [subprocess.run([sys.executable, '-c', script, str(tmp_path / 'cache'), str(log)], check=True,
+                               capture_output=True, text=True, cwd=ROOT).stdout.strip() for _ in range(2)]
+        assert keys[0] == keys[1] != 'None'
+
+        cache = ParseCache(tmp_path / 'cache')
+        model = eval('new_model("conn", %s)' % fields)
+        assert cache.key(log, model=model, type_hook={'count': CountType}) == keys[0]
+        other = eval('new_model("conn", %s)' % fields.replace('SetType', 'VectorType'))
+        assert cache.key(log, model=other, type_hook={'count': CountType}) != keys[0]
+
+    def test_invalidate(self, log, tmp_path):
+        cache = ParseCache(tmp_path / 'cache')
+        parse(log, cache=cache)
+
+        with open(log, 'rb') as file:
+            data = file.read()
+        lines = data.splitlines(keepends=True)
+        with open(log, 'wb') as file:
+            file.writelines(lines[:9] + lines[-1:])
+        os.utime(log, ns=(0, 0))
+
+        info = parse(log, cache=cache)
+        assert cache.misses == 2
+        assert len(info.data) == 1
+
+    def test_evict(self, log, tmp_path):
+        directory = tmp_path / 'cache'
+        cache = ParseCache(directory)
+        parse(log, cache=cache)
+        (entry,) = os.scandir(directory)
+        os.utime(entry.path, (0, 0))
+
+        cache = ParseCache(directory, max_size=entry.stat().st_size * 3 // 2)
+        parse(log, cache=cache, slots=True)
+        assert cache.misses == 1
+        assert len(os.listdir(directory)) == 1
+
+        # the least recently used entry is evicted
+        parse(log, cache=cache, slots=True)
+        assert cache.hits == 1
+        parse(log, cache=cache)
+        assert cache.misses == 2
+
+    def test_corrupted(self, log, tmp_path):
+        directory = tmp_path / 'cache'
+        cache = ParseCache(directory)
+        parse(log, cache=cache)
+        for entry in os.scandir(directory):
+            with open(entry.path, 'wb') as file:
+                file.write(b'garbage')
+
+        info = parse(log, cache=cache)
+        assert cache.misses == 2
+        assert len(info.data) > 0
+
+        cache.clear()
+        assert os.listdir(directory) == []
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import array
+import os
+
+import pytest
+
+from zlogging._compat import numpy
+from zlogging._exc import ASCIIParserError, JSONParserError
+from zlogging.columnar import ArrayColumn, DictionaryColumn, ObjectColumn, Table
+from zlogging.loader import loads_ascii, loads_json, parse_ascii
+from zlogging.model import new_model
+from zlogging.types import CountType, SetType, StringType, TimeType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestASCIIColumnar:
+
+    @pytest.fixture(scope='class')
+    def info(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log'), columnar=True)
+
+    @pytest.fixture(scope='class')
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log')).data
+
+    def test_table(self, info, records):
+        table = info.data
+        assert isinstance(table, Table)
+        assert len(table) == len(records)
+        assert list(table) == list(records[0].fields)
+
+    def test_storage(self, info):
+        table = info.data
+        assert isinstance(table['id.resp_p'], ArrayColumn)
+        assert table['id.resp_p'].array.typecode == 'Q'
+        assert isinstance(table['ts'], ArrayColumn)
+        assert table['ts'].array.typecode == 'q'
+        assert isinstance(table['uid'], DictionaryColumn)
+        assert isinstance(table['proto'], DictionaryColumn)
+        assert isinstance(table['tunnel_parents'], ObjectColumn)
+
+    def test_values(self, info, records):
+        table = info.data
+        for index, record in enumerate(records):
+            port = getattr(record, 'id.resp_p')
+            assert table['id.resp_p'][index] == port.value
+            assert table['id.orig_h'][index] == getattr(record, 'id.orig_h')
+            assert table['proto'][index] == record.proto
+
+            duration = record.duration
+            if duration is None:
+                assert table['duration'][index] is None
+                assert not table['duration'].is_valid(index)
+            else:
+                nanoseconds = round(duration.total_seconds() * 1_000_000) * 1_000
+                assert table['duration'][index] == nanoseconds
+
+    def test_null_count(self, info, records):
+        table = info.data
+        assert table['duration'].null_count == sum(record.duration is None for record in records)
+
+    @pytest.mark.skipif(numpy is None, reason='NumPy not available')
+    def test_numpy(self, info):
+        table = info.data
+        assert table['id.resp_p'].values.dtype == numpy.uint64
+        assert str(table['ts'].values.dtype) == 'datetime64[ns]'
+        assert str(table['duration'].values.dtype) == 'timedelta64[ns]'
+
+    @pytest.mark.skipif(numpy is not None, reason='NumPy available')
+    def test_array(self, info):
+        assert isinstance(info.data['id.resp_p'].values, array.array)
+
+    def test_error(self):
+        with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+            data = file.read().replace(b'\t35226\t', b'\tabc\t')
+        with pytest.raises(ASCIIParserError) as excinfo:
+            loads_ascii(data, columnar=True)
+        assert excinfo.value.field == 'trans_id'
+
+
+class TestJSONColumnar:
+
+    model = new_model('test', count=CountType(), string=StringType(), time=TimeType(),
+                      set=SetType(element_type=StringType))
+
+    def test_values(self):
+        data = ('{"count": 1, "string": "a", "time": 1.5, "set": ["a", "b"]}\n'
+                '{"count": null, "string": "a"}\n')
+        table = loads_json(data, model=self.model, columnar=True).data
+        assert table.to_pydict() == {
+            'count': [1, None],
+            'string': [b'a', b'a'],
+            'time': [1_500_000_000, None],
+            'set': [{b'a', b'b'}, None],
+        }
+        assert table['string'].dictionary == [b'a']
+
+    def test_error(self):
+        with pytest.raises(JSONParserError):
+            loads_json('{"unknown": 1}\n', model=self.model, columnar=True)
+        with pytest.raises(JSONParserError):
+            loads_json('{"count": "a"}\n', model=self.model, columnar=True)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import io
+import json
+import os
+
+import pytest
+
+from zlogging.dumper import ASCIIWriter, dump_ascii, dumps_ascii, dumps_json, write_ascii
+from zlogging.loader import loads_ascii, parse_ascii
+from zlogging.model import Model, new_model
+from zlogging.types import CountType, StringType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class CountingFile(io.BytesIO):
+
+    writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class TestASCIIWriter:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'dns.log')).data
+
+    def body(self, text):
+        return [line for line in text.splitlines() if not line.startswith('#')]
+
+    def test_iterable(self, records):
+        expected = self.body(dumps_ascii(records))
+        assert len(expected) == len(records)
+        assert self.body(dumps_ascii(iter(records))) == expected
+        assert self.body(dumps_ascii(tuple(records))) == expected
+
+        file = io.StringIO()
+        dump_ascii(records, file)
+        assert self.body(file.getvalue()) == expected
+
+        file = io.StringIO()
+        dump_ascii((record for record in records), file)
+        assert self.body(file.getvalue()) == expected
+
+    def test_empty(self):
+        for data in ([], iter([]), None):
+            text = dumps_ascii(data)
+            assert text.startswith('#separator')
+            assert text.splitlines()[-1].startswith('#close')
+            assert self.body(text) == []
+
+    def test_binary(self, records):
+        file = CountingFile()
+        dump_ascii(records, file, buffer_size=1024)
+        text = file.getvalue().decode('ascii')
+        assert self.body(text) == self.body(dumps_ascii(records))
+        # header, batches of lines and trailer
+        assert 2 < file.writes < len(records)
+
+        info = loads_ascii(file.getvalue())
+        assert [record.tojson() for record in info.data] == [record.tojson() for record in records]
+
+    def test_write(self, records, tmp_path):
+        filename = tmp_path / 'dns.log'
+        write_ascii(iter(records), filename)
+        with open(filename, encoding='ascii') as file:
+            text = file.read()
+        assert '#path\t%s\n' % os.path.splitext(filename)[0] in text
+        assert len(parse_ascii(filename).data) == len(records)
+
+    def test_write_line(self, records):
+        writer = ASCIIWriter()
+        file = io.BytesIO()
+        writer.write_line(file, records[0])
+        assert file.getvalue().decode('ascii') == writer.dump_line(records[0])
+
+    def test_file_like(self, records):
+        class TextSink:
+            def __init__(self):
+                self.lines = []
+
+            def write(self, data):
+                if not isinstance(data, str):
+                    raise TypeError('write() argument must be str')
+                self.lines.append(data)
+                return len(data)
+
+        class BinarySink(TextSink):
+            def write(self, data):
+                if not isinstance(data, bytes):
+                    raise TypeError('a bytes-like object is required')
+                return super().write(data.decode('ascii'))
+
+        writer = ASCIIWriter()
+        for sink in (TextSink(), BinarySink()):
+            writer.write_file(sink, records)
+            text = ''.join(sink.lines)
+            assert text.startswith('#separator')
+            assert text.count(writer.dump_line(records[0])) >= 1
+            assert len(loads_ascii(text.encode('ascii')).data) == len(records)
+
+
+class TestEncoder:
+
+    @pytest.fixture(params=[{}, {'slots': True}, {'lazy': True}])
+    def records(self, request):
+        return parse_ascii(os.path.join(LOGS, 'conn.log'), **request.param).data
+
+    def test_ascii(self, records):
+        text = dumps_ascii(records, separator='|')
+        lines = [line for line in text.splitlines(keepends=True) if not line.startswith('#')]
+        assert lines == ['%s\n' % '|'.join(record.toascii().values()) for record in records]
+
+    def test_json(self, records):
+        assert dumps_json(records) == ''.join('%s\n' % json.dumps(record.tojson()) for record in records)
+
+    def test_custom_encoder(self):
+        class Encoder(json.JSONEncoder):
+            def encode(self, o):
+                return 'custom'
+
+        model = new_model('test', count=CountType())
+        assert dumps_json([model(count=1)]) == '{"count": 1}\n'
+        assert dumps_json([model(count=1)], encoder=Encoder) == 'custom\n'
+
+    def test_empty(self):
+        model = new_model('test')
+        assert dumps_json([model(), model()]) == '{}\n{}\n'
+        assert ASCIIWriter().dump_line(model()) == '\n'
+        assert dumps_ascii([model()]).splitlines()[-2] == ''
+
+    def test_override(self):
+        class Record(Model):
+            string = StringType()
+
+            def toascii(self):
+                return {'string': 'custom'}
+
+        assert dumps_ascii([Record(string=b'a%s"')]).splitlines()[-2] == 'custom'
+        assert dumps_json([Record(string=b'a%s"')]) == '{"string": "a%s\\""}\n'
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import gzip
+import ipaddress
+import os
+import random
+import shutil
+
+import pytest
+
+from zlogging.index import BloomFilter, build_index, candidates, load_index, search
+from zlogging.loader import parse_ascii
+from zlogging.transcoder import ascii_to_json
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestBloomFilter:
+
+    def test_error_rate(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        values = [b'%d' % random.getrandbits(64) for _ in range(1000)]
+        for value in values:
+            bloom.add(value)
+        assert all(value in bloom for value in values)
+        assert sum(b'x%d' % index in bloom for index in range(10000)) < 300
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes(), bloom.hashes)
+        assert all(value in restored for value in values)
+
+    def test_keys(self):
+        bloom = BloomFilter(10)
+        bloom.add(b'192.168.0.1')
+        assert '192.168.0.1' in bloom
+        assert ipaddress.ip_address('192.168.0.1') in bloom
+        assert memoryview(b'192.168.0.1') in bloom
+
+
+class TestIndex:
+
+    @pytest.fixture
+    def logs(self, tmp_path):
+        for name in ('conn', 'dns', 'http', 'ssl', 'files'):
+            shutil.copy(os.path.join(LOGS, f'{name}.log'), tmp_path / f'{name}.log')
+        return tmp_path
+
+    def test_search(self, logs):
+        sidecars = build_index(str(logs / '*.log'))
+        assert len(sidecars) == 5
+        assert set(load_index(logs / 'conn.log')) == {'uid', 'id.orig_h', 'id.resp_h'}
+        assert set(load_index(logs / 'dns.log')) == {'uid', 'id.orig_h', 'id.resp_h', 'query'}
+
+        uid = parse_ascii(logs / 'http.log').data[0].uid
+        assert search(str(logs / '*.log'), uid) == [str(logs / 'conn.log'), str(logs / 'http.log')]
+        assert search(str(logs / '*.log'), uid, columns=['uid']) == [str(logs / 'conn.log'), str(logs / 'http.log')]
+        assert search(str(logs / '*.log'), uid, columns=['id.orig_h']) == []
+
+        query = parse_ascii(logs / 'dns.log').data[0].query
+        assert search(str(logs / '*.log'), query.decode()) == [str(logs / 'dns.log')]
+        assert candidates(str(logs / '*.log'), b'nonexistent') == []
+        assert search(str(logs / '*.log'), b'nonexistent') == []
+
+    def test_set(self, logs):
+        build_index(logs / 'files.log', columns=['fuid', 'conn_uids'])
+        record = parse_ascii(logs / 'files.log').data[0]
+        for uid in record.conn_uids:
+            assert search(logs / 'files.log', uid, columns=['conn_uids']) == [str(logs / 'files.log')]
+
+    def test_stale(self, logs):
+        build_index(logs / 'conn.log')
+        os.utime(logs / 'conn.log.bloom', ns=(0, 0))
+        # up-to-date sidecars are kept
+        assert build_index(logs / 'conn.log') == [str(logs / 'conn.log') + '.bloom']
+        assert os.stat(logs / 'conn.log.bloom').st_mtime_ns == 0
+
+        with open(logs / 'conn.log', 'ab') as file:
+            file.write(b'\n')
+        assert load_index(logs / 'conn.log') is None
+        # files without valid sidecars are always candidates
+        assert candidates(logs / 'conn.log', b'nonexistent') == [str(logs / 'conn.log')]
+
+        with open(logs / 'conn.log.bloom', 'wb') as file:
+            file.write(b'garbage')
+        assert load_index(logs / 'conn.log') is None
+
+    def test_formats(self, logs):
+        with open(logs / 'dns.log', 'rb') as src, gzip.open(logs / 'dns.log.gz', 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        ascii_to_json(logs / 'dns.log', logs / 'dns.json')
+
+        build_index([logs / 'dns.log.gz', logs / 'dns.json'])
+        query = parse_ascii(logs / 'dns.log').data[0].query
+        assert search([logs / 'dns.log.gz', logs / 'dns.json'], query) == [
+            str(logs / 'dns.log.gz'), str(logs / 'dns.json'),
+        ]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import os
+
+import pytest
+
+from zlogging._exc import ZeekValueError
+from zlogging.join import join
+from zlogging.loader import parse_ascii
+from zlogging.model import new_model
+from zlogging.types import SetType, StringType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+CONN = os.path.join(LOGS, 'conn.log')
+HTTP = os.path.join(LOGS, 'http.log')
+FILES = os.path.join(LOGS, 'files.log')
+
+
+def pairs(result, left, right):
+    return sorted((tuple(a[field] for field in left), None if b is None else tuple(b[field] for field in right))
+                  for a, b in result)
+
+
+class TestJoin:
+
+    @pytest.mark.parametrize('memory_limit', [256 << 20, 1 << 12, 0])
+    def test_join(self, memory_limit, tmp_path):
+        conn = parse_ascii(CONN).data
+        http = parse_ascii(HTTP).data
+        hosts = {}
+        for record in http:
+            hosts.setdefault(record.uid, []).append(record.host)
+
+        inner = [((record.uid,), (record.uid, host)) for record in conn for host in hosts.get(record.uid, [])]
+        left = inner + [((record.uid,), None) for record in conn if record.uid not in hosts]
+        assert inner
+
+        result = join(CONN, HTTP, on='uid', left_fields=['uid'], right_fields=['uid', 'host'],
+                      memory_limit=memory_limit, spill_dir=tmp_path)
+        assert pairs(result, ['uid'], ['uid', 'host']) == sorted(inner)
+
+        # the smaller left side is built instead
+        result = join(HTTP, CONN, on='uid', left_fields=['uid', 'host'], right_fields=['uid'],
+                      memory_limit=memory_limit, spill_dir=tmp_path)
+        assert pairs(result, ['uid', 'host'], ['uid']) == sorted((b, a) for a, b in inner)
+
+        result = join(CONN, HTTP, on='uid', how='left', left_fields=['uid'], right_fields=['uid', 'host'],
+                      memory_limit=memory_limit, spill_dir=tmp_path)
+        assert pairs(result, ['uid'], ['uid', 'host']) == sorted(left)
+        assert os.listdir(tmp_path) == []
+
+    def test_set_key(self):
+        files = parse_ascii(FILES).data
+        result = list(join(FILES, CONN, on='conn_uids', right_on='uid', right_fields=['uid', 'id.resp_p']))
+        assert len(result) == sum(len(record.conn_uids) for record in files)
+        for a, b in result:
+            assert b['uid'] in a['conn_uids']
+            assert isinstance(b['id.resp_p'], int)
+
+    @pytest.mark.parametrize('memory_limit', [256 << 20, 0])
+    def test_multiple_keys(self, memory_limit):
+        model_a = new_model('a', name=StringType(), uids=SetType(element_type=StringType))
+        model_b = new_model('b', uid=StringType())
+        left = [model_a(name=b'x', uids={b'1', b'2'}), model_a(name=b'y', uids={b'3', b'4'}),
+                model_a(name=b'z', uids=None), model_a(name=b'w', uids={b'1'})]
+        right = [model_b(uid=b'1'), model_b(uid=b'2'), model_b(uid=b'2'), model_b(uid=None)]
+
+        result = join(left, right, on='uids', right_on='uid', how='left', left_fields=['name'],
+                      memory_limit=memory_limit)
+        assert pairs(result, ['name'], ['uid']) == sorted([
+            ((b'x',), (b'1',)), ((b'x',), (b'2',)), ((b'x',), (b'2',)),
+            ((b'y',), None), ((b'z',), None), ((b'w',), (b'1',)),
+        ])
+
+        result = join(right, left, on='uid', right_on='uids', right_fields=['name'], memory_limit=memory_limit)
+        assert pairs(result, ['uid'], ['name']) == sorted([
+            ((b'1',), (b'x',)), ((b'1',), (b'w',)), ((b'2',), (b'x',)), ((b'2',), (b'x',)),
+        ])
+
+    def test_error(self):
+        with pytest.raises(ZeekValueError):
+            list(join(CONN, HTTP, on='uid', how='outer'))
+        with pytest.raises(ZeekValueError):
+            list(join(CONN, HTTP, on='uid', right_fields=['nonexistent']))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import io
+import os
+import tracemalloc
+
+import pytest
+
+from zlogging._exc import ASCIIParserError, ASCIIParserWarning, ZeekValueError
+from zlogging.loader import ASCIIParser, loads_ascii, parse_ascii
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestZeroCopy:
+
+    @pytest.mark.parametrize('name', ['conn', 'dns', 'http', 'ssl', 'x509'])
+    def test_parse(self, name, monkeypatch):
+        monkeypatch.setattr(ASCIIParser, 'view_threshold', 0)
+        info = parse_ascii(os.path.join(LOGS, f'{name}.log'))
+        zero_copy = parse_ascii(os.path.join(LOGS, f'{name}.log'), zero_copy=True)
+        assert zero_copy.close == info.close
+        assert zero_copy.exit_with_error == info.exit_with_error
+        assert [record.tojson() for record in zero_copy.data] == [record.tojson() for record in info.data]
+
+    def test_memoryview(self, monkeypatch):
+        record = parse_ascii(os.path.join(LOGS, 'conn.log'), zero_copy=True).data[0]
+        assert isinstance(record.uid, bytes)
+
+        monkeypatch.setattr(ASCIIParser, 'view_threshold', 0)
+        record = parse_ascii(os.path.join(LOGS, 'conn.log'), zero_copy=True).data[0]
+        assert isinstance(record.uid, memoryview)
+        assert record.uid.readonly
+        assert record.uid == b'CiUwQ23juyBEWCz75j'
+        assert record.toascii()['uid'] == 'CiUwQ23juyBEWCz75j'
+        assert record.tojson()['uid'] == 'CiUwQ23juyBEWCz75j'
+        assert isinstance(record.conn_state, memoryview)
+
+    def test_block_size(self, monkeypatch):
+        monkeypatch.setattr(ASCIIParser, 'block_size', 97)
+        monkeypatch.setattr(ASCIIParser, 'view_threshold', 0)
+        info = parse_ascii(os.path.join(LOGS, 'dns.log'))
+        zero_copy = parse_ascii(os.path.join(LOGS, 'dns.log'), zero_copy=True)
+        assert [record.tojson() for record in zero_copy.data] == [record.tojson() for record in info.data]
+
+    def test_error(self):
+        with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+            data = file.read()
+        with pytest.raises(ASCIIParserError):
+            loads_ascii(data.replace(b'\t35226\t', b'\t35226\t\t'), zero_copy=True)
+        with pytest.raises(ASCIIParserError) as excinfo:
+            loads_ascii(data.replace(b'\t35226\t', b'\tabc\t'), zero_copy=True)
+        assert excinfo.value.field == 'trans_id'
+
+    def test_batches(self, monkeypatch):
+        monkeypatch.setattr(ASCIIParser, 'block_size', 4096)
+        monkeypatch.setattr(ASCIIParser, 'view_threshold', 0)
+        expected = [record.tojson() for record in parse_ascii(os.path.join(LOGS, 'http.log')).data]
+
+        records, previous = [], None
+        with open(os.path.join(LOGS, 'http.log'), 'rb') as file:
+            for batch in ASCIIParser(zero_copy=True).iter_batches(file):
+                if previous is not None:
+                    # slices are released with their batch
+                    with pytest.raises(ValueError):
+                        bytes(previous.uid)
+                records.extend(record.tojson() for record in batch)
+                previous = batch[-1]
+        assert len(records) == len(expected) and records == expected
+
+        with pytest.raises(ZeekValueError):
+            next(ASCIIParser(lazy=True).iter_batches(io.BytesIO(b'')))
+        with open(os.path.join(LOGS, 'http.log'), 'rb') as file:
+            data = file.read()
+        with pytest.warns(ASCIIParserWarning):
+            assert sum(map(len, ASCIIParser().iter_batches(io.BytesIO(data[:data.rindex(b'#close')])))) == len(expected)
+
+    def test_saving(self):
+        header = (b'#separator \\x09\n#set_separator\t,\n#empty_field\t(empty)\n#unset_field\t-\n'
+                  b'#path\thttp\n#open\t2020-02-09-10-53-49\n#fields\tts\turi\tuser_agent\n'
+                  b'#types\ttime\tstring\tstring\n')
+        data = header + b'1581245648.761106\t/%s\t%s\n' % (b'a' * 1024, b'b' * 2048) * 2000 + b'#close\t2020-02-09-11-01-41\n'
+
+        peaks = []
+        for zero_copy in (False, True):
+            tracemalloc.start()
+            for batch in ASCIIParser(zero_copy=zero_copy).iter_batches(io.BytesIO(data)):
+                assert all(len(record.user_agent) == 2048 for record in batch)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        # long strings are not copied, and at most one block is kept alive
+        assert peaks[1] < peaks[0] * 0.8
+        assert peaks[1] < ASCIIParser.block_size * 4
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import os
+import pickle
+
+import pytest
+
+from zlogging._exc import ASCIIParserError, ModelTypeError
+from zlogging.loader import loads_ascii, parse_ascii
+from zlogging.model import LazyModel, Model, new_model
+from zlogging.types import AddrType, CountType, PortType, RecordType, StringType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestLazyModel:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log')).data
+
+    @pytest.fixture
+    def lazy(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log'), lazy=True).data
+
+    def test_lazy(self, lazy):
+        record = lazy[0]
+        assert isinstance(record, LazyModel)
+        assert 'id.resp_p' not in record.__dict__
+        assert getattr(record, 'id.resp_p').value == 56407
+        assert 'id.resp_p' in record.__dict__
+        assert 'uid' not in record.__dict__
+
+    def test_serialise(self, records, lazy):
+        for record, lazy_record in zip(records, lazy):
+            assert lazy_record.tojson() == record.tojson()
+            assert lazy_record.toascii() == record.toascii()
+            assert repr(lazy_record.asdict()) == repr(record.asdict())
+            assert repr(lazy_record.astuple(tuple)) == repr(record.astuple(tuple))
+
+    def test_raw(self, lazy):
+        record = lazy[0]
+        assert record.toascii(raw=True) == record.toascii()
+
+        record.uid = b'modified'
+        ascii = record.toascii(raw=True)
+        assert ascii['uid'] == 'modified'
+        assert ascii['proto'] == 'tcp'
+
+    def test_new_model(self):
+        model = new_model('test', __base__=LazyModel, name=StringType(), count=CountType())
+        assert isinstance(model.name, StringType)
+
+        record = model.from_raw([b'foo', b'-'])
+        assert record.name == b'foo'
+        assert record.count is None
+
+        record = model(name=b'bar', count=1)
+        assert record.count.value == 1
+        assert record.toascii(raw=True) == record.toascii()
+
+    def test_error(self):
+        model = new_model('test', __base__=LazyModel, count=CountType())
+        record = model.from_raw([b'abc'])
+        with pytest.raises(ValueError):
+            record.count
+
+        with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+            data = file.read().replace(b'\t35226\t', b'\t35226\t\t')
+        with pytest.raises(ASCIIParserError):
+            loads_ascii(data, lazy=True)
+
+
+class TestSlotsModel:
+
+    class Conn(Model, slots=True):
+        id = RecordType(orig_h=AddrType(), orig_p=PortType())
+        name = StringType()
+
+    def test_slots(self):
+        assert self.Conn.__slots__ == ('_id_orig_h', '_id_orig_p', 'name')
+        assert list(self.Conn.__fields__) == ['id.orig_h', 'id.orig_p', 'name']
+
+        record = self.Conn(**{'id.orig_h': '127.0.0.1', 'id.orig_p': 80, 'name': 'foo'})
+        assert not hasattr(record, '__dict__')
+        assert str(getattr(record, 'id.orig_h')) == '127.0.0.1'
+        assert record.name == b'foo'
+        assert record.toascii() == {'id.orig_h': '127.0.0.1', 'id.orig_p': '80', 'name': 'foo'}
+
+        setattr(record, 'id.orig_p', PortType()(8080))
+        assert getattr(record, 'id.orig_p').value == 8080
+        with pytest.raises(AttributeError):
+            record.unknown = 1
+
+    def test_parse(self):
+        records = parse_ascii(os.path.join(LOGS, 'conn.log')).data
+        slotted = parse_ascii(os.path.join(LOGS, 'conn.log'), slots=True).data
+        for record, slotted_record in zip(records, slotted):
+            assert not hasattr(slotted_record, '__dict__')
+            assert slotted_record.tojson() == record.tojson()
+            assert slotted_record.toascii() == record.toascii()
+
+    def test_lazy(self):
+        with pytest.raises(ModelTypeError):
+            new_model('test', __base__=LazyModel, __slots__=True, name=StringType())
+
+
+class TestFromConverted:
+
+    class Record(Model):
+        name = StringType()
+        count = CountType()
+
+        def __post_init__(self):
+            self.post_init = True
+
+    class Slots(Model, slots=True):
+        id = RecordType(orig_h=AddrType(), orig_p=PortType())
+
+    def test_from_converted(self):
+        record = self.Record._from_converted((b'foo', None))
+        assert record.name == b'foo'
+        assert record.count is None
+        assert record.post_init
+        assert record.toascii() == self.Record(name=b'foo', count=None).toascii()
+
+    def test_slots(self):
+        port = PortType()(80)
+        record = self.Slots._from_converted((None, port))
+        assert getattr(record, 'id.orig_h') is None
+        assert getattr(record, 'id.orig_p') is port
+
+    def test_parse(self):
+        with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+            data = file.read().replace(b'\t35226\t', b'\t35226\t\t')
+        with pytest.raises(ASCIIParserError):
+            loads_ascii(data)
+
+
+class TestAsTuple:
+
+    @pytest.fixture
+    def info(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log'))
+
+    def test_astuple(self, info):
+        record = info.data[0]
+        assert type(record.astuple()) is type(info.data[1].astuple())
+        assert record.astuple()._fields[:4] == ('ts', 'uid', 'id_orig_h', 'id_orig_p')
+        assert record.astuple(tuple) == tuple(record.astuple())
+
+    def test_astuples(self, info):
+        records = info.astuples()
+        assert len(records) == len(info.data)
+        assert repr(records[0]) == repr(info.data[0].astuple())
+        assert info.astuples(tuple)[-1] == tuple(records[-1])
+
+    def test_asdicts(self, info):
+        records = info.asdicts()
+        assert repr(records[0]) == repr(info.data[0].asdict())
+        assert list(records[0]) == list(info.data[0].fields)
+
+    def test_columnar(self):
+        info = parse_ascii(os.path.join(LOGS, 'conn.log'), columnar=True)
+        rows = info.astuples()
+        assert len(rows) == len(info.data)
+        assert rows[0] == tuple(column[0] for column in info.data.columns.values())
+        assert info.asdicts()[0]['uid'] == rows[0][1]
+
+
+class TestPickle:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'conn.log')).data
+
+    def test_pickle(self, records):
+        record = pickle.loads(pickle.dumps(records[0]))
+        assert type(record) is type(records[0])
+        assert record.toascii() == records[0].toascii()
+
+    def test_rebuild(self, records, monkeypatch):
+        data = pickle.dumps(records)
+        monkeypatch.setattr('zlogging.model._SCHEMA_REGISTRY', {})
+
+        loaded = pickle.loads(data)
+        assert type(loaded[0]) is not type(records[0])
+        assert type(loaded[0]) is type(loaded[-1])
+        assert list(loaded[0].fields) == list(records[0].fields)
+        assert [record.tojson() for record in loaded] == [record.tojson() for record in records]
+
+    def test_variants(self):
+        for options in ({'slots': True}, {'lazy': True}):
+            record = parse_ascii(os.path.join(LOGS, 'dns.log'), **options).data[0]
+            assert pickle.loads(pickle.dumps(record)).toascii() == record.toascii()
+
+    def test_reference(self):
+        assert pickle.loads(pickle.dumps(Model)) is Model
+        assert pickle.loads(pickle.dumps(LazyModel)) is LazyModel
+
+    def test_new_model(self):
+        model = new_model('test', name=StringType())
+        other = new_model('test', name=StringType())
+        assert pickle.loads(pickle.dumps(model)) is model
+        assert pickle.loads(pickle.dumps(other)) is other
+
+        record = pickle.loads(pickle.dumps(other(name='foo')))
+        assert type(record) is other
+        assert record.name == b'foo'
+
+    def test_custom(self):
+        class Custom(Model):
+            name = StringType()
+
+            @property
+            def title(self):
+                return self.name.title()
+
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(Custom)
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(Custom(name='foo'))
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(new_model('test', __base__=Custom, port=StringType()))
+
+
+def test_frozen():
+    data = parse_ascii(os.path.join(LOGS, 'dns.log'), frozen=True).data
+    assert all(record.answers is None or isinstance(record.answers, tuple) for record in data)
+    assert all(record.TTLs is None or isinstance(record.TTLs, tuple) for record in data)
+
+
+def test_new_model_name():
+    model = new_model('test', name=StringType())
+    assert issubclass(model, Model)
+    assert model(name='foo').name == b'foo'
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import os
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+
+import pytest
+
+from zlogging.loader import parse_ascii
+from zlogging.packed import PackedAddress, PackedNetwork
+from zlogging.types import AddrType, SetType, SubnetType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestPackedAddress:
+
+    @pytest.mark.parametrize('address', ['0.0.0.0', '192.168.0.1', '255.255.255.255',
+                                         '::', '::1', '2001:db8::ff00:42:8329', '::ffff:192.168.0.1'])
+    def test_roundtrip(self, address):
+        packed = PackedAddress.from_string(address)
+        assert str(packed) == address
+        assert packed.to_ipaddress() == IPv4Address(address) if packed.version == 4 else IPv6Address(address)
+        assert PackedAddress.from_ipaddress(packed.to_ipaddress()) == packed
+
+    def test_compare(self):
+        assert PackedAddress.from_string('0.0.0.1') != PackedAddress.from_string('::1')
+        assert hash(PackedAddress.from_string('10.0.0.1')) == hash(PackedAddress(167772161, 4))
+
+    @pytest.mark.parametrize('address', ['1.2.3', '1.2.3.4.5', 'foo', '::g'])
+    def test_error(self, address):
+        with pytest.raises(ValueError):
+            PackedAddress.from_string(address)
+
+
+class TestPackedNetwork:
+
+    @pytest.mark.parametrize('network', ['0.0.0.0/0', '10.0.0.0/8', '192.168.1.128/25',
+                                         '::/0', '2001:db8::/32', 'fe80::/64'])
+    def test_roundtrip(self, network):
+        packed = PackedNetwork.from_string(network)
+        assert str(packed) == network
+        assert str(packed.to_ipaddress()) == network
+        assert PackedNetwork.from_ipaddress(packed.to_ipaddress()) == packed
+
+    def test_contains(self):
+        network = PackedNetwork.from_string('192.168.0.0/16')
+        assert PackedAddress.from_string('192.168.255.1') in network
+        assert PackedAddress.from_string('192.169.0.1') not in network
+        assert PackedAddress.from_string('::ffff:192.168.0.1') not in network
+        assert PackedAddress.from_string('1.2.3.4') in PackedNetwork.from_string('0.0.0.0/0')
+        assert PackedAddress.from_string('2001:db8::1') in PackedNetwork.from_string('2001:db8::/32')
+
+    def test_mask(self):
+        assert str(PackedNetwork.from_string('192.168.1.1/16')) == '192.168.0.0/16'
+        assert str(PackedNetwork.from_string('192.168.1.1')) == '192.168.1.1/32'
+
+    @pytest.mark.parametrize('network', ['10.0.0.0/33', '10.0.0.0/a', '::/129'])
+    def test_error(self, network):
+        with pytest.raises(ValueError):
+            PackedNetwork.from_string(network)
+
+
+class TestPackedTypes:
+
+    def test_addr(self):
+        field = AddrType(packed=True)
+        assert field.python_type is PackedAddress
+        assert field(b'127.0.0.1') == PackedAddress(2130706433, 4)
+        assert field(IPv6Address('::1')) == PackedAddress(1, 6)
+        assert field(b'-') is None
+        assert field.toascii(field(b'::1')) == '::1'
+        assert field.tojson(field(b'127.0.0.1')) == '127.0.0.1'
+        assert AddrType()(PackedAddress(1, 6)) == IPv6Address('::1')
+
+    def test_subnet(self):
+        field = SubnetType(packed=True)
+        assert field(b'10.0.0.0/8') == PackedNetwork(167772160, 8, 4)
+        assert field(IPv4Network('10.0.0.0/8')) == PackedNetwork(167772160, 8, 4)
+        assert field.toascii(field(b'2001:db8::/32')) == '2001:db8::/32'
+        assert SubnetType()(PackedNetwork(0, 0, 6)) == IPv6Network('::/0')
+
+    def test_set(self):
+        field = SetType(element_type=AddrType(packed=True))
+        assert field(b'10.0.0.1,10.0.0.2') == {PackedAddress(167772161, 4), PackedAddress(167772162, 4)}
+
+    def test_parse(self):
+        info = parse_ascii(os.path.join(LOGS, 'conn.log'))
+        packed = parse_ascii(os.path.join(LOGS, 'conn.log'), packed=True)
+        assert isinstance(getattr(packed.data[0], 'id.orig_h'), PackedAddress)
+        assert [record.tojson() for record in packed.data] == [record.tojson() for record in info.data]
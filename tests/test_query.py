@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import collections
+import os
+
+import pytest
+
+from zlogging._exc import ZeekValueError
+from zlogging.loader import parse_ascii
+from zlogging.query import Count, Distinct, Max, Mean, Min, Query, Sum, query
+from zlogging.transcoder import ascii_to_json
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+CONN = os.path.join(LOGS, 'conn.log')
+
+
+def value(data):
+    return None if data is None else getattr(data, 'value', data)
+
+
+class TestQuery:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(CONN).data
+
+    def test_group_by(self, records):
+        expected = collections.OrderedDict()
+        for record in records:
+            if record.service != b'ssl':
+                continue
+            host = getattr(record, 'id.orig_h')
+            total = expected.setdefault(host, None)
+            for data in (record.orig_bytes, record.resp_bytes):
+                if data is not None:
+                    total = data.value if total is None else total + data.value
+            expected[host] = total
+
+        result = list(query(CONN)
+                      .where('service', '==', b'ssl')
+                      .group_by('id.orig_h')
+                      .aggregate(bytes=Sum('orig_bytes', 'resp_bytes')))
+        assert result == [{'id.orig_h': host, 'bytes': total} for host, total in expected.items()]
+
+        # the same query over data models
+        assert list(Query(records)
+                    .where('service', '==', b'ssl')
+                    .group_by('id.orig_h')
+                    .aggregate(bytes=Sum('orig_bytes', 'resp_bytes'))) == result
+
+    def test_group_by_container(self):
+        dns = os.path.join(LOGS, 'dns.log')
+        expected = collections.Counter(None if record.answers is None else tuple(record.answers)
+                                       for record in parse_ascii(dns).data)
+        result = list(Query(dns).group_by('answers').aggregate(n=Count()))
+        assert {row['answers']: row['n'] for row in result} == expected
+
+        files = os.path.join(LOGS, 'files.log')
+        records = parse_ascii(files).data
+        expected = collections.Counter(None if record.tx_hosts is None else frozenset(record.tx_hosts)
+                                       for record in records)
+        for source in (files, records):
+            result = list(Query(source).group_by('tx_hosts').aggregate(n=Count()))
+            assert {row['tx_hosts']: row['n'] for row in result} == expected
+
+    def test_aggregate_container(self):
+        files = os.path.join(LOGS, 'files.log')
+        records = parse_ascii(files).data
+        for field in ('tx_hosts', 'analyzers'):
+            expected = len({frozenset(getattr(record, field)) for record in records
+                            if getattr(record, field) is not None})
+            for source in (files, records):
+                (result,) = Query(source).aggregate(n=Distinct(field))
+                assert result == {'n': expected}
+            for aggregate in (Min, Max, Sum, Mean):
+                with pytest.raises(ZeekValueError):
+                    list(Query(files).aggregate(n=aggregate(field)))
+
+        dns = os.path.join(LOGS, 'dns.log')
+        expected = len({tuple(record.answers) for record in parse_ascii(dns).data if record.answers is not None})
+        assert list(Query(dns).aggregate(n=Distinct('answers'))) == [{'n': expected}]
+
+    def test_aggregate(self, records):
+        durations = [record.duration for record in records if record.duration is not None]
+        tcp = records[0].proto
+        ports = [getattr(record, 'id.resp_p').value for record in records if record.proto is tcp]
+
+        (result,) = Query(CONN).where('proto', '==', tcp).aggregate(
+            count=Count(), min=Min('id.resp_p'), max=Max('id.resp_p'), ports=Distinct('id.resp_p'),
+        )
+        assert result == {'count': len(ports), 'min': min(ports), 'max': max(ports), 'ports': len(set(ports))}
+
+        (result,) = Query(CONN).aggregate(duration=Mean('duration'), set=Count('duration'))
+        assert result == {'duration': sum(durations[1:], durations[0]) / len(durations), 'set': len(durations)}
+
+        (result,) = Query(CONN).where('ts', '<', 0).aggregate(sum=Sum('orig_bytes'), mean=Mean('orig_bytes'))
+        assert result == {'sum': None, 'mean': None}
+
+        counts = collections.Counter(record.conn_state for record in records)
+        assert {row['conn_state']: row['count'] for row in Query(CONN).group_by('conn_state')} == counts
+
+    def test_select(self, records):
+        result = list(Query(CONN)
+                      .filter(lambda orig, resp: (orig or 0) + (resp or 0) > 1000, 'orig_bytes', 'resp_bytes')
+                      .where('history', '!=', None)
+                      .select('uid', 'orig_bytes'))
+        expected = [{'uid': record.uid, 'orig_bytes': value(record.orig_bytes)} for record in records
+                    if (value(record.orig_bytes) or 0) + (value(record.resp_bytes) or 0) > 1000
+                    and record.history is not None]
+        assert result and result == expected
+
+        row = next(iter(Query(CONN)))
+        assert list(row) == list(records[0].__fields__)
+        assert row['id.orig_p'] == getattr(records[0], 'id.orig_p').value
+
+    def test_json(self, records, tmp_path):
+        filename = tmp_path / 'conn.json'
+        ascii_to_json(CONN, filename)
+
+        expected = collections.Counter(record.service for record in records if record.service is not None)
+        result = Query(filename).where('service', '!=', None).group_by('service')
+        assert {row['service'].encode(): row['count'] for row in result} == expected
+
+        result = Query(filename, type(records[0])).where('service', '==', b'ssl').select('uid', 'orig_bytes')
+        assert list(result) == [{'uid': record.uid, 'orig_bytes': value(record.orig_bytes)}
+                                for record in records if record.service == b'ssl']
+
+    def test_error(self):
+        with pytest.raises(ZeekValueError):
+            Query(CONN).where('service', '~', b'ssl')
+        with pytest.raises(ZeekValueError):
+            list(Query(CONN).where('nonexistent', '==', 1))
+        with pytest.raises(ZeekValueError):
+            list(Query(CONN).select('uid').aggregate(count=Count()))
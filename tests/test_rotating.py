@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import gzip
+import itertools
+import json
+import os
+import re
+
+import pytest
+
+from zlogging import rotating
+from zlogging._exc import WriterFormatError
+from zlogging.loader import loads_ascii, parse_ascii
+from zlogging.rotating import RotatingWriter
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestRotatingWriter:
+
+    @pytest.fixture
+    def records(self):
+        return parse_ascii(os.path.join(LOGS, 'dns.log')).data
+
+    def test_size(self, records, tmp_path):
+        filename = tmp_path / 'dns.log'
+        with RotatingWriter(filename, max_bytes=16384) as writer:
+            for record in records:
+                writer.write(record)
+
+        assert len(writer.rotated) > 1
+        assert not filename.exists()
+        parsed = []
+        for name in writer.rotated:
+            assert re.fullmatch(r'dns\.\d{4}(-\d{2}){5}(-\d+)?\.log', os.path.basename(name))
+            with open(name, 'rb') as file:
+                data = file.read()
+            assert data.startswith(b'#separator')
+            assert b'\n#path\tdns\n' in data
+            assert data.splitlines()[-1].startswith(b'#close')
+            parsed.extend(loads_ascii(data).data)
+        assert [record.tojson() for record in parsed] == [record.tojson() for record in records]
+
+    def test_interval(self, records, tmp_path, monkeypatch):
+        clock = itertools.count(1000, 10)
+        monkeypatch.setattr(rotating.time, 'time', lambda: next(clock))
+
+        with RotatingWriter(tmp_path / 'dns.log', interval=600) as writer:
+            writer.write_many(records)
+        assert len(writer.rotated) > 1
+
+        parsed = []
+        for name in writer.rotated:
+            parsed.extend(parse_ascii(name).data)
+        assert len(parsed) == len(records)
+
+    def test_compress(self, records, tmp_path):
+        with RotatingWriter(tmp_path / 'dns.log', format='json', max_bytes=16384, compress=True) as writer:
+            writer.write_many(records)
+
+        lines = []
+        for name in writer.rotated:
+            assert name.endswith('.log.gz')
+            assert not os.path.exists(name[:-3])
+            with gzip.open(name, 'rt') as file:
+                lines.extend(file.read().splitlines())
+        assert [json.loads(line) for line in lines] == [record.tojson() for record in records]
+
+    def test_format(self, tmp_path):
+        with pytest.raises(WriterFormatError):
+            RotatingWriter(tmp_path / 'dns.log', format='xml')
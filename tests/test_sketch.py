@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import bisect
+import collections
+import os
+import random
+
+import pytest
+
+from zlogging._exc import ZeekValueError
+from zlogging.loader import parse_ascii
+from zlogging.query import Query
+from zlogging.sketch import ApproxDistinct, ApproxQuantiles, HyperLogLog, SpaceSaving, TDigest, TopK
+
+CONN = os.path.join(os.path.dirname(__file__), 'logs', 'conn.log')
+
+
+class TestHyperLogLog:
+
+    def test_count(self):
+        sketch = HyperLogLog()
+        sketch.update(range(100000))
+        assert abs(sketch.count() - 100000) < 3000
+        sketch.update([None, 0, '0', b'0'])
+        assert abs(sketch.count() - 100000) < 3000
+
+        small = HyperLogLog()
+        small.update(['10.0.0.1', '10.0.0.2', '10.0.0.1'])
+        assert len(small) == 2
+
+    def test_merge(self):
+        left, right = HyperLogLog(12), HyperLogLog(12)
+        left.update(range(0, 30000))
+        right.update(range(20000, 50000))
+        merged = left.merge(HyperLogLog.from_bytes(right.to_bytes()))
+        assert abs(merged.count() - 50000) < 2500
+
+        with pytest.raises(ZeekValueError):
+            left.merge(HyperLogLog(10))
+        with pytest.raises(ZeekValueError):
+            HyperLogLog.from_bytes(TDigest().to_bytes())
+        with pytest.raises(ZeekValueError):
+            HyperLogLog(3)
+
+
+class TestSpaceSaving:
+
+    def test_top(self):
+        rng = random.Random(0)
+        values = [int(rng.paretovariate(1.0)) for _ in range(20000)]
+        counter = collections.Counter(values)
+
+        sketch = SpaceSaving(50)
+        sketch.update(values)
+        assert len(sketch) == 50 and sketch.total == len(values)
+        for key, count, error in sketch.top():
+            assert count - error <= counter[int(key)] <= count
+        assert [int(key) for key, _, _ in sketch.top(5)] == [value for value, _ in counter.most_common(5)]
+
+        weighted = SpaceSaving(2)
+        for value, weight in (('a', 1), ('b', 10), ('c', 3)):
+            weighted.add(value, weight)
+        assert weighted.top() == [(b'b', 10, 0), (b'c', 4, 1)]
+
+    def test_merge(self):
+        rng = random.Random(1)
+        values = [int(rng.paretovariate(1.0)) for _ in range(20000)]
+        counter = collections.Counter(values)
+
+        left, right = SpaceSaving(50), SpaceSaving(50)
+        left.update(values[::2])
+        right.update(values[1::2])
+        merged = left.merge(SpaceSaving.from_bytes(right.to_bytes()))
+        assert merged.total == len(values)
+        for key, count, error in merged.top():
+            assert count - error <= counter[int(key)] <= count
+        assert [int(key) for key, _, _ in merged.top(5)] == [value for value, _ in counter.most_common(5)]
+
+        with pytest.raises(ZeekValueError):
+            merged.merge(SpaceSaving(10))
+
+
+class TestTDigest:
+
+    def test_quantile(self):
+        rng = random.Random(0)
+        values = [rng.expovariate(1.0) for _ in range(50000)]
+        ordered = sorted(values)
+
+        left, right = TDigest(), TDigest()
+        left.update(values[::2])
+        right.update(values[1::2])
+        sketch = left.merge(TDigest.from_bytes(right.to_bytes()))
+        assert len(sketch) == len(values)
+        assert sketch.quantile(0) == ordered[0] and sketch.quantile(1) == ordered[-1]
+        for quantile in (0.01, 0.1, 0.5, 0.9, 0.99, 0.999):
+            rank = bisect.bisect(ordered, sketch.quantile(quantile)) / len(ordered)
+            assert abs(rank - quantile) < 0.01 * min(quantile, 1 - quantile) + 0.001
+
+        assert TDigest().quantile(0.5) is None
+        with pytest.raises(ZeekValueError):
+            sketch.quantile(2)
+
+
+class TestAggregates:
+
+    def test_query(self):
+        data = parse_ascii(CONN).data
+        (result,) = Query(CONN).aggregate(hosts=ApproxDistinct('id.resp_h'),
+                                          pairs=ApproxDistinct('id.orig_h', 'id.resp_h'),
+                                          talkers=TopK('id.orig_h', capacity=10),
+                                          duration=ApproxQuantiles('duration'))
+
+        hosts = {getattr(record, 'id.resp_h') for record in data}
+        pairs = {(getattr(record, 'id.orig_h'), getattr(record, 'id.resp_h')) for record in data}
+        assert abs(result['hosts'].count() - len(hosts)) <= 0.02 * len(hosts)
+        assert abs(result['pairs'].count() - len(pairs)) <= 0.02 * len(pairs)
+
+        counter = collections.Counter(str(getattr(record, 'id.orig_h')) for record in data)
+        (key, count, error), = result['talkers'].top(1)
+        assert (key.decode(), count, error) == (*counter.most_common(1)[0], 0)
+
+        durations = sorted(record.duration.total_seconds() for record in data if record.duration is not None)
+        assert len(result['duration']) == len(durations)
+        assert result['duration'].quantile(0.5) == pytest.approx(durations[len(durations) // 2], rel=0.05)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import ipaddress
+import os
+import random
+
+import pytest
+
+from zlogging._exc import ASCIIParserError, JSONParserWarning
+from zlogging.loader import loads_json, parse_ascii
+from zlogging.packed import PackedAddress, PackedNetwork
+from zlogging.subnet import SubnetTree
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestSubnetTree:
+
+    def test_match(self):
+        tree = SubnetTree({'10.0.0.0/8': 'internal', '10.1.0.0/16': 'dmz', '10.1.2.0/24': 'lab',
+                           '2001:db8::/32': 'v6', '0.0.0.0/0': 'any'})
+        assert len(tree) == 5
+        assert tree['10.1.2.3'] == 'lab'
+        assert tree['10.1.3.3'] == 'dmz'
+        assert tree['10.2.0.1'] == 'internal'
+        assert tree['192.168.0.1'] == 'any'
+        assert tree['2001:db8::1'] == 'v6'
+        assert tree.get('2001:db9::1') is None
+        assert '2001:db9::1' not in tree
+        assert tree.match('10.1.2.3') == PackedNetwork.from_string('10.1.2.0/24')
+
+        # addresses in any representation
+        assert tree[b'10.1.2.3'] == 'lab'
+        assert tree[ipaddress.ip_address('10.1.2.3')] == 'lab'
+        assert tree[PackedAddress.from_string('10.1.2.3')] == 'lab'
+        for address in (b'-', b'(empty)', None, '10.1.2', 42):
+            assert address not in tree
+
+        del tree['10.1.2.0/24']
+        assert tree['10.1.2.3'] == 'dmz'
+        with pytest.raises(KeyError):
+            del tree['10.1.2.0/24']
+        with pytest.raises(KeyError):
+            SubnetTree(['10.0.0.0/8'])['192.168.0.1']
+
+    def test_random(self):
+        rng = random.Random(0)
+        networks = set()
+        for _ in range(500):
+            prefixlen = rng.randint(0, 32)
+            networks.add(ipaddress.IPv4Network((rng.getrandbits(32) >> (32 - prefixlen) << (32 - prefixlen), prefixlen)))
+        for _ in range(100):
+            prefixlen = rng.randint(0, 128)
+            networks.add(ipaddress.IPv6Network((rng.getrandbits(128) >> (128 - prefixlen) << (128 - prefixlen), prefixlen)))
+
+        tree = SubnetTree({network: str(network) for network in networks})
+        assert len(tree) == len(networks)
+        assert {network.to_ipaddress() for network in tree} == networks
+        assert all(str(network.to_ipaddress()) == value for network, value in tree.items())
+
+        addresses = [ipaddress.IPv4Address(rng.getrandbits(32)) for _ in range(500)]
+        addresses += [network.network_address + 1 for network in networks if network.num_addresses > 1]
+        for address in addresses:
+            matches = [network for network in networks if network.version == address.version and address in network]
+            expected = max(matches, key=lambda network: network.prefixlen, default=None)
+            assert tree.get(address) == (None if expected is None else str(expected))
+
+    def test_row_filter(self):
+        tree = SubnetTree(['192.168.0.0/16'])
+        expected = [record.tojson() for record in parse_ascii(os.path.join(LOGS, 'conn.log')).data
+                    if getattr(record, 'id.orig_h') in ipaddress.ip_network('192.168.0.0/16')]
+        assert expected
+
+        for options in ({}, {'zero_copy': True}, {'lazy': True}):
+            info = parse_ascii(os.path.join(LOGS, 'conn.log'), row_filter={'id.orig_h': tree.__contains__}, **options)
+            assert [record.tojson() for record in info.data] == expected
+            assert not info.exit_with_error
+
+        table = parse_ascii(os.path.join(LOGS, 'conn.log'), columnar=True,
+                            row_filter={'id.orig_h': tree.__contains__}).data
+        assert table.num_rows == len(expected)
+
+        with pytest.raises(ASCIIParserError):
+            parse_ascii(os.path.join(LOGS, 'conn.log'), row_filter={'nonexistent': tree.__contains__})
+
+    def test_row_filter_json(self):
+        tree = SubnetTree(['10.0.0.0/8'])
+        data = b'{"host": "10.0.0.1"}\n{"host": "192.168.0.1"}\n{"port": 80}\n'
+        with pytest.warns(JSONParserWarning):
+            info = loads_json(data, row_filter={'host': tree.__contains__})
+        assert [record.host for record in info.data] == ['10.0.0.1']
+        with pytest.warns(JSONParserWarning):
+            table = loads_json(data, columnar=True, row_filter={'host': tree.__contains__}).data
+        assert table.num_rows == 1
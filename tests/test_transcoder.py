@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import json
+import math
+import os
+
+import pytest
+
+from zlogging import transcode
+from zlogging._exc import ASCIIParserError, JSONParserError, JSONParserWarning, WriterFormatError, ZeekValueError
+from zlogging.loader import parse_ascii
+from zlogging.model import new_model
+from zlogging.types import CountType, SetType, StringType
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+def normalise(value):
+    if isinstance(value, list):
+        return sorted(map(str, value))
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+class TestASCIIToJSON:
+
+    @pytest.mark.parametrize('name', ['conn.log', 'dns.log', 'http.log', 'ssl.log', 'x509.log'])
+    def test_values(self, name, tmp_path):
+        dst = tmp_path / 'out.json'
+        count = transcode(os.path.join(LOGS, name), dst)
+
+        records = parse_ascii(os.path.join(LOGS, name)).data
+        with open(dst) as file:
+            lines = [json.loads(line) for line in file]
+        assert count == len(records) == len(lines)
+        for record, line in zip(records, lines):
+            expected = record.tojson()
+            assert list(line) == list(expected)
+            assert {key: normalise(value) for key, value in line.items()} == \
+                {key: normalise(value) for key, value in expected.items()}
+
+    def test_escape(self, tmp_path):
+        dst = tmp_path / 'out.json'
+        transcode(os.path.join(LOGS, 'http.log'), dst)
+        with open(dst) as file:
+            uris = [json.loads(line)['uri'] for line in file]
+        assert any('\\x82es"' in uri for uri in uris)
+
+    def test_files(self, tmp_path):
+        names = [os.path.join(LOGS, name) for name in ('conn.log', 'dns.log', 'files.log')]
+        count = transcode(names, tmp_path / 'out', processes=2)
+        assert count == sum(len(parse_ascii(name).data) for name in names)
+        assert sorted(os.listdir(tmp_path / 'out')) == ['conn.json', 'dns.json', 'files.json']
+
+    def test_names(self, tmp_path):
+        for day in ('2024-01-01', '2024-01-02'):
+            (tmp_path / 'src' / day).mkdir(parents=True)
+            with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+                (tmp_path / 'src' / day / 'dns.log').write_bytes(file.read())
+        names = [tmp_path / 'src' / '2024-01-01' / 'dns.log', tmp_path / 'src' / '2024-01-02' / 'dns.log']
+
+        count = transcode(names, tmp_path / 'out', processes=1)
+        assert count == 2 * len(parse_ascii(os.path.join(LOGS, 'dns.log')).data)
+        assert sorted(os.listdir(tmp_path / 'out')) == ['2024-01-01', '2024-01-02']
+        assert os.listdir(tmp_path / 'out' / '2024-01-01') == ['dns.json']
+
+        with pytest.raises(ZeekValueError):
+            transcode([names[0], names[0]], tmp_path / 'dup')
+        with pytest.raises(ZeekValueError):
+            transcode([names[0]], tmp_path / 'src' / '2024-01-01', format='ascii')
+        assert not os.path.exists(tmp_path / 'dup')
+
+    def test_error(self, tmp_path):
+        with open(os.path.join(LOGS, 'dns.log'), 'rb') as file:
+            data = file.read().replace(b'\t35226\t', b'\t')
+        src = tmp_path / 'dns.log'
+        src.write_bytes(data)
+        with pytest.raises(ASCIIParserError):
+            transcode(src, tmp_path / 'out.json')
+        with pytest.raises(WriterFormatError):
+            transcode(src, tmp_path / 'out.json', format='xml')
+
+
+class TestJSONToASCII:
+
+    @pytest.fixture
+    def src(self, tmp_path):
+        src = tmp_path / 'conn.json'
+        transcode(os.path.join(LOGS, 'conn.log'), src)
+        return src
+
+    def test_model(self, src, tmp_path):
+        records = parse_ascii(os.path.join(LOGS, 'conn.log')).data
+        dst = tmp_path / 'conn.log'
+        assert transcode(src, dst, format='ascii', model=type(records[0])) == len(records)
+
+        info = parse_ascii(dst)
+        assert not info.exit_with_error
+        assert [record.toascii() for record in info.data] == [record.toascii() for record in records]
+
+    def test_infer(self, src, tmp_path):
+        dst = tmp_path / 'conn.log'
+        transcode(src, dst, format='ascii', infer_lines=100)
+        with open(dst) as file:
+            text = file.read()
+        assert '#path\tconn\n' in text
+        assert '#types\ttime\tstring\taddr\tcount\taddr\tcount\tstring' in text
+        assert len(parse_ascii(dst).data) == 2203
+
+    def test_keys(self, tmp_path):
+        model = new_model('test', count=CountType(), string=StringType(), set=SetType(element_type=StringType))
+        src = tmp_path / 'test.json'
+        src.write_text('{"count": 1, "string": "a\\tb\\u00e9", "set": ["x", "y"]}\n'
+                       '{"count": 2, "string": "", "set": []}\n'
+                       '{"count": 3, "extra": true}\n')
+        dst = tmp_path / 'test.log'
+        with pytest.warns(JSONParserWarning) as record:
+            transcode(src, dst, format='ascii', model=model)
+        messages = [str(warning.message) for warning in record]
+        assert any('missing fields' in message and 'set (1), string (1)' in message for message in messages)
+        assert any('extra fields' in message and 'extra (1)' in message for message in messages)
+
+        lines = [line for line in dst.read_text().splitlines() if not line.startswith('#')]
+        assert lines == ['1\ta\\x09b\\xc3\\xa9\tx,y', '2\t(empty)\t(empty)', '3\t-\t-']
+
+    def test_control(self, tmp_path):
+        model = new_model('test', string=StringType(), set=SetType(element_type=StringType))
+        src = tmp_path / 'test.json'
+        src.write_text('{"string": "a\\rb\\u0000c\\u007f", "set": ["x\\ry", 1]}\n'
+                       '{"string": "a\\nb\\u00e9", "set": ["x\\u0000"]}\n')
+        dst = tmp_path / 'test.log'
+        transcode(src, dst, format='ascii', model=model)
+
+        lines = [line for line in dst.read_text().splitlines() if not line.startswith('#')]
+        assert lines == ['a\\x0db\\x00c\\x7f\tx\\x0dy,1', 'a\\x0ab\\xc3\\xa9\tx\\x00']
+
+    def test_error(self, tmp_path):
+        src = tmp_path / 'test.json'
+        src.write_text('{"count": 1}\n[1]\n')
+        with pytest.raises(JSONParserError) as excinfo:
+            transcode(src, tmp_path / 'test.log', format='ascii')
+        assert excinfo.value.lineno == 2
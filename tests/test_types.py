@@ -3,6 +3,7 @@
 # type: ignore
 
 import sys
+import time
 from ctypes import c_int64, c_uint16, c_uint64
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, localcontext
@@ -18,7 +19,7 @@ from zlogging.enum.zeek import Host
 from zlogging.types import BaseType  # isort: split
 from zlogging.types import (AddrType, AnyType, BoolType, CountType, DoubleType, EnumType,
                             IntervalType, IntType, PortType, RecordType, SetType, StringType,
-                            SubnetType, TimeType, VectorType)
+                            SubnetType, TimeType, VectorType, get_type)
 
 if sys.version_info[:2] < (3, 7):
     from aenum import Enum
@@ -328,6 +329,11 @@ class TestDoubleType:
             ]:
                 assert field.parse(data) == expected
 
+    def test_parse_iso8601(self, field: 'DoubleType'):
+        # ISO 8601 timestamps are only valid for time fields
+        with pytest.raises(ArithmeticError):
+            field.parse(b'2020-02-09T10:54:08.761106Z')
+
     def test_tojson(self, field: 'DoubleType'):
         for data, expected in [
             (Decimal(1), 1),
@@ -393,6 +399,41 @@ class TestTimeType:
         ]:
             assert field.toascii(data) == expected
 
+    def test_toascii_precision(self, field: 'TimeType'):
+        for data in [
+            datetime(2021, 1, 25, 13, 5, 47),
+            datetime(2021, 1, 25, 13, 5, 47, 10),
+            datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc),
+        ]:
+            assert field.toascii(data) == '%.6f' % data.timestamp()
+            assert field.tojson(data) == data.timestamp()
+
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason='time.tzset() not available')
+    def test_fold(self, monkeypatch):
+        monkeypatch.setenv('TZ', 'America/New_York')
+        time.tzset()
+        try:
+            field = TimeType()
+            # the repeated hour when DST ends on 2021-11-07
+            first, second = field.parse(b'1636262400.500000'), field.parse(b'1636266000.500000')
+            assert first.replace(fold=0) == second.replace(fold=0)
+            for data, timestamp, iso8601 in [(first, '1636262400.500000', '2021-11-07T05:20:00.500000Z'),
+                                             (second, '1636266000.500000', '2021-11-07T06:20:00.500000Z')]:
+                assert field.toascii(data) == timestamp
+                assert field.tojson(data) == data.timestamp() == float(timestamp)
+                assert TimeType(iso8601=True).tojson(data) == iso8601
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_iso8601(self):
+        field = TimeType(iso8601=True)
+        now = datetime(2021, 1, 25, 13, 5, 47, 490889, tzinfo=timezone.utc)
+        assert field.tojson(now) == '2021-01-25T13:05:47.490889Z'
+        assert field.parse('2021-01-25T13:05:47.490889Z') == datetime.fromtimestamp(now.timestamp())
+        assert field.parse(b'2021-01-25T13:05:47Z') == datetime.fromtimestamp(now.replace(microsecond=0).timestamp())
+        assert field.toascii(now) == '1611579947.490889'
+
 
 class TestIntervalType:
 
@@ -436,6 +477,9 @@ class TestIntervalType:
         diff = timedelta(days=1, seconds=2, milliseconds=34, microseconds=10)
         for data, expected in [
             (diff, '86402.034010'),
+            (timedelta(microseconds=10), '0.000010'),
+            (timedelta(microseconds=-10), '-0.000010'),
+            (-diff, '-86402.034010'),
             (None, expected['unset_field']),
         ]:
             assert field.toascii(data) == expected
@@ -849,3 +893,99 @@ class TestRecordType:
 
     def test_attributes(self, field: 'RecordType'):
         assert field.element_mapping['foo'].zeek_type == 'string'
+
+
+class TestGetType:
+
+    def test_shared(self):
+        assert get_type(StringType) is get_type(StringType, '(empty)', '-', ',')
+        assert get_type(StringType) is get_type(StringType, b'(empty)', b'-', b',')
+        assert get_type(StringType) is not get_type(StringType, empty_field='[empty]')
+        assert get_type(StringType) is not get_type(CountType)
+
+    def test_container(self):
+        field = get_type(SetType, element_type=StringType)
+        assert field.element_type is get_type(StringType)
+        assert field is get_type(SetType, element_type=get_type(StringType))
+        assert field is not get_type(VectorType, element_type=StringType)
+
+    def test_kwargs(self):
+        assert get_type(EnumType, namespaces=['zeek']) is get_type(EnumType, namespaces=['zeek'])
+        assert get_type(EnumType, namespaces=['zeek']) is not get_type(EnumType, namespaces=['zeek'], bare=True)
+        assert get_type(EnumType, enum_hook={'foo': Host['ALL_HOSTS']}) is not get_type(EnumType, enum_hook={'foo': Host['ALL_HOSTS']})
+
+
+class TestContainerCache:
+
+    def test_set(self):
+        field = SetType(element_type=StringType)
+        first, second = field(b'a,b'), field(b'a,b')
+        assert first == second == {b'a', b'b'}
+        assert first is not second
+        first.add(b'c')
+        assert field(b'a,b') == {b'a', b'b'}
+
+        frozen = SetType(element_type=StringType, frozen=True)
+        assert frozen(b'a,b') is frozen(b'a,b')
+        assert frozen(b'a,b') == frozenset({b'a', b'b'})
+        assert frozen(b'(empty)') == frozenset()
+        assert frozen([b'a']) == frozenset({b'a'})
+        assert frozen.toascii(frozen(b'b,a')) == 'a,b'
+
+    def test_vector(self):
+        field = VectorType(element_type=AddrType)
+        assert field(b'127.0.0.1,::1') == [IPv4Address('127.0.0.1'), IPv6Address('::1')]
+        assert field(b'127.0.0.1,::1') is not field(b'127.0.0.1,::1')
+
+        frozen = VectorType(element_type=AddrType, frozen=True)
+        assert frozen(b'127.0.0.1,::1') is frozen(b'127.0.0.1,::1')
+        assert frozen(b'127.0.0.1,::1') == (IPv4Address('127.0.0.1'), IPv6Address('::1'))
+        assert frozen(b'(empty)') == ()
+        assert frozen.tojson(frozen(b'::1')) == ['::1']
+
+    def test_cache_size(self):
+        field = VectorType(element_type=StringType, frozen=True, cache_size=2)
+        value = field(b'a')
+        field(b'b')
+        field(b'c')
+        assert len(field._cache) <= 2
+        assert field(b'a') == value
+
+        uncached = VectorType(element_type=StringType, frozen=True, cache_size=0)
+        assert uncached(b'a,b') == (b'a', b'b')
+        assert not uncached._cache
+
+    def test_mutable(self):
+        for field in (VectorType(element_type=CountType), VectorType(element_type=PortType),
+                      VectorType(element_type=IntType)):
+            assert not field.memoised
+            first, second = list(field(b'1,2')), list(field(b'1,2'))
+            for element in first:
+                element.value += 10
+            assert sorted(element.value for element in second) == [1, 2]
+            assert sorted(element.value for element in field(b'1,2')) == [1, 2]
+
+        assert VectorType(element_type=CountType, frozen=True).memoised
+        assert VectorType(element_type=StringType).memoised
+        assert not VectorType(element_type=StringType, cache_size=0).memoised
+
+    def test_pickle(self):
+        import pickle
+        field = SetType(element_type=StringType)
+        field(b'a,b')
+        assert pickle.loads(pickle.dumps(field))._cache == {}
+
+
+def test_string_zero_copy():
+    view = memoryview(b'foo\tbar')
+    field = StringType(zero_copy=True)
+    assert field(view[:3]).obj is view.obj
+    assert field(view[:3]) == b'foo'
+    assert field.toascii(view[4:]) == 'bar'
+    assert field.tojson(view[4:]) == 'bar'
+    assert field(memoryview(b'-')) is None
+    assert field(memoryview(b'(empty)')) == b''
+
+    assert isinstance(StringType()(view[:3]), bytes)
+    assert isinstance(field(memoryview(bytearray(b'foo'))), bytes)
+
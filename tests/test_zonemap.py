@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+# type: ignore
+
+import datetime
+import os
+import shutil
+
+import pytest
+
+from zlogging._exc import ZeekValueError
+from zlogging.loader import parse, parse_ascii, parse_files, parse_json
+from zlogging.transcoder import ascii_to_json
+from zlogging.zonemap import build_zonemap, candidates, load_zonemap, parse_range, scan_zonemap
+
+LOGS = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+class TestZoneMap:
+
+    @pytest.fixture
+    def logs(self, tmp_path):
+        for name in ('conn', 'dns', 'http', 'ssl'):
+            shutil.copy(os.path.join(LOGS, f'{name}.log'), tmp_path / f'{name}.log')
+        return tmp_path
+
+    def test_scan(self, logs):
+        data = parse_ascii(logs / 'conn.log').data
+        zonemap = scan_zonemap(logs / 'conn.log', block_size=100)
+        assert [block.rows for block in zonemap.blocks[:-1]] == [100] * (len(zonemap.blocks) - 1)
+
+        summary = zonemap.summary
+        assert summary.rows == len(data)
+        assert datetime.datetime.fromtimestamp(float(summary.min['ts'])) == min(record.ts for record in data)
+        assert datetime.datetime.fromtimestamp(float(summary.max['ts'])) == max(record.ts for record in data)
+        assert summary.max['orig_pkts'] == max(record.orig_pkts.value for record in data)
+        assert summary.nulls['service'] == sum(record.service is None for record in data)
+        assert 'uid' not in summary.min
+
+        block = zonemap.blocks[0]
+        assert block.max['id.resp_p'] == max(getattr(record, 'id.resp_p').value for record in data[:100])
+
+    def test_parse_range(self, logs):
+        data = parse_ascii(logs / 'conn.log').data
+        stamps = sorted(record.ts for record in data)
+        start, end = stamps[len(stamps) // 3], stamps[len(stamps) // 2]
+
+        info = parse_range(logs / 'conn.log', (start, end), block_size=50)
+        assert [record.tojson() for record in info.data] == [record.tojson() for record in data
+                                                             if start <= record.ts < end]
+        assert load_zonemap(logs / 'conn.log').block_size == 50
+
+        info = parse(logs / 'conn.log', time_range=(start, None), ranges={'orig_bytes': (1000, 10000)})
+        assert [record.tojson() for record in info.data] == [record.tojson() for record in data
+                                                             if start <= record.ts and record.orig_bytes is not None
+                                                             and 1000 <= record.orig_bytes.value <= 10000]
+
+        info = parse(logs / 'conn.log', time_range=(0, 1))
+        assert info.data == [] and not info.exit_with_error
+        with pytest.raises(ZeekValueError):
+            parse(logs / 'conn.log', ranges={'duration': ('now', None)})
+
+    def test_json(self, logs):
+        ascii_to_json(logs / 'dns.log', logs / 'dns.json')
+        data = parse_ascii(logs / 'dns.log').data
+        stamps = sorted(record.ts for record in data)
+        start = stamps[len(stamps) // 2]
+
+        with pytest.warns(Warning):
+            expected = [record.uid for record in parse_json(logs / 'dns.json').data]
+        with pytest.warns(Warning):
+            info = parse_range(logs / 'dns.json', (start, None), block_size=10)
+        assert [record.uid for record in info.data] == [uid for uid, record in zip(expected, data) if record.ts >= start]
+
+    def test_files(self, logs):
+        build_zonemap(str(logs / '*.log'))
+        summaries = {name: load_zonemap(logs / f'{name}.log').summary for name in ('conn', 'dns', 'http', 'ssl')}
+        lower = summaries['http'].max['ts'] + 1
+        skipped = [name for name, summary in summaries.items() if summary.max['ts'] < lower]
+        assert skipped == ['http']
+
+        selected = candidates(str(logs / '*.log'), time_range=(lower, None))
+        assert selected == sorted(str(logs / f'{name}.log') for name in summaries if name not in skipped)
+        infos = parse_files(str(logs / '*.log'), time_range=(lower, None))
+        assert list(infos) == selected
+        assert all(record.ts >= datetime.datetime.fromtimestamp(float(lower))
+                   for info in infos.values() for record in info.data)
+
+        assert list(parse_files(str(logs / '*.log'))) == sorted(str(logs / f'{name}.log') for name in summaries)
+        assert candidates(str(logs / '*.log'), ranges={'nonexistent': (0, None)}) == []
+
+    def test_stale(self, logs):
+        build_zonemap(logs / 'conn.log')
+        assert load_zonemap(logs / 'conn.log') is not None
+        with open(logs / 'conn.log', 'ab') as file:
+            file.write(b'\n')
+        assert load_zonemap(logs / 'conn.log') is None
+
+        with open(logs / 'conn.log.zonemap', 'wb') as file:
+            file.write(b'garbage')
+        assert load_zonemap(logs / 'conn.log') is None
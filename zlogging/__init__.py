@@ -16,6 +16,7 @@ if os.path.exists(_extern):
 from zlogging.dumper import dump, dumps, write
 from zlogging.loader import load, loads, parse
 from zlogging.model import Model, new_model
+from zlogging.transcoder import transcode
 from zlogging.types import (AddrType, BoolType, CountType, DoubleType, EnumType, IntervalType,
                             IntType, PortType, RecordType, SetType, StringType, SubnetType,
                             TimeType, VectorType)
@@ -23,6 +24,7 @@ from zlogging.types import (AddrType, BoolType, CountType, DoubleType, EnumType,
 __all__ = [
     'write', 'dump', 'dumps',
     'parse', 'load', 'loads',
+    'transcode',
 
     'Model', 'new_model',
 
@@ -3,18 +3,25 @@
 
 import collections
 import decimal
+import functools
+import glob
 import itertools
 import math
+import os
 import textwrap
+import time
 from typing import TYPE_CHECKING, cast, overload
 
 from typing_inspect import get_args, get_origin, is_generic_type, is_typevar
 
 if TYPE_CHECKING:
     from collections import OrderedDict
+    from datetime import datetime as DateTimeType
+    from datetime import timedelta as TimeDeltaType
     from decimal import Decimal
     from io import BufferedReader as BinaryFile
-    from typing import Optional, Type, TypeVar, Union
+    from os import PathLike
+    from typing import Iterable, Optional, Type, TypeVar, Union
 
     from typing_extensions import Literal
 
@@ -22,7 +29,8 @@ if TYPE_CHECKING:
     from zlogging.model import Model
     from zlogging.types import _VariadicType
 
-__all__ = ['readline', 'decimal_toascii', 'float_toascii', 'unicode_escape', 'expand_typing']
+__all__ = ['readline', 'expand_paths', 'decimal_toascii', 'float_toascii', 'time_toseconds', 'time_toascii',
+           'time_tojson', 'time_toiso', 'interval_toascii', 'strftime_header', 'unicode_escape', 'expand_typing']
 
 
 @overload
@@ -55,6 +63,31 @@ def readline(file: 'BinaryFile', separator: 'bytes' = b'\x09',  # type: ignore[m
     return line.split(separator, maxsplit)
 
 
+def expand_paths(paths: 'Union[PathLike[str], Iterable[PathLike[str]]]') -> 'list[str]':
+    """Expand log file names.
+
+    Args:
+        paths: Log file name, or glob pattern thereof; or an iterable of
+            log file names and glob patterns.
+
+    Returns:
+        The sorted log file names of each pattern, in the order of
+        ``paths``, with duplicates removed.
+
+    """
+    if isinstance(paths, (str, bytes, os.PathLike)):
+        paths = [paths]  # type: ignore[list-item]
+
+    expanded = {}  # type: dict[str, None]
+    for path in paths:  # type: ignore[union-attr]
+        path = os.fsdecode(path)
+        if any(char in path for char in '*?['):
+            expanded.update(dict.fromkeys(sorted(glob.glob(path))))
+        else:
+            expanded[path] = None
+    return list(expanded)
+
+
 def decimal_toascii(data: 'Decimal', infinite: 'Optional[str]' = None) -> 'str':
     """Convert :obj:`decimal.Decimal` to ASCII.
 
@@ -162,12 +195,165 @@ def float_toascii(data: 'float', infinite: 'Optional[str]' = None) -> 'str':
         if infinite is None:
             return str(data)
         return infinite
-    int_part, flt_part = str(data).split('.')
+    text = repr(data)
+    if 'e' in text:
+        # NOTE: the shortest representation may use scientific notation,
+        # e.g. ``1e-05``; fall back to fixed-point notation then
+        text = '%.20f' % data  # pylint: disable=consider-using-f-string
+    int_part, flt_part = text.split('.')
     return '%s.%s%s' % (int_part,  # pylint: disable=consider-using-f-string
                         flt_part[:6],
                         '0' * (6 - len(flt_part)))
 
 
+def _microseconds_toascii(value: 'int') -> 'str':
+    """Format a number of microseconds as seconds with 6 fractional digits."""
+    if value < 0:
+        return '-%d.%06d' % divmod(-value, 1_000_000)  # pylint: disable=consider-using-f-string
+    return '%d.%06d' % divmod(value, 1_000_000)  # pylint: disable=consider-using-f-string
+
+
+@functools.lru_cache(maxsize=4096)
+def _epoch_seconds(data: 'DateTimeType', fold: 'int' = 0) -> 'int':  # pylint: disable=unused-argument
+    """Epoch seconds of a whole-second :obj:`datetime.datetime`.
+
+    Log records are mostly ordered by time, so consecutive records fall within
+    the same second and the conversion, which goes through :func:`time.mktime`
+    for naive datetimes, is served from the cache.
+
+    Note:
+        Naive datetimes compare and hash regardless of their ``fold``
+        attribute, thus ``fold`` is part of the cache key, so that the
+        repeated local times, e.g. when DST ends, are told apart.
+
+    """
+    return int(data.timestamp())
+
+
+def time_toseconds(data: 'DateTimeType') -> 'int':
+    """Convert :obj:`datetime.datetime` to whole epoch seconds.
+
+    Args:
+        data: A :obj:`datetime.datetime` object.
+
+    Returns:
+        The epoch timestamp truncated to whole seconds, same as
+        ``int(data.replace(microsecond=0).timestamp())``.
+
+    """
+    return _epoch_seconds(data.replace(microsecond=0), data.fold)
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_prefix(seconds: 'int') -> 'str':
+    """ISO 8601 date and time prefix (in UTC) of epoch seconds."""
+    return time.strftime(r'%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+
+
+def time_toascii(data: 'DateTimeType') -> 'str':
+    """Convert :obj:`datetime.datetime` to ASCII.
+
+    Args:
+        data: A :obj:`datetime.datetime` object.
+
+    Returns:
+        The epoch timestamp with exactly **6 digits** of fractional part.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> time_toascii(datetime.datetime(2021, 1, 25, 13, 5, 47, 490889, tzinfo=datetime.timezone.utc))
+            '1611579947.490889'
+
+    Note:
+        The timestamp is formatted with integer arithmetic only, and the
+        conversion of the whole seconds is cached, which is much cheaper
+        than :meth:`datetime.datetime.timestamp` and :func:`float_toascii`.
+
+    """
+    seconds = time_toseconds(data)
+    return _microseconds_toascii(seconds * 1_000_000 + data.microsecond)
+
+
+def time_tojson(data: 'DateTimeType') -> 'float':
+    """Convert :obj:`datetime.datetime` to epoch timestamp.
+
+    Args:
+        data: A :obj:`datetime.datetime` object.
+
+    Returns:
+        The epoch timestamp, same as :meth:`datetime.datetime.timestamp`.
+
+    """
+    if data.tzinfo is not None:
+        return data.timestamp()
+    return time_toseconds(data) + data.microsecond / 1e6
+
+
+def time_toiso(data: 'DateTimeType') -> 'str':
+    """Convert :obj:`datetime.datetime` to ISO 8601 format.
+
+    Args:
+        data: A :obj:`datetime.datetime` object.
+
+    Returns:
+        The ISO 8601 representation in UTC, as Zeek writes with
+        ``JSON::TS_ISO8601``.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> time_toiso(datetime.datetime(2021, 1, 25, 13, 5, 47, 490889, tzinfo=datetime.timezone.utc))
+            '2021-01-25T13:05:47.490889Z'
+
+    """
+    seconds = time_toseconds(data)
+    return '%s.%06dZ' % (_iso_prefix(seconds), data.microsecond)  # pylint: disable=consider-using-f-string
+
+
+def interval_toascii(data: 'TimeDeltaType') -> 'str':
+    """Convert :obj:`datetime.timedelta` to ASCII.
+
+    Args:
+        data: A :obj:`datetime.timedelta` object.
+
+    Returns:
+        The number of seconds with exactly **6 digits** of fractional part.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> interval_toascii(datetime.timedelta(microseconds=-10))
+            '-0.000010'
+
+    """
+    return _microseconds_toascii((data.days * 86400 + data.seconds) * 1_000_000 + data.microseconds)
+
+
+@functools.lru_cache(maxsize=1)
+def _strftime_header(seconds: 'int') -> 'str':
+    """Format epoch seconds for log headers."""
+    return time.strftime(r'%Y-%m-%d-%H-%M-%S', time.localtime(seconds))
+
+
+def strftime_header(timestamp: 'Optional[float]' = None) -> 'str':
+    """Format time for the ``#open`` and ``#close`` lines of ASCII logs.
+
+    Args:
+        timestamp: Epoch timestamp, in default the current time.
+
+    Returns:
+        The local time formatted as ``%Y-%m-%d-%H-%M-%S``.
+
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    return _strftime_header(int(timestamp))
+
+
 def unicode_escape(string: 'bytes') -> 'str':
     """Conterprocess of :meth:`bytes.decode('unicode_escape') <bytes.decode>`.
 
@@ -11,6 +11,7 @@ __all__ = [
     'enum',
     'GenericMeta',
     'cached_property',
+    'numpy',
 ]
 
 if TYPE_CHECKING:
@@ -29,6 +30,12 @@ else:
 # 3.9+ _SpecialGenericAlias
 GenericMeta = type(DefaultDict)
 
+# NumPy is an optional dependency
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
 # functools.cached_property added in 3.8
 if version_info >= (3, 8):
     from functools import cached_property
@@ -6,14 +6,16 @@ import abc
 import dataclasses
 from typing import TYPE_CHECKING
 
+from zlogging.columnar import Table
+
 __all__ = [
-    'ASCIIInfo', 'JSONInfo'
+    'ASCIIInfo', 'JSONInfo', 'BinaryInfo',
 ]
 
 if TYPE_CHECKING:
     from datetime import datetime as DateTimeType
     from os import PathLike
-    from typing import Literal
+    from typing import Any, Literal, Optional, Type, Union
 
     from zlogging.model import Model
 
@@ -31,6 +33,66 @@ class Info(metaclass=abc.ABCMeta):
     def format(self) -> str:
         """Log file format."""
 
+    def astuples(self, tuple_factory: 'Optional[Type[tuple]]' = None) -> 'list[tuple[Any, ...]]':
+        """Convert log records as tuples of field values.
+
+        Args:
+            tuple_factory: If given, ``tuple_factory`` will be used instead of
+                the :class:`~collections.namedtuple` of the data model.
+
+        Returns:
+            A :obj:`list` of tuples of field values.
+
+        See Also:
+            See :meth:`Model.astuple <zlogging.model.Model.astuple>` for more
+            information.
+
+        """
+        data = self.data  # type: ignore[attr-defined]
+        if isinstance(data, Table):
+            return [(tuple_factory or tuple)(row) for row in zip(*data.columns.values())]
+
+        records = []  # type: list[tuple[Any, ...]]
+        model = None
+        for record in data:
+            if type(record) is not model:  # pylint: disable=unidiomatic-typecheck
+                model = type(record)
+                fields = tuple(model.__fields__)
+                factory = model._namedtuple()._make if tuple_factory is None else tuple_factory  # pylint: disable=protected-access
+            records.append(factory([getattr(record, field) for field in fields]))
+        return records
+
+    def asdicts(self, dict_factory: 'Optional[Type[dict]]' = None) -> 'list[dict[str, Any]]':
+        """Convert log records as dictionaries.
+
+        Args:
+            dict_factory: If given, ``dict_factory`` will be used instead of
+                built-in :obj:`dict`.
+
+        Returns:
+            A :obj:`list` of dictionaries mapping field names to field values.
+
+        See Also:
+            See :meth:`Model.asdict <zlogging.model.Model.asdict>` for more
+            information.
+
+        """
+        if dict_factory is None:
+            dict_factory = dict
+
+        data = self.data  # type: ignore[attr-defined]
+        if isinstance(data, Table):
+            return [dict_factory(zip(data.fields, row)) for row in zip(*data.columns.values())]
+
+        records = []  # type: list[dict[str, Any]]
+        model = None
+        for record in data:
+            if type(record) is not model:  # pylint: disable=unidiomatic-typecheck
+                model = type(record)
+                fields = tuple(model.__fields__)
+            records.append(dict_factory(zip(fields, [getattr(record, field) for field in fields])))
+        return records
+
 
 @dataclasses.dataclass(frozen=True)
 class ASCIIInfo(Info):
@@ -47,7 +109,8 @@ class ASCIIInfo(Info):
         close: The value is specified in the ASCII log file
             under ``# close`` directive.
         data: The log records parsed as a :obj:`list` of
-            :class:`~zlogging.model.Model` per line.
+            :class:`~zlogging.model.Model` per line, or as a
+            :class:`~zlogging.columnar.Table` in columnar mode.
         exit_with_error: When exit with error, the ASCII log
             file doesn't has a ``# close`` directive.
 
@@ -68,8 +131,9 @@ class ASCIIInfo(Info):
     #: file under ``# close`` directive.
     close: 'DateTimeType'
     #: Log records. The log records parsed as a :obj:`list` of
-    #: :class:`~zlogging.model.Model` per line.
-    data: 'list[Model]'
+    #: :class:`~zlogging.model.Model` per line, or as a
+    #: :class:`~zlogging.columnar.Table` in columnar mode.
+    data: 'Union[list[Model], Table]'
     #: Log exit with error. When exit with error, the ASCII log
     #: file doesn't has a ``# close`` directive.
     exit_with_error: 'bool'
@@ -84,7 +148,8 @@ class JSONInfo(Info):
 
     Args:
         data: The log records parsed as a :obj:`list` of
-            :class:`~zlogging.model.Model` per line.
+            :class:`~zlogging.model.Model` per line, or as a
+            :class:`~zlogging.columnar.Table` in columnar mode.
 
     """
 
@@ -94,5 +159,45 @@ class JSONInfo(Info):
         return 'json'
 
     #: Log records. The log records parsed as a :obj:`list` of
-    #: :class:`~zlogging.model.Model` per line.
-    data: 'list[Model]'
+    #: :class:`~zlogging.model.Model` per line, or as a
+    #: :class:`~zlogging.columnar.Table` in columnar mode.
+    data: 'Union[list[Model], Table]'
+
+
+@dataclasses.dataclass(frozen=True)
+class BinaryInfo(Info):
+    """Parsed log info for binary logs.
+
+    The binary log will be stored as in this :func:`dataclass <dataclasses.dataclass>`,
+    as introduced in :pep:`557`.
+
+    Args:
+        path: The value is specified in the binary log header.
+        open: The value is specified in the binary log header.
+        close: The value is specified in the binary log trailer.
+        data: The log records parsed as a :obj:`list` of
+            :class:`~zlogging.model.Model` per line, or as a
+            :class:`~zlogging.columnar.Table` in columnar mode.
+        exit_with_error: When exit with error, the binary log
+            file doesn't has a trailer.
+
+    """
+
+    @property
+    def format(self) -> 'Literal["binary"]':
+        """Log file format."""
+        return 'binary'
+
+    #: Log path. The value is specified in the binary log header.
+    path: 'PathLike[str]'
+    #: Log open time. The value is specified in the binary log header.
+    open: 'DateTimeType'
+    #: Log close time. The value is specified in the binary log trailer.
+    close: 'DateTimeType'
+    #: Log records. The log records parsed as a :obj:`list` of
+    #: :class:`~zlogging.model.Model` per line, or as a
+    #: :class:`~zlogging.columnar.Table` in columnar mode.
+    data: 'Union[list[Model], Table]'
+    #: Log exit with error. When exit with error, the binary log
+    #: file doesn't has a trailer.
+    exit_with_error: 'bool'
@@ -40,7 +40,9 @@ class ParserError(ZeekException, ValueError):
             errmsg = f'{msg}: line {lineno}'
         else:
             errmsg = f'{msg}: line {lineno} (field {field!r})'
-        super().__init__(self, errmsg)
+        # NOTE: bypass json.JSONDecodeError.__init__ for JSONParserError,
+        # which requires the JSON document and position of the failure
+        ZeekException.__init__(self, self, errmsg)
 
         self.msg = msg
         self.field = field
@@ -72,6 +74,17 @@ class ASCIIParserError(ParserError):
     """
 
 
+class BinaryParserError(ParserError):
+    """Error when parsing binary log.
+
+    Args:
+        msg: The unformatted error message.
+        lineno: The line corresponding to the failure.
+        field: The field name where parsing failed.
+
+    """
+
+
 class WriterError(ZeekException, TypeError):
     """Error when writing logs.
 
@@ -151,6 +164,10 @@ class ASCIIParserWarning(ParserWarning):
     """Warning when parsing logs in ASCII format."""
 
 
+class BinaryParserWarning(ParserWarning):
+    """Warning when parsing logs in binary format."""
+
+
 class ZeekTypeError(ZeekException, TypeError):
     """Invalid Bro/Zeek data type."""
 
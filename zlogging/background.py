@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""Background log writer."""
+
+import contextlib
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from zlogging._exc import WriterError, WriterFormatError, ZeekValueError
+from zlogging.dumper import ASCIIWriter, JSONWriter
+from zlogging.rotating import RotatingWriter
+
+__all__ = ['BackgroundWriter']
+
+if TYPE_CHECKING:
+    from io import BufferedWriter as BinaryFile
+    from os import PathLike
+    from typing import Any, Iterable, Optional, Type, Union
+
+    from typing_extensions import Literal
+
+    from zlogging.model import Model
+
+#: Sentinel closing the background thread.
+_CLOSE = object()
+
+
+class _FileSink:
+    """Plain log file written by :class:`BackgroundWriter`.
+
+    Args:
+        filename: Log file name.
+        writer: Log writer.
+
+    """
+
+    def __init__(self, filename: 'str', writer: 'Union[ASCIIWriter, JSONWriter]') -> 'None':
+        self.filename = filename
+        self.writer = writer
+        self._file = None  # type: Optional[BinaryFile]
+
+    def write_many(self, data: 'Iterable[Model]') -> 'None':
+        """Write log records."""
+        dump_line = self.writer.dump_line
+
+        buffer = []  # type: list[str]
+        for line in data:
+            if self._file is None:
+                self._file = open(self.filename, 'wb')  # pylint: disable=consider-using-with
+                if isinstance(self.writer, ASCIIWriter):
+                    buffer.append(self.writer.dump_head(line, name=os.path.basename(self.filename)))
+            buffer.append(dump_line(line))
+
+        if buffer:
+            self._file.write(''.join(buffer).encode('ascii'))  # type: ignore[union-attr]
+
+    def flush(self, fsync: 'bool' = False) -> 'None':
+        """Flush the log file."""
+        if self._file is not None:
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> 'None':
+        """Close the log file."""
+        if self._file is not None:
+            if isinstance(self.writer, ASCIIWriter):
+                self._file.write(self.writer.dump_tail().encode('ascii'))
+            self._file.close()
+            self._file = None
+
+
+class BackgroundWriter:
+    """Log writer emitting records from a background thread.
+
+    Records are handed to the background thread through a bounded queue, so
+    that the caller never waits on the disk. The background thread drains the
+    queue by batches of up to ``batch_size`` records, which are then rendered
+    and written at once.
+
+    Args:
+        target: Log file name, or a :class:`~zlogging.rotating.RotatingWriter`
+            to write to.
+        format: Log format, i.e. ``ascii`` or ``json``.
+        queue_size: Maximum number of records waiting in the queue.
+        policy: What to do when the queue is full, either ``block`` until
+            there is room, or ``drop`` the record.
+        batch_size: Maximum number of records written per batch.
+        fsync_interval: If given, commit the log file to disk by
+            :func:`os.fsync` at most every ``fsync_interval`` seconds, and
+            within ``fsync_interval`` seconds after the last record is
+            written should no more records come, as well as on
+            :meth:`flush` and :meth:`close`.
+        writer: Writer class, in default :class:`~zlogging.dumper.ASCIIWriter`
+            or :class:`~zlogging.dumper.JSONWriter` per ``format``.
+        **kwargs: Arbitrary keyword arguments for the writer class.
+
+    Raises:
+        :exc:`WriterFormatError`: If ``format`` is not supported.
+        :exc:`ZeekValueError`: If ``policy`` is not supported.
+
+    Note:
+        The writer may be shared by multiple threads, but records can no
+        longer be written once it is closed.
+
+    Note:
+        Errors raised in the background thread, e.g. when serialising a
+        record, stop the writer and are re-raised on the next call of
+        :meth:`write`, :meth:`flush` or :meth:`close`.
+
+    Example:
+
+        .. code-block:: python
+
+            writer = BackgroundWriter('logs/enrich.log', policy='drop', fsync_interval=1)
+            writer.write(record)  # never blocks
+            ...
+            writer.close()
+
+    """
+
+    #: Maximum number of records waiting in the queue.
+    queue_size: 'int'
+    #: Policy when the queue is full.
+    policy: 'Literal["block", "drop"]'
+    #: Maximum number of records written per batch.
+    batch_size: 'int'
+    #: Interval of committing the log file to disk.
+    fsync_interval: 'Optional[float]'
+    #: Number of records written.
+    written: 'int'
+    #: Number of records dropped as the queue was full.
+    dropped: 'int'
+    #: Number of batches written.
+    batches: 'int'
+
+    @property
+    def queue_depth(self) -> 'int':
+        """Number of records waiting in the queue."""
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> 'dict[str, int]':
+        """Counters of the writer, i.e. ``queue_depth``, ``written``,
+        ``dropped`` and ``batches``."""
+        return {
+            'queue_depth': self.queue_depth,
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+        }
+
+    def __init__(self, target: 'Union[PathLike[str], RotatingWriter]', format: 'str' = 'ascii',  # pylint: disable=redefined-builtin
+                 queue_size: 'int' = 65536, policy: 'Literal["block", "drop"]' = 'block',
+                 batch_size: 'int' = 1024, fsync_interval: 'Optional[float]' = None,
+                 writer: 'Optional[Type[Union[ASCIIWriter, JSONWriter]]]' = None,
+                 **kwargs: 'Any') -> 'None':
+        if policy not in ('block', 'drop'):
+            raise ZeekValueError('unsupported policy: %s' % policy)  # pylint: disable=consider-using-f-string
+
+        if isinstance(target, RotatingWriter):
+            self._sink = target  # type: Union[RotatingWriter, _FileSink]
+        else:
+            if writer is None:
+                if format == 'ascii':
+                    writer = ASCIIWriter
+                elif format == 'json':
+                    writer = JSONWriter
+                else:
+                    raise WriterFormatError('unsupported format: %s' % format)  # pylint: disable=consider-using-f-string
+            self._sink = _FileSink(os.fspath(target), writer(**kwargs))
+
+        self.queue_size = queue_size
+        self.policy = policy
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+
+        self._queue = queue.Queue(queue_size)  # type: queue.Queue[Any]
+        self._lock = threading.Lock()
+        self._error = None  # type: Optional[BaseException]
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='zlogging-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'BackgroundWriter':
+        return self
+
+    def __exit__(self, *exc: 'Any') -> 'None':
+        self.close()
+
+    def write(self, data: 'Model') -> 'bool':
+        """Queue one-line record for writing.
+
+        Args:
+            data: Log record.
+
+        Returns:
+            If the record is queued, i.e. :data:`False` if it is dropped per
+            the ``drop`` policy.
+
+        Raises:
+            :exc:`WriterError`: If the writer is closed.
+
+        """
+        self._check()
+        if self._closed:
+            raise WriterError('write to closed writer')
+
+        if self.policy == 'block':
+            self._put(data)
+            return True
+
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def write_many(self, data: 'Iterable[Model]') -> 'int':
+        """Queue log records for writing.
+
+        Args:
+            data: Log records as an :class:`~typing.Iterable` of
+                :class:`~zlogging.model.Model` per line.
+
+        Returns:
+            Number of records queued.
+
+        """
+        return sum(self.write(line) for line in data)
+
+    def flush(self) -> 'None':
+        """Wait until all queued records are written and flushed.
+
+        Raises:
+            :exc:`WriterError`: If the queue is full while the writer is
+                closed.
+
+        """
+        self._check()
+        event = threading.Event()
+        self._put(event)
+        while not event.wait(0.1):
+            if not self._thread.is_alive():
+                break
+        self._check()
+
+    def close(self) -> 'None':
+        """Write all queued records and close the log file."""
+        if not self._closed:
+            self._closed = True
+            if self._thread.is_alive():
+                self._queue.put(_CLOSE)
+            self._thread.join()
+        self._check()
+
+    def _put(self, item: 'Any') -> 'None':
+        """Put item into the queue, waiting for room.
+
+        Args:
+            item: Log record, or control item of the background thread.
+
+        Raises:
+            :exc:`WriterError`: If the queue is full while the writer is
+                closed, or the background thread stopped.
+
+        """
+        # do not wait forever should the background thread stop
+        while True:
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                if self._closed or not self._thread.is_alive():
+                    self._check()
+                    raise WriterError('write to closed writer') from None
+                continue
+            return
+
+    def _check(self) -> 'None':
+        """Re-raise error from the background thread."""
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> 'None':
+        """Main loop of the background thread."""
+        sink = self._sink
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        fsync_interval = self.fsync_interval
+        last_fsync = time.monotonic()
+
+        # records written but not yet committed to disk
+        dirty = False
+        try:
+            while True:
+                if fsync_interval is not None and dirty:
+                    try:
+                        item = get(timeout=max(last_fsync + fsync_interval - time.monotonic(), 0))
+                    except queue.Empty:
+                        # commit the pending records once idle
+                        sink.flush(fsync=True)
+                        last_fsync = time.monotonic()
+                        dirty = False
+                        continue
+                else:
+                    item = get()
+
+                batch = []  # type: list[Model]
+                events = []  # type: list[Any]
+                while True:
+                    if item is _CLOSE or isinstance(item, threading.Event):
+                        events.append(item)
+                    else:
+                        batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    sink.write_many(batch)
+                    self.written += len(batch)
+                    self.batches += 1
+                    dirty = True
+
+                fsync = fsync_interval is not None and time.monotonic() - last_fsync >= fsync_interval
+                if events or fsync:
+                    sink.flush(fsync=fsync_interval is not None)
+                    last_fsync = time.monotonic()
+                    dirty = False
+
+                for event in events:
+                    if event is _CLOSE:
+                        sink.close()
+                        return
+                    event.set()
+        except BaseException as error:  # pylint: disable=broad-except
+            self._error = error
+            with contextlib.suppress(Exception):
+                sink.close()
+
+            # release callers blocked on the queue or waiting in flush()
+            while True:
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
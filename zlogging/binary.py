@@ -0,0 +1,682 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports,unsubscriptable-object
+"""Binary columnar log format."""
+
+import datetime
+import decimal
+import ipaddress
+import itertools
+import json
+import os
+import warnings
+import zlib
+from typing import TYPE_CHECKING
+
+from zlogging._aux import strftime_header, time_toseconds
+from zlogging._data import BinaryInfo
+from zlogging._exc import BinaryParserError, BinaryParserWarning
+from zlogging.columnar import ArrayColumn, Table, _interval, _number, _time
+from zlogging.loader import ASCIIParser
+from zlogging.model import new_model
+from zlogging.types import (AddrType, BoolType, CountType, DoubleType, EnumType, IntervalType,
+                            IntType, PortType, SetType, StringType, SubnetType, TimeType, VectorType)
+
+__all__ = [
+    'write_binary', 'dump_binary',
+    'parse_binary', 'load_binary',
+]
+
+if TYPE_CHECKING:
+    from io import BufferedReader, BufferedWriter
+    from os import PathLike
+    from typing import Any, Iterable, Optional, Type, Union
+
+    from zlogging.model import Model
+    from zlogging.types import BaseType
+
+#: Magic number of binary log files.
+MAGIC = b'ZLOGBIN\x01'
+
+#: Default number of records per row group.
+ROW_GROUP_SIZE = 65536
+
+#: Column encodings.
+_PLAIN, _DICTIONARY, _VARINT, _ZIGZAG, _DELTA, _DECIMAL, _BITMAP = range(7)
+
+#: Column flags, i.e. presence of the *unset* and *empty* bitmaps.
+_HAS_UNSET = 1
+_HAS_EMPTY = 2
+
+#: Decimal context for exact scaling of ``double`` values.
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+#: Errors raised when decoding malformed data, e.g. :exc:`UnicodeDecodeError`
+#: and :exc:`json.JSONDecodeError` as subclasses of :exc:`ValueError`.
+_DECODE_ERRORS = (zlib.error, IndexError, KeyError, TypeError, ValueError, OverflowError)
+
+
+def _write_varint(buffer: 'bytearray', value: 'int') -> 'None':
+    """Append an unsigned LEB128 varint to ``buffer``."""
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_varints(buffer: 'bytearray', values: 'Iterable[int]') -> 'None':
+    """Append unsigned LEB128 varints to ``buffer``."""
+    append = buffer.append
+    for value in values:
+        while value > 0x7F:
+            append(value & 0x7F | 0x80)
+            value >>= 7
+        append(value)
+
+
+def _read_varints(data: 'bytes', offset: 'int', count: 'int') -> 'tuple[list[int], int]':
+    """Read ``count`` unsigned LEB128 varints from ``data`` at ``offset``.
+
+    Returns:
+        The values and the offset past them.
+
+    """
+    values = []  # type: list[int]
+    append = values.append
+    for _ in range(count):
+        byte = data[offset]
+        offset += 1
+        if byte < 0x80:
+            append(byte)
+            continue
+
+        value = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        append(value)
+    return values, offset
+
+
+def _zigzag(values: 'Iterable[int]') -> 'list[int]':
+    """Map signed integers to unsigned, so that small magnitudes stay small."""
+    return [value << 1 if value >= 0 else (-value << 1) - 1 for value in values]
+
+
+def _unzigzag(values: 'Iterable[int]') -> 'list[int]':
+    """Reverse :func:`_zigzag`."""
+    return [value >> 1 ^ -(value & 1) for value in values]
+
+
+def _write_entries(buffer: 'bytearray', entries: 'Iterable[bytes]') -> 'None':
+    """Append length-prefixed byte strings to ``buffer``."""
+    for entry in entries:
+        _write_varint(buffer, len(entry))
+        buffer += entry
+
+
+def _read_entries(data: 'bytes', offset: 'int', count: 'int') -> 'tuple[list[bytes], int]':
+    """Read ``count`` length-prefixed byte strings from ``data`` at ``offset``.
+
+    Returns:
+        The byte strings and the offset past them.
+
+    """
+    entries = []  # type: list[bytes]
+    for _ in range(count):
+        (length,), offset = _read_varints(data, offset, 1)
+        entries.append(data[offset:offset + length])
+        offset += length
+    return entries, offset
+
+
+def _pack_bits(flags: 'list[bool]') -> 'bytes':
+    """Pack flags as a bitmap in little-endian bit order."""
+    bits = ''.join(['1' if flag else '0' for flag in reversed(flags)])
+    return int(bits or '0', 2).to_bytes((len(flags) + 7) >> 3, 'little')
+
+
+def _unpack_bits(data: 'bytes', offset: 'int', count: 'int') -> 'tuple[str, int]':
+    """Unpack a bitmap of ``count`` flags from ``data`` at ``offset``.
+
+    Returns:
+        The flags as a string of ``'0'`` and ``'1'``, and the offset past the
+        bitmap.
+
+    """
+    end = offset + ((count + 7) >> 3)
+    bits = format(int.from_bytes(data[offset:end], 'little'), '0%db' % count)  # pylint: disable=consider-using-f-string
+    return bits[::-1], end
+
+
+def _microseconds(value: 'Union[datetime.datetime, datetime.timedelta]') -> 'int':
+    """Convert :obj:`datetime.datetime` to epoch microseconds, or
+    :obj:`datetime.timedelta` to microseconds."""
+    if isinstance(value, datetime.timedelta):
+        return (value.days * 86400 + value.seconds) * 1_000_000 + value.microseconds
+    return time_toseconds(value) * 1_000_000 + value.microsecond
+
+
+def _decimal(value: 'decimal.Decimal') -> 'tuple[int, int]':
+    """Split finite :obj:`decimal.Decimal` as integral mantissa and exponent.
+
+    Raises:
+        :exc:`ValueError`: If ``value`` is not finite.
+
+    """
+    exponent = value.as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError('non-finite decimal: %s' % value)  # pylint: disable=consider-using-f-string
+    return int(value.scaleb(-exponent, _EXACT)), exponent
+
+
+def _addr_bytes(value: 'Any') -> 'bytes':
+    """Pack IP address, either :mod:`ipaddress` or :class:`~zlogging.packed.PackedAddress`."""
+    if isinstance(value, tuple):
+        return value.value.to_bytes(4 if value.version == 4 else 16, 'big')
+    return value.packed
+
+
+def _has_empty(type: 'BaseType') -> 'bool':  # pylint: disable=redefined-builtin
+    """Check if the data type has *empty* values, i.e. ``string``, ``set`` and ``vector``."""
+    return isinstance(type, (StringType, SetType, VectorType))
+
+
+def _storage(type: 'BaseType', value: 'Any') -> 'Any':  # pylint: disable=redefined-builtin
+    """Convert a value to the storage representation of :class:`~zlogging.columnar.ArrayColumn`."""
+    if isinstance(type, TimeType):
+        return _time(value)
+    if isinstance(type, IntervalType):
+        return _interval(value)
+    if isinstance(type, DoubleType):
+        return float(value)
+    if isinstance(type, BoolType):
+        return int(value)
+    return _number(value)
+
+
+def _encode_values(type: 'BaseType', values: 'list[Any]') -> 'tuple[int, bytearray]':  # pylint: disable=redefined-builtin
+    """Encode set and non-empty values of a column.
+
+    Args:
+        type: Field data type.
+        values: Field values.
+
+    Returns:
+        The column encoding and the encoded values. Values not fitting the
+        encoding of its data type, e.g. a non-finite ``double``, fall back to
+        the ``PLAIN`` encoding of their ASCII representations.
+
+    """
+    buffer = bytearray()
+    try:
+        if isinstance(type, (CountType, PortType)):
+            _write_varints(buffer, [_number(value) for value in values])
+            return _VARINT, buffer
+        if isinstance(type, IntType):
+            _write_varints(buffer, _zigzag([_number(value) for value in values]))
+            return _ZIGZAG, buffer
+        if isinstance(type, BoolType):
+            return _BITMAP, bytearray(_pack_bits(values))
+        if isinstance(type, DoubleType):
+            pairs = [_decimal(value) for value in values]
+            _write_varints(buffer, _zigzag(itertools.chain.from_iterable(pairs)))
+            return _DECIMAL, buffer
+        if isinstance(type, TimeType):
+            stamps = [_microseconds(value) for value in values]
+            _write_varints(buffer, _zigzag([stamp - prev for stamp, prev in zip(stamps, [0] + stamps)]))
+            return _DELTA, buffer
+        if isinstance(type, IntervalType):
+            _write_varints(buffer, _zigzag([_microseconds(value) for value in values]))
+            return _ZIGZAG, buffer
+
+        if isinstance(type, StringType):
+            keys = [bytes(value) for value in values]
+        elif isinstance(type, AddrType):
+            keys = [_addr_bytes(value) for value in values]
+        elif isinstance(type, (EnumType, SubnetType)):
+            keys = [type.toascii(value).encode('utf-8') for value in values]
+        else:
+            keys = None
+        if keys is not None:
+            index = {}  # type: dict[bytes, int]
+            codes = [index.setdefault(key, len(index)) for key in keys]
+            _write_varint(buffer, len(index))
+            _write_entries(buffer, index)
+            _write_varints(buffer, codes)
+            return _DICTIONARY, buffer
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        buffer.clear()
+
+    _write_entries(buffer, [type.toascii(value).encode('utf-8') for value in values])
+    return _PLAIN, buffer
+
+
+def _decode_values(type: 'BaseType', encoding: 'int', data: 'bytes', offset: 'int',  # pylint: disable=redefined-builtin
+                   count: 'int', storage: 'bool' = False) -> 'tuple[list[Any], int]':
+    """Decode set and non-empty values of a column.
+
+    Args:
+        type: Field data type.
+        encoding: Column encoding.
+        data: Row group data.
+        offset: Offset of the encoded values.
+        count: Number of values.
+        storage: Decode values in the storage representation of
+            :class:`~zlogging.columnar.ArrayColumn` rather than as Python
+            objects of the data type.
+
+    Returns:
+        The values and the offset past them.
+
+    Raises:
+        :exc:`BinaryParserError`: If the encoding is unknown.
+
+    """
+    if encoding == _PLAIN:
+        entries, offset = _read_entries(data, offset, count)
+        if storage:
+            return [_storage(type, type.parse(entry)) for entry in entries], offset
+        return [type.parse(entry) for entry in entries], offset
+
+    if encoding == _DICTIONARY:
+        (size,), offset = _read_varints(data, offset, 1)
+        entries, offset = _read_entries(data, offset, size)
+        codes, offset = _read_varints(data, offset, count)
+        if isinstance(type, AddrType):
+            dictionary = [type.parse(ipaddress.ip_address(entry)) for entry in entries]
+        else:
+            dictionary = [type.parse(entry) for entry in entries]
+        return [dictionary[code] for code in codes], offset
+
+    if encoding == _BITMAP:
+        bits, offset = _unpack_bits(data, offset, count)
+        return [bit == '1' for bit in bits], offset
+
+    if encoding == _DECIMAL:
+        pairs, offset = _read_varints(data, offset, count * 2)
+        pairs = _unzigzag(pairs)
+        factory = float if storage else decimal.Decimal
+        return [factory('%de%d' % pair) for pair in zip(pairs[::2], pairs[1::2])], offset  # pylint: disable=consider-using-f-string
+
+    if encoding not in (_VARINT, _ZIGZAG, _DELTA):
+        raise BinaryParserError('unknown column encoding: %d' % encoding)  # pylint: disable=consider-using-f-string
+
+    values, offset = _read_varints(data, offset, count)
+    if encoding != _VARINT:
+        values = _unzigzag(values)
+    if encoding == _DELTA:
+        values = list(itertools.accumulate(values))
+
+    if storage:
+        if isinstance(type, (TimeType, IntervalType)):
+            return [value * 1_000 for value in values], offset
+        return values, offset
+    if isinstance(type, TimeType):
+        fromtimestamp = datetime.datetime.fromtimestamp
+        return [fromtimestamp(value / 1_000_000) for value in values], offset
+    if isinstance(type, IntervalType):
+        timedelta = datetime.timedelta
+        return [timedelta(microseconds=value) for value in values], offset
+    if isinstance(type, (CountType, IntType, PortType)):
+        return list(map(type.python_type, values)), offset
+    return [type.parse(value) for value in values], offset
+
+
+def _encode_column(type: 'BaseType', values: 'list[Any]', buffer: 'bytearray') -> 'None':  # pylint: disable=redefined-builtin
+    """Encode a column chunk of a row group.
+
+    The column chunk starts with its encoding and flags, followed by the
+    bitmaps of *unset* and *empty* values if any, and then the encoded values
+    which are neither *unset* nor *empty*.
+
+    Args:
+        type: Field data type.
+        values: Field values of the row group.
+        buffer: Row group buffer.
+
+    """
+    unset = [value is None for value in values]
+    if _has_empty(type):
+        empty = [value is not None and len(value) == 0 for value in values]
+    else:
+        empty = []
+
+    flags = 0
+    if any(unset):
+        flags |= _HAS_UNSET
+    if any(empty):
+        flags |= _HAS_EMPTY
+    if flags:
+        values = [value for value, is_unset, is_empty in itertools.zip_longest(values, unset, empty)
+                  if not (is_unset or is_empty)]
+
+    encoding, data = _encode_values(type, values)
+    buffer.append(encoding)
+    buffer.append(flags)
+    if flags & _HAS_UNSET:
+        buffer += _pack_bits(unset)
+    if flags & _HAS_EMPTY:
+        buffer += _pack_bits(empty)
+    buffer += data
+
+
+def _decode_column(type: 'BaseType', data: 'bytes', offset: 'int',  # pylint: disable=redefined-builtin
+                   count: 'int', storage: 'bool' = False) -> 'tuple[list[Any], int]':
+    """Decode a column chunk of a row group.
+
+    Args:
+        type: Field data type.
+        data: Row group data.
+        offset: Offset of the column chunk.
+        count: Number of rows.
+        storage: Decode values in the storage representation of
+            :class:`~zlogging.columnar.ArrayColumn`.
+
+    Returns:
+        The field values and the offset past the column chunk.
+
+    """
+    encoding, flags = data[offset], data[offset + 1]
+    offset += 2
+    if not flags:
+        return _decode_values(type, encoding, data, offset, count, storage)
+
+    unset = empty = '0' * count
+    if flags & _HAS_UNSET:
+        unset, offset = _unpack_bits(data, offset, count)
+    if flags & _HAS_EMPTY:
+        empty, offset = _unpack_bits(data, offset, count)
+    present = count - unset.count('1') - empty.count('1')
+
+    values, offset = _decode_values(type, encoding, data, offset, present, storage)
+    iterator = iter(values)
+    empty_field = type.empty_field
+    return [None if is_unset == '1' else type.parse(empty_field) if is_empty == '1' else next(iterator)
+            for is_unset, is_empty in zip(unset, empty)], offset
+
+
+def _read_block(file: 'BufferedReader') -> 'Optional[bytes]':
+    """Read a length-prefixed block from ``file``.
+
+    Returns:
+        The block data, or :data:`None` at the end of file.
+
+    Raises:
+        :exc:`BinaryParserError`: If the block is truncated.
+
+    """
+    prefix = bytearray()
+    while True:
+        byte = file.read(1)
+        if not byte:
+            if prefix:
+                raise BinaryParserError('truncated block')
+            return None
+        prefix += byte
+        if byte[0] < 0x80:
+            break
+
+    (length,), _ = _read_varints(prefix, 0, 1)
+    data = file.read(length)
+    if len(data) < length:
+        raise BinaryParserError('truncated block')
+    return data
+
+
+def _write_block(file: 'BufferedWriter', data: 'bytes') -> 'None':
+    """Write a length-prefixed block to ``file``."""
+    prefix = bytearray()
+    _write_varint(prefix, len(data))
+    file.write(prefix)
+    file.write(data)
+
+
+def dump_binary(data: 'Iterable[Model]', file: 'BufferedWriter', name: 'Optional[str]' = None,
+                row_group_size: 'Optional[int]' = None, compresslevel: 'int' = 6) -> 'None':
+    """Write binary log file.
+
+    The binary log starts with :data:`MAGIC` and the log header, i.e. log path,
+    open time, placeholders and the fields with their Zeek types, as JSON. Log
+    records are then stored column by column in row groups of up to
+    ``row_group_size`` records, each compressed by :mod:`zlib`, where the
+    columns are encoded per their data types:
+
+    * ``count`` and ``port``: varints
+    * ``int`` and ``interval`` (in microseconds): zigzag varints
+    * ``time``: delta-encoded zigzag varints of epoch microseconds
+    * ``double``: zigzag varints of decimal mantissa and exponent
+    * ``bool``: bitmap
+    * ``string`` and ``addr`` (packed): dictionary-encoded
+    * ``enum`` and ``subnet``: dictionary-encoded ASCII representations
+    * others, e.g. ``set`` and ``vector``: plain ASCII representations
+
+    and *unset* and *empty* values are recorded in bitmaps rather than
+    encoded. The log ends with an empty block and the trailer, i.e. the log
+    close time, as JSON.
+
+    Args:
+        data: Log records as an :class:`~typing.Iterable` of
+            :class:`~zlogging.model.Model` per line.
+        file: Log file object opened in binary mode.
+        name: Log file name, which provides the log path.
+        row_group_size: Maximum number of records per row group.
+        compresslevel: :mod:`zlib` compression level.
+
+    """
+    if row_group_size is None:
+        row_group_size = ROW_GROUP_SIZE
+
+    iterator = iter(data)
+    first = next(iterator, None)
+    if first is None:
+        fields = {}  # type: dict[str, BaseType]
+        empty_field, unset_field, set_separator = '(empty)', '-', ','
+    else:
+        fields = first.fields
+        empty_field = first.empty_field.decode('ascii')
+        unset_field = first.unset_field.decode('ascii')
+        set_separator = first.set_separator.decode('ascii')
+
+    header = {
+        'path': os.path.splitext(name or '<unknown>')[0],
+        'open': strftime_header(),
+        'empty_field': empty_field,
+        'unset_field': unset_field,
+        'set_separator': set_separator,
+        'fields': list(fields),
+        'types': [type_cls.zeek_type for type_cls in fields.values()],
+    }
+    file.write(MAGIC)
+    _write_block(file, json.dumps(header).encode('ascii'))
+
+    if first is not None:
+        iterator = itertools.chain((first,), iterator)
+    while True:
+        rows = list(itertools.islice(iterator, row_group_size))
+        if not rows:
+            break
+
+        buffer = bytearray()
+        _write_varint(buffer, len(rows))
+        for field, type_cls in fields.items():
+            _encode_column(type_cls, [getattr(record, field) for record in rows], buffer)
+        _write_block(file, zlib.compress(buffer, compresslevel))
+
+    _write_block(file, b'')
+    _write_block(file, json.dumps({'close': strftime_header()}).encode('ascii'))
+
+
+def write_binary(data: 'Iterable[Model]', filename: 'PathLike[str]',
+                 row_group_size: 'Optional[int]' = None, compresslevel: 'int' = 6) -> 'None':
+    """Write binary log file.
+
+    Args:
+        data: Log records as an :class:`~typing.Iterable` of
+            :class:`~zlogging.model.Model` per line.
+        filename: Log file name.
+        row_group_size: Maximum number of records per row group.
+        compresslevel: :mod:`zlib` compression level.
+
+    See Also:
+        See :func:`dump_binary` for the layout of binary log files.
+
+    """
+    with open(filename, 'wb') as file:
+        dump_binary(data, file, name=os.path.basename(filename),
+                    row_group_size=row_group_size, compresslevel=compresslevel)
+
+
+def load_binary(file: 'BufferedReader', parser: 'Optional[Type[ASCIIParser]]' = None,
+                type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
+                enum_namespaces: 'Optional[list[str]]' = None, bare: 'bool' = False,
+                columnar: 'bool' = False, slots: 'bool' = False, frozen: 'bool' = False,
+                packed: 'bool' = False) -> 'BinaryInfo':
+    """Parse binary log file.
+
+    Args:
+        file: Log file object opened in binary mode.
+        parser: Parser class, which resolves the data types of fields as
+            declared in the log header.
+        type_hook: Bro/Zeek type parser hooks. User may customise subclasses of
+            :class:`~zlogging.types.BaseType` to modify parsing behaviours.
+        enum_namespaces: Namespaces to be loaded.
+        bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        slots: If :data:`True`, generate the data model with ``__slots__``.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            packed integers.
+
+    Returns:
+        The parsed binary log data.
+
+    Raises:
+        :exc:`BinaryParserError`: If the log file is malformed.
+
+    Warns:
+        BinaryParserWarning: If the binary log file exited with error, see
+            :attr:`BinaryInfo.exit_with_error <zlogging._data.BinaryInfo.exit_with_error>`
+            for more information.
+
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise BinaryParserError('not a binary log file')
+    block = _read_block(file)
+    if block is None:
+        raise BinaryParserError('missing log header')
+    try:
+        header = json.loads(block)
+        path = header['path']
+        open_time = datetime.datetime.strptime(header['open'], r'%Y-%m-%d-%H-%M-%S')
+        fields, type_names = header['fields'], header['types']
+        empty_field = header['empty_field'].encode('ascii')
+        unset_field = header['unset_field'].encode('ascii')
+        set_separator = header['set_separator'].encode('ascii')
+    except _DECODE_ERRORS as error:
+        raise BinaryParserError('malformed log header') from error
+
+    if parser is None:
+        parser = ASCIIParser
+    binary_parser = parser(type_hook, enum_namespaces, bare, slots=slots, frozen=frozen, packed=packed)
+    model_fields = binary_parser._get_fields(fields, type_names, empty_field, unset_field, set_separator)  # pylint: disable=protected-access
+    model_cls = new_model(path, __slots__=slots, **model_fields)
+    field_types = list(model_fields.values())
+
+    data = Table.from_fields(model_fields) if columnar else []  # type: Union[list[Model], Table]
+    if columnar:
+        storages = [isinstance(column, ArrayColumn) for column in data.columns.values()]  # type: ignore[union-attr]
+    else:
+        storages = [False] * len(field_types)
+    exit_with_error = True
+    index = 0
+    while True:
+        block = _read_block(file)
+        if block is None:
+            break
+        if not block:
+            exit_with_error = False
+            break
+        index += 1
+
+        try:
+            block = zlib.decompress(block)
+            (count,), offset = _read_varints(block, 0, 1)
+            columns = []  # type: list[list[Any]]
+            for type_cls, storage in zip(field_types, storages):
+                values, offset = _decode_column(type_cls, block, offset, count, storage)
+                columns.append(values)
+        except _DECODE_ERRORS as error:
+            raise BinaryParserError('malformed row group', lineno=index) from error
+
+        if columnar:
+            for column, values in zip(data.columns.values(), columns):  # type: ignore[union-attr]
+                if isinstance(column, ArrayColumn):
+                    column.extend_storage(values)
+                    continue
+                for value in values:
+                    column.append(value)
+        else:
+            from_converted = model_cls._from_converted  # pylint: disable=protected-access
+            data.extend(from_converted(values) for values in zip(*columns))  # type: ignore[union-attr]
+
+    if exit_with_error:
+        warnings.warn('log file exited with error', BinaryParserWarning)
+        close_time = datetime.datetime.now()
+    else:
+        block = _read_block(file)
+        if block is None:
+            raise BinaryParserError('missing log trailer')
+        try:
+            close_time = datetime.datetime.strptime(json.loads(block)['close'], r'%Y-%m-%d-%H-%M-%S')
+        except _DECODE_ERRORS as error:
+            raise BinaryParserError('malformed log trailer') from error
+
+    return BinaryInfo(
+        path=path,
+        open=open_time,
+        close=close_time,
+        data=data,
+        exit_with_error=exit_with_error,
+    )
+
+
+def parse_binary(filename: 'PathLike[str]', parser: 'Optional[Type[ASCIIParser]]' = None,
+                 type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
+                 enum_namespaces: 'Optional[list[str]]' = None, bare: 'bool' = False,
+                 columnar: 'bool' = False, slots: 'bool' = False, frozen: 'bool' = False,
+                 packed: 'bool' = False) -> 'BinaryInfo':
+    """Parse binary log file.
+
+    Args:
+        filename: Log file name.
+        parser: Parser class, which resolves the data types of fields as
+            declared in the log header.
+        type_hook: Bro/Zeek type parser hooks. User may customise subclasses of
+            :class:`~zlogging.types.BaseType` to modify parsing behaviours.
+        enum_namespaces: Namespaces to be loaded.
+        bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        slots: If :data:`True`, generate the data model with ``__slots__``.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            packed integers.
+
+    Returns:
+        The parsed binary log data.
+
+    See Also:
+        See :func:`load_binary` for more information.
+
+    """
+    with open(filename, 'rb') as file:
+        return load_binary(file, parser, type_hook, enum_namespaces, bare, columnar=columnar,
+                           slots=slots, frozen=frozen, packed=packed)
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports
+"""Persistent cache of parsed logs."""
+
+import contextlib
+import dataclasses
+import hashlib
+import ipaddress
+import mmap
+import os
+import pickle  # nosec: B403
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+from zlogging.loader import parse
+from zlogging.model import LazyModel, Model
+from zlogging.types import CountType, IntType, PortType
+
+__all__ = ['ParseCache']
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any, Optional, Union
+
+    from zlogging._data import ASCIIInfo, JSONInfo
+
+    Info = Union[ASCIIInfo, JSONInfo]
+
+#: Version of the cache entry format, bumped on incompatible changes.
+_FORMAT_VERSION = 1
+
+#: File name suffix of cache entries.
+_SUFFIX = '.pickle'
+
+#: Age in seconds after which leftover temporary files are removed.
+_STALE_TIMEOUT = 3600
+
+#: Immutable value types shared across records in cache entries.
+_INTERNABLE = frozenset([
+    bytes, str,
+    ipaddress.IPv4Address, ipaddress.IPv6Address,
+    ipaddress.IPv4Network, ipaddress.IPv6Network,
+])
+
+
+def _pack(info: 'Info') -> 'tuple[Any, ...]':
+    """Pack parsed log as a cache entry.
+
+    Records of a single (non-lazy) data model are stored as plain tuples of
+    their field values, where :mod:`ctypes` numbers are stored as :obj:`int`
+    and equal immutable values, e.g. strings and IP addresses, are stored only
+    once. Other parsed logs, e.g. in columnar mode, are pickled as is.
+
+    Args:
+        info: Parsed log.
+
+    Returns:
+        The cache entry payload.
+
+    """
+    data = info.data
+    if not isinstance(data, list) or not data:
+        return 'info', info
+
+    model = type(data[0])
+    if issubclass(model, LazyModel) or any(type(record) is not model for record in data):  # pylint: disable=unidiomatic-typecheck
+        return 'info', info
+
+    fields = list(model.__fields__)
+    numbers = frozenset(index for index, type_cls in enumerate(model.__fields__.values())
+                        if isinstance(type_cls, (CountType, IntType, PortType)))
+
+    memo = {}  # type: dict[Any, Any]
+    rows = []  # type: list[tuple[Any, ...]]
+    for record in data:
+        row = []  # type: list[Any]
+        for index, field in enumerate(fields):
+            value = getattr(record, field)
+            if value is None:
+                pass
+            elif index in numbers:
+                value = value.value
+            elif isinstance(value, memoryview):
+                value = memo.setdefault(value.tobytes(), value.tobytes())
+            elif type(value) in _INTERNABLE:
+                value = memo.setdefault(value, value)
+            row.append(value)
+        rows.append(tuple(row))
+
+    factories = tuple((index, type_cls.python_type) for index, type_cls in enumerate(model.__fields__.values())
+                      if index in numbers)
+    return 'rows', dataclasses.replace(info, data=[]), model, factories, rows
+
+
+def _unpack(payload: 'tuple[Any, ...]') -> 'Info':
+    """Unpack cache entry as parsed log.
+
+    Args:
+        payload: The cache entry payload.
+
+    Returns:
+        The parsed log.
+
+    """
+    if payload[0] == 'info':
+        return payload[1]
+
+    _, info, model, factories, rows = payload
+    from_converted = model._from_converted  # pylint: disable=protected-access
+    if not factories:
+        return dataclasses.replace(info, data=[from_converted(row) for row in rows])
+
+    records = []
+    for row in rows:
+        values = list(row)
+        for index, factory in factories:
+            value = values[index]
+            if value is not None:
+                values[index] = factory(value)
+        records.append(from_converted(values))
+    return dataclasses.replace(info, data=records)
+
+
+def _canonical(value: 'Any') -> 'Any':
+    """Describe parser option canonically for the cache key.
+
+    Data models created by :func:`~zlogging.model.new_model` are pickled
+    with an identifier specific to the process, thus they are described by
+    their names, base classes and fields, i.e. field names and Zeek types,
+    instead. Other values are kept as is, to be pickled by reference.
+
+    Args:
+        value: Parser option, or a container thereof.
+
+    Returns:
+        The canonical description of ``value``.
+
+    """
+    if isinstance(value, type) and issubclass(value, Model) and value.__dict__.get('__dynamic__', False):
+        if '__fields__' not in value.__dict__:
+            value._expand_fields()  # pylint: disable=protected-access
+        fields = tuple((field, type_cls.zeek_type, '%s.%s' % (type(type_cls).__module__, type(type_cls).__qualname__))  # pylint: disable=consider-using-f-string
+                       for field, type_cls in value.__fields__.items())
+        return 'new_model', value.__name__, _canonical(value.__bases__[0]), '__attrmap__' in value.__dict__, fields
+    if isinstance(value, dict):
+        return dict, tuple((key, _canonical(data)) for key, data in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_canonical, value))
+    return value
+
+
+class ParseCache:
+    """On-disk cache of parsed logs.
+
+    Parsed logs are stored in ``directory``, keyed by the identity of the log
+    file, i.e. its real path, size, modification time and inode, together
+    with the parser options, so that a changed log file or different options
+    will never be served from a stale entry. Entries are stored in a compact
+    pickled form which is restored without running the field data types
+    again, and are evicted in least recently used order once the cache grows
+    beyond ``max_size``.
+
+    Args:
+        directory: Cache directory, created if not exists. In default
+            ``~/.cache/zlogging``.
+        max_size: Maximum total size of cache entries in bytes, or
+            :data:`None` for unbounded.
+        mmap: Load cache entries through :mod:`mmap` rather than reading
+            them into memory first.
+
+    Note:
+        The cache is safe for concurrent use by multiple processes: entries
+        are written to a temporary file and atomically renamed into place,
+        so that readers never see a partial entry, and an entry removed or
+        corrupted underneath is simply treated as a miss.
+
+    Warning:
+        Cache entries are :mod:`pickle` data and are trusted when loaded.
+        Never point the cache to a directory writable by others.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> cache = ParseCache('/var/cache/zlogging', max_size=4 << 30)
+            >>> info = parse('conn.log', cache=cache)  # parsed and stored
+            >>> info = parse('conn.log', cache=cache)  # loaded from cache
+
+    """
+
+    #: Cache directory.
+    directory: 'str'
+    #: Maximum total size of cache entries in bytes.
+    max_size: 'Optional[int]'
+    #: Load cache entries through :mod:`mmap`.
+    mmap: 'bool'
+    #: Number of cache hits.
+    hits: 'int'
+    #: Number of cache misses.
+    misses: 'int'
+
+    def __init__(self, directory: 'Optional[PathLike[str]]' = None, max_size: 'Optional[int]' = 1 << 30,  # pylint: disable=redefined-outer-name
+                 mmap: 'bool' = False) -> 'None':
+        if directory is None:
+            directory = os.path.join(os.path.expanduser('~'), '.cache', 'zlogging')  # type: ignore[assignment]
+        self.directory = os.fspath(directory)  # type: ignore[arg-type]
+        self.max_size = max_size
+        self.mmap = mmap
+
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(directory={self.directory!r}, max_size={self.max_size!r})'
+
+    def key(self, filename: 'PathLike[str]', *args: 'Any', **kwargs: 'Any') -> 'Optional[str]':
+        """Compute cache key of a log file.
+
+        Args:
+            filename: Log file name.
+            *args: Positional arguments for :func:`~zlogging.loader.parse`.
+            **kwargs: Keyword arguments for :func:`~zlogging.loader.parse`.
+
+        Returns:
+            The cache key, or :data:`None` if the parser options cannot be
+            keyed, e.g. a :obj:`lambda` in ``type_hook``.
+
+        """
+        path = os.path.realpath(filename)
+        stat = os.stat(path)
+        identity = (_FORMAT_VERSION, path, stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_dev,
+                    _canonical(args), _canonical(sorted(kwargs.items())))
+        try:
+            data = pickle.dumps(identity, protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return hashlib.sha1(data).hexdigest()  # nosec: B324
+
+    def parse(self, filename: 'PathLike[str]', *args: 'Any', **kwargs: 'Any') -> 'Info':
+        """Parse log file through the cache.
+
+        Args:
+            filename: Log file name.
+            *args: See :func:`~zlogging.loader.parse` for more information.
+            **kwargs: See :func:`~zlogging.loader.parse` for more information.
+
+        Returns:
+            The parsed log, loaded from the cache if possible.
+
+        """
+        key = self.key(filename, *args, **kwargs)
+        if key is not None:
+            info = self.get(key)
+            if info is not None:
+                self.hits += 1
+                return info
+        self.misses += 1
+
+        info = parse(filename, *args, **kwargs)
+        # do not store should the log file change while being parsed
+        if key is not None and key == self.key(filename, *args, **kwargs):
+            with contextlib.suppress(OSError):
+                self.put(key, info)
+        return info
+
+    def get(self, key: 'str') -> 'Optional[Info]':
+        """Load parsed log from the cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The parsed log, or :data:`None` if not cached.
+
+        """
+        path = os.path.join(self.directory, key + _SUFFIX)
+        try:
+            with open(path, 'rb') as file:
+                if self.mmap:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        payload = pickle.loads(buffer)  # nosec: B301
+                else:
+                    payload = pickle.loads(file.read())  # nosec: B301
+            info = _unpack(payload)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # corrupted or incompatible entry
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            return None
+
+        # mark as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return info
+
+    def put(self, key: 'str', info: 'Info') -> 'None':
+        """Store parsed log in the cache.
+
+        Args:
+            key: Cache key.
+            info: Parsed log.
+
+        """
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(_pack(info), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, os.path.join(self.directory, key + _SUFFIX))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp)
+            raise
+        self.evict()
+
+    def evict(self) -> 'None':
+        """Evict least recently used entries until the cache fits in
+        ``max_size``, and remove leftover temporary files."""
+        now = time.time()
+        entries = []  # type: list[tuple[float, int, str]]
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith('.tmp'):
+                    if now - stat.st_mtime > _STALE_TIMEOUT:
+                        with contextlib.suppress(OSError):
+                            os.remove(entry.path)
+                    continue
+                if entry.name.endswith(_SUFFIX):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        if self.max_size is None:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+    def clear(self) -> 'None':
+        """Remove all entries from the cache."""
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(_SUFFIX):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(entry.path)
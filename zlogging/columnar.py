@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports,unsubscriptable-object
+"""Columnar storage for parsed logs."""
+
+import abc
+import array
+import collections
+import datetime
+from typing import TYPE_CHECKING
+
+from zlogging._compat import numpy
+from zlogging._exc import ZeekValueError
+from zlogging.types import (AddrType, BoolType, CountType, DoubleType, EnumType, IntervalType,
+                            IntType, PortType, StringType, SubnetType, TimeType)
+
+__all__ = [
+    'Table', 'Column',
+    'ArrayColumn', 'DictionaryColumn', 'ObjectColumn',
+    'new_column',
+]
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+    from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+    from zlogging.types import BaseType
+
+#: Nanoseconds per second.
+NANOSECONDS = 1_000_000_000
+
+
+def _nanoseconds(data: 'bytes') -> 'int':
+    """Convert an ASCII decimal number of seconds to integral nanoseconds.
+
+    Args:
+        data: ASCII representation of seconds, e.g. ``b'1581245648.761106'``.
+
+    Returns:
+        The number of nanoseconds, without going through :obj:`float`.
+
+    """
+    negative = data.startswith(b'-')
+    if negative:
+        data = data[1:]
+    int_part, _, flt_part = data.partition(b'.')
+    value = int(int_part or b'0') * NANOSECONDS + int(flt_part[:9].ljust(9, b'0'))
+    return -value if negative else value
+
+
+def _bool(data: 'bytes') -> 'int':
+    """Convert an ASCII ``bool`` field to ``0``/``1``."""
+    if data == b'T':
+        return 1
+    if data == b'F':
+        return 0
+    raise ZeekValueError('invalid bool value: %s' % data.decode('ascii'))  # pylint: disable=consider-using-f-string
+
+
+def _number(value: 'Any') -> 'int':
+    """Unwrap :mod:`ctypes` numbers as returned by numeric data types."""
+    return int(getattr(value, 'value', value))
+
+
+def _time(value: 'Union[float, datetime.datetime]') -> 'int':
+    """Convert epoch seconds or :obj:`datetime.datetime` to nanoseconds."""
+    if isinstance(value, datetime.datetime):
+        value = value.timestamp()
+    return round(value * 1_000_000) * 1_000
+
+
+def _interval(value: 'Union[float, datetime.timedelta]') -> 'int':
+    """Convert seconds or :obj:`datetime.timedelta` to nanoseconds."""
+    if isinstance(value, datetime.timedelta):
+        return ((value.days * 86400 + value.seconds) * 1_000_000 + value.microseconds) * 1_000
+    return round(value * 1_000_000) * 1_000
+
+
+class Column(metaclass=abc.ABCMeta):
+    """Typed column of a parsed log.
+
+    Args:
+        name: Field name.
+        type: Field data type.
+
+    Note:
+        Unset values are recorded in :attr:`validity`, a bitmap with one bit
+        per row in little-endian bit order (as the Apache Arrow format), where
+        a set bit marks a valid (i.e. *not unset*) value.
+
+    """
+    #: Field name.
+    name: 'str'
+    #: Field data type.
+    type: 'BaseType'
+    #: Validity bitmap.
+    validity: 'bytearray'
+
+    @property
+    @abc.abstractmethod
+    def values(self) -> 'Any':
+        """Column values, as a NumPy array if NumPy is available."""
+
+    @property
+    def null_count(self) -> 'int':
+        """Number of unset values."""
+        return self._null_count
+
+    def __init__(self, name: 'str', type: 'BaseType') -> 'None':  # pylint: disable=redefined-builtin
+        self.name = name
+        self.type = type
+        self.validity = bytearray()
+
+        self._length = 0
+        self._null_count = 0
+
+    def __len__(self) -> 'int':
+        return self._length
+
+    def __iter__(self) -> 'Iterator[Any]':
+        for index in range(self._length):
+            yield self[index]
+
+    def __getitem__(self, index: 'int') -> 'Any':
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('column index out of range')
+        if not self.is_valid(index):
+            return None
+        return self._get(index)
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(name={self.name!r}, type={self.type}, length={self._length})'
+
+    def is_valid(self, index: 'int') -> 'bool':
+        """Check if the value at ``index`` is set.
+
+        Args:
+            index: Row index.
+
+        Returns:
+            :data:`False` if the value is *unset*.
+
+        """
+        return bool(self.validity[index >> 3] >> (index & 7) & 1)
+
+    def tolist(self) -> 'list[Any]':
+        """Convert column as a :obj:`list`, with :data:`None` for unset values."""
+        return list(self)
+
+    def _mark(self, valid: 'bool') -> 'None':
+        """Record validity of the next row."""
+        index = self._length
+        if index & 7 == 0:
+            self.validity.append(0)
+        if valid:
+            self.validity[-1] |= 1 << (index & 7)
+        else:
+            self._null_count += 1
+        self._length = index + 1
+
+    @abc.abstractmethod
+    def _get(self, index: 'int') -> 'Any':
+        """Fetch a valid value at ``index``."""
+
+    @abc.abstractmethod
+    def append_null(self) -> 'None':
+        """Append an unset value."""
+
+    @abc.abstractmethod
+    def append(self, value: 'Any') -> 'None':
+        """Append a Python value, e.g. as loaded from a JSON log.
+
+        Args:
+            value: Field value, :data:`None` for unset values.
+
+        """
+
+    @abc.abstractmethod
+    def append_raw(self, data: 'bytes') -> 'None':
+        """Append a raw field from an ASCII log.
+
+        Args:
+            data: Field data as in the log file.
+
+        Raises:
+            :exc:`ValueError`: If ``data`` is malformed.
+
+        """
+
+
+class ArrayColumn(Column):
+    """Column of fixed-width numbers backed by :mod:`array`.
+
+    Args:
+        name: Field name.
+        type: Field data type.
+        typecode: :mod:`array` type code of the storage.
+        dtype: NumPy data type of :attr:`values`.
+        from_raw: Converter from raw ASCII field.
+        from_value: Converter from Python value.
+
+    Note:
+        ``time`` and ``interval`` values are stored as integral nanoseconds,
+        which shall be presented as ``datetime64[ns]`` and ``timedelta64[ns]``
+        respectively in :attr:`values` when NumPy is available.
+
+    """
+    #: Column storage.
+    array: 'array.array'
+    #: NumPy data type of :attr:`values`.
+    dtype: 'str'
+
+    @property
+    def values(self) -> 'Any':
+        """Column values, as a NumPy array if NumPy is available.
+
+        The NumPy array shares memory with :attr:`array`. Unset values are
+        stored as ``0`` and must be checked against :attr:`validity`.
+
+        """
+        if numpy is None:
+            return self.array
+        if not self.array:
+            return numpy.zeros(0, dtype=self.dtype)
+        return numpy.frombuffer(self.array, dtype=self.dtype)
+
+    def __init__(self, name: 'str', type: 'BaseType', typecode: 'str', dtype: 'str',  # pylint: disable=redefined-builtin
+                 from_raw: 'Callable[[bytes], Any]', from_value: 'Callable[[Any], Any]') -> 'None':
+        super().__init__(name, type)
+
+        self.array = array.array(typecode)
+        self.dtype = dtype
+
+        self._from_raw = from_raw
+        self._from_value = from_value
+        self._unset_field = type.unset_field
+
+    def _get(self, index: 'int') -> 'Any':
+        """Fetch a valid value at ``index``."""
+        return self.array[index]
+
+    def append_null(self) -> 'None':
+        """Append an unset value."""
+        self.array.append(0)
+        self._mark(False)
+
+    def append(self, value: 'Any') -> 'None':
+        """Append a Python value, e.g. as loaded from a JSON log.
+
+        Args:
+            value: Field value, :data:`None` for unset values.
+
+        """
+        if value is None:
+            return self.append_null()
+        self.array.append(self._from_value(value))
+        return self._mark(True)
+
+    def append_raw(self, data: 'bytes') -> 'None':
+        """Append a raw field from an ASCII log.
+
+        Args:
+            data: Field data as in the log file.
+
+        """
+        if data == self._unset_field:
+            return self.append_null()
+        self.array.append(self._from_raw(data))
+        return self._mark(True)
+
+    def extend_storage(self, values: 'Iterable[Any]') -> 'None':
+        """Append values already in the storage representation.
+
+        This is the bulk path for decoders producing the same representation,
+        e.g. :func:`~zlogging.binary.load_binary`, where values are stored
+        as is without conversion.
+
+        Args:
+            values: Column storage values, :data:`None` for unset values.
+
+        """
+        append = self.array.append
+        mark = self._mark
+        for value in values:
+            if value is None:
+                append(0)
+                mark(False)
+            else:
+                append(value)
+                mark(True)
+
+
+class DictionaryColumn(Column):
+    """Dictionary-encoded column.
+
+    Each distinct raw value is converted by the data type only once, and
+    rows refer to the decoded value by its index in :attr:`dictionary`.
+
+    Args:
+        name: Field name.
+        type: Field data type.
+
+    """
+    #: Decoded distinct values.
+    dictionary: 'list[Any]'
+    #: Dictionary index of each row.
+    codes: 'array.array'
+
+    @property
+    def values(self) -> 'Any':
+        """Dictionary codes, as a NumPy array if NumPy is available.
+
+        Unset values are stored as ``0`` and must be checked against
+        :attr:`validity`.
+
+        """
+        if numpy is None:
+            return self.codes
+        if not self.codes:
+            return numpy.zeros(0, dtype='uint32')
+        return numpy.frombuffer(self.codes, dtype='uint32')
+
+    def __init__(self, name: 'str', type: 'BaseType') -> 'None':  # pylint: disable=redefined-builtin
+        super().__init__(name, type)
+
+        self.dictionary = []
+        self.codes = array.array('I')
+
+        self._index = {}  # type: dict[Any, int]
+        self._unset_field = type.unset_field
+
+    def _get(self, index: 'int') -> 'Any':
+        """Fetch a valid value at ``index``."""
+        return self.dictionary[self.codes[index]]
+
+    def _encode(self, key: 'Any') -> 'Optional[int]':
+        """Look up dictionary code of ``key``, converting it on first sight."""
+        code = self._index.get(key)
+        if code is None:
+            value = self.type(key)
+            if value is None:
+                return None
+            code = self._index[key] = len(self.dictionary)
+            self.dictionary.append(value)
+        return code
+
+    def append_null(self) -> 'None':
+        """Append an unset value."""
+        self.codes.append(0)
+        self._mark(False)
+
+    def append(self, value: 'Any') -> 'None':
+        """Append a Python value, e.g. as loaded from a JSON log.
+
+        Args:
+            value: Field value, :data:`None` for unset values.
+
+        """
+        if value is None:
+            return self.append_null()
+        code = self._encode(value)
+        if code is None:
+            return self.append_null()
+        self.codes.append(code)
+        return self._mark(True)
+
+    def append_raw(self, data: 'bytes') -> 'None':
+        """Append a raw field from an ASCII log.
+
+        Args:
+            data: Field data as in the log file.
+
+        """
+        if data == self._unset_field:
+            return self.append_null()
+        return self.append(data)
+
+
+class ObjectColumn(Column):
+    """Column of arbitrary Python objects.
+
+    Args:
+        name: Field name.
+        type: Field data type.
+
+    """
+    #: Column storage.
+    objects: 'list[Any]'
+
+    @property
+    def values(self) -> 'Any':
+        """Column values, as a NumPy ``object`` array if NumPy is available."""
+        if numpy is None:
+            return self.objects
+        values = numpy.empty(len(self.objects), dtype=object)
+        values[:] = self.objects
+        return values
+
+    def __init__(self, name: 'str', type: 'BaseType') -> 'None':  # pylint: disable=redefined-builtin
+        super().__init__(name, type)
+        self.objects = []
+
+    def _get(self, index: 'int') -> 'Any':
+        """Fetch a valid value at ``index``."""
+        return self.objects[index]
+
+    def append_null(self) -> 'None':
+        """Append an unset value."""
+        self.objects.append(None)
+        self._mark(False)
+
+    def append(self, value: 'Any') -> 'None':
+        """Append a Python value, e.g. as loaded from a JSON log.
+
+        Args:
+            value: Field value, :data:`None` for unset values.
+
+        """
+        if value is None:
+            return self.append_null()
+        value = self.type(value)
+        self.objects.append(value)
+        return self._mark(value is not None)
+
+    def append_raw(self, data: 'bytes') -> 'None':
+        """Append a raw field from an ASCII log.
+
+        Args:
+            data: Field data as in the log file.
+
+        """
+        return self.append(data)
+
+
+def new_column(name: 'str', type: 'BaseType') -> 'Column':  # pylint: disable=redefined-builtin
+    """Create a column with the appropriate storage for a data type.
+
+    Args:
+        name: Field name.
+        type: Field data type.
+
+    Returns:
+        Created column.
+
+    Note:
+        The storage is selected as following:
+
+        * ``count`` and ``port``: ``array('Q')``
+        * ``int``: ``array('q')``
+        * ``double``: ``array('d')``
+        * ``bool``: ``array('B')``
+        * ``time`` and ``interval``: ``array('q')`` of nanoseconds
+        * ``string``, ``addr``, ``subnet`` and ``enum``: dictionary-encoded
+        * others, e.g. ``set`` and ``vector``: :obj:`list` of objects
+
+    """
+    if isinstance(type, (CountType, PortType)):
+        return ArrayColumn(name, type, 'Q', 'uint64', int, _number)
+    if isinstance(type, IntType):
+        return ArrayColumn(name, type, 'q', 'int64', int, _number)
+    if isinstance(type, DoubleType):
+        return ArrayColumn(name, type, 'd', 'float64', float, float)
+    if isinstance(type, BoolType):
+        return ArrayColumn(name, type, 'B', 'bool', _bool, int)
+    if isinstance(type, TimeType):
+        return ArrayColumn(name, type, 'q', 'datetime64[ns]', _nanoseconds, _time)
+    if isinstance(type, IntervalType):
+        return ArrayColumn(name, type, 'q', 'timedelta64[ns]', _nanoseconds, _interval)
+    if isinstance(type, (StringType, AddrType, SubnetType, EnumType)):
+        return DictionaryColumn(name, type)
+    return ObjectColumn(name, type)
+
+
+class Table:
+    """Columnar table of a parsed log.
+
+    Args:
+        columns: Columns of the table.
+
+    Example:
+        Tables are created by parsers in columnar mode, e.g.:
+
+        .. code-block:: python
+
+            >>> info = parse_ascii('conn.log', columnar=True)
+            >>> info.data['id.resp_p'].values
+            array([  53,  443, ...], dtype=uint64)
+
+    """
+    #: Columns of the table.
+    columns: 'OrderedDict[str, Column]'
+
+    @property
+    def fields(self) -> 'OrderedDict[str, BaseType]':
+        """Fields of the table."""
+        return collections.OrderedDict((name, column.type) for name, column in self.columns.items())
+
+    @property
+    def num_rows(self) -> 'int':
+        """Number of rows."""
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __init__(self, columns: 'Iterable[Column]') -> 'None':
+        self.columns = collections.OrderedDict((column.name, column) for column in columns)
+
+    @classmethod
+    def from_fields(cls, fields: 'OrderedDict[str, BaseType]') -> 'Table':
+        """Create an empty table.
+
+        Args:
+            fields: Field names and their data types.
+
+        Returns:
+            Created table.
+
+        """
+        return cls(new_column(name, type_cls) for name, type_cls in fields.items())
+
+    def __len__(self) -> 'int':
+        return self.num_rows
+
+    def __iter__(self) -> 'Iterator[str]':
+        return iter(self.columns)
+
+    def __contains__(self, name: 'str') -> 'bool':
+        return name in self.columns
+
+    def __getitem__(self, name: 'str') -> 'Column':
+        return self.columns[name]
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(columns={list(self.columns)!r}, num_rows={self.num_rows})'
+
+    def to_pydict(self) -> 'dict[str, list[Any]]':
+        """Convert table as a :obj:`dict` mapping field names to value lists."""
+        return {name: column.tolist() for name, column in self.columns.items()}
@@ -2,12 +2,12 @@
 """Bro/Zeek log dumper."""
 
 import abc
+import io
 import json
 import os
-import time
 from typing import TYPE_CHECKING
 
-from zlogging._aux import unicode_escape
+from zlogging._aux import strftime_header, unicode_escape
 from zlogging._exc import ASCIIWriterError, JSONWriterError, WriterFormatError
 from zlogging.model import Model
 
@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 if TYPE_CHECKING:
+    from io import BufferedWriter as BinaryFile
     from io import TextIOWrapper as TextFile
     from json import JSONEncoder
     from os import PathLike
@@ -140,6 +141,12 @@ class JSONWriter(BaseWriter):
     Args:
         encoder: JSON encoder class.
 
+    Note:
+        With the default :class:`~json.JSONEncoder`, records are rendered by
+        an encoder compiled once per data model; a custom ``encoder`` falls
+        back to :func:`json.dumps` on
+        :meth:`Model.tojson <zlogging.model.Model.tojson>`.
+
     """
     #: JSON encoder class.
     encoder: 'Type[JSONEncoder]'
@@ -187,10 +194,7 @@ class JSONWriter(BaseWriter):
             :exc:`JSONWriterError`: If failed to serialise ``data`` as JSON.
 
         """
-        try:
-            return file.write('%s\n' % json.dumps(data.tojson(), cls=self.encoder))  # pylint: disable=consider-using-f-string
-        except TypeError as error:
-            raise JSONWriterError(str(error), lineno=lineno) from error
+        return file.write(self.dump_line(data, lineno=lineno))
 
     def dump_file(self, data: 'Optional[Iterable[Model]]' = None) -> 'str':
         """Serialise records to a log line.
@@ -222,6 +226,8 @@ class JSONWriter(BaseWriter):
 
         """
         try:
+            if self.encoder is json.JSONEncoder:
+                return type(data)._encoder('json')(data)  # pylint: disable=protected-access
             return '%s\n' % json.dumps(data.tojson(), cls=self.encoder)  # pylint: disable=consider-using-f-string
         except TypeError as error:
             raise JSONWriterError(str(error), lineno=lineno) from error
@@ -235,8 +241,18 @@ class ASCIIWriter(BaseWriter):
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        buffer_size: Number of characters to gather before writing to the
+            log file, in default :attr:`buffer_size`.
+
+    Note:
+        Log files can be opened either in text mode or in binary mode, in
+        the latter case the rendered lines are encoded by batches of
+        ``buffer_size``, which avoids the per-write overhead of the text
+        layer.
 
     """
+    #: Default number of characters to gather before writing to the log file.
+    buffer_size: 'int' = 1048576
     #: Field separator when writing log lines.
     separator: 'bytes'
     str_separator: 'str'
@@ -256,7 +272,11 @@ class ASCIIWriter(BaseWriter):
         return 'ascii'
 
     def __init__(self, separator: 'Optional[AnyStr]' = None, empty_field: 'Optional[AnyStr]' = None,
-                 unset_field: 'Optional[AnyStr]' = None, set_separator: 'Optional[AnyStr]' = None) -> 'None':
+                 unset_field: 'Optional[AnyStr]' = None, set_separator: 'Optional[AnyStr]' = None,
+                 buffer_size: 'Optional[int]' = None) -> 'None':
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+
         if separator is None:
             self.separator = b'\x09'
             self.str_separator = '\x09'
@@ -297,11 +317,11 @@ class ASCIIWriter(BaseWriter):
             self.set_separator = set_separator
             self.str_set_separator = set_separator.decode('ascii')
 
-    def write_file(self, file: 'TextFile', data: 'Iterable[Model]') -> 'int':
+    def write(self, filename: 'PathLike[str]', data: 'Iterable[Model]') -> 'int':
         """Write log file.
 
         Args:
-            file: Log file object opened in text mode.
+            filename: Log file name.
             data: Log records as an :class:`~typing.Iterable` of
                 :class:`~zlogging.model.Model` per line.
 
@@ -309,25 +329,57 @@ class ASCIIWriter(BaseWriter):
             The file offset after writing.
 
         """
-        if data:
-            line = next(data)  # type: ignore[call-overload]
-            self.write_head(file, line)
-            self.write_line(file, line, lineno=1)
-            lineno_start = 2
-        else:
-            self.write_head(file)
-            lineno_start = 1
+        with open(filename, 'wb') as file:
+            offset = self.write_file(file, data)
+        return offset
+
+    def write_file(self, file: 'Union[TextFile, BinaryFile]', data: 'Iterable[Model]') -> 'int':
+        """Write log file.
 
-        for index, line in enumerate(data, start=lineno_start):
-            self.write_line(file, line, lineno=index)
+        Args:
+            file: Log file object opened in text or binary mode.
+            data: Log records as an :class:`~typing.Iterable` of
+                :class:`~zlogging.model.Model` per line.
+
+        Returns:
+            The file offset after writing.
+
+        Note:
+            ``data`` can be any iterable, which will be consumed lazily. The
+            rendered lines are gathered and written to ``file`` every
+            :attr:`buffer_size` characters.
+
+        """
+        data_iter = iter(data)
+        line = next(data_iter, None)  # type: Optional[Model]
+        self.write_head(file, line)
+
+        if line is not None:
+            dump_line = self.dump_line
+            buffer_size = self.buffer_size
+
+            buffer = [dump_line(line, lineno=1)]
+            size = len(buffer[0])
+            for index, line in enumerate(data_iter, start=2):
+                text = dump_line(line, lineno=index)
+                buffer.append(text)
+
+                size += len(text)
+                if size >= buffer_size:
+                    self._write_buffer(file, ''.join(buffer))
+                    buffer.clear()
+                    size = 0
+
+            if buffer:
+                self._write_buffer(file, ''.join(buffer))
         return self.write_tail(file)
 
-    def write_line(self, file: 'TextFile', data: 'Model',
+    def write_line(self, file: 'Union[TextFile, BinaryFile]', data: 'Model',
                    lineno: 'Optional[int]' = 0) -> 'int':
         """Write log line as one-line record.
 
         Args:
-            file: Log file object opened in text mode.
+            file: Log file object opened in text or binary mode.
             data: Log record.
             lineno: Line number of current line.
 
@@ -338,59 +390,60 @@ class ASCIIWriter(BaseWriter):
             :exc:`ASCIIWriterError`: If failed to serialise ``data`` as ASCII.
 
         """
-        try:
-            return file.write('%s\n' % self.str_separator.join(data.toascii().values()))  # pylint: disable=consider-using-f-string
-        except TypeError as error:
-            raise ASCIIWriterError(str(error), lineno=lineno) from error
+        return self._write_buffer(file, self.dump_line(data, lineno=lineno))
 
-    def write_head(self, file: 'TextFile', data: 'Optional[Model]' = None) -> 'int':
+    def write_head(self, file: 'Union[TextFile, BinaryFile]', data: 'Optional[Model]' = None) -> 'int':
         """Write header fields of ASCII log file.
 
         Args:
-            file: Log file object opened in text mode.
+            file: Log file object opened in text or binary mode.
             data: Log record.
 
         Returns:
             The file offset after writing.
 
         """
-        separator = self.str_separator
-        if data is None:
-            empty_field = self.str_empty_field
-            unset_field = self.str_unset_field
-            set_separator = self.str_set_separator
+        name = getattr(file, 'name', None)
+        if not isinstance(name, str):
+            name = None
+        return self._write_buffer(file, self.dump_head(data, name=name))
 
-            fields = ''
-            types = ''
-        else:
-            empty_field = data.empty_field.decode('ascii')
-            unset_field = data.unset_field.decode('ascii')
-            set_separator = data.set_separator.decode('ascii')
+    def write_tail(self, file: 'Union[TextFile, BinaryFile]') -> 'int':
+        """Write trailing fields of ASCII log file.
 
-            line_fields = data.fields
-            fields = separator.join(line_fields.keys())
-            types = separator.join(field.zeek_type for field in line_fields.values())
+        Args:
+            file: Log file object opened in text or binary mode.
 
-        file.write('#separator %s\n' % unicode_escape(self.separator))  # pylint: disable=consider-using-f-string
-        file.write('#set_separator%s%s\n' % (separator, set_separator))  # pylint: disable=consider-using-f-string
-        file.write('#empty_field%s%s\n' % (separator, empty_field))  # pylint: disable=consider-using-f-string
-        file.write('#unset_field%s%s\n' % (separator, unset_field))  # pylint: disable=consider-using-f-string
-        file.write('#path%s%s\n' % (separator, os.path.splitext(file.name)[0]))  # pylint: disable=consider-using-f-string
-        file.write('#open%s%s\n' % (separator, time.strftime(r'%Y-%m-%d-%H-%M-%S')))  # pylint: disable=consider-using-f-string
-        file.write('#fields%s%s\n' % (separator, fields))  # pylint: disable=consider-using-f-string
-        return file.write('#types%s%s\n' % (separator, types))  # pylint: disable=consider-using-f-string
+        Returns:
+            The file offset after writing.
 
-    def write_tail(self, file: 'TextFile') -> 'int':
-        """Write trailing fields of ASCII log file.
+        """
+        return self._write_buffer(file, self.dump_tail())
+
+    @staticmethod
+    def _write_buffer(file: 'Union[TextFile, BinaryFile]', buffer: 'str') -> 'int':
+        """Write rendered buffer to log file.
 
         Args:
-            file: Log file object opened in text mode.
+            file: Log file object opened in text or binary mode.
+            buffer: Rendered log string.
 
         Returns:
             The file offset after writing.
 
         """
-        return file.write('#close%s%s\n' % (self.str_separator, time.strftime(r'%Y-%m-%d-%H-%M-%S')))  # pylint: disable=consider-using-f-string
+        if isinstance(file, io.TextIOBase):
+            return file.write(buffer)
+
+        mode = getattr(file, 'mode', None)
+        if isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or (isinstance(mode, str) and 'b' in mode):
+            return file.write(buffer.encode('ascii'))
+
+        # file-like objects of unknown mode, e.g. wrappers of text files
+        try:
+            return file.write(buffer)  # type: ignore[arg-type]
+        except TypeError:
+            return file.write(buffer.encode('ascii'))  # type: ignore[arg-type]
 
     def dump_file(self, data: 'Optional[Iterable[Model]]' = None, name: 'Optional[str]' = None) -> 'str':  # pylint: disable=arguments-differ
         """Serialise records to a log line.
@@ -404,17 +457,14 @@ class ASCIIWriter(BaseWriter):
             The converted log string.
 
         """
-        if data:
-            data_iter = iter(data)
-            line = next(data_iter)
+        data_iter = iter(() if data is None else data)
+        line = next(data_iter, None)  # type: Optional[Model]
 
-            buffer = self.dump_head(line, name=name)
+        buffer = self.dump_head(line, name=name)
+        if line is not None:
             buffer += self.dump_line(line, lineno=1)
-
             buffer += ''.join(self.dump_line(line, lineno=index)
                               for index, line in enumerate(data_iter, start=2))
-        else:
-            buffer = self.dump_head(name=name)
 
         buffer += self.dump_tail()
         return buffer
@@ -434,7 +484,7 @@ class ASCIIWriter(BaseWriter):
 
         """
         try:
-            return '%s\n' % self.str_separator.join(data.toascii().values())  # pylint: disable=consider-using-f-string
+            return type(data)._encoder('ascii', self.str_separator)(data)  # pylint: disable=protected-access
         except TypeError as error:
             raise ASCIIWriterError(str(error), lineno=lineno) from error
 
@@ -474,7 +524,7 @@ class ASCIIWriter(BaseWriter):
         buffer += '#empty_field%s%s\n' % (separator, empty_field)  # pylint: disable=consider-using-f-string
         buffer += '#unset_field%s%s\n' % (separator, unset_field)  # pylint: disable=consider-using-f-string
         buffer += '#path%s%s\n' % (separator, os.path.splitext(name)[0])  # pylint: disable=consider-using-f-string
-        buffer += '#open%s%s\n' % (separator, time.strftime(r'%Y-%m-%d-%H-%M-%S'))  # pylint: disable=consider-using-f-string
+        buffer += '#open%s%s\n' % (separator, strftime_header())  # pylint: disable=consider-using-f-string
         buffer += '#fields%s%s\n' % (separator, fields)  # pylint: disable=consider-using-f-string
         buffer += '#types%s%s\n' % (separator, types)  # pylint: disable=consider-using-f-string
         return buffer
@@ -486,7 +536,7 @@ class ASCIIWriter(BaseWriter):
             The converted log string.
 
         """
-        return '#close%s%s\n' % (self.str_separator, time.strftime(r'%Y-%m-%d-%H-%M-%S'))  # pylint: disable=consider-using-f-string
+        return '#close%s%s\n' % (self.str_separator, strftime_header())  # pylint: disable=consider-using-f-string
 
 
 def write_json(data: 'Iterable[Model]', filename: 'PathLike[str]', writer: 'Optional[Type[JSONWriter]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
@@ -554,7 +604,8 @@ def dumps_json(data: 'Optional[Iterable[Model]]' = None, writer: 'Optional[Type[
 def write_ascii(data: 'Iterable[Model]', filename: 'PathLike[str]',  # pylint: disable=unused-argument,keyword-arg-before-vararg
                 writer: 'Optional[Type[ASCIIWriter]]' = None, separator: 'Optional[AnyStr]' = None,
                 empty_field: 'Optional[AnyStr]' = None, unset_field: 'Optional[AnyStr]' = None,
-                set_separator: 'Optional[AnyStr]' = None, *args: 'Any', **kwargs: 'Any') -> 'None':
+                set_separator: 'Optional[AnyStr]' = None, buffer_size: 'Optional[int]' = None,
+                *args: 'Any', **kwargs: 'Any') -> 'None':
     """Write ASCII log file.
 
     Args:
@@ -566,6 +617,8 @@ def write_ascii(data: 'Iterable[Model]', filename: 'PathLike[str]',  # pylint: d
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        buffer_size: Number of characters to gather before writing to the
+            log file.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -573,25 +626,29 @@ def write_ascii(data: 'Iterable[Model]', filename: 'PathLike[str]',  # pylint: d
     if writer is None:
         writer = ASCIIWriter
     ascii_writer = writer(separator=separator, empty_field=empty_field,
-                          unset_field=unset_field, set_separator=set_separator)
+                          unset_field=unset_field, set_separator=set_separator,
+                          buffer_size=buffer_size)
     ascii_writer.write(filename, data)
 
 
-def dump_ascii(data: 'Iterable[Model]', file: 'TextFile',  # pylint: disable=unused-argument,keyword-arg-before-vararg
+def dump_ascii(data: 'Iterable[Model]', file: 'Union[TextFile, BinaryFile]',  # pylint: disable=unused-argument,keyword-arg-before-vararg
                writer: 'Optional[Type[ASCIIWriter]]' = None, separator: 'Optional[AnyStr]' = None,
                empty_field: 'Optional[AnyStr]' = None, unset_field: 'Optional[AnyStr]' = None,
-               set_separator: 'Optional[AnyStr]' = None, *args: 'Any', **kwargs: 'Any') -> 'None':
+               set_separator: 'Optional[AnyStr]' = None, buffer_size: 'Optional[int]' = None,
+               *args: 'Any', **kwargs: 'Any') -> 'None':
     """Write ASCII log file.
 
     Args:
         data: Log records as an :class:`~typing.Iterable` of
             :class:`~zlogging.model.Model` per line.
-        file: Log file object opened in text mode.
+        file: Log file object opened in text or binary mode.
         writer: Writer class.
         separator: Field separator when writing log lines.
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        buffer_size: Number of characters to gather before writing to the
+            log file.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -599,7 +656,8 @@ def dump_ascii(data: 'Iterable[Model]', file: 'TextFile',  # pylint: disable=unu
     if writer is None:
         writer = ASCIIWriter
     ascii_writer = writer(separator=separator, empty_field=empty_field,
-                          unset_field=unset_field, set_separator=set_separator)
+                          unset_field=unset_field, set_separator=set_separator,
+                          buffer_size=buffer_size)
     ascii_writer.write_file(file, data)
 
 
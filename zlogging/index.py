@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports
+"""Bloom filter index of log files."""
+
+import contextlib
+import ctypes
+import enum
+import gzip
+import hashlib
+import json
+import math
+import os
+import struct
+from typing import TYPE_CHECKING
+
+from zlogging._aux import expand_paths
+from zlogging._exc import ZeekValueError
+from zlogging.transcoder import _read_header
+
+__all__ = [
+    'BloomFilter', 'build_index', 'load_index', 'candidates', 'search',
+    'DEFAULT_COLUMNS',
+]
+
+if TYPE_CHECKING:
+    from io import BufferedReader as BinaryFile
+    from os import PathLike
+    from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+    Paths = Union[PathLike[str], Iterable[PathLike[str]]]
+
+#: Columns indexed in default.
+DEFAULT_COLUMNS = ('uid', 'id.orig_h', 'id.resp_h', 'query', 'host')
+
+#: Magic bytes of index sidecar files.
+MAGIC = b'ZLOGIDX\x01'
+
+#: File name suffix of index sidecar files.
+SUFFIX = '.bloom'
+
+
+def _key(value: 'Any') -> 'bytes':
+    """Normalise value as index key.
+
+    Values are keyed as written in ASCII logs, e.g. IP addresses by their
+    string representation and :mod:`ctypes` numbers by their values.
+
+    Args:
+        value: Value to be keyed.
+
+    Returns:
+        The index key.
+
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if isinstance(value, ctypes._SimpleCData):  # pylint: disable=protected-access
+        value = value.value
+    elif isinstance(value, enum.Enum):
+        value = value.name
+    return str(value).encode('utf-8')
+
+
+class BloomFilter:
+    """Bloom filter of byte strings.
+
+    Membership tests never give false negatives, and give false positives
+    with probability about ``error_rate`` once ``capacity`` distinct values
+    have been added. The bit positions are derived from :func:`hashlib.blake2b`
+    digests, thus are stable across processes and platforms.
+
+    Args:
+        capacity: Expected number of distinct values.
+        error_rate: Expected false positive rate.
+
+    Raises:
+        :exc:`ZeekValueError`: If ``error_rate`` is not in ``(0, 1)``.
+
+    """
+
+    #: Number of bits.
+    size: 'int'
+    #: Number of hash functions.
+    hashes: 'int'
+    #: Bit array.
+    bits: 'bytearray'
+
+    def __init__(self, capacity: 'int', error_rate: 'float' = 0.01) -> 'None':
+        if not 0 < error_rate < 1:
+            raise ZeekValueError('invalid error rate: %r' % error_rate)  # pylint: disable=consider-using-f-string
+        capacity = max(capacity, 1)
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = max(size + -size % 8, 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray(self.size // 8)
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(size={self.size}, hashes={self.hashes})'
+
+    def _positions(self, key: 'bytes') -> 'Iterator[int]':
+        """Compute bit positions of a key by double hashing."""
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        for index in range(self.hashes):
+            yield (first + index * second) % size
+
+    def add(self, value: 'Any') -> 'None':
+        """Add value to the filter.
+
+        Args:
+            value: Value to be added, see :func:`search` for how values
+                are compared.
+
+        """
+        bits = self.bits
+        for position in self._positions(_key(value)):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: 'Any') -> 'bool':
+        bits = self.bits
+        return all(bits[position >> 3] >> (position & 7) & 1 for position in self._positions(_key(value)))
+
+    def to_bytes(self) -> 'bytes':
+        """Serialise the bit array.
+
+        Returns:
+            The bit array, to be restored by :meth:`from_bytes` with
+            :attr:`hashes`.
+
+        """
+        return bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: 'bytes', hashes: 'int') -> 'BloomFilter':
+        """Restore filter from its bit array.
+
+        Args:
+            data: Bit array as returned by :meth:`to_bytes`.
+            hashes: Number of hash functions.
+
+        Returns:
+            The restored filter.
+
+        """
+        self = cls.__new__(cls)
+        self.size = len(data) * 8
+        self.hashes = hashes
+        self.bits = bytearray(data)
+        return self
+
+
+@contextlib.contextmanager
+def _open(filename: 'PathLike[str]') -> 'Iterator[BinaryFile]':
+    """Open log file in binary mode, decompressing ``.gz`` files."""
+    if os.fspath(filename).endswith('.gz'):
+        with gzip.open(filename, 'rb') as file:
+            yield file  # type: ignore[misc]
+    else:
+        with open(filename, 'rb') as file:
+            yield file
+
+
+def _scan(file: 'BinaryFile', columns: 'Sequence[str]') -> 'tuple[list[str], Iterator[list[list[bytes]]]]':
+    """Scan raw values of columns without parsing log records.
+
+    Args:
+        file: Log file object opened in binary mode.
+        columns: Candidate columns.
+
+    Returns:
+        The columns present in the log, and the iterator of their keys per
+        record, where ``set`` and ``vector`` fields have a key per element
+        and *empty* or *unset* fields have none.
+
+    """
+    if file.peek(1)[:1] != b'#':  # type: ignore[attr-defined]
+        return list(columns), _scan_json(file, columns)
+
+    header = _read_header(file)
+    fields = header['fields']
+    present = [column for column in columns if column in fields]
+    indices = [(fields.index(column), header['types'][fields.index(column)].startswith(('set[', 'vector[')))
+               for column in present]
+    return present, _scan_ascii(file, header, indices)
+
+
+def _scan_ascii(file: 'BinaryFile', header: 'dict[str, Any]',
+                indices: 'list[tuple[int, bool]]') -> 'Iterator[list[list[bytes]]]':
+    """Scan raw values of ASCII log records."""
+    separator = header['separator']
+    set_separator = header['set_separator']
+    placeholders = (header['empty_field'], header['unset_field'])
+    for line in file:
+        if line.startswith(b'#'):
+            break
+        values = line.rstrip(b'\r\n').split(separator)
+        keys = []  # type: list[list[bytes]]
+        for index, container in indices:
+            value = values[index] if index < len(values) else placeholders[1]
+            if value in placeholders:
+                keys.append([])
+            elif container:
+                keys.append(value.split(set_separator))
+            else:
+                keys.append([value])
+        yield keys
+
+
+def _scan_json(file: 'BinaryFile', columns: 'Sequence[str]') -> 'Iterator[list[list[bytes]]]':
+    """Scan values of JSON log records."""
+    for line in file:
+        if not line.strip():
+            continue
+        data = json.loads(line)  # type: dict[str, Any]
+        keys = []  # type: list[list[bytes]]
+        for column in columns:
+            value = data.get(column)
+            if value is None:
+                keys.append([])
+            elif isinstance(value, list):
+                keys.append([_key(element) for element in value if element is not None])
+            else:
+                keys.append([_key(value)])
+        yield keys
+
+
+def _count_lines(filename: 'PathLike[str]') -> 'int':
+    """Count lines of log file, as the upper bound of distinct values."""
+    count = 0
+    with _open(filename) as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            count += chunk.count(b'\n')
+    return count
+
+
+def _sidecar(filename: 'PathLike[str]', suffix: 'str') -> 'str':
+    """Get file name of index sidecar."""
+    return os.fspath(filename) + suffix
+
+
+def _identity(filename: 'PathLike[str]') -> 'dict[str, int]':
+    """Identify log file by its size and modification time."""
+    stat = os.stat(filename)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _build(filename: 'str', columns: 'Sequence[str]', error_rate: 'float', suffix: 'str') -> 'str':
+    """Build index sidecar of a log file."""
+    identity = _identity(filename)
+    capacity = _count_lines(filename)
+
+    with _open(filename) as file:
+        present, records = _scan(file, columns)
+        filters = [BloomFilter(capacity, error_rate) for _ in present]
+        count = 0
+        for keys in records:
+            count += 1
+            for bloom, values in zip(filters, keys):
+                for value in values:
+                    bloom.add(value)
+
+    header = dict(identity, records=count, columns={})  # type: dict[str, Any]
+    for column, bloom in zip(present, filters):
+        header['columns'][column] = {'size': bloom.size, 'hashes': bloom.hashes}
+    data = json.dumps(header).encode('utf-8')
+
+    path = _sidecar(filename, suffix)
+    temp = path + '.tmp'
+    try:
+        with open(temp, 'wb') as file:
+            file.write(MAGIC)
+            file.write(struct.pack('>I', len(data)))
+            file.write(data)
+            for bloom in filters:
+                file.write(bloom.to_bytes())
+        os.replace(temp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp)
+        raise
+    return path
+
+
+def build_index(paths: 'Paths', columns: 'Sequence[str]' = DEFAULT_COLUMNS, error_rate: 'float' = 0.01,
+                suffix: 'str' = SUFFIX, rebuild: 'bool' = False) -> 'list[str]':
+    """Build Bloom filter index sidecars of log files.
+
+    For each log file, a sidecar file named after the log file with
+    ``suffix`` is written, holding a :class:`BloomFilter` per indexed column
+    present in the log. The raw values are scanned without parsing log
+    records, and each element of ``set`` and ``vector`` fields is indexed.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`. ASCII and
+            JSON logs are supported, optionally compressed with :mod:`gzip`.
+        columns: Columns to be indexed.
+        error_rate: False positive rate of the Bloom filters.
+        suffix: File name suffix of the sidecars.
+        rebuild: If :data:`True`, rebuild sidecars even if up to date.
+
+    Returns:
+        File names of the sidecars.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> build_index('/var/log/zeek/2020-02-*/conn.*.log.gz')
+            >>> search('/var/log/zeek/2020-02-*/conn.*.log.gz', 'CiUwQ23juyBEWCz75j')
+            ['/var/log/zeek/2020-02-09/conn.18:00:00-19:00:00.log.gz']
+
+    """
+    sidecars = []  # type: list[str]
+    for filename in expand_paths(paths):
+        if not rebuild and load_index(filename, suffix=suffix) is not None:
+            sidecars.append(_sidecar(filename, suffix))
+            continue
+        sidecars.append(_build(filename, columns, error_rate, suffix))
+    return sidecars
+
+
+def load_index(filename: 'PathLike[str]', suffix: 'str' = SUFFIX) -> 'Optional[dict[str, BloomFilter]]':
+    """Load Bloom filter index sidecar of a log file.
+
+    Args:
+        filename: Log file name.
+        suffix: File name suffix of the sidecar.
+
+    Returns:
+        The Bloom filters by column names, or :data:`None` if the sidecar
+        does not exist, is corrupted, or is stale, i.e. the log file has
+        changed since the sidecar was built.
+
+    """
+    try:
+        with open(_sidecar(filename, suffix), 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                return None
+            (length,) = struct.unpack('>I', file.read(4))
+            header = json.loads(file.read(length))
+            if any(header[key] != value for key, value in _identity(filename).items()):
+                return None
+
+            filters = {}  # type: dict[str, BloomFilter]
+            for column, info in header['columns'].items():
+                data = file.read(info['size'] // 8)
+                if len(data) != info['size'] // 8:
+                    return None
+                filters[column] = BloomFilter.from_bytes(data, info['hashes'])
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    return filters
+
+
+def candidates(paths: 'Paths', value: 'Any', columns: 'Optional[Sequence[str]]' = None,
+               suffix: 'str' = SUFFIX) -> 'list[str]':
+    """Find log files which may contain a value, per their index sidecars.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`.
+        value: Value to find, see :func:`search` for more information.
+        columns: Columns to look up. In default, all indexed columns.
+        suffix: File name suffix of the sidecars.
+
+    Returns:
+        Log files whose sidecars may contain ``value`` in any of ``columns``,
+        or whose sidecars are missing or stale.
+
+    """
+    found = []  # type: list[str]
+    for filename in expand_paths(paths):
+        filters = load_index(filename, suffix=suffix)
+        if filters is None:
+            found.append(filename)
+            continue
+        if columns is None:
+            selected = list(filters.values())
+        else:
+            selected = [filters[column] for column in columns if column in filters]
+        if any(value in bloom for bloom in selected):
+            found.append(filename)
+    return found
+
+
+def search(paths: 'Paths', value: 'Any', columns: 'Optional[Sequence[str]]' = None,
+           suffix: 'str' = SUFFIX) -> 'list[str]':
+    """Find log files which contain a value.
+
+    The index sidecars are consulted first, see :func:`candidates`, and only
+    the log files which may contain ``value`` are scanned to rule out false
+    positives of the Bloom filters.
+
+    Values are compared as written in ASCII logs: :obj:`str` values are
+    encoded as UTF-8, and other values, e.g. :mod:`ipaddress` objects, by
+    their string representations.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`.
+        value: Value to find, e.g. a connection ``uid``, an IP address or a
+            DNS query name.
+        columns: Columns to look up. In default, :data:`DEFAULT_COLUMNS`.
+        suffix: File name suffix of the sidecars.
+
+    Returns:
+        Log files containing ``value`` in any of ``columns``.
+
+    """
+    if columns is None:
+        columns = DEFAULT_COLUMNS
+    key = _key(value)
+
+    found = []  # type: list[str]
+    for filename in candidates(paths, value, columns, suffix=suffix):
+        with _open(filename) as file:
+            _, records = _scan(file, columns)
+            if any(key in values for keys in records for values in keys):
+                found.append(filename)
+    return found
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports
+"""Streaming hash join of logs."""
+
+import contextlib
+import os
+import pickle  # nosec: B403
+import sys
+import tempfile
+from typing import TYPE_CHECKING
+
+from zlogging._exc import ZeekValueError
+from zlogging.query import _open_records
+
+__all__ = ['join']
+
+if TYPE_CHECKING:
+    from typing import IO, Any, Iterable, Iterator, Optional, Sequence, Type
+
+    from typing_extensions import Literal
+
+    from zlogging.model import Model
+    from zlogging.query import Getter, Source
+
+    Row = tuple[Any, ...]
+    Pair = tuple[dict[str, Any], Optional[dict[str, Any]]]
+
+#: Number of partitions the spilled build and probe sides are split into.
+_PARTITIONS = 32
+
+#: Maximum depth of repartitioning a partition still too large for memory.
+_MAX_DEPTH = 4
+
+#: Number of entries pickled at once into a partition file.
+_BATCH = 1024
+
+#: Estimated memory overhead per hash table entry in bytes.
+_OVERHEAD = 120
+
+
+def _keys(value: 'Any') -> 'tuple[Any, ...]':
+    """Get the join keys of a field value.
+
+    Args:
+        value: Field value.
+
+    Returns:
+        No key if *unset*; each distinct element for ``set`` and ``vector``
+        values; or the value itself otherwise.
+
+    """
+    if value is None:
+        return ()
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return tuple(dict.fromkeys(bytes(element) if isinstance(element, memoryview) else element
+                                   for element in value if element is not None))
+    if isinstance(value, memoryview):
+        return (bytes(value),)
+    return (value,)
+
+
+def _sizeof(row: 'Row') -> 'int':
+    """Estimate memory size of a projected row."""
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+
+
+def _size(source: 'Source') -> 'Optional[int]':
+    """Estimate size of a source, or :data:`None` if unknown."""
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return os.path.getsize(source)
+    if hasattr(source, '__len__'):
+        return len(source)  # type: ignore[arg-type]
+    return None
+
+
+class _Partitions:
+    """Temporary files of entries partitioned by join keys.
+
+    Args:
+        directory: Directory of the temporary files.
+        level: Partitioning level, salting the hash of join keys so that
+            a partition can be split again.
+
+    """
+
+    def __init__(self, directory: 'Optional[str]', level: 'int') -> 'None':
+        self.directory = directory
+        self.level = level
+        self.files = [None] * _PARTITIONS  # type: list[Optional[IO[bytes]]]
+        self.buffers = [[] for _ in range(_PARTITIONS)]  # type: list[list[Any]]
+
+    def add(self, key: 'Any', entry: 'Any') -> 'None':
+        """Add an entry to the partition of ``key``."""
+        index = hash((self.level, key)) % _PARTITIONS
+        buffer = self.buffers[index]
+        buffer.append(entry)
+        if len(buffer) >= _BATCH:
+            self._flush(index)
+
+    def _flush(self, index: 'int') -> 'None':
+        """Write buffered entries of a partition to its file."""
+        file = self.files[index]
+        if file is None:
+            file = self.files[index] = tempfile.TemporaryFile(dir=self.directory, suffix='.zlogging')  # pylint: disable=consider-using-with
+        pickle.dump(self.buffers[index], file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.buffers[index] = []
+
+    def read(self, index: 'int') -> 'Iterator[Any]':
+        """Read and release entries of a partition."""
+        yield from self.buffers[index]
+        self.buffers[index] = []
+
+        file = self.files[index]
+        if file is None:
+            return
+        try:
+            file.seek(0)
+            while True:
+                try:
+                    batch = pickle.load(file)  # nosec: B301
+                except EOFError:
+                    break
+                yield from batch
+        finally:
+            file.close()
+            self.files[index] = None
+
+    def close(self) -> 'None':
+        """Remove all partition files."""
+        for file in self.files:
+            if file is not None:
+                file.close()
+        self.files = [None] * _PARTITIONS
+        self.buffers = [[] for _ in range(_PARTITIONS)]
+
+
+def _resolve(getters: 'dict[str, Getter]', key: 'str',
+             fields: 'Optional[Sequence[str]]') -> 'tuple[Getter, tuple[str, ...], list[Getter]]':
+    """Resolve getters of the join key and projected fields of a side."""
+    if fields is None:
+        fields = tuple(getters)
+    for field in (key, *fields):
+        if field not in getters:
+            raise ZeekValueError('unknown field: %s' % field)  # pylint: disable=consider-using-f-string
+    return getters[key], tuple(fields), [getters[field] for field in fields]
+
+
+def join(left: 'Source', right: 'Source', on: 'str', right_on: 'Optional[str]' = None,
+         how: 'Literal["inner", "left"]' = 'inner', left_fields: 'Optional[Sequence[str]]' = None,
+         right_fields: 'Optional[Sequence[str]]' = None, memory_limit: 'int' = 256 << 20,
+         spill_dir: 'Optional[str]' = None, left_model: 'Optional[Type[Model]]' = None,
+         right_model: 'Optional[Type[Model]]' = None, **kwargs: 'Any') -> 'Iterator[Pair]':
+    """Join records of two logs on equal keys.
+
+    A hash table is built over the projected fields of the *build* side and
+    probed with the records of the other side as streamed, so that only the
+    build side is ever held in memory. For inner joins the smaller side, by
+    file size or length, is built; for left joins it is always ``right``.
+    Only the join keys and the projected fields are converted, and the
+    projected fields of the probe side only for matched records.
+
+    Should the hash table grow beyond ``memory_limit``, both sides are
+    partitioned by their join keys into temporary files, which are then
+    joined partition by partition, i.e. a *grace* hash join.
+
+    Args:
+        left: Left log, as the ``source`` of :class:`~zlogging.query.Query`.
+        right: Right log, as the ``source`` of :class:`~zlogging.query.Query`.
+        on: Join key field of ``left``. *Unset* keys never match; and each
+            element of a ``set`` or ``vector`` key, e.g. ``conn_uids`` of
+            ``files.log``, matches on its own.
+        right_on: Join key field of ``right``. In default, same as ``on``.
+        how: Join type, ``'inner'`` or ``'left'``.
+        left_fields: Projected fields of ``left``. In default, all fields.
+        right_fields: Projected fields of ``right``. In default, all fields.
+        memory_limit: Estimated memory budget of the hash table in bytes.
+        spill_dir: Directory of temporary files when spilled.
+        left_model: Field declarations of ``left``, if it is a JSON log.
+        right_model: Field declarations of ``right``, if it is a JSON log.
+        **kwargs: Keyword arguments for :class:`~zlogging.loader.ASCIIParser`.
+
+    Yields:
+        Pairs of projected ``left`` and ``right`` fields as :obj:`dict`, one
+        per pair of matched keys. For left joins, unmatched ``left`` records
+        are paired with :data:`None`.
+
+    Raises:
+        :exc:`ZeekValueError`: If ``how`` is not supported; or the join
+            refers to unknown fields.
+
+    Note:
+        Keys are compared as parsed, e.g. :obj:`bytes` for ``string``
+        fields of ASCII logs but :obj:`str` of JSON logs without a model.
+        Records are yielded in the order of the probe side, unless spilled.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> for conn, http in join('conn.log', 'http.log', on='uid',
+            ...                        left_fields=['uid', 'duration'],
+            ...                        right_fields=['host', 'uri']):
+            ...     print(conn['uid'], conn['duration'], http['host'], http['uri'])
+
+    """
+    if how not in ('inner', 'left'):
+        raise ZeekValueError('unsupported join: %s' % how)  # pylint: disable=consider-using-f-string
+    if right_on is None:
+        right_on = on
+
+    sides = [(left, left_model, on, left_fields), (right, right_model, right_on, right_fields)]
+    swap = False
+    if how == 'inner':
+        left_size, right_size = _size(left), _size(right)
+        swap = left_size is not None and right_size is not None and left_size < right_size
+    if swap:
+        sides.reverse()
+    (probe, probe_model, probe_on, probe_fields), (build, build_model, build_on, build_fields) = sides
+
+    def pair(probe_row: 'dict[str, Any]', build_row: 'Optional[dict[str, Any]]') -> 'Pair':
+        if swap:
+            return build_row, probe_row  # type: ignore[return-value]
+        return probe_row, build_row
+
+    build_table = {}  # type: Optional[dict[Any, list[Row]]]
+    build_spill = None  # type: Optional[_Partitions]
+    with _open_records(build, build_model, **kwargs) as (getters, records):
+        if getters:
+            build_key, build_fields, build_getters = _resolve(getters, build_on, build_fields)
+            build_table, build_spill = _build(((_keys(build_key(record)), record) for record in records),
+                                              build_getters, memory_limit, spill_dir)
+
+    try:
+        with _open_records(probe, probe_model, **kwargs) as (getters, records):
+            if not getters:
+                return
+            probe_key, probe_fields, probe_getters = _resolve(getters, probe_on, probe_fields)
+
+            if build_spill is not None:
+                yield from _grace(build_spill, records, probe_key, probe_getters, how == 'left',
+                                  memory_limit, spill_dir, lambda probe_row, build_row: pair(
+                                      dict(zip(probe_fields, probe_row)),
+                                      None if build_row is None else dict(zip(build_fields, build_row)),
+                                  ))
+                return
+
+            for record in records:
+                probe_row = None  # type: Optional[dict[str, Any]]
+                for key in _keys(probe_key(record)):
+                    rows = build_table.get(key)  # type: ignore[union-attr]
+                    if not rows:
+                        continue
+                    if probe_row is None:
+                        probe_row = dict(zip(probe_fields, (get(record) for get in probe_getters)))
+                    for row in rows:
+                        yield pair(probe_row, dict(zip(build_fields, row)))
+                if probe_row is None and how == 'left':
+                    yield pair(dict(zip(probe_fields, (get(record) for get in probe_getters))), None)
+    finally:
+        if build_spill is not None:
+            build_spill.close()
+
+
+def _build(records: 'Iterable[tuple[tuple[Any, ...], Any]]', getters: 'list[Getter]', memory_limit: 'int',
+           spill_dir: 'Optional[str]') -> 'tuple[Optional[dict[Any, list[Row]]], Optional[_Partitions]]':
+    """Build the hash table, spilling to partitions if beyond memory budget.
+
+    Args:
+        records: Join keys and raw records of the build side.
+        getters: Getters of projected fields.
+        memory_limit: Estimated memory budget in bytes.
+        spill_dir: Directory of temporary files.
+
+    Returns:
+        Either the hash table from join keys to projected rows, or the
+        partitions of ``(key, row)`` entries if spilled.
+
+    """
+    table = {}  # type: dict[Any, list[Row]]
+    size = 0
+    for keys, record in records:
+        if not keys:
+            continue
+        row = tuple(get(record) for get in getters)
+        size += _sizeof(row) + _OVERHEAD * len(keys)
+        for key in keys:
+            rows = table.get(key)
+            if rows is None:
+                table[key] = [row]
+            else:
+                rows.append(row)
+        if size > memory_limit:
+            break
+    else:
+        return table, None
+
+    spill = _Partitions(spill_dir, 0)
+    for key, rows in table.items():
+        for row in rows:
+            spill.add(key, (key, row))
+    del table
+    for keys, record in records:
+        if not keys:
+            continue
+        row = tuple(get(record) for get in getters)
+        for key in keys:
+            spill.add(key, (key, row))
+    return None, spill
+
+
+def _grace(build: '_Partitions', records: 'Iterator[Any]', probe_key: 'Getter', getters: 'list[Getter]',
+           left: 'bool', memory_limit: 'int', spill_dir: 'Optional[str]', pair: 'Any') -> 'Iterator[Pair]':
+    """Join spilled build partitions with the probe side.
+
+    Args:
+        build: Partitions of the build side.
+        records: Raw records of the probe side.
+        probe_key: Getter of the probe join key.
+        getters: Getters of projected probe fields.
+        left: If the join is a left join.
+        memory_limit: Estimated memory budget in bytes.
+        spill_dir: Directory of temporary files.
+        pair: Function creating output pairs from projected rows.
+
+    Yields:
+        Joined pairs.
+
+    """
+    # records with multiple keys may match in any partitions, thus for left
+    # joins they are also kept aside and checked against ``matched`` at last
+    matched = bytearray()
+    with contextlib.ExitStack() as stack:
+        probe = _Partitions(spill_dir, 0)
+        stack.callback(probe.close)
+        orphans = None  # type: Optional[IO[bytes]]
+
+        for record in records:
+            keys = _keys(probe_key(record))
+            if not keys:
+                if left:
+                    yield pair(tuple(get(record) for get in getters), None)
+                continue
+            row = tuple(get(record) for get in getters)
+            if len(keys) == 1:
+                probe.add(keys[0], (-1, keys[0], row))
+                continue
+
+            mark = len(matched)
+            matched.append(0)
+            for key in keys:
+                probe.add(key, (mark, key, row))
+            if left:
+                if orphans is None:
+                    orphans = stack.enter_context(tempfile.TemporaryFile(dir=spill_dir, suffix='.zlogging'))
+                pickle.dump((mark, row), orphans, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for index in range(_PARTITIONS):
+            yield from _probe(build.read(index), probe.read(index), matched, left,
+                              memory_limit, spill_dir, pair, 1)
+
+        if orphans is not None:
+            orphans.seek(0)
+            while True:
+                try:
+                    mark, row = pickle.load(orphans)  # nosec: B301
+                except EOFError:
+                    break
+                if not matched[mark]:
+                    yield pair(row, None)
+
+
+def _probe(build: 'Iterator[tuple[Any, Row]]', probe: 'Iterator[tuple[int, Any, Row]]', matched: 'bytearray',
+           left: 'bool', memory_limit: 'int', spill_dir: 'Optional[str]', pair: 'Any',
+           level: 'int') -> 'Iterator[Pair]':
+    """Join a pair of build and probe partitions.
+
+    Args:
+        build: ``(key, row)`` entries of the build partition.
+        probe: ``(mark, key, row)`` entries of the probe partition, where
+            ``mark`` indexes ``matched`` for records with multiple keys or
+            is ``-1`` otherwise.
+        matched: Match flags of probe records with multiple keys.
+        left: If the join is a left join.
+        memory_limit: Estimated memory budget in bytes.
+        spill_dir: Directory of temporary files.
+        pair: Function creating output pairs from projected rows.
+        level: Partitioning level, for further repartitioning.
+
+    Yields:
+        Joined pairs.
+
+    """
+    table = {}  # type: dict[Any, list[Row]]
+    size = 0
+    for key, row in build:
+        table.setdefault(key, []).append(row)
+        size += _sizeof(row) + _OVERHEAD
+        if size > memory_limit and level < _MAX_DEPTH:
+            break
+    else:
+        for mark, key, row in probe:
+            rows = table.get(key)
+            if rows:
+                if mark >= 0:
+                    matched[mark] = 1
+                for build_row in rows:
+                    yield pair(row, build_row)
+            elif mark < 0 and left:
+                yield pair(row, None)
+        return
+
+    # still too large, e.g. skewed keys, thus split into finer partitions
+    build_parts = _Partitions(spill_dir, level)
+    probe_parts = _Partitions(spill_dir, level)
+    try:
+        for key, rows in table.items():
+            for row in rows:
+                build_parts.add(key, (key, row))
+        del table
+        for key, row in build:
+            build_parts.add(key, (key, row))
+        for entry in probe:
+            probe_parts.add(entry[1], entry)
+
+        for index in range(_PARTITIONS):
+            yield from _probe(build_parts.read(index), probe_parts.read(index), matched, left,
+                              memory_limit, spill_dir, pair, level + 1)
+    finally:
+        build_parts.close()
+        probe_parts.close()
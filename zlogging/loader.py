@@ -11,17 +11,18 @@ import re
 import warnings
 from typing import TYPE_CHECKING, TypeVar, cast
 
-from zlogging._aux import readline
+from zlogging._aux import expand_paths, expand_typing, readline
 from zlogging._data import ASCIIInfo, JSONInfo
 from zlogging._exc import (ASCIIParserError, ASCIIParserWarning, JSONParserError, JSONParserWarning,
-                           ParserError, ZeekValueError)
-from zlogging.model import new_model
+                           ModelTypeError, ParserError, ZeekValueError)
+from zlogging.columnar import Table
+from zlogging.model import LazyModel, new_model
 from zlogging.types import (AddrType, AnyType, BaseType, BoolType, CountType, DoubleType, EnumType,
                             IntervalType, IntType, PortType, SetType, StringType, SubnetType,
-                            TimeType, VectorType)
+                            TimeType, VectorType, get_type)
 
 __all__ = [
-    'parse', 'parse_ascii', 'parse_json',
+    'parse', 'parse_ascii', 'parse_json', 'parse_files',
     'loads', 'loads_ascii', 'loads_json',
     'load', 'load_ascii', 'load_json',
     'ASCIIParser', 'JSONParser',
@@ -32,13 +33,15 @@ if TYPE_CHECKING:
     from collections import OrderedDict
     from io import BufferedReader as BinaryFile
     from os import PathLike
-    from typing import Any, Optional, Type, Union
+    from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Type, Union
 
     from typing_extensions import Literal
 
     from zlogging._data import Info
+    from zlogging.cache import ParseCache
     from zlogging.model import Model
     from zlogging.types import _SimpleType
+    from zlogging.zonemap import Range
 
     AnyStr = Union[str, bytes]
 
@@ -127,6 +130,13 @@ class JSONParser(BaseParser):
         model: Field declrations for :class:`~zlogging.loader.JSONParser`,
             as in JSON logs the field typing information are omitted by
             the Bro/Zeek logging framework.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table` instead of
+            :class:`~zlogging.model.Model` per line.
+        row_filter: Predicates of field values as decoded from JSON, i.e.
+            :data:`None` if absent, by field names. Records rejected by any
+            predicate are skipped before their fields are converted, e.g.
+            with :class:`~zlogging.subnet.SubnetTree` for IP addresses.
 
     Warns:
         JSONParserWarning: If ``model`` is not specified.
@@ -136,16 +146,23 @@ class JSONParser(BaseParser):
     #: as in JSON logs the field typing information are omitted by
     #: the Bro/Zeek logging framework.
     model: 'Optional[Type[Model]]'
+    #: Parse log records as a :class:`~zlogging.columnar.Table`.
+    columnar: 'bool'
+    #: Predicates of field values to filter log records.
+    row_filter: 'Optional[dict[str, Callable[[Any], bool]]]'
 
     @property
     def format(self) -> 'Literal["json"]':
         """Log file format."""
         return 'json'
 
-    def __init__(self, model: 'Optional[Type[Model]]' = None) -> 'None':
+    def __init__(self, model: 'Optional[Type[Model]]' = None, columnar: 'bool' = False,
+                 row_filter: 'Optional[dict[str, Callable[[Any], bool]]]' = None) -> 'None':
         if model is None:
             warnings.warn('missing log data model specification', JSONParserWarning)
         self.model = model
+        self.columnar = columnar
+        self.row_filter = row_filter
 
     if TYPE_CHECKING:
         def parse(self, filename: 'PathLike[str]', model: 'Optional[Type[Model]]' = None) -> 'JSONInfo':  # pylint: disable=signature-differs,line-too-long
@@ -159,16 +176,62 @@ class JSONParser(BaseParser):
             model: Field declrations of current log.
 
         Returns:
-            The parsed log as a :class:`~zlogging.model.Model` per line.
+            The parsed log as a :class:`~zlogging.model.Model` per line,
+            or as a :class:`~zlogging.columnar.Table` in columnar mode.
 
         """
+        if self.columnar:
+            table = None  # type: Optional[Table]
+            if self.row_filter:
+                for index, record in self._filter_records(file):
+                    table = self._append_columns(record, lineno=index, model=model, table=table)
+            else:
+                for index, line in enumerate(file, start=1):
+                    table = self.parse_columns(line, lineno=index, model=model, table=table)
+            if table is None:
+                model_cls = model or self.model
+                if model_cls is None:
+                    table = Table([])
+                else:
+                    table = Table.from_fields(expand_typing(model_cls)['fields'])
+            return JSONInfo(
+                data=table
+            )
+
         data = []
-        for index, line in enumerate(file, start=1):
-            data.append(self.parse_line(line, lineno=index, model=model))
+        if self.row_filter:
+            for _, record in self._filter_records(file):
+                data.append(self._from_dict(record, model=model))
+        else:
+            for index, line in enumerate(file, start=1):
+                data.append(self.parse_line(line, lineno=index, model=model))
         return JSONInfo(
             data=data
         )
 
+    def _filter_records(self, file: 'BinaryFile') -> 'Iterator[tuple[int, dict[str, Any]]]':
+        """Decode log lines and filter by :attr:`row_filter`.
+
+        Args:
+            file: Log file object opened in binary mode.
+
+        Yields:
+            Line number and decoded data of log lines accepted by all
+            predicates.
+
+        Raises:
+            :exc:`JSONParserError`: If failed to serialise a line from JSON.
+
+        """
+        predicates = list(self.row_filter.items())  # type: ignore[union-attr]
+        for index, line in enumerate(file, start=1):
+            try:
+                data = json.loads(line)  # type: dict[str, Any]
+            except json.JSONDecodeError as error:
+                raise JSONParserError(error.msg, index) from error
+            if all(predicate(data.get(field)) for field, predicate in predicates):
+                yield index, data
+
     def parse_line(self, line: 'bytes', lineno: 'Optional[int]' = 0,
                    model: 'Optional[Type[Model]]' = None) -> 'Model':
         """Parse log line as one-line record.
@@ -189,12 +252,86 @@ class JSONParser(BaseParser):
             data = json.loads(line)  # type: dict[str, Any]
         except json.JSONDecodeError as error:
             raise JSONParserError(error.msg, lineno) from error
+        return self._from_dict(data, model=model)
+
+    def _from_dict(self, data: 'dict[str, Any]', model: 'Optional[Type[Model]]' = None) -> 'Model':
+        """Create record from decoded log line.
 
+        Args:
+            data: Decoded log line.
+            model: Field declrations of current log.
+
+        Returns:
+            The parsed log as a plain :class:`~zlogging.model.Model`.
+
+        """
         model_cls = model or self.model
         if model_cls is None:
-            model_cls = new_model('<unknown>', **{field: AnyType() for field in data.keys()})
+            model_cls = new_model('<unknown>', **{field: get_type(AnyType) for field in data.keys()})
         return model_cls(**data)
 
+    def parse_columns(self, line: 'bytes', lineno: 'Optional[int]' = 0,
+                      model: 'Optional[Type[Model]]' = None, table: 'Optional[Table]' = None) -> 'Table':
+        """Parse log line into columns.
+
+        Args:
+            line: A simple line of log.
+            lineno: Line number of current line.
+            model: Field declrations of current log.
+            table: Table to append the record to. If not given, a new table
+                will be created per field declarations.
+
+        Returns:
+            The table with the parsed record appended.
+
+        Raises:
+            :exc:`JSONParserError`: If failed to serialise the ``line`` from JSON;
+                or the record has fields not declared in the table.
+
+        """
+        try:
+            data = json.loads(line)  # type: dict[str, Any]
+        except json.JSONDecodeError as error:
+            raise JSONParserError(error.msg, lineno) from error
+        return self._append_columns(data, lineno=lineno, model=model, table=table)
+
+    def _append_columns(self, data: 'dict[str, Any]', lineno: 'Optional[int]' = 0,
+                        model: 'Optional[Type[Model]]' = None, table: 'Optional[Table]' = None) -> 'Table':
+        """Append decoded log line into columns.
+
+        Args:
+            data: Decoded log line.
+            lineno: Line number of current line.
+            model: Field declrations of current log.
+            table: Table to append the record to.
+
+        Returns:
+            The table with the parsed record appended.
+
+        Raises:
+            :exc:`JSONParserError`: If the record has fields not declared in
+                the table.
+
+        """
+        if table is None:
+            model_cls = model or self.model
+            if model_cls is None:
+                fields = collections.OrderedDict((field, get_type(AnyType)) for field in data.keys())  # type: OrderedDict[str, Any]
+            else:
+                fields = expand_typing(model_cls)['fields']
+            table = Table.from_fields(fields)
+
+        columns = table.columns
+        for field in data:
+            if field not in columns:
+                raise JSONParserError('unexpected field %r' % field, lineno)  # pylint: disable=consider-using-f-string
+        for field, column in columns.items():
+            try:
+                column.append(data.get(field))
+            except (TypeError, ValueError) as error:
+                raise JSONParserError(str(error), lineno, field) from error
+        return table
+
 
 class ASCIIParser(BaseParser):
     """ASCII log parser.
@@ -204,6 +341,36 @@ class ASCIIParser(BaseParser):
             :class:`~zlogging.types.BaseType` to modify parsing behaviours.
         enum_namespaces: Namespaces to be loaded.
         bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table` instead of
+            :class:`~zlogging.model.Model` per line.
+        lazy: If :data:`True`, parse log records as
+            :class:`~zlogging.model.LazyModel`, whose fields are only
+            decoded on first access.
+        slots: If :data:`True`, generate the data model with ``__slots__``
+            to reduce memory footprint of log records.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`, which are shared among log
+            records with identical field data.
+        zero_copy: If :data:`True`, read the log file in blocks of
+            :attr:`block_size` bytes, and parse ``string`` fields of at
+            least :attr:`view_threshold` bytes as read-only
+            :obj:`memoryview` slices of the blocks.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            :class:`~zlogging.packed.PackedAddress` and
+            :class:`~zlogging.packed.PackedNetwork`.
+        row_filter: Predicates of raw field values, i.e. :obj:`bytes` as in
+            the log file including the *empty* and *unset* placeholders, by
+            field names. Records rejected by any predicate are skipped
+            before their fields are converted, e.g. with
+            :class:`~zlogging.subnet.SubnetTree` for IP addresses.
+
+    Note:
+        The *zero-copy* mode only takes effect when parsing log records as
+        :class:`~zlogging.model.Model`. The sliced ``string`` fields keep the
+        whole block they were read from alive, see
+        :class:`~zlogging.types.StringType` for more information; use
+        :meth:`iter_batches` to release the blocks per batch instead.
 
     """
     #: Bro/Zeek type parser hooks.
@@ -212,6 +379,25 @@ class ASCIIParser(BaseParser):
     enum_namespaces: 'list[str]'
     #: If :data:`True`, do not load ``zeek`` namespace by default.
     bare: 'bool'
+    #: Parse log records as a :class:`~zlogging.columnar.Table`.
+    columnar: 'bool'
+    #: Parse log records as :class:`~zlogging.model.LazyModel`.
+    lazy: 'bool'
+    #: Generate the data model with ``__slots__``.
+    slots: 'bool'
+    #: Parse ``set`` and ``vector`` fields as immutable containers.
+    frozen: 'bool'
+    #: Parse ``string`` fields as slices of the read blocks.
+    zero_copy: 'bool'
+    #: Size of blocks to read in *zero-copy* mode.
+    block_size: 'int' = 1048576
+    #: Minimum size of ``string`` fields to be sliced in *zero-copy* mode,
+    #: as shorter fields are cheaper to copy than a :obj:`memoryview`.
+    view_threshold: 'int' = 256
+    #: Parse ``addr`` and ``subnet`` fields as packed integers.
+    packed: 'bool'
+    #: Predicates of raw field values to filter log records.
+    row_filter: 'Optional[dict[str, Callable[[bytes], bool]]]'
 
     @property
     def format(self) -> 'Literal["ascii"]':
@@ -219,7 +405,10 @@ class ASCIIParser(BaseParser):
         return 'ascii'
 
     def __init__(self, type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
-                 enum_namespaces: 'Optional[list[str]]' = None, bare: bool = False) -> 'None':
+                 enum_namespaces: 'Optional[list[str]]' = None, bare: bool = False,
+                 columnar: bool = False, lazy: bool = False, slots: bool = False,
+                 frozen: bool = False, zero_copy: bool = False, packed: bool = False,
+                 row_filter: 'Optional[dict[str, Callable[[bytes], bool]]]' = None) -> 'None':
         self.__type__ = {
             'bool': BoolType,
             'count': CountType,
@@ -240,6 +429,13 @@ class ASCIIParser(BaseParser):
 
         self.enum_namespaces = enum_namespaces or []
         self.bare = bare
+        self.columnar = columnar
+        self.lazy = lazy
+        self.slots = slots
+        self.frozen = frozen
+        self.zero_copy = zero_copy
+        self.packed = packed
+        self.row_filter = row_filter
 
     if TYPE_CHECKING:
         def parse(self, filename: 'PathLike[str]', model: 'Optional[Type[Model]]' = None) -> 'ASCIIInfo':  # pylint: disable=signature-differs,line-too-long
@@ -256,13 +452,69 @@ class ASCIIParser(BaseParser):
                 be used at runtime.
 
         Returns:
-            The parsed log as a :class:`~zlogging.model.Model` per line.
+            The parsed log as a :class:`~zlogging.model.Model` per line,
+            or as a :class:`~zlogging.columnar.Table` in columnar mode.
 
         Warns:
             ASCIIParserWarning: If the ASCII log file exited with error, see
                 :attr:`ASCIIInfo.exit_with_error <zlogging._data.ASCIIInfo.exit_with_error>`
                 for more information.
 
+        """
+        separator, path, open_time, model_fields = self._parse_header(file)
+        field_parser = list(model_fields.items())
+        model_cls = new_model(path, __base__=LazyModel if self.lazy else None, __slots__=self.slots,
+                              **model_fields)
+        predicates = self._get_predicates(list(model_fields))
+
+        if TYPE_CHECKING:
+            close_time = datetime.datetime.now()
+
+        exit_with_error = True
+        data = Table.from_fields(model_fields) if self.columnar else []  # type: Union[list[Model], Table]
+        if self.zero_copy and not (self.columnar or self.lazy):
+            file = self._extend_blocks(file, data, model_cls, field_parser, separator, predicates)  # type: ignore[arg-type,assignment]
+        for index, line in enumerate(file, start=1):
+            if line.startswith(b'#'):
+                exit_with_error = False
+                close_time = datetime.datetime.strptime(line.strip().split(separator)[1].decode(),
+                                                        r'%Y-%m-%d-%H-%M-%S')
+                break
+            if predicates and not self._accept(line, separator, predicates):
+                continue
+
+            if self.columnar:
+                self.parse_columns(line, lineno=index, table=data, separator=separator)  # type: ignore[arg-type]
+                continue
+
+            if self.lazy:
+                parsed = self.parse_raw(line, lineno=index, model=model_cls, separator=separator)  # type: ignore[arg-type]
+            else:
+                parsed = self.parse_line(line, lineno=index, model=model_cls, parser=field_parser)
+            data.append(parsed)  # type: ignore[union-attr]
+
+        if exit_with_error:
+            warnings.warn('log file exited with error', ASCIIParserWarning)
+            close_time = datetime.datetime.now()
+
+        return ASCIIInfo(
+            path=cast('PathLike[str]', path),
+            open=open_time,
+            close=close_time,
+            data=data,
+            exit_with_error=exit_with_error,
+        )
+
+    def _parse_header(self, file: 'BinaryFile') -> 'tuple[bytes, str, datetime.datetime, OrderedDict[str, BaseType]]':
+        """Parse the header of log file.
+
+        Args:
+            file: Log file object opened in binary mode.
+
+        Returns:
+            The data separator, log path, log open time, and the data types
+            of fields.
+
         """
         # data separator
         separator = readline(file, b' ', maxsplit=1)[1].decode('unicode_escape').encode('ascii')
@@ -284,68 +536,350 @@ class ASCIIParser(BaseParser):
         # log filed types
         types_line = readline(file, separator, decode=True)[1:]
 
-        field_parser = []  # type: list[tuple[str, BaseType]]
-        model_fields = collections.OrderedDict()
-        for (field, type_) in zip(model_line, types_line):
+        model_fields = self._get_fields(model_line, types_line, empty_field, unset_field, set_separator)
+        return separator, path, open_time, model_fields
+
+    def _get_fields(self, fields: 'list[str]', types: 'list[str]', empty_field: 'bytes',
+                    unset_field: 'bytes', set_separator: 'bytes') -> 'OrderedDict[str, BaseType]':
+        """Get the data types of fields as declared in the log header.
+
+        Args:
+            fields: Field names, as in the ``#fields`` directive.
+            types: Zeek type names, as in the ``#types`` directive.
+            empty_field: Placeholder for empty field.
+            unset_field: Placeholder for unset field.
+            set_separator: Separator for ``set``/``vector`` fields.
+
+        Returns:
+            Field names and their data types, with parser options applied.
+
+        """
+        model_fields = collections.OrderedDict()  # type: OrderedDict[str, BaseType]
+        for (field, type_) in zip(fields, types):
             match_set = re.match(r'set\[(?P<type>.+?)\]', type_)
             if match_set is not None:
                 set_type = match_set.group('type')
                 ele_type = cast('Type[_SimpleType]', self.__type__[set_type])
-                type_cls = SetType(empty_field, unset_field, set_separator,
-                                   element_type=ele_type(empty_field, unset_field, set_separator))
-                field_parser.append((field, type_cls))
-                model_fields[field] = type_cls
+                element_type = self._get_type(ele_type, empty_field, unset_field, set_separator)
+                model_fields[field] = get_type(SetType, empty_field, unset_field, set_separator,
+                                               frozen=self.frozen, element_type=element_type)
                 continue
 
             match_vector = re.match(r'^vector\[(?P<type>.+?)\]', type_)
             if match_vector is not None:
                 vec_type = match_vector.group('type')
                 ele_type = cast('Type[_SimpleType]', self.__type__[vec_type])
-                type_cls = VectorType(empty_field, unset_field, set_separator,
-                                      element_type=ele_type(empty_field, unset_field, set_separator))  # type: ignore[assignment] # pylint: disable=line-too-long
-                field_parser.append((field, type_cls))
-                model_fields[field] = type_cls
+                element_type = self._get_type(ele_type, empty_field, unset_field, set_separator)
+                model_fields[field] = get_type(VectorType, empty_field, unset_field, set_separator,
+                                               frozen=self.frozen, element_type=element_type)
                 continue
 
             if type_ == 'enum':
-                type_cls = EnumType(empty_field, unset_field, set_separator,
-                                    namespaces=self.enum_namespaces, bare=self.bare)  # type: ignore[assignment]
-                field_parser.append((field, type_cls))
-                model_fields[field] = type_cls
+                model_fields[field] = get_type(EnumType, empty_field, unset_field, set_separator,
+                                               namespaces=self.enum_namespaces, bare=self.bare)
                 continue
 
             ele_type = cast('Type[_SimpleType]', self.__type__[type_])
-            type_cls = ele_type(empty_field, unset_field, set_separator)  # type: ignore[assignment]
-            field_parser.append((field, type_cls))
-            model_fields[field] = type_cls
-        model_cls = new_model(path, **model_fields)
+            model_fields[field] = self._get_type(ele_type, empty_field, unset_field, set_separator)
+        return model_fields
 
-        if TYPE_CHECKING:
-            close_time = datetime.datetime.now()
+    def _get_predicates(self, fields: 'list[str]') -> 'list[tuple[int, Callable[[bytes], bool]]]':
+        """Get the predicates of :attr:`row_filter` by field indices.
 
-        exit_with_error = True
-        data = []
-        for index, line in enumerate(file, start=1):
-            if line.startswith(b'#'):
-                exit_with_error = False
-                close_time = datetime.datetime.strptime(line.strip().split(separator)[1].decode(),
-                                                        r'%Y-%m-%d-%H-%M-%S')
+        Args:
+            fields: Field names, as in the ``#fields`` directive.
+
+        Returns:
+            Field indices and their predicates.
+
+        Raises:
+            :exc:`ASCIIParserError`: If :attr:`row_filter` refers to fields
+                not in the log.
+
+        """
+        if not self.row_filter:
+            return []
+        predicates = []  # type: list[tuple[int, Callable[[bytes], bool]]]
+        for field, predicate in self.row_filter.items():
+            try:
+                predicates.append((fields.index(field), predicate))
+            except ValueError:
+                raise ASCIIParserError('unknown field in row filter: %s' % field) from None  # pylint: disable=consider-using-f-string
+        return predicates
+
+    @staticmethod
+    def _accept(line: 'bytes', separator: 'bytes', predicates: 'list[tuple[int, Callable[[bytes], bool]]]') -> 'bool':
+        """Check if log line is accepted by the row filter.
+
+        Args:
+            line: A simple line of log.
+            separator: Data separator.
+            predicates: Field indices and their predicates.
+
+        Returns:
+            If all predicates accept the raw field values. Malformed lines
+            are accepted, so that the parser reports the error.
+
+        """
+        values = line.rstrip(b'\r\n').split(separator)
+        try:
+            return all(predicate(values[index]) for index, predicate in predicates)
+        except IndexError:
+            return True
+
+    def _get_type(self, type_cls: 'Type[_SimpleType]', empty_field: 'bytes', unset_field: 'bytes',
+                  set_separator: 'bytes') -> '_SimpleType':
+        """Get the shared data type instance with parser options applied.
+
+        Args:
+            type_cls: Data type class.
+            empty_field: Placeholder for empty field.
+            unset_field: Placeholder for unset field.
+            set_separator: Separator for ``set``/``vector`` fields.
+
+        Returns:
+            The data type instance.
+
+        """
+        kwargs = {}  # type: dict[str, Any]
+        if self.zero_copy and issubclass(type_cls, StringType):
+            kwargs['zero_copy'] = True
+        if self.packed and issubclass(type_cls, (AddrType, SubnetType)):
+            kwargs['packed'] = True
+        return get_type(type_cls, empty_field, unset_field, set_separator, **kwargs)
+
+    def _read_blocks(self, file: 'BinaryFile') -> 'Iterator[tuple[bytes, int]]':
+        """Read log file in blocks of complete lines.
+
+        Args:
+            file: Log file object opened in binary mode.
+
+        Yields:
+            A block of log file, and the end offset of the last complete
+            line in the block.
+
+        """
+        remainder = b''
+        while True:
+            chunk = file.read(self.block_size)
+            if not chunk:
                 break
 
-            parsed = self.parse_line(line, lineno=index, model=model_cls, parser=field_parser)
-            data.append(parsed)
+            block = remainder + chunk if remainder else chunk
+            end = block.rfind(b'\n') + 1
+            if end:
+                yield block, end
+            remainder = block[end:]
+
+        if remainder:
+            yield remainder + b'\n', len(remainder) + 1
+
+    def _parse_blocks(self, file: 'BinaryFile', model: 'Type[Model]', parser: 'list[tuple[str, BaseType]]',
+                      separator: 'bytes', predicates: 'Optional[list[tuple[int, Callable[[bytes], bool]]]]' = None,
+                      ) -> 'Iterator[tuple[list[Model], list[memoryview], Optional[bytes]]]':
+        """Parse log records from blocks of log file.
 
+        Args:
+            file: Log file object opened in binary mode.
+            model: Field declrations of current log.
+            parser: Field data type parsers.
+            separator: Data separator.
+            predicates: Field indices and predicates of the row filter.
+
+        Yields:
+            The log records parsed from a block, the :obj:`memoryview`
+            slices of the block referenced by them in *zero-copy* mode, and
+            the trailing comment line, i.e. ``#close``, if reached.
+
+        """
+        plan = [(field_name, type_cls.parse, isinstance(type_cls, StringType) and type_cls.zero_copy)
+                for field_name, type_cls in parser]
+
+        lineno = 0
+        for block, end in self._read_blocks(file):
+            view = memoryview(block)
+            batch = []  # type: list[Model]
+            slices = [view]  # type: list[memoryview]
+
+            start = 0
+            while start < end:
+                stop = block.index(b'\n', start, end)
+                lineno += 1
+
+                line_end = stop
+                if line_end > start and block[line_end - 1] == 0x0D:  # '\r'
+                    line_end -= 1
+                if block.startswith(b'#', start):
+                    yield batch, slices, block[start:line_end]
+                    return
+                if predicates and not self._accept(block[start:line_end], separator, predicates):
+                    start = stop + 1
+                    continue
+
+                batch.append(self._parse_span(block, view, start, line_end, lineno, model, plan, separator, slices))
+                start = stop + 1
+            yield batch, slices, None
+
+    def _extend_blocks(self, file: 'BinaryFile', data: 'list[Model]', model: 'Type[Model]',
+                       parser: 'list[tuple[str, BaseType]]', separator: 'bytes',
+                       predicates: 'Optional[list[tuple[int, Callable[[bytes], bool]]]]' = None) -> 'Iterator[bytes]':
+        """Parse log records from blocks of log file in *zero-copy* mode.
+
+        Args:
+            file: Log file object opened in binary mode.
+            data: List to append the parsed log records to.
+            model: Field declrations of current log.
+            parser: Field data type parsers.
+            separator: Data separator.
+            predicates: Field indices and predicates of the row filter.
+
+        Yields:
+            The trailing comment line, i.e. ``#close``, if any.
+
+        """
+        for batch, _, trailer in self._parse_blocks(file, model, parser, separator, predicates):
+            data.extend(batch)
+            if trailer is not None:
+                yield trailer
+
+    def iter_batches(self, file: 'BinaryFile') -> 'Iterator[list[Model]]':
+        """Parse log file in batches of log records.
+
+        The log file is read in blocks of :attr:`block_size` bytes, and the
+        log records of each block are yielded as a batch. In *zero-copy*
+        mode, the ``string`` fields of a batch are slices of its block, which
+        are valid until the next batch is requested or the iteration is
+        closed. The slices are then released, so that at most one block is
+        kept in memory; accessing them afterwards raises :exc:`ValueError`.
+        Call :obj:`bytes` on the data to keep it beyond its batch.
+
+        Args:
+            file: Log file object opened in binary mode.
+
+        Yields:
+            The parsed log records of each block, as
+            :class:`~zlogging.model.Model`.
+
+        Raises:
+            :exc:`ZeekValueError`: If the parser is in columnar or lazy mode.
+
+        Warns:
+            ASCIIParserWarning: If the ASCII log file exited with error.
+
+        """
+        if self.columnar or self.lazy:
+            raise ZeekValueError('batches are not supported in columnar or lazy mode')
+
+        separator, path, _, model_fields = self._parse_header(file)
+        model_cls = new_model(path, __slots__=self.slots, **model_fields)
+        predicates = self._get_predicates(list(model_fields))
+
+        exit_with_error = True
+        for batch, slices, trailer in self._parse_blocks(file, model_cls, list(model_fields.items()),
+                                                         separator, predicates):
+            try:
+                if batch:
+                    yield batch
+            finally:
+                for slice_ in reversed(slices):
+                    try:
+                        slice_.release()
+                    except BufferError:  # exported by the caller, e.g. to NumPy
+                        pass
+            if trailer is not None:
+                exit_with_error = False
         if exit_with_error:
             warnings.warn('log file exited with error', ASCIIParserWarning)
-            close_time = datetime.datetime.now()
 
-        return ASCIIInfo(
-            path=cast('PathLike[str]', path),
-            open=open_time,
-            close=close_time,
-            data=data,
-            exit_with_error=exit_with_error,
-        )
+    def parse_view(self, block: 'bytes', view: 'memoryview', start: 'int', end: 'int',
+                   lineno: 'Optional[int]' = 0, model: 'Optional[Type[Model]]' = None,
+                   separator: 'bytes' = b'\x09', parser: 'Optional[list[tuple[str, BaseType]]]' = None,
+                   views: 'Optional[list[bool]]' = None, slices: 'Optional[list[memoryview]]' = None) -> 'Model':
+        """Parse log line from a block of log file as one-line record.
+
+        The fields are located in ``block`` directly, and only the fields
+        flagged by ``views`` of at least :attr:`view_threshold` bytes are
+        sliced from ``view`` without copying.
+
+        Args:
+            block: A block of log file.
+            view: Memory view of ``block``.
+            start: Start offset of the line in ``block``.
+            end: End offset of the line in ``block``, excluding the newline.
+            lineno: Line number of current line.
+            model: Field declrations of current log.
+            separator: Data separator.
+            parser: Field data type parsers.
+            views: Flags indicating whether each field should be passed to
+                its parser as a :obj:`memoryview` slice rather than :obj:`bytes`.
+            slices: List to append the :obj:`memoryview` slices to, e.g. to
+                release them with their batch.
+
+        Returns:
+            The parsed log as a :class:`~zlogging.model.Model`.
+
+        Raises:
+            :exc:`ASCIIParserError`: If ``parser`` is not provided; or failed to
+                serialise the line as ASCII.
+
+        """
+        if parser is None:
+            raise ASCIIParserError("parse_view() missing 1 required positional argument: 'parser'")
+        if views is None:
+            views = [False] * len(parser)
+        if model is None:
+            model = new_model('<unknown>', **{field_name: get_type(AnyType) for field_name, _ in parser})
+
+        plan = [(field_name, field_type.parse, as_view) for (field_name, field_type), as_view in zip(parser, views)]
+        return self._parse_span(block, view, start, end, lineno, model, plan, separator, slices)
+
+    def _parse_span(self, block: 'bytes', view: 'memoryview', start: 'int', end: 'int',
+                    lineno: 'Optional[int]', model: 'Type[Model]',
+                    plan: 'list[tuple[str, Callable[[Any], Any], bool]]', separator: 'bytes',
+                    slices: 'Optional[list[memoryview]]' = None) -> 'Model':
+        """Parse log line from a block of log file, see :meth:`parse_view`.
+
+        Args:
+            block: A block of log file.
+            view: Memory view of ``block``.
+            start: Start offset of the line in ``block``.
+            end: End offset of the line in ``block``, excluding the newline.
+            lineno: Line number of current line.
+            model: Field declrations of current log.
+            plan: Field names, parsers, and whether each field may be sliced.
+            separator: Data separator.
+            slices: List to append the :obj:`memoryview` slices to.
+
+        Returns:
+            The parsed log as a :class:`~zlogging.model.Model`.
+
+        """
+        count = block.count(separator, start, end) + 1
+        if count != len(plan):
+            raise ASCIIParserError('expected %d fields but %d were given' % (len(plan), count), lineno)  # pylint: disable=consider-using-f-string
+
+        find = block.find
+        threshold = self.view_threshold
+        step = len(separator)
+        data = []  # type: list[Any]
+        append = data.append
+        pos = start
+        for field_name, parse, as_view in plan:
+            stop = find(separator, pos, end)
+            if stop < 0:
+                stop = end
+            try:
+                if as_view and stop - pos >= threshold:
+                    value = view[pos:stop]
+                    if slices is not None:
+                        slices.append(value)
+                    append(parse(value))
+                else:
+                    append(parse(block[pos:stop]))
+            except ValueError as error:
+                raise ASCIIParserError(str(error), lineno, field_name) from error
+            pos = stop + step
+        return model._from_converted(data)  # pylint: disable=protected-access
 
     def parse_line(self, line: 'bytes', lineno: 'Optional[int]' = 0,  # pylint: disable=arguments-differ
                    model: 'Optional[Type[Model]]' = None, separator: 'Optional[bytes]' = b'\x09',
@@ -370,21 +904,78 @@ class ASCIIParser(BaseParser):
         if parser is None:
             raise ASCIIParserError("parse_line() missing 1 required positional argument: 'parser'")
 
-        data = collections.OrderedDict()  # type: OrderedDict[str, Any]
-        for i, s in enumerate(line.strip().split(separator)):
-            field_name, field_type = parser[i]
+        values = line.strip().split(separator)
+        if len(values) != len(parser):
+            raise ASCIIParserError('expected %d fields but %d were given' % (len(parser), len(values)), lineno)  # pylint: disable=line-too-long,consider-using-f-string
+
+        data = []  # type: list[Any]
+        for (field_name, field_type), s in zip(parser, values):
             try:
-                data[field_name] = field_type(s)
+                data.append(field_type(s))
             except ZeekValueError as error:
                 raise ASCIIParserError(str(error), lineno, field_name) from error
 
         if model is None:
-            model = new_model('<unknown>', **{field: AnyType() for field in data.keys()})
-        return model(**data)
+            model = new_model('<unknown>', **{field_name: get_type(AnyType) for field_name, _ in parser})
+        return model._from_converted(data)  # pylint: disable=protected-access
+
+    def parse_raw(self, line: 'bytes', model: 'Type[LazyModel]', lineno: 'Optional[int]' = 0,
+                  separator: 'Optional[bytes]' = b'\x09') -> 'LazyModel':
+        """Parse log line as one-line lazy record.
+
+        Args:
+            line: A simple line of log.
+            model: Lazy data model of current log.
+            lineno: Line number of current line.
+            separator: Data separator.
+
+        Returns:
+            The lazy record, with fields not yet decoded.
+
+        Raises:
+            :exc:`ASCIIParserError`: If the number of fields does not match
+                the data model.
+
+        """
+        try:
+            return model.from_raw(line.strip().split(separator))
+        except ModelTypeError as error:
+            raise ASCIIParserError(str(error), lineno) from error
+
+    def parse_columns(self, line: 'bytes', table: 'Table', lineno: 'Optional[int]' = 0,
+                      separator: 'Optional[bytes]' = b'\x09') -> 'Table':
+        """Parse log line into columns.
+
+        Args:
+            line: A simple line of log.
+            table: Table to append the record to.
+            lineno: Line number of current line.
+            separator: Data separator.
+
+        Returns:
+            The table with the parsed record appended.
+
+        Raises:
+            :exc:`ASCIIParserError`: If failed to serialise ``line`` as ASCII.
+
+        """
+        values = line.strip().split(separator)
+        columns = table.columns
+        if len(values) != len(columns):
+            raise ASCIIParserError('expected %d fields but %d were given' % (len(columns), len(values)), lineno)  # pylint: disable=line-too-long,consider-using-f-string
+
+        for (field_name, column), data in zip(columns.items(), values):
+            try:
+                column.append_raw(data)
+            except ValueError as error:
+                raise ASCIIParserError(str(error), lineno, field_name) from error
+        return table
 
 
 def parse_json(filename: 'PathLike[str]', parser: 'Optional[Type[JSONParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
-               model: 'Optional[Type[Model]]' = None, *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
+               model: 'Optional[Type[Model]]' = None, columnar: 'bool' = False,
+               row_filter: 'Optional[dict[str, Callable[[Any], bool]]]' = None,
+               *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
     """Parse JSON log file.
 
     Args:
@@ -393,6 +984,10 @@ def parse_json(filename: 'PathLike[str]', parser: 'Optional[Type[JSONParser]]' =
         model: Field declarations for :class:`~zlogging.loader.JSONParser`,
             as in JSON logs the field typing information are omitted by the
             Bro/Zeek logging framework.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        row_filter: Predicates of field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -402,12 +997,14 @@ def parse_json(filename: 'PathLike[str]', parser: 'Optional[Type[JSONParser]]' =
     """
     if parser is None:
         parser = JSONParser
-    json_parser = parser(model)
+    json_parser = parser(model, columnar=columnar, row_filter=row_filter)
     return json_parser.parse(filename)
 
 
 def load_json(file: 'BinaryFile', parser: 'Optional[Type[JSONParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
-              model: 'Optional[Type[Model]]' = None, *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
+              model: 'Optional[Type[Model]]' = None, columnar: 'bool' = False,
+              row_filter: 'Optional[dict[str, Callable[[Any], bool]]]' = None,
+              *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
     """Parse JSON log file.
 
     Args:
@@ -416,6 +1013,10 @@ def load_json(file: 'BinaryFile', parser: 'Optional[Type[JSONParser]]' = None,
         model: Field declarations for :class:`~zlogging.loader.JSONParser`,
             as in JSON logs the field typing information are omitted by the
             Bro/Zeek logging framework.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        row_filter: Predicates of field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -425,12 +1026,14 @@ def load_json(file: 'BinaryFile', parser: 'Optional[Type[JSONParser]]' = None,
     """
     if parser is None:
         parser = JSONParser
-    json_parser = parser(model)
+    json_parser = parser(model, columnar=columnar, row_filter=row_filter)
     return json_parser.parse_file(file)
 
 
 def loads_json(data: 'AnyStr', parser: 'Optional[Type[JSONParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
-               model: 'Optional[Type[Model]]' = None, *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
+               model: 'Optional[Type[Model]]' = None, columnar: 'bool' = False,
+               row_filter: 'Optional[dict[str, Callable[[Any], bool]]]' = None,
+               *args: 'Any', **kwargs: 'Any') -> 'JSONInfo':
     """Parse JSON log string.
 
     Args:
@@ -439,6 +1042,10 @@ def loads_json(data: 'AnyStr', parser: 'Optional[Type[JSONParser]]' = None,  # p
         model: Field declarations for :class:`~zlogging.loader.JSONParser`,
             as in JSON logs the field typing information are omitted by the
             Bro/Zeek logging framework.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        row_filter: Predicates of field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -451,7 +1058,7 @@ def loads_json(data: 'AnyStr', parser: 'Optional[Type[JSONParser]]' = None,  # p
 
     if parser is None:
         parser = JSONParser
-    json_parser = parser(model)
+    json_parser = parser(model, columnar=columnar, row_filter=row_filter)
 
     with io.BytesIO(data) as file:
         info = json_parser.parse_file(file)  # type: ignore[arg-type]
@@ -461,7 +1068,11 @@ def loads_json(data: 'AnyStr', parser: 'Optional[Type[JSONParser]]' = None,  # p
 def parse_ascii(filename: 'PathLike[str]', parser: 'Optional[Type[ASCIIParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
                 type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
                 enum_namespaces: 'Optional[list[str]]' = None,
-                bare: 'bool' = False, *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
+                bare: 'bool' = False, columnar: 'bool' = False, lazy: 'bool' = False,
+                slots: 'bool' = False, frozen: 'bool' = False,
+                zero_copy: 'bool' = False, packed: 'bool' = False,
+                row_filter: 'Optional[dict[str, Callable[[bytes], bool]]]' = None,
+                *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
     """Parse ASCII log file.
 
     Args:
@@ -471,6 +1082,19 @@ def parse_ascii(filename: 'PathLike[str]', parser: 'Optional[Type[ASCIIParser]]'
             :class:`~zlogging.types.BaseType` to modify parsing behaviours.
         enum_namespaces: Namespaces to be loaded.
         bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        lazy: If :data:`True`, parse log records as
+            :class:`~zlogging.model.LazyModel`.
+        slots: If :data:`True`, generate the data model with ``__slots__``.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`.
+        zero_copy: If :data:`True`, parse long ``string`` fields as read-only
+            :obj:`memoryview` slices of blocks read from the log file.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            packed integers.
+        row_filter: Predicates of raw field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -480,14 +1104,19 @@ def parse_ascii(filename: 'PathLike[str]', parser: 'Optional[Type[ASCIIParser]]'
     """
     if parser is None:
         parser = ASCIIParser
-    ascii_parser = parser(type_hook, enum_namespaces, bare)
+    ascii_parser = parser(type_hook, enum_namespaces, bare, columnar=columnar, lazy=lazy, slots=slots,
+                          frozen=frozen, zero_copy=zero_copy, packed=packed, row_filter=row_filter)
     return ascii_parser.parse(filename)
 
 
 def load_ascii(file: 'BinaryFile', parser: 'Optional[Type[ASCIIParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
                type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
                enum_namespaces: 'Optional[list[str]]' = None,
-               bare: 'bool' = False, *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
+               bare: 'bool' = False, columnar: 'bool' = False, lazy: 'bool' = False,
+               slots: 'bool' = False, frozen: 'bool' = False,
+               zero_copy: 'bool' = False, packed: 'bool' = False,
+               row_filter: 'Optional[dict[str, Callable[[bytes], bool]]]' = None,
+               *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
     """Parse ASCII log file.
 
     Args:
@@ -497,6 +1126,19 @@ def load_ascii(file: 'BinaryFile', parser: 'Optional[Type[ASCIIParser]]' = None,
             :class:`~zlogging.types.BaseType` to modify parsing behaviours.
         enum_namespaces: Namespaces to be loaded.
         bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        lazy: If :data:`True`, parse log records as
+            :class:`~zlogging.model.LazyModel`.
+        slots: If :data:`True`, generate the data model with ``__slots__``.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`.
+        zero_copy: If :data:`True`, parse long ``string`` fields as read-only
+            :obj:`memoryview` slices of blocks read from the log file.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            packed integers.
+        row_filter: Predicates of raw field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -506,14 +1148,19 @@ def load_ascii(file: 'BinaryFile', parser: 'Optional[Type[ASCIIParser]]' = None,
     """
     if parser is None:
         parser = ASCIIParser
-    ascii_parser = parser(type_hook, enum_namespaces, bare)
+    ascii_parser = parser(type_hook, enum_namespaces, bare, columnar=columnar, lazy=lazy, slots=slots,
+                          frozen=frozen, zero_copy=zero_copy, packed=packed, row_filter=row_filter)
     return ascii_parser.parse_file(file)
 
 
 def loads_ascii(data: 'AnyStr', parser: 'Optional[Type[ASCIIParser]]' = None,  # pylint: disable=unused-argument,keyword-arg-before-vararg
                 type_hook: 'Optional[dict[str, Type[BaseType]]]' = None,
                 enum_namespaces: 'Optional[list[str]]' = None,
-                bare: 'bool' = False, *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
+                bare: 'bool' = False, columnar: 'bool' = False, lazy: 'bool' = False,
+                slots: 'bool' = False, frozen: 'bool' = False,
+                zero_copy: 'bool' = False, packed: 'bool' = False,
+                row_filter: 'Optional[dict[str, Callable[[bytes], bool]]]' = None,
+                *args: 'Any', **kwargs: 'Any') -> 'ASCIIInfo':
     """Parse ASCII log string.
 
     Args:
@@ -523,6 +1170,19 @@ def loads_ascii(data: 'AnyStr', parser: 'Optional[Type[ASCIIParser]]' = None,  #
             :class:`~zlogging.types.BaseType` to modify parsing behaviours.
         enum_namespaces: Namespaces to be loaded.
         bare: If :data:`True`, do not load ``zeek`` namespace by default.
+        columnar: If :data:`True`, parse log records as a
+            :class:`~zlogging.columnar.Table`.
+        lazy: If :data:`True`, parse log records as
+            :class:`~zlogging.model.LazyModel`.
+        slots: If :data:`True`, generate the data model with ``__slots__``.
+        frozen: If :data:`True`, parse ``set`` and ``vector`` fields as
+            :obj:`frozenset` and :obj:`tuple`.
+        zero_copy: If :data:`True`, parse long ``string`` fields as read-only
+            :obj:`memoryview` slices of blocks read from the log file.
+        packed: If :data:`True`, parse ``addr`` and ``subnet`` fields as
+            packed integers.
+        row_filter: Predicates of raw field values by field names, to skip
+            rejected records before their fields are converted.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -535,20 +1195,29 @@ def loads_ascii(data: 'AnyStr', parser: 'Optional[Type[ASCIIParser]]' = None,  #
 
     if parser is None:
         parser = ASCIIParser
-    ascii_parser = parser(type_hook, enum_namespaces, bare)
+    ascii_parser = parser(type_hook, enum_namespaces, bare, columnar=columnar, lazy=lazy, slots=slots,
+                          frozen=frozen, zero_copy=zero_copy, packed=packed, row_filter=row_filter)
 
     with io.BytesIO(data) as file:
         info = ascii_parser.parse_file(file)  # type: ignore[arg-type]
     return info
 
 
-def parse(filename: 'PathLike[str]', *args: 'Any', **kwargs: 'Any') -> 'Union[JSONInfo, ASCIIInfo]':
+def parse(filename: 'PathLike[str]', *args: 'Any', cache: 'Optional[ParseCache]' = None,
+          time_range: 'Optional[Range]' = None, ranges: 'Optional[Mapping[str, Range]]' = None,
+          **kwargs: 'Any') -> 'Union[JSONInfo, ASCIIInfo]':
     """Parse Bro/Zeek log file.
 
     Args:
         filename: Log file name.
         *args: See :func:`~zlogging.loader.parse_json` and
             :func:`~zlogging.loader.parse_ascii` for more information.
+        cache: If given, parse the log file through the
+            :class:`~zlogging.cache.ParseCache`.
+        time_range: If given, parse only records whose ``ts`` is within
+            the half-open range, see :func:`~zlogging.zonemap.parse_range`.
+        ranges: If given, parse only records whose numeric fields are within
+            the closed ranges, see :func:`~zlogging.zonemap.parse_range`.
         **kwargs: See :func:`~zlogging.loader.parse_json` and
             :func:`~zlogging.loader.parse_ascii` for more information.
 
@@ -558,7 +1227,21 @@ def parse(filename: 'PathLike[str]', *args: 'Any', **kwargs: 'Any') -> 'Union[JS
     Raises:
         :exc:`ParserError`: If the format of the log file is unknown.
 
+    Note:
+        With ``time_range`` or ``ranges``, the blocks of the log file are
+        pruned by its zone map, and ``*args`` and ``cache`` are not
+        supported.
+
     """
+    if time_range is not None or ranges is not None:
+        if args or cache is not None:
+            raise ZeekValueError('positional arguments and cache are not supported with ranges')
+        from zlogging.zonemap import parse_range  # pylint: disable=import-outside-toplevel
+        return parse_range(filename, time_range=time_range, ranges=ranges, **kwargs)
+
+    if cache is not None:
+        return cache.parse(filename, *args, **kwargs)
+
     with open(filename, 'rb') as file:
         char = file.read(1)
 
@@ -569,6 +1252,34 @@ def parse(filename: 'PathLike[str]', *args: 'Any', **kwargs: 'Any') -> 'Union[JS
     raise ParserError('unknown format')
 
 
+def parse_files(paths: 'Union[PathLike[str], Iterable[PathLike[str]]]', *args: 'Any',
+                time_range: 'Optional[Range]' = None, ranges: 'Optional[Mapping[str, Range]]' = None,
+                **kwargs: 'Any') -> 'dict[str, Union[JSONInfo, ASCIIInfo]]':
+    """Parse Bro/Zeek log files.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`.
+        *args: See :func:`~zlogging.loader.parse` for more information.
+        time_range: If given, skip log files and blocks without records whose
+            ``ts`` is within the half-open range.
+        ranges: If given, skip log files and blocks without records whose
+            numeric fields are within the closed ranges.
+        **kwargs: See :func:`~zlogging.loader.parse` for more information.
+
+    Returns:
+        The parsed log data by file names, excluding log files skipped by
+        their zone maps, see :func:`~zlogging.zonemap.candidates`.
+
+    """
+    if time_range is None and ranges is None:
+        return {filename: parse(filename, *args, **kwargs) for filename in expand_paths(paths)}
+
+    from zlogging.zonemap import candidates  # pylint: disable=import-outside-toplevel
+    options = {key: kwargs[key] for key in ('block_size', 'suffix') if key in kwargs}
+    return {filename: parse(filename, *args, time_range=time_range, ranges=ranges, **kwargs)
+            for filename in candidates(paths, time_range=time_range, ranges=ranges, **options)}
+
+
 def load(file: 'BinaryFile', *args: 'Any', **kwargs: 'Any') -> 'Union[JSONInfo, ASCIIInfo]':
     """Parse Bro/Zeek log file.
 
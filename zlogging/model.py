@@ -3,24 +3,221 @@
 
 import abc
 import collections
+import copyreg
+import json
+import keyword
+import math
+import pickle
+import re
+import sys
 import types
+import uuid
+import weakref
+from json.encoder import encode_basestring_ascii
 from typing import TYPE_CHECKING
 
 from zlogging._aux import expand_typing
 from zlogging._exc import ModelFormatError, ModelTypeError, ModelValueError
+from zlogging.types import BaseType, get_type
 
 __all__ = [
-    'Model', 'new_model',
+    'Model', 'LazyModel', 'new_model',
 ]
 
 if TYPE_CHECKING:
     from collections import OrderedDict
-    from typing import Any, Optional, Type, Union
+    from typing import Any, Callable, Optional, Sequence, Type, Union
 
+    from zlogging._typing import ExpandedTyping
     from zlogging.types import _GenericType, _SimpleType, _VariadicType
 
+    Schema = tuple[str, Type[Model], bool, tuple[tuple[str, BaseType], ...]]
 
-class Model(metaclass=abc.ABCMeta):
+
+#: Registry of data models by their schema identifier.
+_SCHEMA_REGISTRY = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary[str, Type[Model]]
+
+
+def _reduce_model(cls: 'Type[Model]') -> 'Union[str, tuple[Callable[..., Type[Model]], tuple[str, Schema]]]':
+    """Reduce a data model for pickling.
+
+    Data models importable from their modules are pickled by reference as
+    usual. Otherwise, only data models created by :func:`new_model`, whose
+    namespaces consist of field declarations only, are pickled by their
+    schema, and rebuilt on unpickling.
+
+    Raises:
+        :exc:`pickle.PicklingError`: If the data model is neither importable
+            nor created by :func:`new_model`, as its custom methods and
+            attributes cannot be rebuilt from the schema.
+
+    """
+    target = sys.modules.get(cls.__module__)
+    for part in cls.__qualname__.split('.'):
+        target = getattr(target, part, None)
+    if target is cls:
+        return cls.__qualname__
+    if not cls.__dict__.get('__dynamic__', False):
+        raise pickle.PicklingError('cannot pickle data model %r: not importable as %s.%s '
+                                   'nor created by new_model()' % (cls, cls.__module__, cls.__qualname__))  # pylint: disable=consider-using-f-string
+    return _rebuild_model, cls._schema()
+
+
+def _rebuild_model(schema_id: 'str', schema: 'Schema') -> 'Type[Model]':
+    """Rebuild a data model from its pickled schema.
+
+    Args:
+        schema_id: Identifier of the data model.
+        schema: Schema of the data model, as ``(name, base, slots, fields)``.
+
+    Returns:
+        The data model registered with ``schema_id``, or a new data model
+        created from ``schema`` if not found.
+
+    """
+    model = _SCHEMA_REGISTRY.get(schema_id)
+    if model is None:
+        name, base, slots, fields = schema
+        model = new_model(name, __base__=base, __slots__=slots, **collections.OrderedDict(fields))
+        model.__schema__ = schema_id, schema
+        _SCHEMA_REGISTRY[schema_id] = model
+    return model
+
+
+def _restore_record(model: 'Type[Model]', values: 'tuple[Any, ...]') -> 'Model':
+    """Restore a pickled data model instance."""
+    return model._from_converted(values)  # pylint: disable=protected-access
+
+
+def _slots_getattr(self: 'Model', name: 'str') -> 'Any':
+    """Get field value of a slotted data model by its field name."""
+    try:
+        attr = type(self).__attrmap__[name]
+    except KeyError:
+        raise AttributeError('%r object has no attribute %r' % (type(self).__name__, name)) from None  # pylint: disable=consider-using-f-string
+    return object.__getattribute__(self, attr)
+
+
+def _slots_setattr(self: 'Model', name: 'str', value: 'Any') -> 'None':
+    """Set field value of a slotted data model by its field name."""
+    object.__setattr__(self, type(self).__attrmap__.get(name, name), value)
+
+
+def _json_value(value: 'Any') -> 'str':
+    """Encode JSON serialisable field value, same as :func:`json.dumps`."""
+    if value is None:
+        return 'null'
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value_type is float and math.isfinite(value):
+        return float.__repr__(value)
+    if value_type is bool:
+        return 'true' if value else 'false'
+    return json.dumps(value)
+
+
+def _compile_encoder(model: 'Type[Model]', format: 'str', separator: 'str') -> 'Callable[[Model], str]':  # pylint: disable=redefined-builtin
+    """Generate the log line encoder of a data model.
+
+    The encoder renders a record as a log line directly by a single string
+    formatting, with the field converters bound as closure variables and
+    the field names (and JSON keys) formatted in advance.
+
+    Args:
+        model: Data model class.
+        format: Log format, i.e. ``ascii`` or ``json``.
+        separator: Field separator of ASCII logs.
+
+    Returns:
+        The encoder function.
+
+    """
+    if not model.__fields__:
+        # NOTE: no values to be formatted, nor valid source to be generated
+        line = '{}\n' if format == 'json' else '\n'
+        return lambda record: line
+
+    attrmap = model.__attrmap__ if '__attrmap__' in model.__dict__ else {}
+
+    namespace = {'_json_value': _json_value}  # type: dict[str, Any]
+    values = []  # type: list[str]
+    for index, (field, type_cls) in enumerate(model.__fields__.items()):
+        attr = attrmap.get(field, field)
+        if attr.isidentifier() and not keyword.iskeyword(attr):
+            getter = 'record.%s' % attr  # pylint: disable=consider-using-f-string
+        else:
+            getter = 'getattr(record, %r)' % field  # pylint: disable=consider-using-f-string
+
+        namespace['_to_%d' % index] = getattr(type_cls, 'to%s' % format)  # pylint: disable=consider-using-f-string
+        if format == 'json':
+            values.append('_json_value(_to_%d(%s))' % (index, getter))  # pylint: disable=consider-using-f-string
+        else:
+            values.append('_to_%d(%s)' % (index, getter))  # pylint: disable=consider-using-f-string
+
+    if format == 'json':
+        template = '{%s}\n' % ', '.join('%s: %%s' % json.dumps(field).replace('%', '%%')  # pylint: disable=consider-using-f-string
+                                        for field in model.__fields__)
+    else:
+        template = '%s\n' % separator.replace('%', '%%').join('%s' for _ in model.__fields__)  # pylint: disable=consider-using-f-string
+
+    source = 'def make(%s):\n    def encode(record):\n        return %r %% (%s,)\n    return encode\n' % (  # pylint: disable=consider-using-f-string
+        ', '.join(key for key in namespace if key.startswith('_to_')), template, ', '.join(values),
+    )
+    exec(source, namespace)  # pylint: disable=exec-used # nosec: B102
+    return namespace['make'](*(value for key, value in namespace.items() if key.startswith('_to_')))
+
+
+class _ModelMeta(abc.ABCMeta):
+    """Meta class of data models.
+
+    The meta class accepts an optional ``slots`` class keyword. When set to
+    :data:`True`, the data model will be generated with ``__slots__`` matching
+    its expanded fields, so that its instances do not carry a ``__dict__``.
+
+    Fields whose names are not valid identifiers, e.g. ``id.orig_h`` of the
+    expanded ``record`` fields, are stored in sanitised slots, e.g.
+    ``_id_orig_h``, and mapped through ``__attrmap__``.
+
+    """
+
+    def __new__(mcls, name: 'str', bases: 'tuple[type, ...]', namespace: 'dict[str, Any]',  # pylint: disable=bad-classmethod-argument
+                slots: 'bool' = False, **kwargs: 'Any') -> '_ModelMeta':
+        if not slots:
+            return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        expanded = expand_typing(types.SimpleNamespace(**namespace), ModelValueError)  # type: ignore[arg-type]
+        fields = expanded['fields']
+
+        attrmap = {}  # type: dict[str, str]
+        for field in fields:
+            if field.isidentifier() and not field.startswith('__'):
+                continue
+            attr = '_%s' % re.sub(r'\W', '_', field.lstrip('_'))  # pylint: disable=consider-using-f-string
+            while attr in fields or attr in attrmap.values():
+                attr += '_'
+            attrmap[field] = attr
+
+        namespace = {key: value for key, value in namespace.items()
+                     if key not in fields and key not in expanded['record_fields']}
+        namespace['__slots__'] = tuple(attrmap.get(field, field) for field in fields)
+        namespace['__attrmap__'] = attrmap
+        if attrmap:
+            namespace.setdefault('__getattr__', _slots_getattr)
+            namespace.setdefault('__setattr__', _slots_setattr)
+
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        cls._expand_fields(expanded)
+        return cls
+
+    def __init__(cls, name: 'str', bases: 'tuple[type, ...]', namespace: 'dict[str, Any]',
+                 slots: 'bool' = False, **kwargs: 'Any') -> 'None':  # pylint: disable=unused-argument
+        super().__init__(name, bases, namespace, **kwargs)
+
+
+class Model(metaclass=_ModelMeta):
     """Log data model.
 
     Args:
@@ -65,6 +262,15 @@ class Model(metaclass=abc.ABCMeta):
         annotations then assignments. Should there be any conflicts,
         ``ModelError`` will be raised.
 
+        To reduce memory footprint of the data model instances, pass the
+        ``slots`` keyword so that fields are stored in ``__slots__``:
+
+        .. code-block:: python
+
+            class MyLog(Model, slots=True):
+                field_one = StringType()
+                field_two = SetType(element_type=PortType)
+
     See Also:
 
         See :func:`~zlogging._aux.expand_typing` for more information about
@@ -81,6 +287,10 @@ class Model(metaclass=abc.ABCMeta):
     __unset_field__: 'bytes'
     #: Separator for set/vector fields.
     __set_separator__: 'bytes'
+    #: Mapping of field names to their ``__slots__`` names, if differ.
+    __attrmap__: 'dict[str, str]' = {}
+
+    __slots__ = ()
 
     @property
     def fields(self) -> 'OrderedDict[str, Union[_SimpleType, _GenericType]]':
@@ -103,7 +313,23 @@ class Model(metaclass=abc.ABCMeta):
         return self.__set_separator__
 
     def __new__(cls, *args: 'Any', **kwargs: 'Any') -> 'Model':  # pylint: disable=unused-argument
-        expanded = expand_typing(cls, ModelValueError)
+        if '__fields__' not in cls.__dict__:
+            cls._expand_fields()
+        return super().__new__(cls)
+
+    @classmethod
+    def _expand_fields(cls, expanded: 'Optional[ExpandedTyping]' = None) -> 'None':
+        """Expand fields of the data model.
+
+        The expanded fields are cached in the class namespace, so that the
+        typing annotations are only processed once per data model.
+
+        Args:
+            expanded: Already expanded fields of the data model.
+
+        """
+        if expanded is None:
+            expanded = expand_typing(cls, ModelValueError)
 
         cls.__fields__ = expanded['fields']
         cls.__record_fields__ = expanded['record_fields']
@@ -113,8 +339,6 @@ class Model(metaclass=abc.ABCMeta):
         cls.__empty_field__ = expanded['empty_field']
         cls.__set_separator__ = expanded['set_separator']
 
-        return super().__new__(cls)
-
     def __init__(self, *args: 'Any', **kwargs: 'Any') -> 'None':
         init_args = collections.OrderedDict()
 
@@ -127,7 +351,7 @@ class Model(metaclass=abc.ABCMeta):
         for arg, val in kwargs.items():
             if arg in init_args:
                 raise ModelTypeError('__init__() got multiple values for argument %r' % arg)  # pylint: disable=consider-using-f-string
-            if arg not in field_names:
+            if arg not in self.__fields__:
                 if arg in self.__record_fields__ and isinstance(val, dict):
                     for arg_nam, arg_val in val.items():
                         name = '%s.%s' % (arg, arg_nam)  # pylint: disable=consider-using-f-string
@@ -157,6 +381,31 @@ class Model(metaclass=abc.ABCMeta):
             setattr(self, key, val)
         self.__post_init__()
 
+    @classmethod
+    def _from_converted(cls, values: 'Sequence[Any]') -> 'Model':
+        """Create a data model instance from converted field values.
+
+        This is a trusted constructor for parsers: ``values`` shall be already
+        converted by the field data types, and exactly follow the order of
+        fields. Neither conversion nor validation is done on the values, but
+        :meth:`~zlogging.model.Model.__post_init__` will still be called.
+
+        Args:
+            values: Converted field values.
+
+        Returns:
+            The data model instance.
+
+        """
+        self = cls.__new__(cls)
+        if '__attrmap__' in cls.__dict__:
+            for attr, value in zip(cls.__slots__, values):  # type: ignore[attr-defined]
+                object.__setattr__(self, attr, value)
+        else:
+            self.__dict__.update(zip(cls.__fields__, values))
+        self.__post_init__()
+        return self
+
     def __post_init__(self) -> 'None':
         """Post-processing customisation."""
 
@@ -252,25 +501,234 @@ class Model(metaclass=abc.ABCMeta):
             A tuple of field values.
 
         """
-        field_names = []  # type: list[str]
-        field_value = []  # type: list[Any]
-        for field in self.__fields__:
-            value = getattr(self, field)
-            field_names.append(field)
-            field_value.append(value)
-
+        field_value = [getattr(self, field) for field in self.__fields__]
         if tuple_factory is None:
-            model_name = type(self).__name__
-            named_tuple = collections.namedtuple(model_name, field_names)  # type: ignore[misc]
-            return named_tuple(*field_value)
+            return self._namedtuple()._make(field_value)
         return tuple_factory(field_value)
 
+    def __reduce__(self) -> 'tuple[Callable[..., Model], tuple[Type[Model], tuple[Any, ...]]]':
+        return _restore_record, (type(self), tuple(getattr(self, field) for field in self.__fields__))
+
+    @classmethod
+    def _schema(cls) -> 'tuple[str, Schema]':
+        """Get the schema of the data model for pickling.
 
-def new_model(name: 'str', **fields: 'Any') -> 'Type[Model]':
+        The schema is computed once and cached per data model, and the data
+        model is registered with a unique identifier, so that it can be looked
+        up when unpickling in the same process. Distinct data models of equal
+        schemas are thus never mixed up.
+
+        Returns:
+            The identifier and the schema as ``(name, base, slots, fields)``.
+
+        """
+        schema = cls.__dict__.get('__schema__')
+        if schema is None:
+            if '__fields__' not in cls.__dict__:
+                cls._expand_fields()
+            fields = tuple(cls.__fields__.items())
+            slots = '__attrmap__' in cls.__dict__
+            data = (cls.__name__, cls.__bases__[0], slots, fields)  # type: Schema
+            schema_id = uuid.uuid4().hex
+
+            schema = cls.__schema__ = schema_id, data
+            _SCHEMA_REGISTRY[schema_id] = cls
+        return schema
+
+    @classmethod
+    def _encoder(cls, format: 'str', separator: 'str' = '\t') -> 'Callable[[Model], str]':  # pylint: disable=redefined-builtin
+        """Get the log line encoder of the data model.
+
+        The encoder is generated once per data model, format and separator,
+        and renders a record as a log line (with the trailing newline)
+        without building the intermediate :obj:`OrderedDict` of
+        :meth:`~Model.tojson` and :meth:`~Model.toascii`. Data models
+        overriding these methods are encoded through them instead.
+
+        Args:
+            format: Log format, i.e. ``ascii`` or ``json``.
+            separator: Field separator of ASCII logs.
+
+        Returns:
+            The encoder function.
+
+        """
+        encoders = cls.__dict__.get('__encoders__')
+        if encoders is None:
+            encoders = cls.__encoders__ = {}
+
+        key = (format, separator)
+        encoder = encoders.get(key)
+        if encoder is None:
+            if '__fields__' not in cls.__dict__:
+                cls._expand_fields()
+
+            method = getattr(cls, 'to%s' % format)  # pylint: disable=consider-using-f-string
+            if method is getattr(Model, 'to%s' % format) or method is getattr(LazyModel, 'to%s' % format):  # pylint: disable=consider-using-f-string
+                encoder = _compile_encoder(cls, format, separator)
+            elif format == 'json':
+                encoder = lambda record: '%s\n' % json.dumps(record.tojson())  # pylint: disable=consider-using-f-string,unnecessary-lambda-assignment
+            else:
+                encoder = lambda record: '%s\n' % separator.join(record.toascii().values())  # pylint: disable=consider-using-f-string,unnecessary-lambda-assignment
+            encoders[key] = encoder
+        return encoder
+
+    @classmethod
+    def _namedtuple(cls) -> 'Type[tuple]':
+        """Get the :func:`~collections.namedtuple` type of the data model.
+
+        The type is created once and cached per data model. Field names which
+        are not valid identifiers, e.g. ``id.orig_h``, are sanitised as
+        ``id_orig_h``.
+
+        Returns:
+            The named tuple type.
+
+        """
+        named_tuple = cls.__dict__.get('__namedtuple__')
+        if named_tuple is None:
+            model_name = re.sub(r'\W', '_', cls.__name__)
+            if not model_name.isidentifier() or keyword.iskeyword(model_name):
+                model_name = '_%s' % model_name  # pylint: disable=consider-using-f-string
+            field_names = [re.sub(r'\W', '_', field) for field in cls.__fields__]
+            named_tuple = collections.namedtuple(model_name, field_names, rename=True)  # type: ignore[misc]
+            cls.__namedtuple__ = named_tuple
+        return named_tuple
+
+
+class _LazyField:
+    """Descriptor of a :class:`LazyModel` field.
+
+    The field is decoded from its raw data on first access, and the decoded
+    value is then cached in the instance namespace.
+
+    Args:
+        name: Field name.
+        index: Index of the field in the raw data.
+        type: Field data type.
+
+    """
+
+    __slots__ = ('name', 'index', 'type')
+
+    def __init__(self, name: 'str', index: 'int', type: 'Union[_SimpleType, _GenericType]') -> 'None':  # pylint: disable=redefined-builtin
+        self.name = name
+        self.index = index
+        self.type = type
+
+    def __get__(self, instance: 'Optional[LazyModel]', owner: 'Optional[Type[LazyModel]]' = None) -> 'Any':
+        if instance is None:
+            return self.type
+
+        cache = instance.__dict__
+        try:
+            return cache[self.name]
+        except KeyError:
+            pass
+
+        raw = cache.get('_raw_fields')
+        if raw is None:
+            raise AttributeError(self.name)
+        value = cache[self.name] = self.type(raw[self.index])
+        return value
+
+    def __set__(self, instance: 'LazyModel', value: 'Any') -> 'None':
+        cache = instance.__dict__
+        cache[self.name] = value
+
+        modified = cache.get('_modified_fields')
+        if modified is not None:
+            modified.add(self.name)
+
+
+class LazyModel(Model):
+    """Log data model with fields decoded on first access.
+
+    A lazy record keeps the raw fields as split from an ASCII log line, and
+    only converts a field with its data type when it is first accessed. It
+    behaves exactly like :class:`Model` otherwise.
+
+    Args:
+        *args: Arbitrary positional arguments.
+        **kwargs: Arbitrary keyword arguments.
+
+    Note:
+        Since fields are decoded on demand, malformed field data will only
+        raise when being accessed, rather than when the log is parsed.
+
+    See Also:
+        See :meth:`LazyModel.from_raw <zlogging.model.LazyModel.from_raw>`
+        for creating lazy records.
+
+    """
+
+    def __init_subclass__(cls, **kwargs: 'Any') -> 'None':
+        super().__init_subclass__(**kwargs)
+
+        if '__attrmap__' in cls.__dict__:
+            raise ModelTypeError('lazy data model does not support __slots__')
+        cls._expand_fields()
+        for index, (name, type_cls) in enumerate(cls.__fields__.items()):
+            setattr(cls, name, _LazyField(name, index, type_cls))
+
+    @classmethod
+    def from_raw(cls, data: 'Sequence[bytes]') -> 'LazyModel':
+        """Create a lazy record from raw fields.
+
+        Args:
+            data: Raw fields of a log line, in the order of fields.
+
+        Returns:
+            The lazy record.
+
+        Raises:
+            :exc:`ModelTypeError`: If the number of raw fields does not
+                match the data model.
+
+        """
+        if len(data) != len(cls.__fields__):
+            raise ModelTypeError('expected %d fields but %d were given' % (len(cls.__fields__), len(data)))  # pylint: disable=line-too-long,consider-using-f-string
+
+        self = cls.__new__(cls)
+        self.__dict__['_raw_fields'] = data
+        self.__dict__['_modified_fields'] = set()
+        self.__post_init__()
+        return self
+
+    def toascii(self, raw: 'bool' = False) -> 'OrderedDict[str, str]':  # pylint: disable=arguments-differ
+        """Serialise data model as ASCII log format.
+
+        Args:
+            raw: If :data:`True`, fields never modified since the record was
+                parsed will be returned untouched as in the original log line,
+                without being decoded and re-encoded.
+
+        Returns:
+            An :obj:`OrderedDict` mapping each field and serialised text data.
+
+        """
+        data = self.__dict__.get('_raw_fields')
+        if not raw or data is None:
+            return super().toascii()
+
+        modified = self.__dict__['_modified_fields']
+        fields = collections.OrderedDict()
+        for index, (field, type_cls) in enumerate(self.__fields__.items()):
+            if field in modified:
+                fields[field] = type_cls.toascii(getattr(self, field))
+            else:
+                fields[field] = data[index].decode('ascii')
+        return fields
+
+
+def new_model(name: 'str', /, *, __base__: 'Optional[Type[Model]]' = None,
+              __slots__: 'bool' = False, **fields: 'Any') -> 'Type[Model]':
     """Create a data model dynamically with the appropriate fields.
 
     Args:
         name: data model name
+        __base__: base class of the data model, default to :class:`Model`
+        __slots__: generate the data model with ``__slots__``
         **fields: defined fields of the data model
 
     Returns:
@@ -293,9 +751,28 @@ def new_model(name: 'str', **fields: 'Any') -> 'Type[Model]':
 
             MyLog = new_model('MyLog', field_one=StringType(), field_two=SetType(element_type=PortType))
 
+    Note:
+        Data models created dynamically cannot be imported by reference,
+        thus they are pickled by schema, i.e. name, base class and fields,
+        and rebuilt on unpickling, e.g. in :mod:`multiprocessing` workers.
+        Rebuilt data models are registered by the identifier of the original
+        data model, so records of the same data model share the same rebuilt
+        one. Records themselves are pickled as a tuple of field values.
+        Subclassed data models which cannot be imported, e.g. those defined
+        in a function, are not picklable.
+
     """
     def gen_body(ns: 'dict[str, Any]') -> 'None':
         """Generate ``exec_body``."""
+        # mark the data model as safe to be pickled by schema
+        ns['__dynamic__'] = True
         for name, type_cls in fields.items():
+            if isinstance(type_cls, type) and issubclass(type_cls, BaseType):
+                type_cls = get_type(type_cls)
             ns[name] = type_cls
-    return types.new_class(name, (Model,), exec_body=gen_body)
+    if __base__ is None:
+        __base__ = Model
+    return types.new_class(name, (__base__,), {'slots': __slots__}, exec_body=gen_body)
+
+
+copyreg.pickle(_ModelMeta, _reduce_model)  # type: ignore[arg-type]
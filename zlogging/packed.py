@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Packed representations of network data types."""
+
+import ipaddress
+import socket
+from typing import TYPE_CHECKING, NamedTuple
+
+__all__ = [
+    'PackedAddress', 'PackedNetwork',
+]
+
+if TYPE_CHECKING:
+    from typing import Union
+
+    from typing_extensions import Literal
+
+    IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+#: Number of bits and address family per IP version.
+_FAMILY = {
+    4: (32, socket.AF_INET),
+    6: (128, socket.AF_INET6),
+}
+
+
+class PackedAddress(NamedTuple):
+    """Integer-packed IP address.
+
+    The IP address is represented as a plain :obj:`tuple` of its integer value
+    and IP version, which is much cheaper to hash and compare than
+    :mod:`ipaddress` objects, e.g. when grouping or joining log records.
+
+    Example:
+
+        >>> address = PackedAddress.from_string('192.168.0.1')
+        >>> address
+        PackedAddress(value=3232235521, version=4)
+        >>> str(address)
+        '192.168.0.1'
+
+    """
+
+    #: Integer value of the IP address.
+    value: int
+    #: IP version, i.e. ``4`` or ``6``.
+    version: 'Literal[4, 6]'
+
+    def __str__(self) -> 'str':
+        bits, family = _FAMILY[self.version]
+        return socket.inet_ntop(family, self.value.to_bytes(bits // 8, 'big'))
+
+    @classmethod
+    def from_string(cls, address: 'str') -> 'PackedAddress':
+        """Parse IP address from string.
+
+        Args:
+            address: IP address string.
+
+        Returns:
+            The packed IP address.
+
+        Raises:
+            :exc:`ValueError`: If ``address`` is not a valid IP address.
+
+        """
+        version = 6 if ':' in address else 4
+        try:
+            packed = socket.inet_pton(_FAMILY[version][1], address)
+        except OSError:
+            raise ValueError(f'{address!r} does not appear to be an IPv4 or IPv6 address') from None
+        return cls(int.from_bytes(packed, 'big'), version)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_ipaddress(cls, address: 'IPAddress') -> 'PackedAddress':
+        """Pack IP address from :mod:`ipaddress` object.
+
+        Args:
+            address: IP address object.
+
+        Returns:
+            The packed IP address.
+
+        """
+        return cls(int(address), address.version)  # type: ignore[arg-type]
+
+    def to_ipaddress(self) -> 'IPAddress':
+        """Convert as :mod:`ipaddress` object.
+
+        Returns:
+            The IP address object.
+
+        """
+        if self.version == 4:
+            return ipaddress.IPv4Address(self.value)
+        return ipaddress.IPv6Address(self.value)
+
+
+class PackedNetwork(NamedTuple):
+    """Integer-packed IP network.
+
+    The IP network is represented as a plain :obj:`tuple` of the integer value
+    of its network address, its prefix length and IP version. Membership of
+    :class:`PackedAddress` can be checked with the ``in`` operator by integer
+    arithmetic only.
+
+    Example:
+
+        >>> network = PackedNetwork.from_string('192.168.0.0/16')
+        >>> network
+        PackedNetwork(value=3232235520, prefixlen=16, version=4)
+        >>> PackedAddress.from_string('192.168.0.1') in network
+        True
+        >>> str(network)
+        '192.168.0.0/16'
+
+    """
+
+    #: Integer value of the network address.
+    value: int
+    #: Prefix length of the network.
+    prefixlen: int
+    #: IP version, i.e. ``4`` or ``6``.
+    version: 'Literal[4, 6]'
+
+    def __str__(self) -> 'str':
+        bits, family = _FAMILY[self.version]
+        return '%s/%d' % (socket.inet_ntop(family, self.value.to_bytes(bits // 8, 'big')), self.prefixlen)  # pylint: disable=consider-using-f-string
+
+    def __contains__(self, address: 'object') -> 'bool':
+        if not isinstance(address, PackedAddress) or address.version != self.version:
+            return False
+        shift = _FAMILY[self.version][0] - self.prefixlen
+        return address.value >> shift == self.value >> shift
+
+    @classmethod
+    def from_string(cls, network: 'str') -> 'PackedNetwork':
+        """Parse IP network from string.
+
+        Args:
+            network: IP network string, in CIDR notation. Host bits of the
+                network address will be masked.
+
+        Returns:
+            The packed IP network.
+
+        Raises:
+            :exc:`ValueError`: If ``network`` is not a valid IP network.
+
+        """
+        address, _, prefix = network.partition('/')
+        packed = PackedAddress.from_string(address)
+        bits = _FAMILY[packed.version][0]
+
+        try:
+            prefixlen = int(prefix) if prefix else bits
+        except ValueError:
+            raise ValueError(f'{network!r} does not appear to be an IPv4 or IPv6 network') from None
+        if not 0 <= prefixlen <= bits:
+            raise ValueError(f'{network!r} does not appear to be an IPv4 or IPv6 network')
+
+        shift = bits - prefixlen
+        return cls(packed.value >> shift << shift, prefixlen, packed.version)
+
+    @classmethod
+    def from_ipaddress(cls, network: 'IPNetwork') -> 'PackedNetwork':
+        """Pack IP network from :mod:`ipaddress` object.
+
+        Args:
+            network: IP network object.
+
+        Returns:
+            The packed IP network.
+
+        """
+        return cls(int(network.network_address), network.prefixlen, network.version)  # type: ignore[arg-type]
+
+    def to_ipaddress(self) -> 'IPNetwork':
+        """Convert as :mod:`ipaddress` object.
+
+        Returns:
+            The IP network object.
+
+        """
+        if self.version == 4:
+            return ipaddress.IPv4Network((self.value, self.prefixlen))
+        return ipaddress.IPv6Network((self.value, self.prefixlen))
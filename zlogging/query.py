@@ -0,0 +1,675 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports
+"""Streaming queries over logs."""
+
+import abc
+import contextlib
+import ctypes
+import itertools
+import json
+import operator
+import os
+from typing import TYPE_CHECKING
+
+from zlogging._aux import expand_typing
+from zlogging._exc import ASCIIParserError, JSONParserError, ZeekValueError
+from zlogging.loader import ASCIIParser
+from zlogging.transcoder import _read_header
+from zlogging.types import AnyType, CountType, IntType, PortType, get_type
+
+__all__ = [
+    'Query', 'query',
+    'Aggregate', 'Count', 'Sum', 'Min', 'Max', 'Mean', 'Distinct',
+]
+
+if TYPE_CHECKING:
+    from io import BufferedReader as BinaryFile
+    from os import PathLike
+    from typing import Any, Callable, Iterable, Iterator, Optional, Type, Union
+
+    from zlogging.model import Model
+    from zlogging.types import BaseType
+
+    Source = Union[PathLike[str], Iterable[Model]]
+    Getter = Callable[[Any], Any]
+
+#: Comparison operators supported by :meth:`Query.where`.
+_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda value, target: value in target,
+    'not in': lambda value, target: value not in target,
+    'contains': lambda value, target: value is not None and target in value,
+}  # type: dict[str, Callable[[Any, Any], bool]]
+
+#: Placeholder for field values not yet converted in the current record.
+_PENDING = object()
+
+
+class Aggregate(metaclass=abc.ABCMeta):
+    """Base class of aggregate functions.
+
+    An aggregate folds the values of its ``fields`` over the records of a
+    group into a small state object, so that a query never holds more than
+    one state per group and aggregate in memory. Should more than one field
+    be given, the value of a record is the sum of its *set* fields.
+
+    Args:
+        *fields: Field names to aggregate.
+
+    """
+
+    #: Field names to aggregate.
+    fields: 'tuple[str, ...]'
+    #: If the value of a record over multiple fields is the tuple of their
+    #: values rather than the sum.
+    tuples: 'bool' = False
+    #: If the aggregate applies to scalar values only, i.e. values of ``set``
+    #: and ``vector`` fields are rejected.
+    scalar: 'bool' = False
+
+    def __init__(self, *fields: 'str') -> 'None':
+        self.fields = fields
+
+    def __repr__(self) -> 'str':
+        return '%s(%s)' % (type(self).__name__, ', '.join(map(repr, self.fields)))  # pylint: disable=consider-using-f-string
+
+    @abc.abstractmethod
+    def initial(self) -> 'Any':
+        """Create the initial state of a group."""
+
+    @abc.abstractmethod
+    def update(self, state: 'Any', value: 'Any') -> 'Any':
+        """Update the state with the value of a record.
+
+        Args:
+            state: The current state.
+            value: Value of the record, never :data:`None`.
+
+        Returns:
+            The updated state.
+
+        """
+
+    def result(self, state: 'Any') -> 'Any':
+        """Compute the result from the final state.
+
+        Args:
+            state: The final state.
+
+        Returns:
+            The aggregated value.
+
+        """
+        return state
+
+
+class Count(Aggregate):
+    """Number of records; or of records with any of ``fields`` set, if given."""
+
+    tuples = True
+
+    def initial(self) -> 'int':
+        return 0
+
+    def update(self, state: 'int', value: 'Any') -> 'int':
+        return state + 1
+
+
+class Sum(Aggregate):
+    """Sum of values, or :data:`None` if no value is set."""
+
+    scalar = True
+
+    def initial(self) -> 'Any':
+        return None
+
+    def update(self, state: 'Any', value: 'Any') -> 'Any':
+        if state is None:
+            return value
+        return state + value
+
+
+class Min(Aggregate):
+    """Minimum of values, or :data:`None` if no value is set."""
+
+    scalar = True
+
+    def initial(self) -> 'Any':
+        return None
+
+    def update(self, state: 'Any', value: 'Any') -> 'Any':
+        if state is None or value < state:
+            return value
+        return state
+
+
+class Max(Aggregate):
+    """Maximum of values, or :data:`None` if no value is set."""
+
+    scalar = True
+
+    def initial(self) -> 'Any':
+        return None
+
+    def update(self, state: 'Any', value: 'Any') -> 'Any':
+        if state is None or value > state:
+            return value
+        return state
+
+
+class Mean(Aggregate):
+    """Arithmetic mean of values, or :data:`None` if no value is set."""
+
+    scalar = True
+
+    def initial(self) -> 'list[Any]':
+        return [None, 0]
+
+    def update(self, state: 'list[Any]', value: 'Any') -> 'list[Any]':
+        state[0] = value if state[0] is None else state[0] + value
+        state[1] += 1
+        return state
+
+    def result(self, state: 'list[Any]') -> 'Any':
+        total, count = state
+        if count == 0:
+            return None
+        return total / count
+
+
+class Distinct(Aggregate):
+    """Number of distinct values.
+
+    Note:
+        The value of a record over multiple fields is the tuple of their
+        values rather than the sum. Values of ``set`` and ``vector`` fields
+        are compared as :obj:`frozenset` and :obj:`tuple`.
+
+    Warning:
+        The distinct values are kept in memory per group.
+
+    """
+
+    tuples = True
+
+    def initial(self) -> 'set[Any]':
+        return set()
+
+    def update(self, state: 'set[Any]', value: 'Any') -> 'set[Any]':
+        state.add(_freeze(value))
+        return state
+
+    def result(self, state: 'set[Any]') -> 'int':
+        return len(state)
+
+
+def _plain(type_cls: 'BaseType') -> 'Callable[[Any], Any]':
+    """Get the converter of field values as plain Python objects.
+
+    Args:
+        type_cls: Field data type.
+
+    Returns:
+        A function converting raw field values with ``type_cls``, where
+        :mod:`ctypes` numbers are further unwrapped as :obj:`int`.
+
+    """
+    if not isinstance(type_cls, (CountType, IntType, PortType)):
+        return type_cls
+
+    def convert(data: 'Any') -> 'Optional[int]':
+        value = type_cls(data)
+        if value is None:
+            return None
+        return value.value
+    return convert
+
+
+def _freeze(value: 'Any') -> 'Any':
+    """Convert value as hashable group key.
+
+    Args:
+        value: Field value, e.g. of a ``set`` or ``vector`` field.
+
+    Returns:
+        The value, with containers converted as :obj:`frozenset` and
+        :obj:`tuple`, and :mod:`ctypes` numbers unwrapped, recursively.
+
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_freeze, value))
+    if isinstance(value, dict):
+        return tuple((key, _freeze(data)) for key, data in value.items())
+    if isinstance(value, ctypes._SimpleCData):  # pylint: disable=protected-access
+        return value.value
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+def _ascii_records(file: 'BinaryFile', parser: 'ASCIIParser') -> 'tuple[dict[str, Getter], Iterator[Any]]':
+    """Prepare records of ASCII log file.
+
+    Args:
+        file: Log file object opened in binary mode.
+        parser: Parser providing the field data types.
+
+    Returns:
+        Field getters and split log lines as records.
+
+    """
+    header = _read_header(file)
+    separator = header['separator']
+    fields = parser._get_fields(header['fields'], header['types'], header['empty_field'],  # pylint: disable=protected-access
+                                header['unset_field'], header['set_separator'])
+
+    def getter(index: 'int', field: 'str', convert: 'Callable[[Any], Any]') -> 'Getter':
+        def get(record: 'tuple[int, list[bytes]]') -> 'Any':
+            lineno, values = record
+            try:
+                return convert(values[index])
+            except (ValueError, IndexError) as error:
+                raise ASCIIParserError(str(error), lineno, field) from error
+        return get
+
+    def records() -> 'Iterator[tuple[int, list[bytes]]]':
+        size = len(fields)
+        for lineno, line in enumerate(file, start=9):
+            if line.startswith(b'#'):
+                break
+            values = line.rstrip(b'\r\n').split(separator)
+            if len(values) != size:
+                raise ASCIIParserError('expected %d fields but %d were given' % (size, len(values)), lineno)  # pylint: disable=line-too-long,consider-using-f-string
+            yield lineno, values
+
+    getters = {field: getter(index, field, _plain(type_cls))
+               for index, (field, type_cls) in enumerate(fields.items())}
+    return getters, records()
+
+
+def _json_records(file: 'BinaryFile', model: 'Optional[Type[Model]]') -> 'tuple[dict[str, Getter], Iterator[Any]]':
+    """Prepare records of JSON log file.
+
+    Args:
+        file: Log file object opened in binary mode.
+        model: Field declarations of the log. If not given, the fields are
+            taken from the first record and their values are kept as decoded
+            from JSON.
+
+    Returns:
+        Field getters and decoded log lines as records.
+
+    """
+    def records() -> 'Iterator[tuple[int, dict[str, Any]]]':
+        for lineno, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield lineno, json.loads(line)
+            except json.JSONDecodeError as error:
+                raise JSONParserError(error.msg, lineno) from error
+
+    iterator = records()
+    if model is None:
+        try:
+            first = next(iterator)
+        except StopIteration:
+            return {}, iterator
+        fields = {field: get_type(AnyType) for field in first[1]}  # type: dict[str, BaseType]
+        iterator = itertools.chain([first], iterator)
+    else:
+        fields = expand_typing(model)['fields']
+
+    def getter(field: 'str', convert: 'Callable[[Any], Any]') -> 'Getter':
+        def get(record: 'tuple[int, dict[str, Any]]') -> 'Any':
+            lineno, data = record
+            try:
+                return convert(data.get(field))
+            except (TypeError, ValueError) as error:
+                raise JSONParserError(str(error), lineno, field) from error
+        return get
+
+    getters = {field: getter(field, _plain(type_cls)) for field, type_cls in fields.items()}
+    return getters, iterator
+
+
+def _model_records(data: 'Iterable[Model]') -> 'tuple[dict[str, Getter], Iterator[Any]]':
+    """Prepare records of data models.
+
+    Args:
+        data: Log records.
+
+    Returns:
+        Field getters and the log records.
+
+    """
+    iterator = iter(data)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return {}, iterator
+
+    def getter(field: 'str', unwrap: 'bool') -> 'Getter':
+        # NOTE: field names may contain dots, e.g. ``id.orig_h``, which
+        # :func:`operator.attrgetter` would take as nested attributes
+        def get(record: 'Model') -> 'Any':
+            value = getattr(record, field)
+            if value is None or not unwrap:
+                return value
+            return value.value
+        return get
+
+    getters = {field: getter(field, isinstance(type_cls, (CountType, IntType, PortType)))
+               for field, type_cls in first.__fields__.items()}
+    return getters, itertools.chain([first], iterator)
+
+
+@contextlib.contextmanager
+def _open_records(source: 'Source', model: 'Optional[Type[Model]]' = None,
+                  *args: 'Any', **kwargs: 'Any') -> 'Iterator[tuple[dict[str, Getter], Iterator[Any]]]':
+    """Open log records for streaming.
+
+    Args:
+        source: Log file name, either in ASCII or JSON format as sniffed
+            from its content; or an iterable of data models.
+        model: Field declarations for JSON logs.
+        *args: Arguments for :class:`~zlogging.loader.ASCIIParser`.
+        **kwargs: Keyword arguments for :class:`~zlogging.loader.ASCIIParser`.
+
+    Yields:
+        Getters of field values by field names, and the iterator of raw
+        records to be passed to the getters. Values are converted only when
+        the getter is called, as described in :class:`~zlogging.query.Query`.
+
+    """
+    if not isinstance(source, (str, bytes, os.PathLike)):
+        yield _model_records(source)
+        return
+
+    with open(source, 'rb') as file:
+        if file.peek(1)[:1] == b'#':
+            parser = ASCIIParser(*args, **kwargs)
+            yield _ascii_records(file, parser)
+        else:
+            yield _json_records(file, model)
+
+
+class Query:
+    """Streaming query over log records.
+
+    A query reads the log records lazily in a single pass, with memory
+    bounded by the number of groups rather than the size of the log. For
+    ASCII and JSON log files, only the fields referenced by the query are
+    ever converted, and the projected fields are only converted for records
+    accepted by all filters.
+
+    Field values are plain Python objects as parsed by the data types,
+    except that ``count``, ``int`` and ``port`` values are :obj:`int`
+    rather than :mod:`ctypes` numbers. *Unset* fields are :data:`None`.
+
+    Args:
+        source: Log file name, either in ASCII or JSON format as sniffed
+            from its content; or an iterable of data models, e.g.
+            :attr:`~zlogging._data.ASCIIInfo.data`.
+        model: Field declarations for JSON logs. If not given, fields are
+            taken from the first record and values are kept as decoded.
+        *args: Arguments for :class:`~zlogging.loader.ASCIIParser`.
+        **kwargs: Keyword arguments for :class:`~zlogging.loader.ASCIIParser`,
+            e.g. ``type_hook`` and ``enum_namespaces``.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> from zlogging.query import Query, Sum
+            >>> q = (Query('conn.log')
+            ...      .where('service', '==', b'ssl')
+            ...      .group_by('id.orig_h')
+            ...      .aggregate(bytes=Sum('orig_bytes', 'resp_bytes')))
+            >>> for row in q:
+            ...     print(row['id.orig_h'], row['bytes'])
+
+    """
+
+    def __init__(self, source: 'Source', model: 'Optional[Type[Model]]' = None,
+                 *args: 'Any', **kwargs: 'Any') -> 'None':
+        self._source = source
+        self._model = model
+        self._args = args
+        self._kwargs = kwargs
+
+        self._filters = []  # type: list[tuple[Callable[..., bool], tuple[str, ...]]]
+        self._select = None  # type: Optional[tuple[str, ...]]
+        self._group_by = None  # type: Optional[tuple[str, ...]]
+        self._aggregates = {}  # type: dict[str, Aggregate]
+
+    def where(self, field: 'str', op: 'str', value: 'Any') -> 'Query':
+        """Filter records by comparing a field with a value.
+
+        Records whose field is *unset* or not comparable with ``value``
+        are rejected, unless ``op`` is ``'!='`` or ``'not in'``.
+
+        Args:
+            field: Field name.
+            op: Comparison operator, i.e. ``'=='``, ``'!='``, ``'<'``,
+                ``'<='``, ``'>'``, ``'>='``, ``'in'``, ``'not in'``; or
+                ``'contains'`` for ``set`` and ``vector`` fields.
+            value: Value to compare with, as the field would be parsed,
+                e.g. :obj:`bytes` for ``string`` fields.
+
+        Returns:
+            The query itself.
+
+        Raises:
+            :exc:`ZeekValueError`: If ``op`` is not supported.
+
+        """
+        try:
+            compare = _OPERATORS[op]
+        except KeyError:
+            raise ZeekValueError('unsupported operator: %s' % op) from None  # pylint: disable=consider-using-f-string
+
+        def predicate(data: 'Any') -> 'bool':
+            try:
+                return compare(data, value)
+            except TypeError:
+                return False
+        self._filters.append((predicate, (field,)))
+        return self
+
+    def filter(self, predicate: 'Callable[..., bool]', *fields: 'str') -> 'Query':
+        """Filter records by a predicate.
+
+        Args:
+            predicate: Function called with the values of ``fields``,
+                returning :data:`True` to accept the record.
+            *fields: Field names passed to ``predicate``.
+
+        Returns:
+            The query itself.
+
+        """
+        self._filters.append((predicate, fields))
+        return self
+
+    def select(self, *fields: 'str') -> 'Query':
+        """Project records to fields.
+
+        Args:
+            *fields: Field names.
+
+        Returns:
+            The query itself.
+
+        """
+        self._select = fields
+        return self
+
+    def group_by(self, *fields: 'str') -> 'Query':
+        """Group records by fields.
+
+        Values of ``set`` and ``vector`` fields are grouped, and reported,
+        as :obj:`frozenset` and :obj:`tuple` of plain values.
+
+        Args:
+            *fields: Field names.
+
+        Returns:
+            The query itself.
+
+        """
+        self._group_by = fields
+        return self
+
+    def aggregate(self, **aggregates: 'Aggregate') -> 'Query':
+        """Aggregate records, per group if grouped.
+
+        Args:
+            **aggregates: Aggregates keyed by their result names.
+
+        Returns:
+            The query itself.
+
+        """
+        self._aggregates.update(aggregates)
+        return self
+
+    def __iter__(self) -> 'Iterator[dict[str, Any]]':
+        """Run the query.
+
+        Yields:
+            The selected records, or the aggregated groups, as :obj:`dict`.
+
+        Raises:
+            :exc:`ZeekValueError`: If the query refers to unknown fields;
+                :meth:`select` and :meth:`aggregate` are both used; or
+                :class:`Sum`, :class:`Min`, :class:`Max` or :class:`Mean`
+                aggregate ``set`` or ``vector`` fields.
+
+        """
+        if self._select is not None and (self._aggregates or self._group_by is not None):
+            raise ZeekValueError('select() cannot be used with group_by() or aggregate()')
+
+        with _open_records(self._source, self._model, *self._args, **self._kwargs) as (getters, records):
+            if not getters:
+                if self._aggregates and self._group_by is None:
+                    yield self._empty()
+                return
+            if self._aggregates or self._group_by is not None:
+                yield from self._aggregate(getters, records)
+            else:
+                yield from self._project(getters, records)
+
+    def _compile(self, getters: 'dict[str, Getter]', fields: 'Iterable[str]') -> 'dict[str, int]':
+        """Assign slots of the per-record value cache to fields."""
+        slots = {}  # type: dict[str, int]
+        for field in fields:
+            if field not in getters:
+                raise ZeekValueError('unknown field: %s' % field)  # pylint: disable=consider-using-f-string
+            slots.setdefault(field, len(slots))
+        return slots
+
+    def _accepted(self, getters: 'dict[str, Getter]',
+                  records: 'Iterator[Any]', slots: 'dict[str, int]') -> 'Iterator[Callable[[str], Any]]':
+        """Filter records, yielding the field accessor of each accepted one."""
+        filters = [(predicate, [(slots[field], getters[field]) for field in fields])
+                   for predicate, fields in self._filters]
+        pending = [_PENDING] * len(slots)
+
+        for record in records:
+            values = pending[:]
+
+            def fetch(slot: 'int', get: 'Getter') -> 'Any':
+                value = values[slot]
+                if value is _PENDING:
+                    value = values[slot] = get(record)  # pylint: disable=cell-var-from-loop
+                return value
+
+            for predicate, arguments in filters:
+                if not predicate(*(fetch(slot, get) for slot, get in arguments)):
+                    break
+            else:
+                yield lambda field: fetch(slots[field], getters[field])  # pylint: disable=cell-var-from-loop
+
+    def _project(self, getters: 'dict[str, Getter]', records: 'Iterator[Any]') -> 'Iterator[dict[str, Any]]':
+        """Run a projection query."""
+        selected = tuple(getters) if self._select is None else self._select
+        slots = self._compile(getters, [field for _, fields in self._filters for field in fields] + list(selected))
+        for fetch in self._accepted(getters, records, slots):
+            yield {field: fetch(field) for field in selected}
+
+    def _empty(self) -> 'dict[str, Any]':
+        """Result of an ungrouped aggregation over no records."""
+        return {name: aggregate.result(aggregate.initial()) for name, aggregate in self._aggregates.items()}
+
+    def _aggregate(self, getters: 'dict[str, Getter]', records: 'Iterator[Any]') -> 'Iterator[dict[str, Any]]':
+        """Run an aggregation query."""
+        keys = self._group_by or ()
+        aggregates = self._aggregates or {'count': Count()}
+        slots = self._compile(getters, [field for _, fields in self._filters for field in fields] + list(keys)
+                              + [field for aggregate in aggregates.values() for field in aggregate.fields])
+
+        plan = [(name, aggregate, aggregate.fields, aggregate.tuples, aggregate.scalar)
+                for name, aggregate in aggregates.items()]
+        groups = {}  # type: dict[tuple[Any, ...], list[Any]]
+        if not keys:
+            groups[()] = [aggregate.initial() for aggregate in aggregates.values()]
+
+        for fetch in self._accepted(getters, records, slots):
+            key = tuple(fetch(field) for field in keys)
+            try:
+                states = groups.get(key)
+            except TypeError:
+                key = _freeze(key)
+                states = groups.get(key)
+            if states is None:
+                states = groups[key] = [aggregate.initial() for aggregate in aggregates.values()]
+
+            for index, (_, aggregate, fields, as_tuple, scalar) in enumerate(plan):
+                if not fields:
+                    value = True
+                elif len(fields) == 1:
+                    value = fetch(fields[0])
+                elif as_tuple:
+                    value = tuple(fetch(field) for field in fields)
+                    if all(data is None for data in value):
+                        value = None
+                else:
+                    value = None
+                    for field in fields:
+                        data = fetch(field)
+                        if data is not None:
+                            value = data if value is None else value + data
+                if value is not None:
+                    if scalar and isinstance(value, (set, frozenset, list, tuple)):
+                        raise ZeekValueError('%r over set or vector field' % aggregate)  # pylint: disable=consider-using-f-string
+                    states[index] = aggregate.update(states[index], value)
+
+        for key, states in groups.items():
+            row = dict(zip(keys, key))
+            for (name, aggregate, _, _, _), state in zip(plan, states):
+                row[name] = aggregate.result(state)
+            yield row
+
+
+def query(source: 'Source', model: 'Optional[Type[Model]]' = None, *args: 'Any', **kwargs: 'Any') -> 'Query':
+    """Create a streaming query over log records.
+
+    Args:
+        source: Log file name or an iterable of data models.
+        model: Field declarations for JSON logs.
+        *args: See :class:`~zlogging.query.Query` for more information.
+        **kwargs: See :class:`~zlogging.query.Query` for more information.
+
+    Returns:
+        The query, to be refined and iterated.
+
+    """
+    return Query(source, model, *args, **kwargs)
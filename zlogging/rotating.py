@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Rotating log writer."""
+
+import concurrent.futures
+import gzip
+import os
+import shutil
+import time
+from typing import TYPE_CHECKING
+
+from zlogging._aux import strftime_header
+from zlogging._exc import WriterFormatError
+from zlogging.dumper import ASCIIWriter, JSONWriter
+
+__all__ = ['RotatingWriter']
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from io import BufferedWriter as BinaryFile
+    from os import PathLike
+    from typing import Any, Iterable, Optional, Type, Union
+
+    from zlogging.model import Model
+
+
+class RotatingWriter:
+    """Log writer rotating log files by size and/or time interval.
+
+    Records are written to ``filename``, and once the log file reaches
+    ``max_bytes`` or has been opened for the rotation ``interval``, it is
+    closed (with the ``#close`` trailer for ASCII logs) and renamed as Zeek
+    does, i.e. ``<path>.<open time>.log``, e.g. ``conn.2020-02-09-18-54-09.log``.
+    A new log file, with a new header, is then opened on the next record.
+
+    Args:
+        filename: Log file name, e.g. ``logs/conn.log``.
+        format: Log format, i.e. ``ascii`` or ``json``.
+        max_bytes: Rotate when the log file reaches this size.
+        interval: Rotate every ``interval`` seconds, aligned to the epoch as
+            Zeek does, e.g. on the hour for ``3600``.
+        compress: Compress rotated log files with :mod:`gzip` in a background
+            thread, so that rotation never stalls the write path.
+        writer: Writer class, in default :class:`~zlogging.dumper.ASCIIWriter`
+            or :class:`~zlogging.dumper.JSONWriter` per ``format``.
+        **kwargs: Arbitrary keyword arguments for the writer class.
+
+    Raises:
+        :exc:`WriterFormatError`: If ``format`` is not supported.
+
+    Note:
+        The writer is not thread-safe.
+
+    Example:
+
+        .. code-block:: python
+
+            with RotatingWriter('logs/conn.log', max_bytes=1 << 30, compress=True) as writer:
+                for record in records:
+                    writer.write(record)
+
+    """
+
+    #: Log file name.
+    filename: 'str'
+    #: Log format.
+    format: 'str'
+    #: Rotate when the log file reaches this size.
+    max_bytes: 'Optional[int]'
+    #: Rotation interval in seconds.
+    interval: 'Optional[float]'
+    #: Compress rotated log files.
+    compress: 'bool'
+    #: Underlying log writer.
+    writer: 'Union[ASCIIWriter, JSONWriter]'
+    #: Names of the rotated log files.
+    rotated: 'list[str]'
+
+    def __init__(self, filename: 'PathLike[str]', format: 'str' = 'ascii',  # pylint: disable=redefined-builtin
+                 max_bytes: 'Optional[int]' = None, interval: 'Optional[float]' = None,
+                 compress: 'bool' = False, writer: 'Optional[Type[Union[ASCIIWriter, JSONWriter]]]' = None,
+                 **kwargs: 'Any') -> 'None':
+        if writer is None:
+            if format == 'ascii':
+                writer = ASCIIWriter
+            elif format == 'json':
+                writer = JSONWriter
+            else:
+                raise WriterFormatError('unsupported format: %s' % format)  # pylint: disable=consider-using-f-string
+
+        self.filename = os.fspath(filename)
+        self.format = format
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.compress = compress
+        self.writer = writer(**kwargs)
+        self.rotated = []
+
+        self._file = None  # type: Optional[BinaryFile]
+        self._size = 0
+        self._open_time = 0.0
+        self._rotate_time = float('inf')
+        self._executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+        self._pending = []  # type: list[Future[str]]
+
+    def __enter__(self) -> 'RotatingWriter':
+        return self
+
+    def __exit__(self, *exc: 'Any') -> 'None':
+        self.close()
+
+    def write(self, data: 'Model') -> 'None':
+        """Write one-line record.
+
+        Args:
+            data: Log record.
+
+        """
+        self.write_many((data,))
+
+    def write_many(self, data: 'Iterable[Model]') -> 'None':
+        """Write log records.
+
+        Args:
+            data: Log records as an :class:`~typing.Iterable` of
+                :class:`~zlogging.model.Model` per line.
+
+        """
+        dump_line = self.writer.dump_line
+        max_bytes = self.max_bytes
+        for line in data:
+            if self._file is not None and ((max_bytes is not None and self._size >= max_bytes)
+                                           or time.time() >= self._rotate_time):
+                self.rotate()
+            if self._file is None:
+                self._open(line)
+
+            buffer = dump_line(line).encode('ascii')
+            self._file.write(buffer)  # type: ignore[union-attr]
+            self._size += len(buffer)
+
+    def flush(self, fsync: 'bool' = False) -> 'None':
+        """Flush the current log file.
+
+        Args:
+            fsync: Also commit the log file to disk by :func:`os.fsync`.
+
+        """
+        if self._file is not None:
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+
+    def rotate(self) -> 'Optional[str]':
+        """Rotate the current log file.
+
+        Returns:
+            Name of the rotated log file, or :data:`None` if no log file is
+            opened. If ``compress`` is set, the name is of the compressed
+            file, which may not be ready until :meth:`close` returns.
+
+        """
+        if self._file is None:
+            return None
+        file, self._file = self._file, None
+
+        if isinstance(self.writer, ASCIIWriter):
+            file.write(self.writer.dump_tail().encode('ascii'))
+        file.close()
+
+        root, ext = os.path.splitext(self.filename)
+        stem = '%s.%s' % (root, strftime_header(self._open_time))  # pylint: disable=consider-using-f-string
+        target = stem + ext
+        suffix = 0
+        while os.path.exists(target) or os.path.exists(target + '.gz'):
+            suffix += 1
+            target = '%s-%d%s' % (stem, suffix, ext)  # pylint: disable=consider-using-f-string
+        os.replace(self.filename, target)
+
+        if self.compress:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(self._executor.submit(self._compress, target))
+            target += '.gz'
+
+        self.rotated.append(target)
+        return target
+
+    def close(self) -> 'None':
+        """Rotate the current log file and wait for pending compression."""
+        self.rotate()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _open(self, data: 'Model') -> 'None':
+        """Open a new log file and write the header.
+
+        Args:
+            data: The first log record of the new log file.
+
+        """
+        now = time.time()
+        self._file = open(self.filename, 'wb')  # pylint: disable=consider-using-with
+        self._size = 0
+        self._open_time = now
+        if self.interval:
+            self._rotate_time = (now // self.interval + 1) * self.interval
+
+        if isinstance(self.writer, ASCIIWriter):
+            buffer = self.writer.dump_head(data, name=os.path.basename(self.filename)).encode('ascii')
+            self._file.write(buffer)
+            self._size += len(buffer)
+
+    @staticmethod
+    def _compress(filename: 'str') -> 'str':
+        """Compress the rotated log file with :mod:`gzip`.
+
+        Args:
+            filename: Name of the rotated log file.
+
+        Returns:
+            Name of the compressed log file.
+
+        """
+        target = filename + '.gz'
+        with open(filename, 'rb') as src, gzip.open(target + '.tmp', 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(target + '.tmp', target)
+        os.remove(filename)
+        return target
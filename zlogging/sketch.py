@@ -0,0 +1,604 @@
+# -*- coding: utf-8 -*-
+"""Approximate streaming sketches of log values."""
+
+import abc
+import bisect
+import ctypes
+import datetime
+import hashlib
+import heapq
+import json
+import math
+import struct
+from typing import TYPE_CHECKING
+
+from zlogging._exc import ZeekValueError
+from zlogging.index import _key
+from zlogging.query import Aggregate
+
+__all__ = [
+    'Sketch', 'HyperLogLog', 'SpaceSaving', 'TDigest',
+    'ApproxDistinct', 'TopK', 'ApproxQuantiles',
+]
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Optional, Type, TypeVar
+
+    _T = TypeVar('_T', bound='Sketch')
+
+#: Magic bytes of serialised sketches.
+MAGIC = b'ZLOGSKT\x01'
+
+#: Entry of serialised :class:`SpaceSaving` counters, i.e. the count, the
+#: error and the key length.
+_ENTRY = struct.Struct('>QQI')
+
+#: Centroid of serialised :class:`TDigest`, i.e. the mean and the weight.
+_CENTROID = struct.Struct('>dd')
+
+
+def _hash(key: 'bytes') -> 'int':
+    """Hash a key as a 64-bit integer."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big')
+
+
+def _float(value: 'Any') -> 'float':
+    """Convert value as :obj:`float` for quantiles.
+
+    Args:
+        value: Numeric value, where :class:`~datetime.timedelta` is taken as
+            seconds and :class:`~datetime.datetime` as epoch seconds.
+
+    Returns:
+        The converted value.
+
+    """
+    if isinstance(value, ctypes._SimpleCData):  # pylint: disable=protected-access
+        value = value.value
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class Sketch(metaclass=abc.ABCMeta):
+    """Basic mergeable sketch."""
+
+    @abc.abstractmethod
+    def add(self, value: 'Any') -> 'None':
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to be added.
+
+        """
+
+    def update(self, values: 'Iterable[Any]') -> 'None':
+        """Add values to the sketch.
+
+        Args:
+            values: Values to be added, e.g. a column of a
+                :class:`~zlogging.columnar.Table`. *Unset* values, i.e.
+                :data:`None`, are skipped.
+
+        """
+        add = self.add
+        for value in values:
+            if value is not None:
+                add(value)
+
+    @abc.abstractmethod
+    def merge(self: '_T', other: '_T') -> '_T':
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch of the same kind and parameters, e.g. of another
+                log file or process.
+
+        Returns:
+            This sketch, updated in place.
+
+        Raises:
+            :exc:`ZeekValueError`: If the sketches are not compatible.
+
+        """
+
+    @abc.abstractmethod
+    def _header(self) -> 'dict[str, Any]':
+        """Parameters of the serialised sketch."""
+
+    @abc.abstractmethod
+    def _payload(self) -> 'bytes':
+        """Data of the serialised sketch."""
+
+    def to_bytes(self) -> 'bytes':
+        """Serialise the sketch."""
+        header = json.dumps(dict(type=type(self).__name__, **self._header())).encode('utf-8')
+        return MAGIC + struct.pack('>I', len(header)) + header + self._payload()
+
+    @classmethod
+    def _parse(cls, data: 'bytes') -> 'tuple[dict[str, Any], memoryview]':
+        """Split serialised sketch as its header and payload.
+
+        Raises:
+            :exc:`ZeekValueError`: If ``data`` is not a serialised sketch of
+                this kind.
+
+        """
+        view = memoryview(data)
+        try:
+            if bytes(view[:len(MAGIC)]) != MAGIC:
+                raise ValueError
+            size, = struct.unpack_from('>I', view, len(MAGIC))
+            start = len(MAGIC) + 4
+            header = json.loads(bytes(view[start:start + size]))
+            if header.pop('type') != cls.__name__:
+                raise ValueError
+        except (ValueError, KeyError, TypeError, AttributeError, struct.error):
+            raise ZeekValueError('invalid %s data' % cls.__name__) from None  # pylint: disable=consider-using-f-string
+        return header, view[start + size:]
+
+    @classmethod
+    @abc.abstractmethod
+    def from_bytes(cls: 'Type[_T]', data: 'bytes') -> '_T':
+        """Deserialise the sketch.
+
+        Args:
+            data: Output of :meth:`to_bytes`.
+
+        Returns:
+            The restored sketch.
+
+        Raises:
+            :exc:`ZeekValueError`: If ``data`` is not a serialised sketch of
+                this kind.
+
+        """
+
+
+class HyperLogLog(Sketch):
+    """HyperLogLog sketch of distinct values.
+
+    Values are keyed as written in ASCII logs, see
+    :func:`~zlogging.index._key`, and the sketch keeps ``2 ** precision``
+    one-byte registers, i.e. 16 KB in default, with a relative standard
+    error of about ``1.04 / sqrt(2 ** precision)``, i.e. 0.8% in default,
+    regardless of the number of values.
+
+    Args:
+        precision: Number of index bits, from 4 to 18.
+
+    Raises:
+        :exc:`ZeekValueError`: If ``precision`` is out of range.
+
+    """
+
+    #: Number of index bits.
+    precision: 'int'
+
+    def __init__(self, precision: 'int' = 14) -> 'None':
+        if not 4 <= precision <= 18:
+            raise ZeekValueError('invalid precision: %r' % precision)  # pylint: disable=consider-using-f-string
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(~{len(self)} distinct values)'
+
+    def __len__(self) -> 'int':
+        return round(self.count())
+
+    def add(self, value: 'Any') -> 'None':
+        hashed = _hash(_key(value))
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> 'float':
+        """Estimate the number of distinct values."""
+        size = len(self._registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(size, 0.7213 / (1 + 1.079 / size))
+        estimate = alpha * size * size / math.fsum(2.0 ** -rank for rank in self._registers)
+
+        # linear counting for small cardinalities
+        zeros = self._registers.count(0)
+        if zeros and estimate <= 2.5 * size:
+            return size * math.log(size / zeros)
+        return estimate
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        if not isinstance(other, HyperLogLog) or other.precision != self.precision:
+            raise ZeekValueError('incompatible sketch: %r' % other)  # pylint: disable=consider-using-f-string
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def _header(self) -> 'dict[str, Any]':
+        return {'precision': self.precision}
+
+    def _payload(self) -> 'bytes':
+        return bytes(self._registers)
+
+    @classmethod
+    def from_bytes(cls, data: 'bytes') -> 'HyperLogLog':
+        header, payload = cls._parse(data)
+        sketch = cls(header['precision'])
+        if len(payload) != len(sketch._registers):
+            raise ZeekValueError('invalid %s data' % cls.__name__)  # pylint: disable=consider-using-f-string
+        sketch._registers[:] = payload
+        return sketch
+
+
+class SpaceSaving(Sketch):
+    """Space-Saving sketch of the most frequent values.
+
+    The sketch keeps at most ``capacity`` counters, and a new value evicts
+    the least frequent one, taking over its count as the error. The counts
+    never underestimate, and any value more frequent than ``total /
+    capacity`` is guaranteed to be kept. Values are keyed as written in
+    ASCII logs, see :func:`~zlogging.index._key`, and reported as such keys.
+
+    Args:
+        capacity: Maximum number of counters.
+
+    Raises:
+        :exc:`ZeekValueError`: If ``capacity`` is not positive.
+
+    """
+
+    #: Maximum number of counters.
+    capacity: 'int'
+    #: Total weight of values added.
+    total: 'int'
+
+    def __init__(self, capacity: 'int' = 1000) -> 'None':
+        if capacity <= 0:
+            raise ZeekValueError('invalid capacity: %r' % capacity)  # pylint: disable=consider-using-f-string
+        self.capacity = capacity
+        self.total = 0
+        self._counters = {}  # type: dict[bytes, list[int]]
+        # min-heap of counts and keys, whose counts may be outdated and are
+        # only refreshed when looking for the least frequent value
+        self._heap = []  # type: list[tuple[int, bytes]]
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}({len(self._counters)} counters of {self.total} values)'
+
+    def __len__(self) -> 'int':
+        return len(self._counters)
+
+    def __contains__(self, value: 'object') -> 'bool':
+        return _key(value) in self._counters
+
+    def add(self, value: 'Any', weight: 'int' = 1) -> 'None':  # pylint: disable=arguments-differ
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to be added.
+            weight: Weight of the value, e.g. number of bytes.
+
+        """
+        key = _key(value)
+        self.total += weight
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+            return
+        if len(self._counters) < self.capacity:
+            self._counters[key] = [weight, 0]
+            heapq.heappush(self._heap, (weight, key))
+            return
+
+        heap = self._heap
+        while True:
+            count, victim = heap[0]
+            current = self._counters[victim][0]
+            if current == count:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        del self._counters[victim]
+        self._counters[key] = [count + weight, count]
+        heapq.heapreplace(heap, (count + weight, key))
+
+    def top(self, n: 'Optional[int]' = None) -> 'list[tuple[bytes, int, int]]':
+        """Get the most frequent values.
+
+        Args:
+            n: Number of values, or all counters if :data:`None`.
+
+        Returns:
+            The keys, their estimated counts and the maximum overestimation
+            of the counts, in descending order of the counts.
+
+        """
+        items = sorted(((key, count, error) for key, (count, error) in self._counters.items()),
+                       key=lambda item: (-item[1], item[0]))
+        return items if n is None else items[:n]
+
+    def _minimum(self) -> 'int':
+        """Count of the evicted values at most, i.e. the least count if full."""
+        if len(self._counters) < self.capacity:
+            return 0
+        return min(count for count, _ in self._counters.values())
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        if not isinstance(other, SpaceSaving) or other.capacity != self.capacity:
+            raise ZeekValueError('incompatible sketch: %r' % other)  # pylint: disable=consider-using-f-string
+
+        # values absent from either sketch may have been evicted with up to
+        # its least count, which is taken as both count and error
+        minimum, other_minimum = self._minimum(), other._minimum()
+        counters = {}  # type: dict[bytes, list[int]]
+        for key in self._counters.keys() | other._counters.keys():
+            count, error = self._counters.get(key, (minimum, minimum))
+            other_count, other_error = other._counters.get(key, (other_minimum, other_minimum))
+            counters[key] = [count + other_count, error + other_error]
+
+        kept = heapq.nlargest(self.capacity, counters.items(), key=lambda item: (item[1][0], item[0]))
+        self._counters = dict(kept)
+        self._heap = [(counter[0], key) for key, counter in kept]
+        heapq.heapify(self._heap)
+        self.total += other.total
+        return self
+
+    def _header(self) -> 'dict[str, Any]':
+        return {'capacity': self.capacity, 'total': self.total}
+
+    def _payload(self) -> 'bytes':
+        return b''.join(_ENTRY.pack(count, error, len(key)) + key
+                        for key, (count, error) in self._counters.items())
+
+    @classmethod
+    def from_bytes(cls, data: 'bytes') -> 'SpaceSaving':
+        header, payload = cls._parse(data)
+        sketch = cls(header['capacity'])
+        sketch.total = header['total']
+        offset = 0
+        try:
+            while offset < len(payload):
+                count, error, size = _ENTRY.unpack_from(payload, offset)
+                offset += _ENTRY.size
+                key = bytes(payload[offset:offset + size])
+                offset += size
+                sketch._counters[key] = [count, error]
+        except struct.error:
+            raise ZeekValueError('invalid %s data' % cls.__name__) from None  # pylint: disable=consider-using-f-string
+        if offset != len(payload) or len(sketch._counters) > sketch.capacity:
+            raise ZeekValueError('invalid %s data' % cls.__name__)  # pylint: disable=consider-using-f-string
+        sketch._heap = [(counter[0], key) for key, counter in sketch._counters.items()]
+        heapq.heapify(sketch._heap)
+        return sketch
+
+
+class TDigest(Sketch):
+    """t-digest sketch of quantiles.
+
+    Values are clustered into at most about ``compression`` centroids, which
+    are smaller towards both tails of the distribution, so that extreme
+    quantiles, e.g. the 99th percentile of ``duration``, are estimated with
+    small relative error. Values are converted as :obj:`float`, where
+    :class:`~datetime.timedelta` is taken as seconds.
+
+    Args:
+        compression: Accuracy parameter, i.e. maximum number of centroids.
+
+    Raises:
+        :exc:`ZeekValueError`: If ``compression`` is not positive.
+
+    """
+
+    #: Accuracy parameter.
+    compression: 'float'
+    #: Number of values added.
+    count: 'int'
+    #: Minimum of values, if any.
+    min: 'Optional[float]'
+    #: Maximum of values, if any.
+    max: 'Optional[float]'
+
+    def __init__(self, compression: 'float' = 100) -> 'None':
+        if compression <= 0:
+            raise ZeekValueError('invalid compression: %r' % compression)  # pylint: disable=consider-using-f-string
+        self.compression = compression
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._means = []  # type: list[float]
+        self._weights = []  # type: list[float]
+        self._buffer = []  # type: list[tuple[float, float]]
+        self._buffer_size = max(int(compression * 5), 100)
+
+    def __repr__(self) -> 'str':
+        self._compress()
+        return f'{type(self).__name__}({len(self._means)} centroids of {self.count} values)'
+
+    def __len__(self) -> 'int':
+        return self.count
+
+    def add(self, value: 'Any', weight: 'int' = 1) -> 'None':  # pylint: disable=arguments-differ
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to be added.
+            weight: Number of occurrences of the value.
+
+        """
+        number = _float(value)
+        if math.isnan(number):
+            return
+        if self.min is None or number < self.min:
+            self.min = number
+        if self.max is None or number > self.max:
+            self.max = number
+        self.count += weight
+        self._buffer.append((number, weight))
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def _scale(self, quantile: 'float') -> 'float':
+        """Scale function ``k1`` of quantiles."""
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(quantile, 0.0), 1.0) - 1)
+
+    def _compress(self) -> 'None':
+        """Merge buffered values into centroids."""
+        if not self._buffer:
+            return
+        points = sorted(self._buffer + list(zip(self._means, self._weights)))
+        self._buffer = []
+
+        means, weights = [], []  # type: list[float], list[float]
+        total = sum(weight for _, weight in points)
+        mean, weight = points[0]
+        before = 0.0
+        limit = self._scale(0.0) + 1
+        for point_mean, point_weight in points[1:]:
+            if self._scale((before + weight + point_weight) / total) <= limit:
+                weight += point_weight
+                mean += (point_mean - mean) * point_weight / weight
+                continue
+            means.append(mean)
+            weights.append(weight)
+            before += weight
+            limit = self._scale(before / total) + 1
+            mean, weight = point_mean, point_weight
+        means.append(mean)
+        weights.append(weight)
+        self._means, self._weights = means, weights
+
+    def quantile(self, quantile: 'float') -> 'Optional[float]':
+        """Estimate a quantile of values.
+
+        Args:
+            quantile: Quantile from 0 to 1, e.g. 0.5 for the median.
+
+        Returns:
+            The estimated quantile, or :data:`None` if no value was added.
+
+        Raises:
+            :exc:`ZeekValueError`: If ``quantile`` is out of range.
+
+        """
+        if not 0 <= quantile <= 1:
+            raise ZeekValueError('invalid quantile: %r' % quantile)  # pylint: disable=consider-using-f-string
+        self._compress()
+        if not self._means:
+            return None
+        if len(self._means) == 1:
+            return self._means[0]
+
+        # centroids are interpolated linearly between their centres, and
+        # towards the minimum and maximum at both ends
+        target = quantile * sum(self._weights)
+        centres = []  # type: list[float]
+        cumulative = 0.0
+        for weight in self._weights:
+            centres.append(cumulative + weight / 2)
+            cumulative += weight
+        if target <= centres[0]:
+            return self.min + (self._means[0] - self.min) * target / centres[0]  # type: ignore[operator]
+        if target >= centres[-1]:
+            rest = cumulative - centres[-1]
+            return self._means[-1] + (self.max - self._means[-1]) * (target - centres[-1]) / rest  # type: ignore[operator]
+        index = bisect.bisect_right(centres, target)
+        left, right = centres[index - 1], centres[index]
+        return self._means[index - 1] + (self._means[index] - self._means[index - 1]) * (target - left) / (right - left)
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        if not isinstance(other, TDigest):
+            raise ZeekValueError('incompatible sketch: %r' % other)  # pylint: disable=consider-using-f-string
+        if other.count:
+            other._compress()
+            self._buffer.extend(zip(other._means, other._weights))
+            self.count += other.count
+            self.min = other.min if self.min is None else min(self.min, other.min)  # type: ignore[type-var]
+            self.max = other.max if self.max is None else max(self.max, other.max)  # type: ignore[type-var]
+            self._compress()
+        return self
+
+    def _header(self) -> 'dict[str, Any]':
+        self._compress()
+        return {'compression': self.compression, 'count': self.count, 'min': self.min, 'max': self.max}
+
+    def _payload(self) -> 'bytes':
+        return b''.join(_CENTROID.pack(mean, weight) for mean, weight in zip(self._means, self._weights))
+
+    @classmethod
+    def from_bytes(cls, data: 'bytes') -> 'TDigest':
+        header, payload = cls._parse(data)
+        if len(payload) % _CENTROID.size:
+            raise ZeekValueError('invalid %s data' % cls.__name__)  # pylint: disable=consider-using-f-string
+        sketch = cls(header['compression'])
+        sketch.count, sketch.min, sketch.max = header['count'], header['min'], header['max']
+        for mean, weight in _CENTROID.iter_unpack(payload):
+            sketch._means.append(mean)
+            sketch._weights.append(weight)
+        return sketch
+
+
+class ApproxDistinct(Aggregate):
+    """Approximate number of distinct values, as a :class:`HyperLogLog`.
+
+    Args:
+        *fields: Field names to aggregate.
+        precision: See :class:`HyperLogLog` for more information.
+
+    """
+
+    tuples = True
+
+    def __init__(self, *fields: 'str', precision: 'int' = 14) -> 'None':
+        super().__init__(*fields)
+        self.precision = precision
+
+    def initial(self) -> 'HyperLogLog':
+        return HyperLogLog(self.precision)
+
+    def update(self, state: 'HyperLogLog', value: 'Any') -> 'HyperLogLog':
+        state.add(value)
+        return state
+
+
+class TopK(Aggregate):
+    """Approximate most frequent values, as a :class:`SpaceSaving`.
+
+    Args:
+        *fields: Field names to aggregate.
+        capacity: See :class:`SpaceSaving` for more information.
+
+    """
+
+    tuples = True
+
+    def __init__(self, *fields: 'str', capacity: 'int' = 1000) -> 'None':
+        super().__init__(*fields)
+        self.capacity = capacity
+
+    def initial(self) -> 'SpaceSaving':
+        return SpaceSaving(self.capacity)
+
+    def update(self, state: 'SpaceSaving', value: 'Any') -> 'SpaceSaving':
+        state.add(value)
+        return state
+
+
+class ApproxQuantiles(Aggregate):
+    """Approximate quantiles of values, as a :class:`TDigest`.
+
+    Args:
+        *fields: Field names to aggregate.
+        compression: See :class:`TDigest` for more information.
+
+    """
+
+    def __init__(self, *fields: 'str', compression: 'float' = 100) -> 'None':
+        super().__init__(*fields)
+        self.compression = compression
+
+    def initial(self) -> 'TDigest':
+        return TDigest(self.compression)
+
+    def update(self, state: 'TDigest', value: 'Any') -> 'TDigest':
+        state.add(value)
+        return state
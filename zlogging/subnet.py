@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""Longest-prefix match index of IP networks."""
+
+import ipaddress
+import socket
+from typing import TYPE_CHECKING
+
+from zlogging.packed import PackedAddress, PackedNetwork
+
+__all__ = ['SubnetTree']
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+    from zlogging.packed import IPAddress, IPNetwork
+
+    Address = Union[str, bytes, IPAddress, PackedAddress]
+    Network = Union[str, bytes, IPNetwork, PackedNetwork]
+
+#: Number of bits per IP version.
+_BITS = {4: 32, 6: 128}
+
+#: Placeholder for nodes without a network of their own.
+_EMPTY = object()
+
+# indices of trie node fields, where a node is a :obj:`list` of the
+# network address, prefix length, associated value and the two children
+_VALUE, _PREFIXLEN, _DATA, _ZERO, _ONE = range(5)
+
+
+def _node(value: 'int', prefixlen: 'int', data: 'Any' = _EMPTY) -> 'list[Any]':
+    """Create a trie node."""
+    return [value, prefixlen, data, None, None]
+
+
+def _pack_address(address: 'Address') -> 'Optional[tuple[int, int]]':
+    """Pack IP address as its integer value and IP version.
+
+    Args:
+        address: IP address, as string, :mod:`ipaddress` object or
+            :class:`~zlogging.packed.PackedAddress`.
+
+    Returns:
+        The packed IP address, or :data:`None` if ``address`` is not a valid
+        IP address, e.g. an *unset* field.
+
+    """
+    if isinstance(address, PackedAddress):
+        return address
+    if isinstance(address, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+        return int(address), address.version
+    if isinstance(address, (bytes, bytearray, memoryview)):
+        try:
+            address = bytes(address).decode('ascii')
+        except UnicodeDecodeError:
+            return None
+    if not isinstance(address, str):
+        return None
+
+    try:
+        if ':' in address:
+            return int.from_bytes(socket.inet_pton(socket.AF_INET6, address), 'big'), 6
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, address), 'big'), 4
+    except OSError:
+        return None
+
+
+def _pack_network(network: 'Network') -> 'PackedNetwork':
+    """Pack IP network.
+
+    Args:
+        network: IP network, as string in CIDR notation, :mod:`ipaddress`
+            object or :class:`~zlogging.packed.PackedNetwork`.
+
+    Returns:
+        The packed IP network.
+
+    Raises:
+        :exc:`ValueError`: If ``network`` is not a valid IP network.
+
+    """
+    if isinstance(network, PackedNetwork):
+        return network
+    if isinstance(network, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return PackedNetwork.from_ipaddress(network)
+    if isinstance(network, (bytes, bytearray, memoryview)):
+        network = bytes(network).decode('ascii')
+    if not isinstance(network, str):
+        raise ValueError(f'{network!r} does not appear to be an IPv4 or IPv6 network')
+    return PackedNetwork.from_string(network)
+
+
+class SubnetTree:
+    """Longest-prefix match index of IP networks.
+
+    The networks are stored in a path-compressed binary radix tree, i.e. a
+    *Patricia trie*, per IP version over the integer values of the network
+    addresses, so that looking up an IP address costs at most one step per
+    bit of its longest matching prefix, regardless of the number of
+    networks indexed. Each network may be associated with a value, e.g. the
+    name of a network zone, and a lookup returns the value of the most
+    specific network containing the address.
+
+    Networks can be given as strings in CIDR notation, :mod:`ipaddress`
+    objects or :class:`~zlogging.packed.PackedNetwork`, i.e. values of
+    ``subnet`` fields; and addresses can be given likewise, including raw
+    fields of ASCII logs as :obj:`bytes`. Invalid addresses, e.g. *unset*
+    fields, never match.
+
+    Args:
+        networks: Networks to be indexed, either as an iterable of networks
+            associated with :data:`True`, or a mapping of networks to their
+            values.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> tree = SubnetTree({'10.0.0.0/8': 'internal', '10.1.0.0/16': 'dmz'})
+            >>> tree['10.1.2.3']
+            'dmz'
+            >>> '192.168.0.1' in tree
+            False
+
+        The tree can be used as a row filter when parsing logs, such that
+        records are rejected before their fields are converted:
+
+        .. code-block:: python
+
+            >>> parse_ascii('conn.log', row_filter={'id.orig_h': tree.__contains__})
+
+    """
+
+    def __init__(self, networks: 'Optional[Union[Iterable[Network], Mapping[Network, Any]]]' = None) -> 'None':
+        self._roots = {4: _node(0, 0), 6: _node(0, 0)}
+        self._size = 0
+
+        if networks is None:
+            return
+        if hasattr(networks, 'items'):
+            for network, data in networks.items():  # type: ignore[union-attr]
+                self[network] = data
+        else:
+            for network in networks:
+                self[network] = True
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}({len(self)} networks)'
+
+    def __len__(self) -> 'int':
+        return self._size
+
+    def __setitem__(self, network: 'Network', data: 'Any') -> 'None':
+        value, prefixlen, version = _pack_network(network)
+        bits = _BITS[version]
+        node = self._roots[version]
+        while True:
+            if node[_PREFIXLEN] == prefixlen:
+                if node[_DATA] is _EMPTY:
+                    self._size += 1
+                node[_DATA] = data
+                return
+
+            index = _ZERO + (value >> (bits - node[_PREFIXLEN] - 1) & 1)
+            child = node[index]
+            if child is None:
+                node[index] = _node(value, prefixlen, data)
+                self._size += 1
+                return
+
+            # length of the common prefix of the child and the new network
+            common = min(child[_PREFIXLEN], prefixlen, bits - (child[_VALUE] ^ value).bit_length())
+            if common == child[_PREFIXLEN]:
+                node = child
+                continue
+
+            if common == prefixlen:
+                branch = _node(value, prefixlen, data)
+            else:
+                shift = bits - common
+                branch = _node(value >> shift << shift, common)
+                branch[_ZERO + (value >> (shift - 1) & 1)] = _node(value, prefixlen, data)
+            branch[_ZERO + (child[_VALUE] >> (bits - common - 1) & 1)] = child
+            node[index] = branch
+            self._size += 1
+            return
+
+    def __delitem__(self, network: 'Network') -> 'None':
+        node = self._find(_pack_network(network))
+        if node is None:
+            raise KeyError(network)
+        node[_DATA] = _EMPTY
+        self._size -= 1
+
+    def _find(self, network: 'PackedNetwork') -> 'Optional[list[Any]]':
+        """Find the node of exactly ``network``, if indexed."""
+        value, prefixlen, version = network
+        bits = _BITS[version]
+        node = self._roots[version]
+        while node is not None and node[_PREFIXLEN] < prefixlen:
+            node = node[_ZERO + (value >> (bits - node[_PREFIXLEN] - 1) & 1)]
+        if node is None or node[_PREFIXLEN] != prefixlen or node[_VALUE] != value or node[_DATA] is _EMPTY:
+            return None
+        return node
+
+    def _match(self, address: 'Address') -> 'Optional[list[Any]]':
+        """Find the node of the longest prefix matching ``address``."""
+        packed = _pack_address(address)
+        if packed is None:
+            return None
+        value, version = packed
+        bits = _BITS[version]
+
+        best = None
+        node = self._roots[version]
+        while node is not None:
+            shift = bits - node[_PREFIXLEN]
+            if (value ^ node[_VALUE]) >> shift:
+                break
+            if node[_DATA] is not _EMPTY:
+                best = node
+            if not shift:
+                break
+            node = node[_ZERO + (value >> (shift - 1) & 1)]
+        return best
+
+    def __contains__(self, address: 'object') -> 'bool':
+        return self._match(address) is not None  # type: ignore[arg-type]
+
+    def __getitem__(self, address: 'Address') -> 'Any':
+        node = self._match(address)
+        if node is None:
+            raise KeyError(address)
+        return node[_DATA]
+
+    def get(self, address: 'Address', default: 'Any' = None) -> 'Any':
+        """Get the value of the longest prefix matching an address.
+
+        Args:
+            address: IP address.
+            default: Value to return if no network matches.
+
+        Returns:
+            The value associated with the most specific network containing
+            ``address``, or ``default``.
+
+        """
+        node = self._match(address)
+        if node is None:
+            return default
+        return node[_DATA]
+
+    def match(self, address: 'Address') -> 'Optional[PackedNetwork]':
+        """Get the longest prefix matching an address.
+
+        Args:
+            address: IP address.
+
+        Returns:
+            The most specific network containing ``address``, or
+            :data:`None` if no network matches.
+
+        """
+        node = self._match(address)
+        if node is None:
+            return None
+        _, version = _pack_address(address)  # type: ignore[misc]
+        return PackedNetwork(node[_VALUE], node[_PREFIXLEN], version)  # type: ignore[arg-type]
+
+    def _nodes(self) -> 'Iterator[tuple[int, list[Any]]]':
+        """Iterate over nodes of indexed networks in pre-order."""
+        for version, root in self._roots.items():
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if node[_DATA] is not _EMPTY:
+                    yield version, node
+                stack.extend(child for child in (node[_ONE], node[_ZERO]) if child is not None)
+
+    def __iter__(self) -> 'Iterator[PackedNetwork]':
+        for version, node in self._nodes():
+            yield PackedNetwork(node[_VALUE], node[_PREFIXLEN], version)  # type: ignore[arg-type]
+
+    def items(self) -> 'Iterator[tuple[PackedNetwork, Any]]':
+        """Iterate over indexed networks and their values.
+
+        Yields:
+            The networks, in ascending order per IP version, and their values.
+
+        """
+        for version, node in self._nodes():
+            yield PackedNetwork(node[_VALUE], node[_PREFIXLEN], version), node[_DATA]  # type: ignore[arg-type]
@@ -0,0 +1,527 @@
+# -*- coding: utf-8 -*-
+"""Direct transcoding between log formats."""
+
+import collections
+import ipaddress
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import warnings
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING
+
+from zlogging._aux import readline, time_toascii
+from zlogging._exc import (ASCIIParserError, ASCIIParserWarning, JSONParserError, JSONParserWarning,
+                           WriterFormatError, ZeekValueError)
+from zlogging.dumper import ASCIIWriter
+from zlogging.model import new_model
+from zlogging.types import (AddrType, BoolType, CountType, DoubleType, IntType, StringType, SubnetType,
+                            TimeType, VectorType, get_type)
+
+__all__ = ['transcode', 'ascii_to_json', 'json_to_ascii']
+
+if TYPE_CHECKING:
+    from io import BufferedReader as BinaryFile
+    from os import PathLike
+    from typing import Any, Callable, Iterator, Optional, Pattern, Type, Union
+
+    from zlogging.model import Model
+    from zlogging.types import BaseType
+
+    Converter = Callable[[bytes], bytes]
+    ValueConverter = Callable[[Any], str]
+
+#: Characters to be escaped in JSON strings.
+_JSON_ESCAPE = re.compile(rb'[\x00-\x1f"\\\x7f-\xff]')
+
+#: Characters to be escaped in ASCII strings, besides the field separator,
+#: i.e. control and non-ASCII characters.
+_ASCII_ESCAPE = r'[\x00-\x1f\x7f-\U0010ffff]'
+
+#: Zeek data types rendered as bare JSON numbers.
+_JSON_NUMBER = frozenset(['count', 'int', 'port', 'double', 'time', 'interval'])
+
+
+def _json_converter(zeek_type: 'str', empty_field: 'bytes', unset_field: 'bytes',
+                    set_separator: 'bytes') -> 'Converter':
+    """Make the ASCII to JSON converter of a field.
+
+    Args:
+        zeek_type: Zeek type name of the field, e.g. ``set[string]``.
+        empty_field: Placeholder for empty field.
+        unset_field: Placeholder for unset field.
+        set_separator: Separator for ``set``/``vector`` fields.
+
+    Returns:
+        The converter mapping raw field data to its JSON fragment.
+
+    """
+    match = re.fullmatch(r'(?:set|vector)\[(?P<type>.+)\]', zeek_type)
+    if match is not None:
+        element = _json_converter(match.group('type'), empty_field, unset_field, set_separator)
+
+        def convert_list(value: 'bytes') -> 'bytes':
+            if value == unset_field:
+                return b'null'
+            if value == empty_field:
+                return b'[]'
+            return b'[%s]' % b', '.join([element(item) for item in value.split(set_separator)])
+        return convert_list
+
+    if zeek_type in _JSON_NUMBER:
+        def convert_number(value: 'bytes') -> 'bytes':
+            if value == unset_field or value == empty_field:
+                return b'null'
+            return value
+        return convert_number
+
+    if zeek_type == 'bool':
+        def convert_bool(value: 'bytes') -> 'bytes':
+            if value == b'T':
+                return b'true'
+            if value == b'F':
+                return b'false'
+            return b'null'
+        return convert_bool
+
+    escape = _JSON_ESCAPE.search
+
+    def convert_string(value: 'bytes') -> 'bytes':
+        if value == unset_field:
+            return b'null'
+        if value == empty_field:
+            return b'""'
+        if escape(value) is None:
+            return b'"%s"' % value
+        return encode_basestring_ascii(value.decode('ascii')).encode('ascii')
+    return convert_string
+
+
+def _read_header(file: 'BinaryFile') -> 'dict[str, Any]':
+    """Read header fields of ASCII log file.
+
+    Args:
+        file: Log file object opened in binary mode.
+
+    Returns:
+        The ``separator``, ``set_separator``, ``empty_field``,
+        ``unset_field``, ``path``, ``fields`` and ``types`` of the log.
+
+    Raises:
+        :exc:`ASCIIParserError`: If ``file`` is not an ASCII log file.
+
+    """
+    line = readline(file, b' ', maxsplit=1)
+    if line[0] != b'#separator' or len(line) != 2:
+        raise ASCIIParserError('invalid ASCII log header', lineno=1)
+    separator = line[1].decode('unicode_escape').encode('ascii')
+
+    header = {'separator': separator}  # type: dict[str, Any]
+    for lineno in range(2, 9):
+        key, *value = readline(file, separator)
+        if not key.startswith(b'#'):
+            raise ASCIIParserError('invalid ASCII log header', lineno=lineno)
+        header[key[1:].decode('ascii')] = value
+
+    try:
+        return {
+            'separator': separator,
+            'set_separator': header['set_separator'][0],
+            'empty_field': header['empty_field'][0],
+            'unset_field': header['unset_field'][0],
+            'path': header['path'][0].decode('ascii'),
+            'fields': [field.decode('ascii') for field in header['fields']],
+            'types': [type_.decode('ascii') for type_ in header['types']],
+        }
+    except (KeyError, IndexError):
+        raise ASCIIParserError('invalid ASCII log header') from None
+
+
+def _ascii_to_json_lines(file: 'BinaryFile') -> 'Iterator[bytes]':
+    """Transcode ASCII log to JSON lines.
+
+    Args:
+        file: ASCII log file object opened in binary mode.
+
+    Yields:
+        JSON log lines.
+
+    Raises:
+        :exc:`ASCIIParserError`: If a log line is malformed.
+
+    Warns:
+        ASCIIParserWarning: If the ASCII log file exited with error.
+
+    """
+    header = _read_header(file)
+    separator = header['separator']
+    fields = header['fields']
+
+    converters = [_json_converter(type_, header['empty_field'], header['unset_field'], header['set_separator'])
+                  for type_ in header['types']]
+    template = b'{%s}\n' % b', '.join(b'%s: %%s' % json.dumps(field).replace('%', '%%').encode('ascii')
+                                      for field in fields)
+    count = len(converters)
+    pairs = list(zip(range(count), converters))
+
+    for lineno, line in enumerate(file, start=9):
+        if line.startswith(b'#'):
+            break
+        values = line.rstrip(b'\r\n').split(separator)
+        if len(values) != count:
+            raise ASCIIParserError('expected %d fields but %d were given' % (count, len(values)), lineno)  # pylint: disable=consider-using-f-string
+        yield template % tuple([convert(values[index]) for index, convert in pairs])
+    else:
+        warnings.warn('log file exited with error', ASCIIParserWarning)
+
+
+def ascii_to_json(src: 'PathLike[str]', dst: 'PathLike[str]') -> 'int':
+    """Transcode ASCII log file to JSON log file.
+
+    Args:
+        src: ASCII log file name.
+        dst: JSON log file name.
+
+    Returns:
+        Number of records transcoded.
+
+    See Also:
+        See :func:`transcode` for more information.
+
+    """
+    count = 0
+    with open(src, 'rb') as file, open(dst, 'wb', buffering=1048576) as output:
+        write = output.write
+        for count, line in enumerate(_ascii_to_json_lines(file), start=1):
+            write(line)
+    return count
+
+
+def _ascii_converter(zeek_type: 'str', empty_field: 'str', unset_field: 'str',
+                     set_separator: 'str', separator: 'str') -> 'ValueConverter':
+    """Make the JSON to ASCII converter of a field.
+
+    Args:
+        zeek_type: Zeek type name of the field, e.g. ``set[string]``.
+        empty_field: Placeholder for empty field.
+        unset_field: Placeholder for unset field.
+        set_separator: Separator for ``set``/``vector`` fields.
+        separator: Field separator of the ASCII log.
+
+    Returns:
+        The converter mapping decoded JSON value to its ASCII representation.
+
+    """
+    escape = re.compile('%s|%s' % (re.escape(separator), _ASCII_ESCAPE))  # pylint: disable=consider-using-f-string
+
+    match = re.fullmatch(r'(?:set|vector)\[(?P<type>.+)\]', zeek_type)
+    if match is not None:
+        element = _ascii_converter(match.group('type'), empty_field, unset_field, set_separator, separator)
+
+        def convert_list(value: 'Any') -> 'str':
+            if value is None:
+                return unset_field
+            if not isinstance(value, list):
+                return element(value)
+            if not value:
+                return empty_field
+            return set_separator.join([element(item) for item in value])
+        return convert_list
+
+    if zeek_type in ('count', 'int', 'port'):
+        def convert_integer(value: 'Any') -> 'str':
+            if value is None:
+                return unset_field
+            if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+                return int.__repr__(value)
+            return _ascii_value(value, empty_field, unset_field, escape)
+        return convert_integer
+
+    if zeek_type in ('double', 'time', 'interval'):
+        def convert_float(value: 'Any') -> 'str':
+            if value is None:
+                return unset_field
+            if type(value) in (float, int):
+                return '%.6f' % value  # pylint: disable=consider-using-f-string
+            if zeek_type == 'time' and isinstance(value, str):
+                return time_toascii(TimeType().parse(value))
+            return _ascii_value(value, empty_field, unset_field, escape)
+        return convert_float
+
+    if zeek_type == 'bool':
+        def convert_bool(value: 'Any') -> 'str':
+            if value is None:
+                return unset_field
+            if value is True:
+                return 'T'
+            if value is False:
+                return 'F'
+            return _ascii_value(value, empty_field, unset_field, escape)
+        return convert_bool
+
+    def convert_string(value: 'Any') -> 'str':
+        if type(value) is str and value and escape.search(value) is None:  # pylint: disable=unidiomatic-typecheck
+            return value
+        return _ascii_value(value, empty_field, unset_field, escape)
+    return convert_string
+
+
+def _ascii_value(value: 'Any', empty_field: 'str', unset_field: 'str', escape: 'Pattern[str]') -> 'str':
+    """Convert arbitrary JSON value to ASCII, escaping as Zeek does.
+
+    Args:
+        value: Decoded JSON value.
+        empty_field: Placeholder for empty field.
+        unset_field: Placeholder for unset field.
+        escape: Pattern of characters to be escaped as ``\\xNN`` per byte
+            of their UTF-8 encoding.
+
+    Returns:
+        The ASCII representation of ``value``.
+
+    """
+    if value is None:
+        return unset_field
+    if not isinstance(value, str):
+        value = json.dumps(value) if isinstance(value, (list, dict)) else str(value)
+    if not value:
+        return empty_field
+    return escape.sub(_ascii_escape, value)
+
+
+def _ascii_escape(match: 're.Match[str]') -> 'str':
+    """Escape matched characters as ``\\xNN`` per byte."""
+    return ''.join('\\x%02x' % byte for byte in match.group().encode('utf-8', 'surrogatepass'))  # pylint: disable=consider-using-f-string
+
+
+def _infer_type(name: 'str', values: 'list[Any]') -> 'BaseType':
+    """Infer data type of a field from its JSON values.
+
+    Args:
+        name: Field name.
+        values: Non-null JSON values of the field.
+
+    Returns:
+        The inferred data type.
+
+    """
+    if not values:
+        return get_type(StringType)
+    if all(isinstance(value, list) for value in values):
+        element = _infer_type(name, list(itertools.chain.from_iterable(values)))
+        return get_type(VectorType, element_type=element)
+    if all(isinstance(value, bool) for value in values):
+        return get_type(BoolType)
+    if all(type(value) is int for value in values):  # pylint: disable=unidiomatic-typecheck
+        return get_type(CountType if all(value >= 0 for value in values) else IntType)
+    if all(type(value) in (int, float) for value in values):
+        return get_type(TimeType if name == 'ts' else DoubleType)
+    if all(isinstance(value, str) for value in values):
+        for type_cls, factory in ((AddrType, ipaddress.ip_address), (SubnetType, ipaddress.ip_network)):
+            try:
+                for value in values:
+                    factory(value)
+            except ValueError:
+                continue
+            return get_type(type_cls)
+    return get_type(StringType)
+
+
+def _infer_model(name: 'str', lines: 'list[dict[str, Any]]') -> 'Type[Model]':
+    """Infer data model from JSON log records.
+
+    Args:
+        name: Name of the data model.
+        lines: Decoded JSON log records.
+
+    Returns:
+        The inferred data model.
+
+    """
+    values = collections.OrderedDict()  # type: OrderedDict[str, list[Any]]
+    for line in lines:
+        for key, value in line.items():
+            field = values.setdefault(key, [])
+            if value is not None:
+                field.append(value)
+    return new_model(name, **{key: _infer_type(key, value) for key, value in values.items()})
+
+
+def json_to_ascii(src: 'PathLike[str]', dst: 'PathLike[str]', model: 'Optional[Type[Model]]' = None,
+                  infer_lines: 'int' = 1000, **kwargs: 'Any') -> 'int':
+    """Transcode JSON log file to ASCII log file.
+
+    Args:
+        src: JSON log file name.
+        dst: ASCII log file name.
+        model: Data model of the log, whose fields give the column order and
+            data types. If not given, the data model is inferred from the
+            first ``infer_lines`` lines of the log.
+        infer_lines: Number of lines to infer the data model from.
+        **kwargs: Arbitrary keyword arguments for
+            :class:`~zlogging.dumper.ASCIIWriter`.
+
+    Returns:
+        Number of records transcoded.
+
+    Raises:
+        :exc:`JSONParserError`: If a log line is not a JSON object.
+
+    Warns:
+        JSONParserWarning: If some records miss fields of the data model, or
+            have fields not in the data model, which are ignored.
+
+    See Also:
+        See :func:`transcode` for more information.
+
+    """
+    writer = ASCIIWriter(**kwargs)
+    separator = writer.str_separator
+
+    def decode(lines: 'Iterator[tuple[int, bytes]]') -> 'Iterator[tuple[int, dict[str, Any]]]':
+        for lineno, line in lines:
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise JSONParserError(error.msg, lineno) from error
+            if not isinstance(data, dict):
+                raise JSONParserError('expected JSON object', lineno)
+            yield lineno, data
+
+    count = 0
+    with open(src, 'rb') as file, open(dst, 'wb', buffering=1048576) as output:
+        records = decode(enumerate(file, start=1))
+        if model is None:
+            head = list(itertools.islice(records, infer_lines))
+            name = os.path.splitext(os.path.basename(src))[0]
+            model = _infer_model(name, [data for _, data in head])
+            records = itertools.chain(head, records)
+
+        dummy = model.__new__(model)
+        empty_field = dummy.empty_field.decode('ascii')
+        unset_field = dummy.unset_field.decode('ascii')
+        set_separator = dummy.set_separator.decode('ascii')
+
+        fields = model.__fields__
+        pairs = [(key, _ascii_converter(type_cls.zeek_type, empty_field, unset_field, set_separator, separator))
+                 for key, type_cls in fields.items()]
+        schema = fields.keys()
+
+        missing = collections.Counter()  # type: collections.Counter[str]
+        extra = collections.Counter()  # type: collections.Counter[str]
+
+        write = output.write
+        write(writer.dump_head(dummy, name=os.path.basename(dst)).encode('ascii'))
+        for count, (_, data) in enumerate(records, start=1):
+            if data.keys() != schema:
+                missing.update(schema - data.keys())
+                extra.update(data.keys() - schema)
+            get = data.get
+            write(('%s\n' % separator.join([convert(get(key)) for key, convert in pairs])).encode('ascii'))  # pylint: disable=consider-using-f-string
+        write(writer.dump_tail().encode('ascii'))
+
+    if missing:
+        warnings.warn('missing fields in %s: %s' % (os.fspath(src), ', '.join(  # pylint: disable=consider-using-f-string
+            '%s (%d)' % item for item in sorted(missing.items()))), JSONParserWarning)  # pylint: disable=consider-using-f-string
+    if extra:
+        warnings.warn('extra fields in %s: %s' % (os.fspath(src), ', '.join(  # pylint: disable=consider-using-f-string
+            '%s (%d)' % item for item in sorted(extra.items()))), JSONParserWarning)  # pylint: disable=consider-using-f-string
+    return count
+
+
+def _transcode_file(job: 'tuple[str, str, str, dict[str, Any]]') -> 'int':
+    """Transcode one log file, as worker of the process pool."""
+    src, dst, format, kwargs = job  # pylint: disable=redefined-builtin
+    if format == 'json':
+        return ascii_to_json(src, dst, **kwargs)
+    if format == 'ascii':
+        return json_to_ascii(src, dst, **kwargs)
+    raise WriterFormatError('unsupported format: %s' % format)  # pylint: disable=consider-using-f-string
+
+
+def transcode(src: 'Union[PathLike[str], list[PathLike[str]]]', dst: 'PathLike[str]',
+              format: 'str' = 'json', processes: 'Optional[int]' = None,  # pylint: disable=redefined-builtin
+              **kwargs: 'Any') -> 'int':
+    """Transcode log files directly between formats.
+
+    Log lines are mapped straight from the raw field data of the source log
+    to the target format per column type, without building
+    :class:`~zlogging.model.Model` records, and streamed with constant memory.
+    For example, when transcoding ASCII logs to JSON, ``count`` and ``port``
+    fields are written as bare numbers, *unset* fields as ``null``, ``set``
+    and ``vector`` fields as arrays, and strings are escaped only when
+    needed.
+
+    Conversely, when transcoding JSON logs to ASCII, each JSON object is
+    rendered straight to a TSV line in the column order of a data model,
+    either given as ``model`` or inferred from the first lines of the log,
+    after the ASCII log header written once.
+
+    Args:
+        src: Source log file name, or a :obj:`list` of log file names.
+        dst: Target log file name; if ``src`` is a :obj:`list`, the
+            directory of the target log files, which are named after their
+            source log files with the suffix of the target format, i.e.
+            ``.json`` or ``.log``, and placed in subdirectories mirroring
+            those of the source log files below their common directory.
+        format: Target log format, i.e. ``json`` for ASCII source logs, or
+            ``ascii`` for JSON source logs.
+        processes: Number of worker processes when transcoding a :obj:`list`
+            of log files, in default :func:`os.cpu_count`.
+        **kwargs: Arbitrary keyword arguments for the transcoder, see
+            :func:`ascii_to_json` and :func:`json_to_ascii`.
+
+    Returns:
+        Total number of records transcoded.
+
+    Raises:
+        :exc:`WriterFormatError`: If ``format`` is not supported.
+        :exc:`ZeekValueError`: If target log files of a :obj:`list` of
+            source log files collide with each other or their sources.
+        :exc:`ASCIIParserError`: If a source ASCII log file is malformed.
+        :exc:`JSONParserError`: If a source JSON log file is malformed.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> transcode('conn.log', 'conn.json')
+            >>> transcode(glob.glob('logs/*.log'), 'json_logs/', processes=8)
+            >>> transcode('sensor.json', 'sensor.log', format='ascii', infer_lines=100)
+
+    """
+    if format not in ('json', 'ascii'):
+        raise WriterFormatError('unsupported format: %s' % format)  # pylint: disable=consider-using-f-string
+
+    if not isinstance(src, (list, tuple)):
+        return _transcode_file((os.fspath(src), os.fspath(dst), format, kwargs))
+
+    jobs = []  # type: list[tuple[str, str, str, dict[str, Any]]]
+    if src:
+        names = [os.fspath(name) for name in src]
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(name)) for name in names])
+        suffix = '.json' if format == 'json' else '.log'
+
+        targets = {}  # type: dict[str, str]
+        for name in names:
+            relpath = os.path.relpath(os.path.abspath(name), root)
+            target = os.path.join(os.fspath(dst), os.path.splitext(relpath)[0] + suffix)
+
+            key = os.path.normcase(os.path.abspath(target))
+            if key in targets or key == os.path.normcase(os.path.abspath(name)):
+                raise ZeekValueError('target log file %s of %s collides with %s' % (  # pylint: disable=consider-using-f-string
+                    target, name, targets.get(key, name)))
+            targets[key] = name
+            jobs.append((name, target, format, kwargs))
+
+    os.makedirs(dst, exist_ok=True)
+    for _, target, _, _ in jobs:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+    if processes == 1 or len(jobs) <= 1:
+        return sum(map(_transcode_file, jobs))
+    with multiprocessing.Pool(processes) as pool:
+        return sum(pool.imap_unordered(_transcode_file, jobs))
@@ -13,11 +13,13 @@ from typing import TYPE_CHECKING, Any, Generic, List, Set, TypeVar, Union, cast,
 
 from mypy_extensions import TypedDict
 
-from zlogging._aux import decimal_toascii, expand_typing, float_toascii
+from zlogging._aux import (decimal_toascii, expand_typing, interval_toascii, time_toascii, time_toiso,
+                           time_tojson)
 from zlogging._compat import enum
 from zlogging._exc import (BroDeprecationWarning, ZeekNotImplemented, ZeekTypeError, ZeekValueError,
                            ZeekValueWarning)
 from zlogging.enum import globals as enum_generator
+from zlogging.packed import PackedAddress, PackedNetwork
 
 _T = TypeVar('_T')
 _S = TypeVar('_S', bound='_SimpleType')
@@ -32,7 +34,7 @@ if TYPE_CHECKING:
     from decimal import Decimal
     from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
     from json import JSONEncoder
-    from typing import NoReturn, Optional, Type
+    from typing import Callable, NoReturn, Optional, Type
 
     from typing_extensions import Literal
 
@@ -45,6 +47,7 @@ __all__ = [
     'AddrType', 'BoolType', 'CountType', 'DoubleType', 'EnumType',
     'IntervalType', 'IntType', 'PortType', 'RecordType', 'SetType',
     'StringType', 'SubnetType', 'TimeType', 'VectorType',
+    'get_type',
 ]
 
 
@@ -164,6 +167,9 @@ class _SimpleType(BaseType):  # pylint: disable=abstract-method
     ``any``, the arbitrary date type is also included.
 
     """
+    #: If the parsed values are mutable, e.g. :mod:`ctypes` integers, thus
+    #: not to be shared among parsed containers.
+    mutable: 'bool' = False
 
 
 class AnyType(_SimpleType):
@@ -378,6 +384,8 @@ class CountType(_SimpleType):
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Parsed values are mutable :mod:`ctypes` integers.
+    mutable = True
 
     @property
     def python_type(self) -> 'Type[uint64]':
@@ -466,6 +474,8 @@ class IntType(_SimpleType):
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Parsed values are mutable :mod:`ctypes` integers.
+    mutable = True
 
     @property
     def python_type(self) -> 'Type[int64]':
@@ -643,10 +653,14 @@ class TimeType(_SimpleType):
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        iso8601: If :data:`True`, serialise timestamps in ISO 8601 format
+            for JSON logs, as Zeek does with ``JSON::TS_ISO8601``.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Serialise timestamps in ISO 8601 format for JSON logs.
+    iso8601: 'bool'
 
     @property
     def python_type(self) -> 'Type[DateTimeType]':
@@ -658,6 +672,15 @@ class TimeType(_SimpleType):
         """str: Corresponding Zeek type name."""
         return 'time'
 
+    def __init__(self,  # pylint: disable=unused-argument,keyword-arg-before-vararg
+                 empty_field: 'Optional[AnyStr]' = None,
+                 unset_field: 'Optional[AnyStr]' = None,
+                 set_separator: 'Optional[AnyStr]' = None,
+                 iso8601: 'bool' = False,
+                 *args: 'Any', **kwargs: 'Any') -> 'None':
+        super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self.iso8601 = iso8601
+
     @overload
     def parse(self, data: 'AnyStr') -> 'Optional[DateTimeType]': ...
 
@@ -687,6 +710,11 @@ class TimeType(_SimpleType):
 
         if data == self.unset_field:
             return None
+        if b'T' in data:
+            # fractional seconds are optional in ISO 8601 timestamps
+            format_ = r'%Y-%m-%dT%H:%M:%S.%fZ' if b'.' in data else r'%Y-%m-%dT%H:%M:%SZ'
+            value = datetime.datetime.strptime(data.decode('ascii'), format_)
+            return datetime.datetime.fromtimestamp(value.replace(tzinfo=datetime.timezone.utc).timestamp())
         with decimal.localcontext() as ctx:
             ctx.prec = 6
             value = decimal.Decimal(data.decode('ascii'))
@@ -698,19 +726,22 @@ class TimeType(_SimpleType):
     @overload
     def tojson(self, data: 'None') -> 'None': ...
 
-    def tojson(self, data: 'Optional[DateTimeType]') -> 'Optional[float]':
+    def tojson(self, data: 'Optional[DateTimeType]') -> 'Optional[Union[float, str]]':
         """Serialize ``data`` as JSON log format.
 
         Args:
             data: raw data
 
         Returns:
-            float: The JSON serialisable numeral data.
+            The JSON serialisable numeral data, or the ISO 8601 string if
+            :attr:`iso8601` is set.
 
         """
         if data is None:
             return None
-        return data.timestamp()
+        if self.iso8601:
+            return time_toiso(data)
+        return time_tojson(data)
 
     def toascii(self, data: 'Optional[DateTimeType]') -> 'str':
         """Serialize ``data`` as ASCII log format.
@@ -724,7 +755,7 @@ class TimeType(_SimpleType):
         """
         if data is None:
             return self.str_unset_field
-        return float_toascii(data.timestamp(), self.str_unset_field)
+        return time_toascii(data)
 
 
 class IntervalType(_SimpleType):
@@ -825,7 +856,7 @@ class IntervalType(_SimpleType):
         """
         if data is None:
             return self.str_unset_field
-        return float_toascii(data.total_seconds(), self.str_unset_field)
+        return interval_toascii(data)
 
 
 class StringType(_SimpleType):
@@ -835,10 +866,22 @@ class StringType(_SimpleType):
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        zero_copy: If :data:`True`, read-only :obj:`memoryview` data will be
+            returned as is, rather than copied as :obj:`bytes`.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
+    Note:
+        In *zero-copy* mode, parsed string data may be a read-only slice of
+        the underlying buffer, e.g. a block of log file read by
+        :class:`~zlogging.loader.ASCIIParser`. Such slices remain valid as long
+        as they are referenced, but they also keep the whole buffer alive.
+        Call :obj:`bytes` on the data to detach it from the buffer should it be
+        kept longer than the parsed log.
+
     """
+    #: Return read-only :obj:`memoryview` data as is.
+    zero_copy: 'bool'
 
     @property
     def python_type(self) -> 'Any':
@@ -850,7 +893,16 @@ class StringType(_SimpleType):
         """str: Corresponding Zeek type name."""
         return 'string'
 
-    def parse(self, data: 'Union[AnyStr, ByteString]') -> 'Optional[bytes]':
+    def __init__(self,  # pylint: disable=unused-argument,keyword-arg-before-vararg
+                 empty_field: 'Optional[AnyStr]' = None,
+                 unset_field: 'Optional[AnyStr]' = None,
+                 set_separator: 'Optional[AnyStr]' = None,
+                 zero_copy: 'bool' = False,
+                 *args: 'Any', **kwargs: 'Any') -> 'None':
+        super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self.zero_copy = zero_copy
+
+    def parse(self, data: 'Union[AnyStr, ByteString]') -> 'Optional[ByteString]':
         """Parse ``data`` from string.
 
         Args:
@@ -863,7 +915,7 @@ class StringType(_SimpleType):
         """
         if isinstance(data, bytearray):
             data = bytes(data)
-        if isinstance(data, memoryview):
+        if isinstance(data, memoryview) and not (self.zero_copy and data.readonly):
             data = data.tobytes()
         if isinstance(data, str):
             data = data.encode('ascii')
@@ -892,12 +944,7 @@ class StringType(_SimpleType):
         """
         if data is None:
             return None
-
-        if isinstance(data, bytearray):
-            data = bytes(data)
-        if isinstance(data, memoryview):
-            data = data.tobytes()
-        return data.decode('ascii')
+        return str(data, 'ascii')
 
     def toascii(self, data: 'Optional[ByteString]') -> 'str':
         """Serialize ``data`` as ASCII log format.
@@ -911,14 +958,8 @@ class StringType(_SimpleType):
         """
         if data is None:
             return self.str_unset_field
-
-        if isinstance(data, bytearray):
-            data = bytes(data)
-        if isinstance(data, memoryview):
-            data = data.tobytes()
-
         if data:
-            return data.decode('ascii')
+            return str(data, 'ascii')
         return self.str_empty_field
 
 
@@ -929,14 +970,20 @@ class AddrType(_SimpleType):
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        packed: If :data:`True`, parse IP addresses as
+            :class:`~zlogging.packed.PackedAddress`.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Parse IP addresses as :class:`~zlogging.packed.PackedAddress`.
+    packed: 'bool'
 
     @property
     def python_type(self) -> 'Any':
         """Any: Corresponding Python type annotation."""
+        if self.packed:
+            return PackedAddress
         return Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
 
     @property
@@ -944,39 +991,53 @@ class AddrType(_SimpleType):
         """str: Corresponding Zeek type name."""
         return 'addr'
 
+    def __init__(self,  # pylint: disable=unused-argument,keyword-arg-before-vararg
+                 empty_field: 'Optional[AnyStr]' = None,
+                 unset_field: 'Optional[AnyStr]' = None,
+                 set_separator: 'Optional[AnyStr]' = None,
+                 packed: 'bool' = False,
+                 *args: 'Any', **kwargs: 'Any') -> 'None':
+        super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self.packed = packed
+
     @overload
-    def parse(self, data: 'AnyStr') -> 'Optional[IPAddress]': ...
+    def parse(self, data: 'AnyStr') -> 'Optional[Union[IPAddress, PackedAddress]]': ...
 
     @overload
-    def parse(self, data: 'IPAddress') -> 'IPAddress': ...
+    def parse(self, data: 'Union[IPAddress, PackedAddress]') -> 'Union[IPAddress, PackedAddress]': ...
 
-    def parse(self, data: 'Union[AnyStr, IPAddress]') -> 'Optional[IPAddress]':
+    def parse(self, data: 'Union[AnyStr, IPAddress, PackedAddress]') -> 'Optional[Union[IPAddress, PackedAddress]]':
         """Parse ``data`` from string.
 
         Args:
             data: raw data
 
         Returns:
-            The parsed IP address. If ``data`` is *unset*, :data:`None` will
-            be returned.
+            The parsed IP address, as a :class:`~zlogging.packed.PackedAddress`
+            if ``packed`` is set. If ``data`` is *unset*, :data:`None` will be
+            returned.
 
         """
+        if isinstance(data, PackedAddress):
+            return data if self.packed else data.to_ipaddress()
         if isinstance(data, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
-            return data
+            return PackedAddress.from_ipaddress(data) if self.packed else data
         if isinstance(data, str):
             data = data.encode('ascii')
 
         if data == self.unset_field:
             return None
+        if self.packed:
+            return PackedAddress.from_string(data.decode('ascii'))
         return ipaddress.ip_address(data.decode('ascii'))
 
     @overload
-    def tojson(self, data: 'IPAddress') -> 'str': ...
+    def tojson(self, data: 'Union[IPAddress, PackedAddress]') -> 'str': ...
 
     @overload
     def tojson(self, data: 'None') -> 'None': ...
 
-    def tojson(self, data: 'Optional[IPAddress]') -> 'Optional[str]':
+    def tojson(self, data: 'Optional[Union[IPAddress, PackedAddress]]') -> 'Optional[str]':
         """Serialize ``data`` as JSON log format.
 
         Args:
@@ -990,7 +1051,7 @@ class AddrType(_SimpleType):
             return None
         return str(data)
 
-    def toascii(self, data: 'Optional[IPAddress]') -> 'str':
+    def toascii(self, data: 'Optional[Union[IPAddress, PackedAddress]]') -> 'str':
         """Serialize ``data`` as ASCII log format.
 
         Args:
@@ -1016,6 +1077,8 @@ class PortType(_SimpleType):
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Parsed values are mutable :mod:`ctypes` integers.
+    mutable = True
 
     @property
     def python_type(self) -> 'Type[uint16]':
@@ -1100,14 +1163,20 @@ class SubnetType(_SimpleType):
         empty_field: Placeholder for empty field.
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
+        packed: If :data:`True`, parse IP networks as
+            :class:`~zlogging.packed.PackedNetwork`.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
     """
+    #: Parse IP networks as :class:`~zlogging.packed.PackedNetwork`.
+    packed: 'bool'
 
     @property
     def python_type(self) -> 'Any':
         """Any: Corresponding Python type annotation."""
+        if self.packed:
+            return PackedNetwork
         return Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
 
     @property
@@ -1115,39 +1184,53 @@ class SubnetType(_SimpleType):
         """str: Corresponding Zeek type name."""
         return 'subnet'
 
+    def __init__(self,  # pylint: disable=unused-argument,keyword-arg-before-vararg
+                 empty_field: 'Optional[AnyStr]' = None,
+                 unset_field: 'Optional[AnyStr]' = None,
+                 set_separator: 'Optional[AnyStr]' = None,
+                 packed: 'bool' = False,
+                 *args: 'Any', **kwargs: 'Any') -> 'None':
+        super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self.packed = packed
+
     @overload
-    def parse(self, data: 'AnyStr') -> 'Optional[IPNetwork]': ...
+    def parse(self, data: 'AnyStr') -> 'Optional[Union[IPNetwork, PackedNetwork]]': ...
 
     @overload
-    def parse(self, data: 'IPNetwork') -> 'IPNetwork': ...
+    def parse(self, data: 'Union[IPNetwork, PackedNetwork]') -> 'Union[IPNetwork, PackedNetwork]': ...
 
-    def parse(self, data: 'Union[AnyStr, IPNetwork]') -> 'Optional[IPNetwork]':
+    def parse(self, data: 'Union[AnyStr, IPNetwork, PackedNetwork]') -> 'Optional[Union[IPNetwork, PackedNetwork]]':
         """Parse ``data`` from string.
 
         Args:
             data: raw data
 
         Returns:
-            The parsed IP network. If ``data`` is *unset*, :data:`None` will
-            be returned.
+            The parsed IP network, as a :class:`~zlogging.packed.PackedNetwork`
+            if ``packed`` is set. If ``data`` is *unset*, :data:`None` will be
+            returned.
 
         """
+        if isinstance(data, PackedNetwork):
+            return data if self.packed else data.to_ipaddress()
         if isinstance(data, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
-            return data
+            return PackedNetwork.from_ipaddress(data) if self.packed else data
         if isinstance(data, str):
             data = data.encode('ascii')
 
         if data == self.unset_field:
             return None
+        if self.packed:
+            return PackedNetwork.from_string(data.decode('ascii'))
         return ipaddress.ip_network(data.decode('ascii'))
 
     @overload
-    def tojson(self, data: 'IPNetwork') -> 'str': ...
+    def tojson(self, data: 'Union[IPNetwork, PackedNetwork]') -> 'str': ...
 
     @overload
     def tojson(self, data: 'None') -> 'None': ...
 
-    def tojson(self, data: 'Optional[IPNetwork]') -> 'Optional[str]':
+    def tojson(self, data: 'Optional[Union[IPNetwork, PackedNetwork]]') -> 'Optional[str]':
         """Serialize ``data`` as JSON log format.
 
         Args:
@@ -1161,7 +1244,7 @@ class SubnetType(_SimpleType):
             return None
         return str(data)
 
-    def toascii(self, data: 'Optional[IPNetwork]') -> 'str':
+    def toascii(self, data: 'Optional[Union[IPNetwork, PackedNetwork]]') -> 'str':
         """Serialize ``data`` as ASCII log format.
 
         Args:
@@ -1219,10 +1302,20 @@ class EnumType(_SimpleType):
         if enum_hook is not None:
             self.enum_namespaces.update(enum_hook)
 
+        self._namespaces = list(namespaces)
+        self._bare = bare
+        self._enum_hook = enum_hook
+
     def __repr__(self) -> 'str':
         return (f'{self._name}(empty_field={self.str_empty_field!r}, unset_field={self.str_unset_field!r}, '
                 f'set_separator={self.str_set_separator!r}, enum_namespaces={self.enum_namespaces!r})')
 
+    def __reduce__(self) -> 'tuple[Type[EnumType], tuple[Any, ...]]':
+        # NOTE: pickle the initialisation arguments rather than the generated
+        # enum namespace, which contains all enums of the loaded namespaces
+        return type(self), (self.empty_field, self.unset_field, self.set_separator,
+                            self._namespaces, self._bare, self._enum_hook)
+
     @overload
     def parse(self, data: 'AnyStr') -> 'Optional[enum.Enum]': ...
 
@@ -1305,6 +1398,89 @@ class _GenericType(BaseType, Generic[_S]):  # pylint: disable=abstract-method
     """
     #: Data type of container's elements.
     element_type: '_S'
+    #: Return immutable containers, i.e. :obj:`frozenset` and :obj:`tuple`.
+    frozen: 'bool'
+    #: Maximum number of cached fields and elements.
+    cache_size: 'int'
+
+    @property
+    def memoised(self) -> 'bool':
+        """bool: If parsed fields and elements are memoised, i.e. ``cache_size``
+        is set, and the elements are immutable or ``frozen`` is set."""
+        return bool(self.cache_size) and (self.frozen or not self.element_type.mutable)
+
+    def _init_cache(self, frozen: 'bool', cache_size: 'int') -> 'None':
+        """Initialise the memo caches.
+
+        Args:
+            frozen: Return immutable containers.
+            cache_size: Maximum number of cached fields and elements.
+
+        """
+        self.frozen = frozen
+        self.cache_size = cache_size
+
+        #: Memo cache of whole fields, mapping raw data to immutable containers.
+        self._cache = {}  # type: dict[bytes, Any]
+        #: Memo cache of elements, mapping raw data to converted elements.
+        self._element_cache = {}  # type: dict[bytes, Any]
+
+    def _parse_elements(self, data: 'bytes') -> 'list[Any]':
+        """Convert elements of raw container data in batch.
+
+        Args:
+            data: raw container data
+
+        Returns:
+            The converted elements.
+
+        """
+        parse = self.element_type.parse
+        if not self.memoised:
+            return list(map(parse, data.split(self.set_separator)))
+
+        cache = self._element_cache
+        elements = []  # type: list[Any]
+        for element in data.split(self.set_separator):
+            try:
+                value = cache[element]
+            except KeyError:
+                if len(cache) >= self.cache_size:
+                    cache.clear()
+                value = cache[element] = parse(element)
+            elements.append(value)
+        return elements
+
+    def _parse_cached(self, data: 'bytes', factory: 'Callable[[list[Any]], Any]') -> 'Any':
+        """Parse raw container data with whole-field memo cache.
+
+        Args:
+            data: raw container data
+            factory: immutable container type, i.e. :obj:`frozenset` or :obj:`tuple`
+
+        Returns:
+            The immutable container of converted elements.
+
+        """
+        if not self.memoised:
+            return factory(self._parse_elements(data))
+
+        cache = self._cache
+        try:
+            return cache[data]
+        except KeyError:
+            pass
+
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        value = cache[data] = factory(self._parse_elements(data))
+        return value
+
+    def __getstate__(self) -> 'dict[str, Any]':
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        state['_element_cache'] = {}
+        return state
 
 
 class SetType(_GenericType, Generic[_S]):
@@ -1315,6 +1491,9 @@ class SetType(_GenericType, Generic[_S]):
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
         element_type: Data type of container's elements.
+        frozen: If :data:`True`, return :obj:`frozenset` instead of :obj:`set`.
+        cache_size: Maximum number of fields and elements in the memo caches,
+            ``0`` to disable caching.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -1340,6 +1519,13 @@ class SetType(_GenericType, Generic[_S]):
         A valid ``element_type`` should be a *simple* data type, i.e. a subclass
         of :class:`~zlogging.types._SimpleType`.
 
+        Parsed fields and elements are memoised, as container fields are often
+        repeated verbatim across log lines. The converted elements are thus
+        shared among parsed containers, and so are the containers themselves
+        when ``frozen`` is set. Elements of mutable data types, e.g. ``count``,
+        ``int`` and ``port``, are not memoised unless ``frozen`` is set.
+        The memo caches are cleared once ``cache_size`` entries are reached.
+
     """
 
     @property
@@ -1358,8 +1544,10 @@ class SetType(_GenericType, Generic[_S]):
                  unset_field: 'Optional[AnyStr]' = None,
                  set_separator: 'Optional[AnyStr]' = None,
                  element_type: 'Optional[Union[_S, Type[_S]]]' = None,
+                 frozen: 'bool' = False, cache_size: 'int' = 1024,
                  *args: 'Any', **kwargs: 'Any') -> 'None':
         super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self._init_cache(frozen, cache_size)
 
         if element_type is None:
             raise ZeekTypeError("__init__() missing 1 required positional argument: 'element_type'")
@@ -1387,11 +1575,13 @@ class SetType(_GenericType, Generic[_S]):
             data: raw data
 
         Returns:
-            The parsed set data. If ``data`` is *unset*, :data:`None` will
-            be returned.
+            The parsed set data, as a :obj:`frozenset` if ``frozen`` is set.
+            If ``data`` is *unset*, :data:`None` will be returned.
 
         """
-        if isinstance(data, set):
+        if isinstance(data, (set, frozenset, list, tuple)):
+            if self.frozen:
+                return frozenset(self.element_type(element) for element in data)
             return {self.element_type(element) for element in data}
         if isinstance(data, str):
             data = data.encode('ascii')
@@ -1399,8 +1589,10 @@ class SetType(_GenericType, Generic[_S]):
         if data == self.unset_field:
             return None
         if data == self.empty_field:
-            return set()
-        return {self.element_type(element) for element in data.split(self.set_separator)}
+            return frozenset() if self.frozen else set()
+
+        value = self._parse_cached(data, frozenset)
+        return value if self.frozen else set(value)
 
     @overload
     def tojson(self, data: 'set[_S]') -> 'list[Optional[_T]]': ...
@@ -1447,6 +1639,9 @@ class VectorType(_GenericType, Generic[_S]):
         unset_field: Placeholder for unset field.
         set_separator: Separator for ``set``/``vector`` fields.
         element_type: Data type of container's elements.
+        frozen: If :data:`True`, return :obj:`tuple` instead of :obj:`list`.
+        cache_size: Maximum number of fields and elements in the memo caches,
+            ``0`` to disable caching.
         *args: Arbitrary positional arguments.
         **kwargs: Arbitrary keyword arguments.
 
@@ -1472,6 +1667,13 @@ class VectorType(_GenericType, Generic[_S]):
         A valid ``element_type`` should be a *simple* data type, i.e. a subclass
         of :class:`~zlogging.types._SimpleType`.
 
+        Parsed fields and elements are memoised, as container fields are often
+        repeated verbatim across log lines. The converted elements are thus
+        shared among parsed containers, and so are the containers themselves
+        when ``frozen`` is set. Elements of mutable data types, e.g. ``count``,
+        ``int`` and ``port``, are not memoised unless ``frozen`` is set.
+        The memo caches are cleared once ``cache_size`` entries are reached.
+
     """
 
     @property
@@ -1490,8 +1692,10 @@ class VectorType(_GenericType, Generic[_S]):
                  unset_field: 'Optional[AnyStr]' = None,
                  set_separator: 'Optional[AnyStr]' = None,
                  element_type: 'Optional[Union[_S, Type[_S]]]' = None,
+                 frozen: 'bool' = False, cache_size: 'int' = 1024,
                  *args: 'Any', **kwargs: 'Any'):
         super().__init__(empty_field=empty_field, unset_field=unset_field, set_separator=set_separator)
+        self._init_cache(frozen, cache_size)
 
         if element_type is None:
             raise ZeekTypeError("__init__() missing 1 required positional argument: 'element_type'")
@@ -1519,11 +1723,13 @@ class VectorType(_GenericType, Generic[_S]):
             data: raw data
 
         Returns:
-            The parsed list data. If ``data`` is *unset*, :data:`None` will
-            be returned.
+            The parsed list data, as a :obj:`tuple` if ``frozen`` is set.
+            If ``data`` is *unset*, :data:`None` will be returned.
 
         """
-        if isinstance(data, list):
+        if isinstance(data, (list, tuple)):
+            if self.frozen:
+                return tuple(self.element_type(element) for element in data)
             return [self.element_type(element) for element in data]
         if isinstance(data, str):
             data = data.encode('ascii')
@@ -1531,8 +1737,10 @@ class VectorType(_GenericType, Generic[_S]):
         if data == self.unset_field:
             return None
         if data == self.empty_field:
-            return []
-        return [self.element_type(element) for element in data.split(self.set_separator)]
+            return () if self.frozen else []
+
+        value = self._parse_cached(data, tuple)
+        return value if self.frozen else list(value)
 
     @overload
     def tojson(self, data: 'list[_S]') -> 'list[Optional[_T]]': ...
@@ -1707,3 +1915,78 @@ class RecordType(_VariadicType):
     def __repr__(self) -> 'str':
         return (f'{self._name}(empty_field={self.str_empty_field!r}, unset_field={self.str_unset_field!r}, '
                 f'set_separator={self.str_set_separator!r}, element_mapping={self.element_mapping!r})')
+
+
+#: Cache of shared data type instances.
+_TYPE_CACHE = {}  # type: dict[tuple[Any, ...], BaseType]
+#: Maximum number of shared data type instances.
+_TYPE_CACHE_SIZE = 4096
+
+
+def _normalise(value: 'Optional[AnyStr]', default: 'bytes') -> 'bytes':
+    """Normalise placeholder values as :obj:`bytes` for cache keys."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.encode('ascii')
+    return value
+
+
+def get_type(type_cls: 'Type[_T]', empty_field: 'Optional[AnyStr]' = None,  # type: ignore[misc]
+             unset_field: 'Optional[AnyStr]' = None, set_separator: 'Optional[AnyStr]' = None,
+             element_type: 'Optional[Union[_SimpleType, Type[_SimpleType]]]' = None,
+             **kwargs: 'Any') -> '_T':
+    """Get a shared data type instance.
+
+    Data type instances are shared as *flyweights* keyed on the type class,
+    the element type, ``empty_field``, ``unset_field``, ``set_separator`` and
+    any additional arguments, so that identical fields of all data models
+    and log files use the same instance.
+
+    Args:
+        type_cls: Data type class, i.e. a subclass of :class:`BaseType`.
+        empty_field: Placeholder for empty field.
+        unset_field: Placeholder for unset field.
+        set_separator: Separator for ``set``/``vector`` fields.
+        element_type: Data type of container elements, for
+            :class:`SetType` and :class:`VectorType`.
+        **kwargs: Additional arguments to initialise ``type_cls``, e.g.
+            ``namespaces`` and ``bare`` for :class:`EnumType`.
+
+    Returns:
+        The shared data type instance.
+
+    Note:
+        As the instances are shared, they **MUST NOT** be mutated. Should
+        ``kwargs`` contain unhashable values other than lists, or the cache
+        already hold 4096 instances, a new instance will be created and
+        returned without being cached.
+
+        The memo caches of ``set`` and ``vector`` instances are internal
+        state bounded per ``cache_size``, and are not shared with their
+        parsed values unless the values are immutable.
+
+    """
+    empty_field = _normalise(empty_field, b'(empty)')
+    unset_field = _normalise(unset_field, b'-')
+    set_separator = _normalise(set_separator, b',')
+
+    if element_type is not None:
+        if isinstance(element_type, type):
+            element_type = get_type(element_type, empty_field, unset_field, set_separator)
+        kwargs['element_type'] = element_type
+
+    try:
+        key = (type_cls, empty_field, unset_field, set_separator,
+               tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                            for name, value in kwargs.items())))
+        instance = _TYPE_CACHE.get(key)
+    except TypeError:
+        return type_cls(empty_field, unset_field, set_separator, **kwargs)  # type: ignore[call-arg]
+
+    if instance is None:
+        if len(_TYPE_CACHE) >= _TYPE_CACHE_SIZE:
+            return type_cls(empty_field, unset_field, set_separator, **kwargs)  # type: ignore[call-arg]
+        instance = _TYPE_CACHE.setdefault(key, type_cls(empty_field, unset_field, set_separator, **kwargs))  # type: ignore[call-arg] # pylint: disable=line-too-long
+    return instance  # type: ignore[return-value]
+
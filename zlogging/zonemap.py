@@ -0,0 +1,597 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=ungrouped-imports
+"""Zone maps of log files for pruning."""
+
+import contextlib
+import dataclasses
+import datetime
+import decimal
+import io
+import json
+import os
+from typing import TYPE_CHECKING
+
+from zlogging._aux import expand_paths
+from zlogging._exc import ZeekValueError
+from zlogging.loader import ASCIIParser, JSONParser
+from zlogging.transcoder import _read_header
+
+__all__ = [
+    'ZoneMap', 'Block',
+    'scan_zonemap', 'build_zonemap', 'load_zonemap', 'candidates', 'parse_range',
+]
+
+if TYPE_CHECKING:
+    from io import BufferedReader as BinaryFile
+    from os import PathLike
+    from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+    from zlogging._data import ASCIIInfo, JSONInfo
+
+    Bound = Union[int, float, decimal.Decimal, datetime.datetime, datetime.timedelta]
+    Range = tuple[Optional[Bound], Optional[Bound]]
+    Predicate = tuple[str, Optional[decimal.Decimal], Optional[decimal.Decimal], bool]
+
+#: Version of the zone map sidecar format.
+_FORMAT_VERSION = 1
+
+#: File name suffix of zone map sidecar files.
+SUFFIX = '.zonemap'
+
+#: Number of records per block in default.
+BLOCK_SIZE = 65536
+
+#: Zeek types of numeric fields, whose minimum and maximum are tracked.
+_NUMERIC = frozenset(['count', 'int', 'port', 'double', 'time', 'interval'])
+
+
+@dataclasses.dataclass
+class Block:
+    """Statistics of a block of log records."""
+
+    #: Byte offset of the first record in the log file.
+    offset: 'int'
+    #: Byte offset past the last record in the log file.
+    end: 'int'
+    #: Number of records.
+    rows: 'int' = 0
+    #: Minimum of numeric fields, absent if all *unset*.
+    min: 'dict[str, decimal.Decimal]' = dataclasses.field(default_factory=dict)
+    #: Maximum of numeric fields, absent if all *unset*.
+    max: 'dict[str, decimal.Decimal]' = dataclasses.field(default_factory=dict)
+    #: Number of *unset* values per field.
+    nulls: 'dict[str, int]' = dataclasses.field(default_factory=dict)
+
+    def merge(self, other: 'Block') -> 'Block':
+        """Merge statistics of adjacent blocks.
+
+        Args:
+            other: The following block.
+
+        Returns:
+            Statistics of both blocks.
+
+        """
+        merged = Block(self.offset, other.end, self.rows + other.rows,
+                       dict(self.min), dict(self.max), dict(self.nulls))
+        for field, value in other.min.items():
+            if field not in merged.min or value < merged.min[field]:
+                merged.min[field] = value
+        for field, value in other.max.items():
+            if field not in merged.max or value > merged.max[field]:
+                merged.max[field] = value
+        for field, count in other.nulls.items():
+            merged.nulls[field] = merged.nulls.get(field, 0) + count
+        return merged
+
+    def may_match(self, predicates: 'list[Predicate]') -> 'bool':
+        """Check if any record of the block may satisfy predicates.
+
+        Args:
+            predicates: Field names, lower and upper bounds, and if the upper
+                bound is inclusive.
+
+        Returns:
+            :data:`False` if no record can satisfy all ``predicates``.
+
+        """
+        for field, lower, upper, inclusive in predicates:
+            if field not in self.min:
+                return False
+            if lower is not None and self.max[field] < lower:
+                return False
+            if upper is not None and (self.min[field] > upper or not inclusive and self.min[field] == upper):
+                return False
+        return True
+
+
+@dataclasses.dataclass
+class ZoneMap:
+    """Zone map of a log file.
+
+    A zone map keeps the :class:`Block` statistics of every
+    :attr:`block_size` records of a log file, i.e. the minimum and maximum
+    of numeric fields, such as ``ts``, and the number of *unset* values,
+    together with the byte offsets of the blocks, so that blocks which
+    cannot satisfy a range predicate are skipped without being read.
+
+    """
+
+    #: Log file format, i.e. ``ascii`` or ``json``.
+    format: 'str'
+    #: Size of the log file when scanned.
+    size: 'int'
+    #: Modification time of the log file in nanoseconds when scanned.
+    mtime_ns: 'int'
+    #: Number of records per block.
+    block_size: 'int'
+    #: Byte offset of the first record, i.e. past the ASCII log header.
+    header_end: 'int'
+    #: Byte offset past the last record, i.e. of the ASCII log trailer.
+    data_end: 'int'
+    #: Statistics per block.
+    blocks: 'list[Block]' = dataclasses.field(default_factory=list)
+
+    @property
+    def summary(self) -> 'Block':
+        """Statistics of the whole log file."""
+        summary = Block(self.header_end, self.header_end)
+        for block in self.blocks:
+            summary = summary.merge(block)
+        return summary
+
+    def prune(self, predicates: 'list[Predicate]') -> 'list[Block]':
+        """Select blocks which may satisfy predicates.
+
+        Args:
+            predicates: See :meth:`Block.may_match` for more information.
+
+        Returns:
+            The blocks which may contain records satisfying ``predicates``.
+
+        """
+        return [block for block in self.blocks if block.may_match(predicates)]
+
+    def todict(self) -> 'dict[str, Any]':
+        """Serialise as a JSON compatible :obj:`dict`."""
+        data = dataclasses.asdict(self)
+        for block in data['blocks']:
+            block['min'] = {field: str(value) for field, value in block['min'].items()}
+            block['max'] = {field: str(value) for field, value in block['max'].items()}
+        return data
+
+    @classmethod
+    def fromdict(cls, data: 'dict[str, Any]') -> 'ZoneMap':
+        """Deserialise from :meth:`todict` output."""
+        blocks = [Block(
+            block['offset'], block['end'], block['rows'],
+            {field: decimal.Decimal(value) for field, value in block['min'].items()},
+            {field: decimal.Decimal(value) for field, value in block['max'].items()},
+            block['nulls'],
+        ) for block in data['blocks']]
+        return cls(data['format'], data['size'], data['mtime_ns'], data['block_size'],
+                   data['header_end'], data['data_end'], blocks)
+
+
+def _number(value: 'Any') -> 'Optional[decimal.Decimal]':
+    """Convert value as :class:`~decimal.Decimal` for comparison.
+
+    Args:
+        value: Raw field value as :obj:`bytes`, JSON number, or bound of a
+            range predicate.
+
+    Returns:
+        The exact numeric value, where :class:`~datetime.datetime` is taken
+        as epoch seconds and :class:`~datetime.timedelta` as seconds; or
+        :data:`None` if ``value`` is not numeric.
+
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        seconds = decimal.Decimal(int(value.replace(microsecond=0).timestamp()))
+        return seconds + decimal.Decimal(value.microsecond).scaleb(-6)
+    if isinstance(value, datetime.timedelta):
+        return decimal.Decimal(value.days * 86400 + value.seconds) + decimal.Decimal(value.microseconds).scaleb(-6)
+    if isinstance(value, (bytes, str)):
+        try:
+            number = decimal.Decimal(value.decode('ascii') if isinstance(value, bytes) else value)
+        except (decimal.InvalidOperation, UnicodeDecodeError):
+            return None
+        return number if number.is_finite() else None
+    if isinstance(value, float):
+        return decimal.Decimal(repr(value))
+    if isinstance(value, (int, decimal.Decimal)):
+        return decimal.Decimal(value)
+    return None
+
+
+def _decimal(value: 'bytes') -> 'decimal.Decimal':
+    """Convert raw field value as :class:`~decimal.Decimal`."""
+    return decimal.Decimal(value.decode('ascii'))
+
+
+def _predicates(time_range: 'Optional[Range]' = None,
+                ranges: 'Optional[Mapping[str, Range]]' = None) -> 'list[Predicate]':
+    """Normalise range predicates.
+
+    Args:
+        time_range: Half-open range of ``ts``.
+        ranges: Closed ranges of numeric fields.
+
+    Returns:
+        Field names, lower and upper bounds, and if the upper bound is
+        inclusive.
+
+    Raises:
+        :exc:`ZeekValueError`: If a bound is not numeric.
+
+    """
+    predicates = []  # type: list[Predicate]
+    items = [('ts', time_range, False)] if time_range is not None else []
+    items.extend((field, bounds, True) for field, bounds in (ranges or {}).items())
+    for field, (lower, upper), inclusive in items:
+        bounds = []  # type: list[Optional[decimal.Decimal]]
+        for bound in (lower, upper):
+            number = None if bound is None else _number(bound)
+            if bound is not None and number is None:
+                raise ZeekValueError('invalid bound of %s: %r' % (field, bound))  # pylint: disable=consider-using-f-string
+            bounds.append(number)
+        predicates.append((field, bounds[0], bounds[1], inclusive))
+    return predicates
+
+
+def _row_filter(predicates: 'list[Predicate]') -> 'dict[str, Callable[[Any], bool]]':
+    """Create row filter of parsers from predicates.
+
+    Args:
+        predicates: Normalised range predicates.
+
+    Returns:
+        Predicates of raw field values by field names. Records with
+        *unset* or non-numeric values never satisfy a range.
+
+    """
+    merged = {}  # type: dict[str, list[Predicate]]
+    for predicate in predicates:
+        merged.setdefault(predicate[0], []).append(predicate)
+
+    def check(ranges: 'list[Predicate]') -> 'Callable[[Any], bool]':
+        def accept(value: 'Any') -> 'bool':
+            number = _number(value)
+            if number is None:
+                return False
+            for _, lower, upper, inclusive in ranges:
+                if lower is not None and number < lower:
+                    return False
+                if upper is not None and (number > upper or not inclusive and number == upper):
+                    return False
+            return True
+        return accept
+    return {field: check(ranges) for field, ranges in merged.items()}
+
+
+def _scan_ascii(file: 'BinaryFile', block_size: 'int') -> 'tuple[int, int, list[Block]]':
+    """Scan blocks of ASCII log file."""
+    header = _read_header(file)
+    header_end = file.tell()
+
+    separator = header['separator']
+    unset_field = header['unset_field']
+    fields = header['fields']
+    numeric = [(index, field, int if type_ in ('count', 'int', 'port') else _decimal)
+               for index, (field, type_) in enumerate(zip(fields, header['types'])) if type_ in _NUMERIC]
+
+    blocks = []  # type: list[Block]
+    offset = header_end
+    block = Block(offset, offset)
+    minimum, maximum = block.min, block.max
+    nulls = [0] * len(fields)
+    for line in file:
+        if line.startswith(b'#'):
+            break
+
+        values = line.rstrip(b'\r\n').split(separator)
+        for index, value in enumerate(values):
+            if value == unset_field:
+                nulls[index] += 1
+        for index, field, factory in numeric:
+            raw = values[index] if index < len(values) else unset_field
+            if raw == unset_field:
+                continue
+            try:
+                value = factory(raw)
+            except (ValueError, decimal.InvalidOperation):
+                continue
+            if factory is _decimal and not value.is_finite():
+                continue
+            if field not in minimum:
+                minimum[field] = maximum[field] = value
+            elif value < minimum[field]:
+                minimum[field] = value
+            elif value > maximum[field]:
+                maximum[field] = value
+
+        offset += len(line)
+        block.rows += 1
+        if block.rows >= block_size:
+            block.end = offset
+            block.nulls = dict(zip(fields, nulls))
+            blocks.append(block)
+            block = Block(offset, offset)
+            minimum, maximum = block.min, block.max
+            nulls = [0] * len(fields)
+
+    if block.rows:
+        block.end = offset
+        block.nulls = dict(zip(fields, nulls))
+        blocks.append(block)
+    for block in blocks:
+        block.min = {field: decimal.Decimal(value) for field, value in block.min.items()}
+        block.max = {field: decimal.Decimal(value) for field, value in block.max.items()}
+    return header_end, offset, blocks
+
+
+def _scan_json(file: 'BinaryFile', block_size: 'int') -> 'tuple[int, int, list[Block]]':
+    """Scan blocks of JSON log file."""
+    blocks = []  # type: list[Block]
+    offset = 0
+    block = Block(offset, offset)
+    for line in file:
+        offset += len(line)
+        if not line.strip():
+            continue
+
+        data = json.loads(line)  # type: dict[str, Any]
+        for field, value in data.items():
+            if value is None:
+                block.nulls[field] = block.nulls.get(field, 0) + 1
+                continue
+            number = _number(value) if isinstance(value, (int, float)) else None
+            if number is None:
+                continue
+            if field not in block.min:
+                block.min[field] = block.max[field] = number
+            elif number < block.min[field]:
+                block.min[field] = number
+            elif number > block.max[field]:
+                block.max[field] = number
+
+        block.rows += 1
+        if block.rows >= block_size:
+            block.end = offset
+            blocks.append(block)
+            block = Block(offset, offset)
+
+    if block.rows:
+        block.end = offset
+        blocks.append(block)
+    return 0, offset, blocks
+
+
+def scan_zonemap(filename: 'PathLike[str]', block_size: 'int' = BLOCK_SIZE) -> 'ZoneMap':
+    """Compute zone map of a log file.
+
+    The raw field values are scanned without parsing log records, and only
+    numeric fields, i.e. ``count``, ``int``, ``port``, ``double``, ``time``
+    and ``interval`` fields of ASCII logs, or number fields of JSON logs,
+    are converted.
+
+    Args:
+        filename: Log file name.
+        block_size: Number of records per block.
+
+    Returns:
+        The zone map.
+
+    Raises:
+        :exc:`ASCIIParserError`: If the ASCII log header is malformed.
+
+    """
+    if block_size <= 0:
+        raise ZeekValueError('invalid block size: %r' % block_size)  # pylint: disable=consider-using-f-string
+
+    stat = os.stat(filename)
+    with open(filename, 'rb') as file:
+        if file.peek(1)[:1] == b'#':
+            format_ = 'ascii'
+            header_end, data_end, blocks = _scan_ascii(file, block_size)
+        else:
+            format_ = 'json'
+            header_end, data_end, blocks = _scan_json(file, block_size)
+    return ZoneMap(format_, stat.st_size, stat.st_mtime_ns, block_size, header_end, data_end, blocks)
+
+
+def load_zonemap(filename: 'PathLike[str]', suffix: 'str' = SUFFIX) -> 'Optional[ZoneMap]':
+    """Load zone map sidecar of a log file.
+
+    Args:
+        filename: Log file name.
+        suffix: File name suffix of the sidecar.
+
+    Returns:
+        The zone map, or :data:`None` if the sidecar does not exist, is
+        corrupted, or is stale, i.e. the log file has changed since the
+        sidecar was built.
+
+    """
+    try:
+        with open(os.fspath(filename) + suffix, 'rb') as file:
+            data = json.load(file)
+        if data.pop('version') != _FORMAT_VERSION:
+            return None
+        zonemap = ZoneMap.fromdict(data)
+        stat = os.stat(filename)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, decimal.InvalidOperation):
+        return None
+    if (zonemap.size, zonemap.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        return None
+    return zonemap
+
+
+def _save(filename: 'PathLike[str]', zonemap: 'ZoneMap', suffix: 'str') -> 'str':
+    """Write zone map sidecar of a log file."""
+    path = os.fspath(filename) + suffix
+    temp = path + '.tmp'
+    try:
+        with open(temp, 'w', encoding='utf-8') as file:
+            json.dump(dict(version=_FORMAT_VERSION, **zonemap.todict()), file)
+        os.replace(temp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp)
+        raise
+    return path
+
+
+def build_zonemap(paths: 'Union[PathLike[str], Iterable[PathLike[str]]]', block_size: 'int' = BLOCK_SIZE,
+                  suffix: 'str' = SUFFIX, rebuild: 'bool' = False) -> 'list[str]':
+    """Build zone map sidecars of log files.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`.
+        block_size: Number of records per block.
+        suffix: File name suffix of the sidecars.
+        rebuild: If :data:`True`, rebuild sidecars even if up to date.
+
+    Returns:
+        File names of the sidecars.
+
+    """
+    sidecars = []  # type: list[str]
+    for filename in expand_paths(paths):
+        if rebuild or load_zonemap(filename, suffix=suffix) is None:
+            _save(filename, scan_zonemap(filename, block_size), suffix)
+        sidecars.append(filename + suffix)
+    return sidecars
+
+
+def _zonemap(filename: 'PathLike[str]', block_size: 'int', suffix: 'Optional[str]') -> 'ZoneMap':
+    """Load zone map of a log file, or scan and save it if missing or stale."""
+    zonemap = None if suffix is None else load_zonemap(filename, suffix=suffix)
+    if zonemap is None:
+        zonemap = scan_zonemap(filename, block_size)
+        if suffix is not None:
+            with contextlib.suppress(OSError):
+                _save(filename, zonemap, suffix)
+    return zonemap
+
+
+def candidates(paths: 'Union[PathLike[str], Iterable[PathLike[str]]]', time_range: 'Optional[Range]' = None,
+               ranges: 'Optional[Mapping[str, Range]]' = None, block_size: 'int' = BLOCK_SIZE,
+               suffix: 'Optional[str]' = SUFFIX) -> 'list[str]':
+    """Select log files which may contain records within ranges.
+
+    Args:
+        paths: Log files, see :func:`~zlogging._aux.expand_paths`.
+        time_range: Half-open range of ``ts``, see :func:`parse_range`.
+        ranges: Closed ranges of numeric fields, see :func:`parse_range`.
+        block_size: Number of records per block, should a zone map be
+            scanned.
+        suffix: File name suffix of the sidecars, see :func:`parse_range`.
+
+    Returns:
+        File names of the log files whose statistics do not rule out
+        records within all ranges.
+
+    Raises:
+        :exc:`ZeekValueError`: If a bound is not numeric.
+
+    """
+    predicates = _predicates(time_range, ranges)
+    return [filename for filename in expand_paths(paths)
+            if _zonemap(filename, block_size, suffix).summary.may_match(predicates)]
+
+
+class _RangeReader(io.RawIOBase):
+    """Read-only view of byte ranges of a file as one stream.
+
+    Args:
+        file: File object opened in binary mode.
+        ranges: Start and end offsets of the byte ranges.
+
+    """
+
+    def __init__(self, file: 'BinaryFile', ranges: 'list[tuple[int, int]]') -> 'None':
+        super().__init__()
+        self._file = file
+        self._ranges = [(start, end) for start, end in ranges if end > start]
+        self._index = 0
+        self._position = self._ranges[0][0] if self._ranges else 0
+
+    def readable(self) -> 'bool':
+        return True
+
+    def readinto(self, buffer: 'Any') -> 'int':
+        while self._index < len(self._ranges):
+            _, end = self._ranges[self._index]
+            if self._position < end:
+                self._file.seek(self._position)
+                data = self._file.read(min(len(buffer), end - self._position))
+                if not data:
+                    break
+                buffer[:len(data)] = data
+                self._position += len(data)
+                return len(data)
+
+            self._index += 1
+            if self._index < len(self._ranges):
+                self._position = self._ranges[self._index][0]
+        return 0
+
+
+def parse_range(filename: 'PathLike[str]', time_range: 'Optional[Range]' = None,
+                ranges: 'Optional[Mapping[str, Range]]' = None, block_size: 'int' = BLOCK_SIZE,
+                suffix: 'Optional[str]' = SUFFIX, model: 'Any' = None,
+                **kwargs: 'Any') -> 'Union[ASCIIInfo, JSONInfo]':
+    """Parse records of log file within ranges.
+
+    The zone map of the log file is loaded from its sidecar, or scanned and
+    saved as the sidecar should it be missing or stale, and the blocks whose
+    statistics cannot satisfy the ranges are skipped without being read.
+    Records of the remaining blocks are filtered before being converted, see
+    ``row_filter`` of :class:`~zlogging.loader.ASCIIParser`.
+
+    Args:
+        filename: Log file name.
+        time_range: Half-open range ``(start, end)`` of ``ts``, as
+            :class:`~datetime.datetime` or epoch seconds. Either bound may be
+            :data:`None` for unbounded.
+        ranges: Closed ranges ``(lower, upper)`` of numeric fields by field
+            names, e.g. ``{'orig_bytes': (1 << 20, None)}``.
+        block_size: Number of records per block, should the zone map be
+            scanned.
+        suffix: File name suffix of the sidecar. If :data:`None`, the zone
+            map is neither loaded nor saved.
+        model: Field declarations for JSON logs.
+        **kwargs: See :func:`~zlogging.loader.parse_ascii` and
+            :func:`~zlogging.loader.parse_json` for more information.
+
+    Returns:
+        The parsed log, with records satisfying all ranges only. *Unset*
+        values never satisfy a range.
+
+    Raises:
+        :exc:`ZeekValueError`: If a bound is not numeric.
+
+    """
+    predicates = _predicates(time_range, ranges)
+    zonemap = _zonemap(filename, block_size, suffix)
+
+    parser_cls = kwargs.pop('parser', None)
+    row_filter = dict(kwargs.pop('row_filter', None) or {})
+    for field, accept in _row_filter(predicates).items():
+        previous = row_filter.get(field)
+        row_filter[field] = accept if previous is None else (
+            lambda value, first=previous, second=accept: first(value) and second(value))
+
+    blocks = zonemap.prune(predicates)
+    spans = [(block.offset, block.end) for block in blocks]
+    with open(filename, 'rb') as file:
+        if zonemap.format == 'ascii':
+            spans = [(0, zonemap.header_end)] + spans + [(zonemap.data_end, zonemap.size)]
+            parser = (parser_cls or ASCIIParser)(row_filter=row_filter, **kwargs)  # type: Union[ASCIIParser, JSONParser]
+        else:
+            parser = (parser_cls or JSONParser)(model, row_filter=row_filter, **kwargs)
+        with io.BufferedReader(_RangeReader(file, spans)) as reader:  # type: ignore[arg-type]
+            return parser.parse_file(reader)  # type: ignore[arg-type]